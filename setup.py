@@ -63,6 +63,11 @@ setup(
     test_suite='tests',
     tests_require=test_requirements,
     extras_require={},
+    entry_points={
+        'console_scripts': [
+            'tdb-export=transistordatabase.export_cli:main',
+        ],
+    },
     url='https://github.com/upb-lea/transistordatabase',
     project_urls={
         "Documentation": "https://upb-lea.github.io/transistordatabase/main/transistordatabase.html",
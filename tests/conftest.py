@@ -0,0 +1,12 @@
+"""Fixtures shared by all unit tests."""
+import pytest
+import transistordatabase as tdb
+
+
+@pytest.fixture(autouse=True)
+def plot_cache_folder(tmp_path_factory):
+    """Write the plots cached by the tests to an empty temporary folder instead of the plot cache folder of the user."""
+    folder = tdb.get_plot_cache_folder()
+    tdb.set_plot_cache(str(tmp_path_factory.mktemp("plots")))
+    yield
+    tdb.set_plot_cache(folder)
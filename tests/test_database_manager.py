@@ -1,39 +1,76 @@
 """Unit tests for the database manager."""
-from transistordatabase.database_manager import DatabaseManager
+from transistordatabase.database_manager import DatabaseManager, OperationMode
+from transistordatabase.json_serializer import JSON_SERIALIZERS, register_json_serializer
+from unittest.mock import patch
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+import functools
+import threading
+import shutil
+import mongomock
 import pytest
 import os
 import json
+import numpy as np
 
 test_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data")
 database_dir = os.path.join(test_dir, "database")
 fixed_transistor_path = os.path.join(test_dir, "CREE_C3M0060065J.json")
 database_transistor_path = os.path.join(database_dir, "CREE_C3M0016120K.json")
+# Long running benchmarks are opt-in
+benchmark = pytest.mark.skipif(not os.environ.get("TDB_BENCHMARK"), reason="benchmark, set TDB_BENCHMARK=1 to run it")
 
 @pytest.fixture
-def database_json():
-    """Fixture for further unit tests."""
+def database_json(tmp_path_factory):
+    """Fixture for further unit tests, works on a copy of the test database folder."""
     if not os.path.exists(database_dir):
         raise Exception("The folder test_data is missing.")
 
+    json_folder = str(tmp_path_factory.mktemp("tdb") / "database")
+    shutil.copytree(database_dir, json_folder, ignore=shutil.ignore_patterns(".tdb_*"))
     db = DatabaseManager()
-    db.set_operation_mode_json(database_dir)
+    db.set_operation_mode_json(json_folder)
+    return db
 
-    # Save current transistor to maybe restore it later
-    transistor = db.load_transistor("CREE_C3M0016120K")
 
-    yield db
+@pytest.fixture
+def mongomock_collection():
+    """
+    Fake MongoDB collection.
+
+    mongomock 4.3 does not accept the 'sort' argument passed by the bulk operations of pymongo >= 4.11, it is dropped here.
+    """
+    builder = mongomock.collection.BulkOperationBuilder
+
+    def drop_sort(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, sort=None, **kwargs):
+            return method(self, *args, **kwargs)
+        return wrapper
+
+    with patch.object(builder, "add_replace", drop_sort(builder.add_replace)), patch.object(builder, "add_update", drop_sort(builder.add_update)):
+        yield mongomock.MongoClient()["transistor_database_fake"].collection
 
-    # Return to initial state of database
-    transistor_names = db.get_transistor_names_list()
-    if "CREE_C3M0016120K" not in transistor_names:
-        # Add transistor
-        with open(database_transistor_path, "w") as fd:
-            json.dump(transistor.convert_to_dict(), fd)
+@pytest.fixture
+def fileexchange_server(tmp_path):
+    """Local http server as stand-in for the fileexchange. Yields the url of the index file."""
+    exchange_dir = tmp_path / "fileexchange"
+    exchange_dir.mkdir()
+    shutil.copy(database_transistor_path, exchange_dir)
+    shutil.copy(fixed_transistor_path, exchange_dir)
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
 
-    if "CREE_C3M0060065J" in transistor_names:
-        # Remove transistor
-        os.remove(os.path.join(database_dir, "CREE_C3M0060065J.json"))
-        
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(QuietHandler, directory=str(exchange_dir)))
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    (exchange_dir / "index.txt").write_text(f"{base_url}/CREE_C3M0016120K.json\n{base_url}/CREE_C3M0060065J.json\n")
+    DatabaseManager.create_fileexchange_manifest(str(exchange_dir), manifest_file_path=str(exchange_dir / "manifest.json"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"{base_url}/index.txt"
+    server.shutdown()
+    server.server_close()
 
 def test_load_transistor_json(database_json: DatabaseManager):
     """Unit test for load_transistor."""
@@ -67,11 +104,11 @@ def test_save_transistor_json(database_json: DatabaseManager):
         "Transistor is missing after adding it to database."
 
     # Check if transistor file is created in the database
-    assert os.path.isfile(os.path.join(database_dir, "CREE_C3M0060065J.json")), "File does not exists"
+    assert os.path.isfile(os.path.join(database_json.json_folder, "CREE_C3M0060065J.json")), "File does not exists"
 
     # Load database transistor
     t2_dict = None
-    with open(os.path.join(database_dir, "CREE_C3M0060065J.json"), "r") as fd:
+    with open(os.path.join(database_json.json_folder, "CREE_C3M0060065J.json"), "r") as fd:
         t2_dict = json.load(fd)
 
     t2 = database_json.convert_dict_to_transistor_object(t2_dict)
@@ -87,10 +124,478 @@ def test_delete_transistor_json(database_json: DatabaseManager):
     assert not database_json.get_transistor_names_list()
 
     # Check if file has been removed
-    assert not os.path.isfile(database_transistor_path)
+    assert not os.path.isfile(os.path.join(database_json.json_folder, "CREE_C3M0016120K.json"))
 
 def test_get_transistor_names_list_json(database_json: DatabaseManager):
     """Unit test for get_transistor_names_list."""
     transistor_list = database_json.get_transistor_names_list()
 
     assert transistor_list == ["CREE_C3M0016120K"]
+
+def test_load_transistor_json_cache(database_json: DatabaseManager):
+    """Unit test for the name index and object cache of load_transistor."""
+    database_json.clear_cache()
+    t1 = database_json.load_transistor("CREE_C3M0016120K")
+    t2 = database_json.load_transistor("CREE_C3M0016120K")
+    assert database_json.cache_info()["misses"] == 1
+    assert database_json.cache_info()["hits"] == 1
+    assert t1 == t2
+
+    # Returned objects are copies, modifications must not leak into the cache
+    t2.name = "modified"
+    assert database_json.load_transistor("CREE_C3M0016120K").name == "CREE_C3M0016120K"
+
+    # Saving a transistor invalidates the cached object and the name index
+    with open(fixed_transistor_path, "r") as fd:
+        t3 = database_json.convert_dict_to_transistor_object(json.load(fd))
+    database_json.save_transistor(t3)
+    assert sorted(database_json.get_transistor_names_list()) == ["CREE_C3M0016120K", "CREE_C3M0060065J"]
+    assert database_json.load_transistor("CREE_C3M0060065J") == t3
+
+def test_load_transistor_threads(database_json: DatabaseManager):
+    """The object cache and the indexes can be used by several threads while transistors are saved."""
+    from concurrent.futures import ThreadPoolExecutor
+    with open(fixed_transistor_path, "r") as fd:
+        fixed_transistor = database_json.convert_dict_to_transistor_object(json.load(fd))
+    database_json.save_transistor(fixed_transistor, True)
+    database_json.cache_size = 1
+    names = ["CREE_C3M0016120K", "CREE_C3M0060065J"] * 50
+
+    def load(name):
+        transistor = database_json.load_transistor(name)
+        database_json.parallel_transistors(transistor, 2)
+        return transistor.name
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = executor.map(load, names)
+        for _ in range(5):
+            database_json.save_transistor(fixed_transistor, True)
+        assert list(futures) == names
+    assert database_json.cache_info()["size"] == 1 and database_json.cache_info()["parallel_size"] == 1
+
+def test_query_json(database_json: DatabaseManager):
+    """Unit test for query in json mode."""
+    rows = database_json.query(fields=["v_abs_max", "switch.t_j_max"])
+    assert rows == [{"name": "CREE_C3M0016120K", "v_abs_max": 1200, "switch_t_j_max": 175}]
+
+    assert database_json.query({"v_abs_max": (1000, None), "type": "SiC-MOSFET"}, ["type"]) == [{"name": "CREE_C3M0016120K", "type": "SiC-MOSFET"}]
+    assert database_json.query({"v_abs_max": (None, 1000)}) == []
+
+    # No array data is part of the rows
+    row = database_json.query()[0]
+    assert "housing_type" in row and "diode_t_j_max" in row
+    assert "switch_channel" not in row and "raw_measurement_data" not in row
+
+def test_query_mongodb():
+    """Unit test for query in mongodb mode."""
+    with open(database_transistor_path, "r") as fd:
+        transistor_dict = json.load(fd)
+    fake_collection = mongomock.MongoClient()["transistor_database_fake"].collection
+    fake_collection.insert_one(transistor_dict)
+
+    with patch("transistordatabase.database_manager.connect_local_tdb", return_value=fake_collection):
+        db = DatabaseManager()
+        db.set_operation_mode_mongodb()
+    assert db.operation_mode == OperationMode.MONGODB
+
+    assert db.query({"switch_t_j_max": 175}, ["i_cont", "diode.t_j_max"]) == [
+        {"name": "CREE_C3M0016120K", "i_cont": transistor_dict["i_cont"], "diode_t_j_max": 175}]
+    assert db.query({"v_abs_max": (1300, None)}) == []
+
+def test_summary_index_json(database_json: DatabaseManager):
+    """Unit test for the persistent summary index of the json folder."""
+    database_json.query()
+    index_file_path = os.path.join(database_json.json_folder, ".tdb_summary_index")
+    assert os.path.isfile(index_file_path)
+
+    # A new DatabaseManager reads the index file instead of the transistor files
+    db = DatabaseManager()
+    db.set_operation_mode_json(database_json.json_folder)
+    with patch("transistordatabase.database_manager.json.load", wraps=json.load) as json_load:
+        assert db.query(fields=["v_abs_max"]) == [{"name": "CREE_C3M0016120K", "v_abs_max": 1200}]
+    assert json_load.call_count == 1
+    assert db.get_operating_points("CREE_C3M0016120K")["switch"]
+    assert "CREE_C3M0016120K" in db.get_transistor_names_list()
+
+    # save_transistor and delete_transistor update the index incrementally
+    with open(fixed_transistor_path, "r") as fd:
+        t1 = db.convert_dict_to_transistor_object(json.load(fd))
+    db.save_transistor(t1)
+    db.delete_transistor("CREE_C3M0016120K")
+    with open(index_file_path, "r") as fd:
+        assert json.load(fd)["name"] == ["CREE_C3M0060065J"]
+
+def test_binary_operation_mode(tmp_path):
+    """Unit test for the binary operation mode."""
+    binary_dir = str(tmp_path / "binary")
+    assert DatabaseManager.convert_json_folder_to_binary(database_dir, binary_dir) == ["CREE_C3M0016120K"]
+
+    db = DatabaseManager()
+    db.set_operation_mode_binary(binary_dir)
+    assert db.get_transistor_names_list() == ["CREE_C3M0016120K"]
+
+    # Loss-free round trip compared to the json file
+    with open(database_transistor_path, "r") as fd:
+        t1 = db.convert_dict_to_transistor_object(json.load(fd))
+    t2 = db.load_transistor("CREE_C3M0016120K")
+    assert t1 == t2
+    assert t2.switch.channel[0].graph_v_i.dtype == np.float64
+    assert db.query(fields=["v_abs_max"]) == [{"name": "CREE_C3M0016120K", "v_abs_max": 1200}]
+
+    # Save and delete
+    with open(fixed_transistor_path, "r") as fd:
+        t3 = db.convert_dict_to_transistor_object(json.load(fd))
+    db.save_transistor(t3)
+    assert db.load_transistor("CREE_C3M0060065J") == t3
+    db.delete_transistor("CREE_C3M0060065J")
+    assert db.get_transistor_names_list() == ["CREE_C3M0016120K"]
+
+def test_binary_operation_mode_memory_mapped_waveforms(tmp_path):
+    """Unit test for memory-mapped raw measurement waveforms in binary mode."""
+    with open(fixed_transistor_path, "r") as fd:
+        transistor_dict = json.load(fd)
+    waveform = np.array([np.linspace(0, 1e-6, 100), np.linspace(0, 400, 100)]).T
+    transistor_dict["raw_measurement_data"] = [{"dataset_type": "dpt_u_i", "t_j": 25, "v_supply": 400, "v_g": 15, "v_g_off": 0,
+                                                "dpt_on_vds": [waveform], "dpt_on_id": [waveform / 10],
+                                                "dpt_off_vds": [waveform], "dpt_off_id": [waveform / 10]}]
+    DatabaseManager.write_binary_transistor_file(transistor_dict, str(tmp_path / "CREE_C3M0060065J.npz"))
+
+    db = DatabaseManager()
+    db.set_operation_mode_binary(str(tmp_path))
+    t1 = db.load_transistor("CREE_C3M0060065J")
+    dpt_on_vds = t1.raw_measurement_data[0].dpt_on_vds[0]
+    assert not dpt_on_vds.flags.writeable
+    np.testing.assert_array_equal(dpt_on_vds, waveform)
+
+    # Cached copies share the read-only waveforms, while all other data is copied
+    t2 = db.load_transistor("CREE_C3M0060065J")
+    assert np.shares_memory(t2.raw_measurement_data[0].dpt_on_vds[0], dpt_on_vds)
+    assert not np.shares_memory(t2.switch.channel[0].graph_v_i, t1.switch.channel[0].graph_v_i)
+    assert t1.raw_measurement_data[0].convert_to_dict()["dpt_off_id"] == [(waveform / 10).tolist()]
+
+def test_update_from_fileexchange(tmp_path, fileexchange_server):
+    """Unit test for the parallel fileexchange download against a local http server."""
+    (tmp_path / "database").mkdir()
+    db = DatabaseManager()
+    db.set_operation_mode_json(str(tmp_path / "database"))
+    progress = []
+    with patch.object(DatabaseManager, "_create_download_session", wraps=DatabaseManager._create_download_session) as create_download_session:
+        db.update_from_fileexchange(index_url=fileexchange_server, module_manufacturers_url=None, housing_types_url=None,
+                                    max_workers=2, progress_callback=lambda finished, total, url: progress.append((finished, total)))
+    # The connection pool is as large as the count of parallel downloads
+    create_download_session.assert_called_once_with(2)
+    assert sorted(db.get_transistor_names_list()) == ["CREE_C3M0016120K", "CREE_C3M0060065J"]
+    assert progress[-1] == (2, 2)
+
+    # Unchanged files are not downloaded again (conditional requests)
+    result = db.download_from_fileexchange(fileexchange_server)
+    assert result == {"downloaded": 0, "not_modified": 2, "failed": 0}
+
+    # Deleted transistors are downloaded again
+    db.delete_transistor("CREE_C3M0060065J")
+    result = db.download_from_fileexchange(fileexchange_server)
+    assert result == {"downloaded": 1, "not_modified": 1, "failed": 0}
+
+def test_sync_from_fileexchange(tmp_path, fileexchange_server):
+    """Unit test for the incremental fileexchange sync using content hashes."""
+    (tmp_path / "database").mkdir()
+    manifest_url = fileexchange_server.replace("index.txt", "manifest.json")
+    db = DatabaseManager()
+    db.set_operation_mode_json(str(tmp_path / "database"))
+    result = db.sync_from_fileexchange(manifest_url, max_workers=2)
+    assert sorted(result["updated"]) == ["CREE_C3M0016120K", "CREE_C3M0060065J"]
+
+    # Unchanged transistors are not downloaded again
+    result = db.sync_from_fileexchange(manifest_url)
+    assert result["updated"] == [] and sorted(result["unchanged"]) == ["CREE_C3M0016120K", "CREE_C3M0060065J"]
+    db.compare_with_fileexchange(fileexchange_server, str(tmp_path / "diff.json"))
+    assert not (tmp_path / "diff.json").exists()
+
+    # Only the changed transistor is downloaded
+    exchange_dir = tmp_path / "fileexchange"
+    with open(exchange_dir / "CREE_C3M0060065J.json", "r") as fd:
+        transistor_dict = json.load(fd)
+    transistor_dict["comment"] = "changed on the fileexchange"
+    with open(exchange_dir / "CREE_C3M0060065J.json", "w") as fd:
+        json.dump(transistor_dict, fd)
+    DatabaseManager.create_fileexchange_manifest(str(exchange_dir), manifest_file_path=str(exchange_dir / "manifest.json"))
+
+    # The comparison with a manifest only downloads the changed transistor
+    session = DatabaseManager._create_download_session()
+    requested_urls = []
+    session.hooks["response"].append(lambda response, *args, **kwargs: requested_urls.append(response.url))
+    db.compare_with_fileexchange(fileexchange_server, str(tmp_path / "diff.json"), manifest_url=manifest_url, session=session)
+    assert requested_urls == [manifest_url, manifest_url.replace("manifest.json", "CREE_C3M0060065J.json")]
+    with open(tmp_path / "diff.json", "r") as fd:
+        assert list(json.load(fd)) == ["CREE_C3M0060065J"]
+
+    result = db.sync_from_fileexchange(manifest_url)
+    assert result == {"updated": ["CREE_C3M0060065J"], "unchanged": ["CREE_C3M0016120K"], "failed": []}
+    assert db.load_transistor("CREE_C3M0060065J").comment == "changed on the fileexchange"
+
+def test_content_hash_binary(tmp_path, database_json: DatabaseManager):
+    """The content hash does not depend on the storage format."""
+    DatabaseManager.convert_json_folder_to_binary(database_dir, str(tmp_path / "binary"))
+    db = DatabaseManager()
+    db.set_operation_mode_binary(str(tmp_path / "binary"))
+    assert db.get_content_hashes() == database_json.get_content_hashes()
+
+def test_trusted_load(tmp_path):
+    """Saved and unchanged transistor files are loaded without validity checks, with the same result."""
+    shutil.copy(database_transistor_path, tmp_path)
+    db = DatabaseManager(cache_size=0)
+    db.set_operation_mode_json(str(tmp_path))
+    untrusted_transistor = db.load_transistor("CREE_C3M0016120K")
+    db.save_transistor(untrusted_transistor, overwrite=True)
+
+    db = DatabaseManager(cache_size=0)
+    db.set_operation_mode_json(str(tmp_path))
+    file_path = str(tmp_path / "CREE_C3M0016120K.json")
+    summary_entry = db._get_current_summary_entry(file_path, os.stat(file_path))
+    assert summary_entry["validated_hash"] == summary_entry["content_hash"]
+    trusted_transistor = db.load_transistor("CREE_C3M0016120K")
+    assert trusted_transistor.convert_to_dict() == untrusted_transistor.convert_to_dict()
+
+    # A hand-edited file is validated again
+    with open(file_path, "a") as fd:
+        fd.write("\n")
+    assert db._get_current_summary_entry(file_path, os.stat(file_path)) is None
+    assert db.load_transistor("CREE_C3M0016120K").convert_to_dict() == untrusted_transistor.convert_to_dict()
+
+def test_trusted_load_benchmark(tmp_path):
+    """Loading a file validated on save without validity checks is faster than the validated load."""
+    import time
+    shutil.copy(database_transistor_path, tmp_path)
+    db = DatabaseManager(cache_size=0)
+    db.set_operation_mode_json(str(tmp_path))
+    db.save_transistor(db.load_transistor("CREE_C3M0016120K"), overwrite=True)
+
+    timings = {}
+    for trusted_load in [False, True]:
+        db = DatabaseManager(cache_size=0, trusted_load=trusted_load)
+        db.set_operation_mode_json(str(tmp_path))
+        durations = []
+        for _ in range(10):
+            start = time.perf_counter()
+            db.load_transistor("CREE_C3M0016120K")
+            durations.append(time.perf_counter() - start)
+        timings[trusted_load] = min(durations)
+    assert timings[True] < timings[False]
+
+@pytest.mark.parametrize("serializer", list(JSON_SERIALIZERS))
+@pytest.mark.parametrize("indent", [2, None])
+def test_export_single_transistor_to_json(tmp_path, database_json: DatabaseManager, serializer, indent):
+    """All serializers write the same data, numpy arrays are written directly."""
+    transistor = database_json.load_transistor("CREE_C3M0016120K")
+    file_path = str(tmp_path / "transistor.json")
+    DatabaseManager.export_single_transistor_to_json(transistor, file_path, indent=indent, serializer=serializer)
+    with open(file_path, "r") as fd:
+        content = fd.read()
+    assert ("\n" in content) == (indent is not None)
+    assert json.loads(content) == json.loads(json.dumps(transistor.convert_to_dict()))
+    assert os.listdir(tmp_path) == ["transistor.json"]
+
+def test_export_single_transistor_to_json_atomic(tmp_path, database_json: DatabaseManager):
+    """A failing write keeps the existing file."""
+    def failing_dumps(data, indent):
+        raise RuntimeError("disk full")
+
+    register_json_serializer("failing", failing_dumps)
+    transistor = database_json.load_transistor("CREE_C3M0016120K")
+    file_path = str(tmp_path / "transistor.json")
+    DatabaseManager.export_single_transistor_to_json(transistor, file_path)
+    with open(file_path, "r") as fd:
+        content = fd.read()
+    try:
+        with pytest.raises(RuntimeError):
+            DatabaseManager.export_single_transistor_to_json(transistor, file_path, serializer="failing")
+    finally:
+        del JSON_SERIALIZERS["failing"]
+    with open(file_path, "r") as fd:
+        assert fd.read() == content
+    assert os.listdir(tmp_path) == ["transistor.json"]
+
+def test_save_transistor_json_benchmark(tmp_path):
+    """The orjson serializer (if installed) writes the json files faster than the json serializer of the standard library."""
+    import time
+    shutil.copy(database_transistor_path, tmp_path)
+    db = DatabaseManager()
+    db.set_operation_mode_json(str(tmp_path))
+    transistor = db.load_transistor("CREE_C3M0016120K")
+    timings = {}
+    for serializer in JSON_SERIALIZERS:
+        durations = []
+        for _ in range(10):
+            start = time.perf_counter()
+            DatabaseManager.export_single_transistor_to_json(transistor, str(tmp_path / "export.json"), serializer=serializer)
+            durations.append(time.perf_counter() - start)
+        timings[serializer] = min(durations)
+    if "orjson" in timings:
+        assert timings["orjson"] < timings["json"]
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_load_many_json(tmp_path, workers):
+    """load_many() and iter_transistors() return the same objects as load_transistor(), also with worker processes."""
+    shutil.copy(database_transistor_path, tmp_path)
+    shutil.copy(fixed_transistor_path, tmp_path)
+    db = DatabaseManager()
+    db.set_operation_mode_json(str(tmp_path))
+
+    transistors = db.load_many(["CREE_C3M0060065J", "missing", "CREE_C3M0016120K"], workers=workers)
+    assert transistors[1] is None
+    assert transistors[0] == db.load_transistor("CREE_C3M0060065J")
+    assert transistors[2] == db.load_transistor("CREE_C3M0016120K")
+
+    assert sorted(transistor.name for transistor in db.iter_transistors(workers=workers)) == ["CREE_C3M0016120K", "CREE_C3M0060065J"]
+    assert [transistor.name for transistor in db.iter_transistors({"v_abs_max": 1200}, workers=workers)] == ["CREE_C3M0016120K"]
+
+def test_save_many_json(tmp_path, database_json: DatabaseManager):
+    """save_many() skips, overwrites or copies existing transistors."""
+    db = DatabaseManager()
+    db.set_operation_mode_json(str(tmp_path))
+    transistors = [database_json.load_transistor("CREE_C3M0016120K")]
+    with open(fixed_transistor_path, "r") as fd:
+        transistors.append(db.convert_dict_to_transistor_object(json.load(fd)))
+
+    assert db.save_many(transistors) == ["CREE_C3M0016120K", "CREE_C3M0060065J"]
+    assert db.save_many(transistors[:1]) == []
+    assert db.save_many(transistors[:1], overwrite=True) == ["CREE_C3M0016120K"]
+    copy_names = db.save_many(transistors[:1], overwrite=False)
+    assert len(copy_names) == 1 and copy_names[0] != "CREE_C3M0016120K"
+    assert sorted(db.get_transistor_names_list()) == sorted(["CREE_C3M0016120K", "CREE_C3M0060065J"] + copy_names)
+    assert db.load_many(["CREE_C3M0016120K", "CREE_C3M0060065J"]) == transistors
+
+def test_save_load_many_mongodb(database_json: DatabaseManager, mongomock_collection):
+    """save_many() uses one bulk write, load_many() and iter_transistors() one query in mongodb mode."""
+    fake_collection = mongomock_collection
+    with patch("transistordatabase.database_manager.connect_local_tdb", return_value=fake_collection):
+        db = DatabaseManager()
+        db.set_operation_mode_mongodb()
+    transistors = [database_json.load_transistor("CREE_C3M0016120K")]
+    with open(fixed_transistor_path, "r") as fd:
+        transistors.append(db.convert_dict_to_transistor_object(json.load(fd)))
+
+    with patch.object(fake_collection, "bulk_write", wraps=fake_collection.bulk_write) as bulk_write:
+        assert db.save_many(transistors) == ["CREE_C3M0016120K", "CREE_C3M0060065J"]
+        assert db.save_many(transistors, overwrite=True) == ["CREE_C3M0016120K", "CREE_C3M0060065J"]
+    assert bulk_write.call_count == 2
+    assert fake_collection.count_documents({}) == 2
+
+    assert db.load_many(["CREE_C3M0060065J", "missing", "CREE_C3M0016120K"]) == [transistors[1], None, transistors[0]]
+    assert [transistor.name for transistor in db.iter_transistors({"v_abs_max": 1200})] == ["CREE_C3M0016120K"]
+
+def test_load_all(tmp_path, monkeypatch):
+    """load_all() returns the transistors sorted by name, with and without worker processes."""
+    shutil.copy(database_transistor_path, tmp_path)
+    shutil.copy(fixed_transistor_path, tmp_path)
+    db = DatabaseManager(cache_size=0)
+    db.set_operation_mode_json(str(tmp_path))
+    serial_transistors = db.load_all(workers=0)
+    assert [transistor.name for transistor in serial_transistors] == ["CREE_C3M0016120K", "CREE_C3M0060065J"]
+
+    # Small libraries are loaded serially
+    with patch("transistordatabase.database_manager.ProcessPoolExecutor") as executor:
+        assert db.load_all(workers=2) == serial_transistors
+    executor.assert_not_called()
+
+    monkeypatch.setattr("transistordatabase.database_manager.PARALLEL_LOAD_MIN_COUNT", 2)
+    monkeypatch.setattr("transistordatabase.database_manager.os.cpu_count", lambda: 2)
+    assert db.load_all(workers=2) == serial_transistors
+
+@pytest.mark.parametrize("count", [0, pytest.param(1000, marks=benchmark)])
+def test_load_all_benchmark(tmp_path, count):
+    """load_all() with worker processes returns the same transistors and is faster than the serial load for a large synthetic library."""
+    import time
+    shutil.copy(database_transistor_path, tmp_path)
+    shutil.copy(fixed_transistor_path, tmp_path)
+    with open(database_transistor_path, "r") as fd:
+        transistor_dict = json.load(fd)
+    for index in range(count):
+        transistor_dict["name"] = f"SYNTHETIC_{index:04d}"
+        with open(tmp_path / f"{transistor_dict['name']}.json", "w") as fd:
+            json.dump(transistor_dict, fd)
+
+    transistors = {}
+    timings = {}
+    for workers in [0, 4]:
+        db = DatabaseManager(cache_size=0)
+        db.set_operation_mode_json(str(tmp_path))
+        start = time.perf_counter()
+        transistors[workers] = db.load_all(workers=workers)
+        timings[workers] = time.perf_counter() - start
+    assert len(transistors[0]) == count + 2
+    assert [transistor.name for transistor in transistors[4]] == [transistor.name for transistor in transistors[0]]
+    if count and (os.cpu_count() or 1) > 1:
+        assert timings[4] < timings[0]
+
+def test_mongodb_indexes(database_json: DatabaseManager, mongomock_collection):
+    """The mongodb collection gets a unique name index and secondary indexes, names are listed with a projection."""
+    import pymongo
+    with patch("transistordatabase.database_manager.connect_local_tdb", return_value=mongomock_collection):
+        db = DatabaseManager()
+        db.set_operation_mode_mongodb()
+    index_information = mongomock_collection.index_information()
+    assert index_information["name_1"]["unique"]
+    assert {"type_1", "manufacturer_1", "v_abs_max_1", "i_cont_1"} <= set(index_information)
+
+    transistor = database_json.load_transistor("CREE_C3M0016120K")
+    db.save_transistor(transistor)
+    with pytest.raises(pymongo.errors.DuplicateKeyError):
+        mongomock_collection.insert_one({"name": "CREE_C3M0016120K"})
+    # Upsert by name: no second document
+    db.save_transistor(transistor, overwrite=True)
+    assert db.get_transistor_names_list() == ["CREE_C3M0016120K"]
+    db.delete_transistor("CREE_C3M0016120K")
+    assert db.get_transistor_names_list() == []
+    assert db.load_transistor("CREE_C3M0016120K") is None
+
+def test_shared_mongodb_client():
+    """Connections to the same host share one MongoClient."""
+    from transistordatabase import mongodb_handling
+    with patch("pymongo.MongoClient", mongomock.MongoClient):
+        collection = mongodb_handling.connect_tdb("local")
+        assert mongodb_handling.connect_tdb("local").database.client is collection.database.client
+        assert mongodb_handling.connect_local_tdb().database.client is mongodb_handling.get_mongodb_client(mongodb_handling.LOCAL_MONGODB_HOST, 1)
+        mongodb_handling.close_mongodb_clients()
+        assert mongodb_handling.connect_tdb("local").database.client is not collection.database.client
+        mongodb_handling.close_mongodb_clients()
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_export_many(tmp_path, monkeypatch, workers):
+    """export_many() writes the files to the given folder independent of the working directory and reports each transistor."""
+    shutil.copy(database_transistor_path, tmp_path)
+    shutil.copy(fixed_transistor_path, tmp_path)
+    db = DatabaseManager()
+    db.set_operation_mode_json(str(tmp_path))
+    monkeypatch.setattr("transistordatabase.database_manager.os.cpu_count", lambda: 2)
+    working_directory = tmp_path / "cwd"
+    working_directory.mkdir()
+    monkeypatch.chdir(working_directory)
+
+    report = db.export_many(["CREE_C3M0060065J", "CREE_C3M0016120K", "Unknown"], "exports", formats=["json", "geckocircuits", "simulink"],
+                            workers=workers)
+    assert [part["name"] for part in report] == ["CREE_C3M0060065J", "CREE_C3M0016120K", "Unknown"]
+    for part in report[:2]:
+        assert part["formats"]["json"]["files"] == [f"{part['name']}.json"]
+        assert part["formats"]["geckocircuits"]["success"]
+        # The simulink exporter only supports IGBTs and prints its error
+        assert not part["formats"]["simulink"]["success"] and not part["success"]
+        assert "Simulink exporter failed" in part["log"]
+    assert not report[2]["success"] and "not found" in report[2]["error"]
+    exported_files = os.listdir(working_directory / "exports")
+    assert sorted(file for file in exported_files if file.endswith(".json")) == ["CREE_C3M0016120K.json", "CREE_C3M0060065J.json"]
+    assert len(exported_files) == 6
+
+    with pytest.raises(ValueError):
+        db.export_many(None, tmp_path / "exports", formats=["spice"])
+
+def test_export_cli(tmp_path, capsys):
+    """The tdb-export console script exports all transistors of a database folder."""
+    from transistordatabase.export_cli import main
+    shutil.copy(fixed_transistor_path, tmp_path)
+    assert main(["--json-folder", str(tmp_path), "-o", str(tmp_path / "exports"), "-f", "json", "plecs", "-w", "0",
+                 "--report", str(tmp_path / "report.json")]) == 0
+    assert "OK      CREE_C3M0060065J" in capsys.readouterr().out
+    assert sorted(os.listdir(tmp_path / "exports")) == ["CREE_C3M0060065J.json", "CREE_C3M0060065J_switch.xml"]
+    with open(tmp_path / "report.json") as fd:
+        assert json.load(fd)[0]["formats"]["plecs"]["success"]
@@ -9,6 +9,9 @@ from unittest.mock import patch
 import os
 import json
 
+# Long running benchmarks are opt-in
+benchmark = pytest.mark.skipif(not os.environ.get("TDB_BENCHMARK"), reason="benchmark, set TDB_BENCHMARK=1 to run it")
+
 ################
 # DEPRECATED - May not work since refactoring
 ################
@@ -610,3 +613,454 @@ def test_get_object_r_e_simplified(my_transistor):
     r_e_object = transistor.get_object_r_e_simplified("e_off", 200, 60, 600, 10)
     assert r_e_object.t_j == 25
     assert r_e_object.v_g == 15
+
+
+def test_calc_lin_channel_batch(my_transistor):
+    """Unit test for calc_lin_channel_batch, compared to calc_lin_channel."""
+    transistor_args, switch_args, diode_args = my_transistor
+    transistor = tdb.Transistor(transistor_args, switch_args, diode_args, possible_housing_types=['TO247'],
+                                possible_module_manufacturers=["Fuji Electric"])
+    i_channel = np.linspace(1, 190, 50)
+    for switch_or_diode in ['switch', 'diode']:
+        v_channel, r_channel = transistor.calc_lin_channel_batch(25, 15, i_channel, switch_or_diode)
+        expected = [transistor.calc_lin_channel(25, 15, i, switch_or_diode) for i in i_channel]
+        assert v_channel == approx([v for v, _ in expected])
+        assert r_channel == approx([r for _, r in expected])
+    # The interpolation table is cached on the switch object, but not exported
+    assert transistor.switch.get_channel_interpolation_table(25, 15) is transistor.switch.get_channel_interpolation_table(25, 15)
+    assert '_channel_interpolation_tables' not in transistor.switch.convert_to_dict()
+
+    with pytest.raises(ValueError):
+        transistor.calc_lin_channel_batch(25, 15, [10, 1000], 'switch')
+    with pytest.raises(ValueError):
+        transistor.calc_lin_channel_batch(100, 15, i_channel, 'switch')
+
+
+def test_operating_point_index(my_transistor):
+    """Unit test for the operating point index of the switch and diode objects."""
+    transistor_args, switch_args, diode_args = my_transistor
+    transistor = tdb.Transistor(transistor_args, switch_args, diode_args, possible_housing_types=['TO247'],
+                                possible_module_manufacturers=["Fuji Electric"])
+    channel_index = transistor.switch.get_operating_point_index('channel')
+    assert transistor.switch.get_operating_point_index('channel') is channel_index
+    assert channel_index.find_exact(t_j=25, v_g=15) == [transistor.switch.channel[0]]
+    assert channel_index.find_exact(t_j=150, v_g=15) == []
+
+    # Nearest neighbour: for equal distances, the first dataset is taken
+    index = tdb.OperatingPointIndex([tdb.ChannelData({'t_j': t_j, 'v_g': v_g, 'graph_v_i': np.array([[0, 1], [0, 1]])})
+                                     for t_j, v_g in [(25, 15), (150, 15), (25, 15), (100, 10)]])
+    assert index.find_nearest(30, 15) is index.datasets[0]
+    assert index.find_nearest(140, 10, normalize_t_to_v=10) is index.datasets[3]
+    assert index.find_nearest(140, 10, normalize_t_to_v=1) is index.datasets[1]
+    assert index.find_nearest(25, 15, dataset_type='graph_i_e') is None
+
+    # Adding datasets rebuilds the index
+    transistor.switch.channel.append(tdb.ChannelData({'t_j': 150, 'v_g': 15, 'graph_v_i': switch_args['channel'][0]['graph_v_i']}))
+    assert len(transistor.switch.get_operating_point_index('channel').find_exact(t_j=150, v_g=15)) == 1
+    channel, e_on, e_off = transistor.switch.find_approx_wp(140, 15)
+    assert channel is transistor.switch.channel[-1]
+    assert '_operating_point_indexes' not in transistor.switch.convert_to_dict()
+
+
+def test_evaluate_working_points(my_transistor):
+    """Unit test for evaluate_working_points, compared to update_wp."""
+    transistor_args, switch_args, diode_args = my_transistor
+    transistor = tdb.Transistor(transistor_args, switch_args, diode_args, possible_housing_types=['TO247'],
+                                possible_module_manufacturers=["Fuji Electric"])
+    graph_v_i = np.array(switch_args['channel'][0]['graph_v_i'])
+    transistor.switch.channel.append(tdb.ChannelData({'t_j': 150, 'v_g': 15, 'graph_v_i': np.array([graph_v_i[0] * 1.3, graph_v_i[1]])}))
+    t_j = np.array([25, 140, 30, 160])
+    i_channel = np.array([10, 50, 100, 150])
+    result = transistor.evaluate_working_points(t_j, 15, i_channel, v_supply=[3, 3, 4, np.nan])
+    assert result.dtype == tdb.WORKING_POINT_DTYPE
+    assert list(result['switch_channel_index']) == [0, 1, 0, 1]
+    assert list(result['e_rr_index']) == [0, 0, 0, 0]
+    for working_point in result:
+        transistor.update_wp(working_point['t_j'], working_point['v_g'], working_point['i_channel'])
+        assert working_point['switch_v_channel'] == approx(transistor.wp.switch_v_channel)
+        assert working_point['switch_r_channel'] == approx(transistor.wp.switch_r_channel)
+        assert working_point['diode_v_channel'] == approx(transistor.wp.diode_v_channel)
+        assert working_point['diode_r_channel'] == approx(transistor.wp.diode_r_channel)
+    assert result['e_oss'][:3] == approx(np.interp([3, 3, 4], *transistor.calc_v_eoss()))
+    assert np.isnan(result['q_oss'][3])
+    assert '_c_oss_integrals' not in transistor.convert_to_dict()
+
+    result = transistor.evaluate_working_points(t_j, 15, i_channel, switch_or_diode='switch')
+    assert np.all(result['diode_channel_index'] == -1) and np.all(np.isnan(result['diode_r_channel']))
+
+
+def test_resampled_curves():
+    """Unit test for the shared curve resampling of the exporters, compared to np.interp per curve."""
+    tdb_json = tdb.DatabaseManager()
+    tdb_json.set_operation_mode_json()
+    with open('master_data/test_data_Fuji_2MBI400XBE065-50.json', "r") as fd:
+        transistor = tdb_json.convert_dict_to_transistor_object(json.load(fd))
+    e_on = transistor.switch.get_resampled_curves('e_on', 15)
+    assert e_on['energy'].shape == (len(e_on['t_j']), len(e_on['v_supply']), 20)
+    assert list(e_on['t_j']) == sorted(e_on['t_j'])
+    for dataset in transistor.switch.e_on:
+        if dataset.v_g == 15 and dataset.dataset_type == 'graph_i_e':
+            t_j_index, v_supply_index = list(e_on['t_j']).index(dataset.t_j), list(e_on['v_supply']).index(dataset.v_supply)
+            assert e_on['energy'][t_j_index, v_supply_index] == approx(np.interp(e_on['current'], *dataset.graph_i_e))
+    assert e_on['current'][-1] <= min(np.max(dataset.graph_i_e[0]) for dataset in transistor.switch.e_on if dataset.dataset_type == 'graph_i_e')
+    assert transistor.switch.get_resampled_curves('e_on', 100) is None
+
+    channel = transistor.diode.get_resampled_curves('channel', None, n_points=10)
+    assert channel['voltage'][0] == approx(np.interp(channel['current'], np.abs(transistor.diode.channel[0].graph_v_i[1]),
+                                                     np.abs(transistor.diode.channel[0].graph_v_i[0])))
+    with pytest.raises(ValueError):
+        channel['voltage'][0, 0] = 1
+
+    # Cached for all exporters, rebuilt if the dataset list changes, not exported
+    assert transistor.switch.get_resampled_curves('e_on', 15) is e_on
+    transistor.switch.e_on = transistor.switch.e_on[:1]
+    assert transistor.switch.get_resampled_curves('e_on', 15) is not e_on
+    assert '_resampled_curves' not in transistor.switch.convert_to_dict()
+    transistor.switch.invalidate_operating_point_index()
+    assert '_resampled_curves' not in transistor.switch.__dict__
+
+    switch_data, diode_data = transistor.get_curve_data(True, [])
+    assert len(switch_data['ConductionLoss']['Channel']) == len(switch_data['ConductionLoss']['TemperatureAxis'])
+    assert diode_data['TurnOffLoss']['TemperatureAxis'] == sorted(diode_data['TurnOffLoss']['TemperatureAxis'])
+
+
+def test_export_datasheet_pdf(my_transistor, tmp_path):
+    """Unit test for the headless virtual datasheet export, which does not need a Qt application."""
+    transistor_args, switch_args, diode_args = my_transistor
+    transistor = tdb.Transistor(transistor_args, switch_args, diode_args, possible_housing_types=['TO247'],
+                                possible_module_manufacturers=["Fuji Electric"])
+    trans, diode, switch = transistor.get_datasheet_data()
+    assert trans['Name'] == ['Test-Transistor', None]
+    transistor.export_datasheet_pdf(str(tmp_path))
+    assert os.listdir(tmp_path) == ['Test-Transistor.pdf']
+    with open(tmp_path / 'Test-Transistor.pdf', 'rb') as fd:
+        assert fd.read(5) == b'%PDF-'
+    # The page figure is reused for all pages and datasheets
+    from transistordatabase import datasheet_pdf
+    assert datasheet_pdf._get_page_figure() is datasheet_pdf._get_page_figure()
+
+
+def test_plot_cache(my_transistor, tmp_path):
+    """Unit test for the plot cache: unchanged plots are not rendered again, changed data is rendered, old plots are evicted."""
+    transistor_args, switch_args, diode_args = my_transistor
+    transistor = tdb.Transistor(transistor_args, switch_args, diode_args, possible_housing_types=['TO247'],
+                                possible_module_manufacturers=["Fuji Electric"])
+    cache_folder = tmp_path / "plots"
+    default_folder = tdb.get_plot_cache_folder()
+    try:
+        tdb.set_plot_cache(str(cache_folder))
+        image = transistor.switch.thermal_foster.get_plots(True)
+        with patch("transistordatabase.data_classes.get_img_raw_data") as render:
+            assert transistor.switch.thermal_foster.get_plots(True) == image
+        render.assert_not_called()
+        # Numeric keys of categorized plots are kept
+        channel_plots = transistor.switch.plot_all_channel_data(True)
+        assert transistor.switch.plot_all_channel_data(True) == channel_plots
+
+        transistor.switch.thermal_foster.graph_t_rthjc = transistor.switch.thermal_foster.graph_t_rthjc * 2
+        statistics = tdb.get_plot_cache_statistics()
+        assert transistor.switch.thermal_foster.get_plots(True) != image
+        assert tdb.get_plot_cache_statistics()["misses"] == statistics["misses"] + 1
+        assert len(os.listdir(cache_folder)) == 3
+
+        # Changed matplotlib settings are rendered again
+        import matplotlib
+        with matplotlib.rc_context({"font.size": 5}):
+            statistics = tdb.get_plot_cache_statistics()
+            transistor.switch.thermal_foster.get_plots(True)
+            assert tdb.get_plot_cache_statistics()["misses"] == statistics["misses"] + 1
+
+        # The cache folder is only scanned if the tracked size exceeds the maximum size
+        with patch("transistordatabase.plot_cache._evict_plots", wraps=tdb.plot_cache._evict_plots) as evict_plots:
+            transistor.diode.thermal_foster.get_plots(True)
+        evict_plots.assert_not_called()
+
+        # Least recently used plots are deleted
+        tdb.set_plot_cache(str(cache_folder), max_size=max(os.path.getsize(cache_folder / name) for name in os.listdir(cache_folder)))
+        transistor.switch.plot_energy_data(True)
+        assert len(os.listdir(cache_folder)) == 1
+        tdb.clear_plot_cache()
+        assert os.listdir(cache_folder) == []
+    finally:
+        tdb.set_plot_cache(default_folder)
+
+    # The plot cache can be disabled by an environment variable
+    import subprocess
+    import sys
+    output = subprocess.run([sys.executable, "-c", "import transistordatabase; print(transistordatabase.get_plot_cache_folder())"],
+                            capture_output=True, text=True, check=True, env=dict(os.environ, TDB_PLOT_CACHE_FOLDER="none"),
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout.splitlines()
+    assert output[-1] == "None"
+
+
+@pytest.mark.parametrize("topology, v_out, i_peak, p1, p2", [
+    ('buck', 200, [499.44150834, 705.93818655, 631.54633283], [783.81973297, 1259.22127289, 1144.27511828],
+     [18.31557048, 74.98108005, 139.93347112]),
+    ('boost', 600, [333.6003333, 471.77207713, 421.99817637], [727.56420292, 1095.9914658, 967.97148312], [9.31372883, 37.59893498, 72.7512471]),
+    ('buck_boost', 300, [534.45940203, 755.7299132, 675.94221363], [1499.9023826, 2383.44053432, 2090.03096591],
+     [17.08651067, 75.13390623, 126.28740566])])
+def test_converter_loss_engine(topology, v_out, i_peak, p1, p2):
+    """Unit test for the converter loss engine, compared to the results of the former topology calculator functions."""
+    tdb_json = tdb.DatabaseManager()
+    tdb_json.set_operation_mode_json()
+    with open('master_data/test_data_Fuji_2MBI400XBE065-50.json', "r") as fd:
+        transistor = tdb_json.convert_dict_to_transistor_object(json.load(fd))
+    engine = tdb.ConverterLossEngine(topology, transistor, transistor, v_g_on1=15)
+    zeta, p_out = np.array([0.002, 0.01, 0.05]), np.array([500, 5000, 20000])
+    results = engine.calculate(zeta, 400, v_out, p_out, frequency=20, r_g_on1=3.3, r_g_off1=3.3, t_heatsink=40, r_th_heatsink=0.1)
+    assert list(results) == tdb.CONVERTER_QUANTITIES
+    assert results['i_peak'] == approx(i_peak)
+    assert results['p1'] == approx(p1)
+    assert results['p2'] == approx(p2)
+    assert results['p1'] == approx(results['conduction_losses1'] + results['p_on1'] + results['p_off1'])
+    # The diode temperature includes the conduction losses of the diode in all topologies
+    assert results['t_diode2'] == approx(40 + results['p2'] * (transistor.diode.thermal_foster.r_th_total + transistor.r_th_cs + 0.1))
+    # The working point of the transistor is not changed by the engine
+    assert transistor.wp.e_on is None and transistor.wp.e_rr is None
+
+    # Currents and switching energies are memoized per mesh and shared by all quantities
+    assert engine.get_operating_point(zeta, 400, v_out, p_out) is engine.get_operating_point(zeta, np.full(3, 400), v_out, p_out)
+    with patch.object(transistor, 'calc_lin_channel_batch') as calc_lin_channel_batch:
+        assert engine.calculate(zeta, 400, v_out, p_out, quantities=['i1_rms'])['i1_rms'] == approx(results['i1_rms'])
+    calc_lin_channel_batch.assert_not_called()
+    memoized_engine = tdb.get_converter_loss_engine(topology, transistor, transistor, 15)
+    assert tdb.get_converter_loss_engine(topology, transistor, transistor, 15) is memoized_engine
+    # Changed datasets create a new engine
+    transistor.switch.channel = transistor.switch.channel[:1]
+    assert tdb.get_converter_loss_engine(topology, transistor, transistor, 15) is not memoized_engine
+    memoized_engine = tdb.get_converter_loss_engine(topology, transistor, transistor, 15)
+    transistor.switch.channel[0].graph_v_i = transistor.switch.channel[0].graph_v_i * 2
+    transistor.switch.invalidate_operating_point_index()
+    assert tdb.get_converter_loss_engine(topology, transistor, transistor, 15) is not memoized_engine
+    with pytest.raises(ValueError):
+        engine.calculate(zeta, 400, v_out, p_out, quantities=['t_switch1'])
+
+
+@pytest.mark.parametrize("converter_name, v_out, i_peak, p1, p2, t_switch1", [
+    ('buck', 200, [14.141147203, 64.780010393, 200.3591883502, 446.9166585114, 631.5463328304],
+     [39.4086673539, 142.8487799545, 300.5975400409, 715.4882268798, 1144.2751182805],
+     [0.2124216668, 2.5380530629, 18.2760048535, 78.1545170062, 139.9334711227],
+     [48.3152288117, 70.1410925704, 103.4260809486, 190.9680158716, 281.4420499572]),
+    ('boost', 600, [9.4325212628, 43.2235367281, 133.7438939027, 298.4809207239, 421.9981763697],
+     [39.4211053499, 162.6657328552, 328.8186359362, 655.6372374431, 967.9714831214],
+     [0.1040002372, 1.3833101325, 9.8995131538, 39.41202466, 72.7512470959],
+     [48.3178532288, 74.3224696324, 109.3807321825, 178.3394571005, 244.2419829386]),
+    ('buck_boost', 300, [15.120815528, 69.2768613767, 214.3154002275, 478.2001957195, 675.9422136254],
+     [73.7285860089, 262.0451726464, 549.2320842256, 1315.8432218178, 2090.0309659102],
+     [0.1918435845, 2.2969559701, 16.7093114601, 70.1061651295, 126.2874056635],
+     [55.5567316479, 95.2915314284, 155.8879697716, 317.6429198036, 480.9965338071])])
+def test_converter_functions_vectorized(converter_name, v_out, i_peak, p1, p2, t_switch1):
+    """Unit test for the f_vec_* functions of the topology calculator for a 10k point sweep, compared to the results of the former loop implementation."""
+    import importlib
+    converter = importlib.import_module(f"transistordatabase.gui.{converter_name}_converter_functions")
+    tdb_json = tdb.DatabaseManager()
+    tdb_json.set_operation_mode_json()
+    with open('master_data/test_data_Fuji_2MBI400XBE065-50.json', "r") as fd:
+        transistor = tdb_json.convert_dict_to_transistor_object(json.load(fd))
+    p_out = np.linspace(10, 20000, 10000)
+    zeta, v_in, v_out, frequency = np.full_like(p_out, 0.05), np.full_like(p_out, 400), np.full_like(p_out, v_out), np.full_like(p_out, 20)
+    reference_points = [0, 100, 1000, 5000, 9999]
+    vec_t_switch1 = converter.f_vec_t_switch1(zeta, v_in, v_out, p_out, 15, 3.3, 3.3, 40, 0.1, frequency, transistor, transistor)
+    assert vec_t_switch1.shape == p_out.shape
+    assert vec_t_switch1[reference_points] == approx(t_switch1)
+    assert converter.f_vec_i_peak(zeta, v_in, v_out, p_out, 15, transistor, transistor)[reference_points] == approx(i_peak)
+    assert converter.f_vec_p1(zeta, v_in, v_out, p_out, 15, 3.3, 3.3, frequency, transistor, transistor)[reference_points] == approx(p1)
+    assert converter.f_vec_p2(zeta, v_in, v_out, p_out, 15, frequency, transistor, transistor)[reference_points] == approx(p2)
+
+    # Like the former loop implementation, the channel data of NaN currents is NaN
+    channel = converter.f_vec_calc_channel(np.array([np.nan, 50]), 15, transistor, transistor)
+    assert len(channel) == 5
+    assert np.all(np.isnan([values[0] for values in channel]))
+    assert [values[1] for values in channel] == approx([0.66379125, 0.53396, 0.003518465, 0.487868, 0.53396])
+
+@benchmark
+def test_converter_functions_vectorized_benchmark():
+    """The f_vec_* functions calculate a 10k point sweep faster than 100 single point calls."""
+    import time
+    from transistordatabase.gui import buck_converter_functions
+    tdb_json = tdb.DatabaseManager()
+    tdb_json.set_operation_mode_json()
+    with open('master_data/test_data_Fuji_2MBI400XBE065-50.json', "r") as fd:
+        transistor = tdb_json.convert_dict_to_transistor_object(json.load(fd))
+    p_out = np.linspace(10, 20000, 10000)
+    zeta, v_in, v_out, frequency = np.full_like(p_out, 0.05), np.full_like(p_out, 400), np.full_like(p_out, 200), np.full_like(p_out, 20)
+    # the channel tables and loss curves of the transistor pair are calculated once per engine, not part of the comparison
+    buck_converter_functions.f_vec_t_switch1(zeta[:1], v_in[:1], v_out[:1], p_out[:1], 15, 3.3, 3.3, 40, 0.1, frequency[:1], transistor, transistor)
+
+    start = time.perf_counter()
+    buck_converter_functions.f_vec_t_switch1(zeta, v_in, v_out, p_out, 15, 3.3, 3.3, 40, 0.1, frequency, transistor, transistor)
+    sweep_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    for point in range(50, 10000, 100):
+        buck_converter_functions.f_vec_t_switch1(zeta[point:point + 1], v_in[point:point + 1], v_out[point:point + 1], p_out[point:point + 1],
+                                                 15, 3.3, 3.3, 40, 0.1, frequency[point:point + 1], transistor, transistor)
+    assert sweep_duration < time.perf_counter() - start
+
+
+def test_converter_sweep():
+    """Unit test for the converter design-space sweep: same results in worker processes, non-dominated Pareto front."""
+    tdb_json = tdb.DatabaseManager()
+    tdb_json.set_operation_mode_json()
+    with open('master_data/test_data_Fuji_2MBI400XBE065-50.json', "r") as fd:
+        transistor = tdb_json.convert_dict_to_transistor_object(json.load(fd))
+    pairs = [(transistor, transistor), (transistor, transistor, 2, 1), (transistor, transistor, 2, 2)]
+    grid = {'zeta': [0.01, 0.05], 'v_in': 400, 'v_out': 200, 'p_out': [500, 5000, 20000], 'frequency': [10, 20], 't_heatsink': 40,
+            'r_th_heatsink': 0.1, 'v_g_on1': 15, 'r_g_on1': 3.3, 'r_g_off1': 3.3}
+    progress = []
+    results, pareto_front = tdb.sweep('buck', pairs, grid, workers=0, progress_callback=lambda *arguments: progress.append(arguments))
+    assert [(done, total) for done, total, _ in progress] == [(1, 3), (2, 3), (3, 3)]
+    # The streamed rows have the columns of the result table
+    for _, _, table in progress:
+        assert list(table) == list(results)
+    assert list(progress[1][2]['pair']) == [1] * 12
+    assert len(results['p_total']) == 3 * 12
+    assert list(results['part_count']) == [2] * 12 + [3] * 12 + [4] * 12
+    assert results['p_total'] == approx(results['p1'] + results['p2'])
+    assert np.all(np.isfinite(results['t_j_max']))
+
+    # Same results as the converter loss engine for the single pair
+    engine = tdb.ConverterLossEngine('buck', transistor, transistor, 15)
+    single = engine.calculate(results['zeta'][:12], results['v_in'][:12], results['v_out'][:12], results['p_out'][:12],
+                              frequency=results['frequency'][:12], r_g_on1=3.3, r_g_off1=3.3, t_heatsink=40, r_th_heatsink=0.1)
+    assert results['p1'][:12] == approx(single['p1'])
+
+    # The transistor objects are sent to the worker processes once, the pairs refer to them by index
+    from concurrent.futures import ProcessPoolExecutor
+    with patch('os.cpu_count', return_value=2), patch.object(ProcessPoolExecutor, 'submit', autospec=True, side_effect=ProcessPoolExecutor.submit) as submit:
+        parallel_results, parallel_pareto_front = tdb.sweep('buck', pairs, grid, workers=2)
+    assert sorted(call.args[2:] for call in submit.call_args_list) == [(0, 0, 1, 1), (0, 0, 2, 1), (0, 0, 2, 2)]
+    for column in results:
+        assert list(parallel_results[column]) == approx(list(results[column])) if results[column].dtype != object else \
+            list(parallel_results[column]) == list(results[column])
+    assert list(parallel_pareto_front['pair']) == list(pareto_front['pair'])
+
+    objectives = np.column_stack([results[objective] for objective in tdb.SWEEP_OBJECTIVES])
+    front = np.column_stack([pareto_front[objective] for objective in tdb.SWEEP_OBJECTIVES])
+    assert 0 < len(front) < len(objectives)
+    for point in front:
+        assert not np.any(np.all(objectives <= point, axis=1) & np.any(objectives < point, axis=1))
+    for point in objectives:
+        assert np.any(np.all(front <= point, axis=1))
+    with pytest.raises(ValueError):
+        tdb.sweep('buck', pairs, {'zeta': 0.01})
+
+
+def test_plot_worker_pool():
+    """Unit test for the GUI plot worker pool: progressive rendering, caching by the plot inputs and cancellation."""
+    import threading
+    import time
+    from PyQt5.QtCore import QCoreApplication
+    from transistordatabase.gui.plot_workers import PlotWorkerPool
+    app = QCoreApplication.instance() or QCoreApplication([])
+    rendered, failed = [], []
+    pool = PlotWorkerPool(lambda plot_id, result: rendered.append((plot_id, result)), lambda plot_id, message: failed.append((plot_id, message)),
+                          max_thread_count=2)
+
+    def process_events(count):
+        start = time.perf_counter()
+        while len(rendered) + len(failed) < count and time.perf_counter() - start < 10:
+            app.processEvents()
+            time.sleep(0.001)
+
+    def divide(x):
+        return pool.get_shared("numerator", lambda: 12.0) / x
+
+    pool.submit([(plot_id, x, divide, (x,)) for plot_id, x in enumerate([1, 2, 0, 3])])
+    process_events(4)
+    assert sorted(rendered) == [(0, 12.0), (1, 6.0), (3, 4.0)]
+    assert failed[0][0] == 2 and "ZeroDivisionError" in failed[0][1]
+
+    # unchanged inputs are rendered from the cache without a worker
+    rendered.clear()
+    pool.submit([("cached", 2, divide, (2,))])
+    assert rendered == [("cached", 6.0)] and pool.cache_hits == 1
+
+    # results of cancelled plots are cached, but not rendered
+    rendered.clear()
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        return release.wait(10) and "done"
+
+    pool.submit([("slow", "slow", slow, ())])
+    assert started.wait(10)
+    pool.cancel()
+    release.set()
+    pool.wait()
+    app.processEvents()
+    assert rendered == [] and pool.results["slow"] == "done"
+
+    # shared inputs are created once, without blocking the workers which need other inputs
+    created = []
+
+    def create(key, event):
+        created.append(key)
+        assert event.wait(10)
+        return key
+
+    release_a, release_b = threading.Event(), threading.Event()
+    thread_a1 = threading.Thread(target=pool.get_shared, args=("a", lambda: create("a", release_a)))
+    thread_a2 = threading.Thread(target=pool.get_shared, args=("a", lambda: create("a", release_a)))
+    thread_a1.start()
+    thread_a2.start()
+    release_b.set()
+    assert pool.get_shared("b", lambda: create("b", release_b)) == "b"
+    release_a.set()
+    thread_a1.join(10)
+    thread_a2.join(10)
+    assert sorted(created) == ["a", "b"] and pool.get_shared("a", list) == "a"
+    with pytest.raises(ZeroDivisionError):
+        pool.get_shared("c", lambda: 1 / 0)
+    assert pool.get_shared("c", lambda: 1) == 1
+
+    pool.clear_cache()
+    assert len(pool.results) == 0
+
+
+def test_parallel_transistors():
+    """Unit test for parallel_transistors(): scaled curves and thermal models, memoized per transistor content and count."""
+    tdb_json = tdb.DatabaseManager()
+    tdb_json.set_operation_mode_json()
+    with open('master_data/test_data_Fuji_2MBI400XBE065-50.json', "r") as fd:
+        transistor = tdb_json.convert_dict_to_transistor_object(json.load(fd))
+    parallel = tdb_json.parallel_transistors(transistor, 3)
+    assert parallel.name == f"{transistor.name}_3_parallel"
+    assert parallel.i_cont == approx(3 * transistor.i_cont)
+    assert parallel.r_th_cs == approx(transistor.r_th_cs / 3)
+    assert parallel.switch.channel[0].graph_v_i[0] == approx(transistor.switch.channel[0].graph_v_i[0])
+    assert parallel.switch.channel[0].graph_v_i[1] == approx(3 * transistor.switch.channel[0].graph_v_i[1])
+    assert parallel.switch.e_on[0].graph_i_e == approx(3 * transistor.switch.e_on[0].graph_i_e)
+    assert parallel.diode.thermal_foster.r_th_vector == approx(np.array(transistor.diode.thermal_foster.r_th_vector) / 3)
+    # the capacitances are scaled, not repeated
+    assert parallel.c_oss[0].graph_v_c.shape == transistor.c_oss[0].graph_v_c.shape
+    assert parallel.c_oss[0].graph_v_c[1] == approx(3 * transistor.c_oss[0].graph_v_c[1])
+    # the operating point index is built from the scaled curves
+    assert parallel.switch.find_approx_wp(25, 15)[0].graph_v_i[1] == approx(3 * transistor.switch.find_approx_wp(25, 15)[0].graph_v_i[1])
+    assert parallel.calc_v_eoss()[1] == approx(3 * transistor.calc_v_eoss()[1])
+
+    # memoized, but every call returns an independent copy
+    assert tdb_json.parallel_transistors(transistor, 3) is not parallel
+    assert tdb_json.cache_info()["parallel_hits"] == 1
+    assert tdb_json.parallel_transistors(transistor, 3).name == parallel.name
+    assert tdb_json.cache_info()["parallel_hits"] == 2
+    parallel.i_cont = 0
+    assert tdb_json.parallel_transistors(transistor, 3).i_cont == approx(3 * transistor.i_cont)
+    tdb_json.parallel_transistors(transistor, 2)
+    transistor.i_cont *= 2
+    assert tdb_json.parallel_transistors(transistor, 3).i_cont == approx(3 * transistor.i_cont)
+    assert tdb_json.cache_info()["parallel_misses"] == 3
+    tdb_json.clear_cache()
+    assert tdb_json.cache_info()["parallel_size"] == 0
+
+
+def test_import_is_lazy():
+    """Importing the transistordatabase must not import the gui, plotting, mongodb and scipy packages."""
+    import subprocess
+    import sys
+    code = ("import sys; import transistordatabase; "
+            "print([m for m in ['PyQt5', 'matplotlib', 'scipy', 'pymongo', 'jinja2', 'requests', 'deepdiff'] if m in sys.modules])")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout.splitlines()
+    assert output[-1] == "[]"
+    assert issubclass(tdb.MissingServerConnection, Exception)
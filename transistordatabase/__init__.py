@@ -5,10 +5,25 @@ from transistordatabase.mongodb_handling import *
 from transistordatabase.checker_functions import *
 from transistordatabase.helper_functions import *
 from transistordatabase.data_classes import *
+from transistordatabase.operating_point_index import *
+from transistordatabase.dataset_cache import *
+from transistordatabase.json_serializer import *
+from transistordatabase.curve_resampling import *
+from transistordatabase.plot_cache import *
 from transistordatabase.transistor import *
 from transistordatabase.diode import *
 from transistordatabase.switch import *
 from transistordatabase.exceptions import *
 from transistordatabase.database_manager import *
+from transistordatabase.converter_loss_engine import *
+from transistordatabase.converter_sweep import *
 from transistordatabase.colors import *
 from transistordatabase.generalplotsettings import *
+from transistordatabase.lazy_imports import LazyModule
+
+
+def __getattr__(name: str):
+    """Provide names which are created on first use, e.g. MissingServerConnection (imports pymongo)."""
+    if name == "MissingServerConnection":
+        return get_missing_server_connection_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
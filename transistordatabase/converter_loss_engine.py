@@ -0,0 +1,537 @@
+"""Loss and temperature calculation of the buck, boost and buck-boost converters of the topology calculator, no Qt application is needed."""
+# Python standard libraries
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import threading
+
+# Third party libraries
+import numpy as np
+
+CONVERTER_TOPOLOGIES = ['buck', 'boost', 'buck_boost']
+# Same current grid as the channel linearization of the topology calculator, see ConverterLossEngine.get_channel_tables()
+CONVERTER_CHANNEL_CURRENTS = np.linspace(1, 1000, 1000)
+# Quantities of ConverterLossEngine.calculate(), same names as the f_m_* functions of the topology calculator
+CONVERTER_QUANTITIES = ['duty_cycle', 'i_peak', 'i1_rms', 'i1_mean', 'i2_rms', 'i2_mean', 'i_l_rms', 'i_l_mean', 'conduction_losses1',
+                        'conduction_losses2', 'conduction_losses', 'p_on1', 'p_off1', 'p_rr2', 'p_on_off1', 'p_on_off_rr_1_2', 'p1', 'p2',
+                        't_switch1', 't_diode2']
+# Count of parameter meshes memoized per engine and count of engines memoized by get_converter_loss_engine()
+CONVERTER_LOSS_ENGINE_CACHE_SIZE = 8
+
+_converter_loss_engines = {}
+_memo_lock = threading.Lock()
+
+class ConverterLossEngine:
+    """
+    Losses and temperatures of a switch (transistor1) and a diode (transistor2) in a buck, boost or buck-boost converter.
+
+    The channel tables of the transistor pair are calculated once per engine. The peak, RMS and mean currents and the switching
+    energies are calculated once per parameter mesh (zeta, v_in, v_out, p_out) and shared by all losses and temperatures, so
+    e.g. the junction temperature does not recalculate the currents of the conduction and switching losses again.
+
+    The transistor objects must not be changed while the engine is used, since the memoized results are not invalidated.
+    get_converter_loss_engine() creates a new engine after the datasets of the transistors are changed.
+
+    :Example:
+
+    >>> import transistordatabase as tdb
+    >>> transistor = tdb.load('Fuji_2MBI400XBE065-50')
+    >>> engine = tdb.ConverterLossEngine('buck', transistor, transistor, v_g_on1=15)
+    >>> results = engine.calculate(zeta=0.01, v_in=400, v_out=200, p_out=5000, frequency=20, r_g_on1=3.3, r_g_off1=3.3,
+    ...                            t_heatsink=40, r_th_heatsink=0.1)
+    >>> results['t_switch1']
+    """
+
+    topology: str  #: 'buck', 'boost' or 'buck_boost'
+    transistor1: object  #: transistor object, the switch of transistor1 is used
+    transistor2: object  #: transistor object, the diode of transistor2 is used
+    v_g_on1: float  #: turn-on gate voltage for transistor1
+
+    def __init__(self, topology: str, transistor1, transistor2, v_g_on1: float):
+        """
+        Initialize a ConverterLossEngine object.
+
+        :param topology: 'buck', 'boost' or 'buck_boost'
+        :type topology: str
+        :param transistor1: transistor object for transistor1 (switch)
+        :type transistor1: Transistor
+        :param transistor2: transistor object for transistor2 (diode)
+        :type transistor2: Transistor
+        :param v_g_on1: turn-on gate voltage for transistor1
+        :type v_g_on1: float
+        """
+        if topology not in CONVERTER_TOPOLOGIES:
+            raise ValueError(f"topology must be one of {CONVERTER_TOPOLOGIES}, not {topology!r}")
+        self.topology = topology
+        self.transistor1 = transistor1
+        self.transistor2 = transistor2
+        self.v_g_on1 = v_g_on1
+        self._channel_tables = None
+        self._operating_points = {}
+        self._switching_energies = {}
+        self._energy_curves = {}
+
+    def get_channel_tables(self) -> Dict[str, np.ndarray]:
+        """
+        Get the linearized channels of transistor1 (switch) and transistor2 (diode) at the currents CONVERTER_CHANNEL_CURRENTS.
+
+        The channels are linearized at the highest junction temperature of the channel curves. Above i_abs_max, the values at
+        i_abs_max are used.
+
+        :return: dictionary with the arrays 'current', 'v_channel1', 'v_channel2', 'r_channel1_switch', 'v_channel1_switch',
+            'v_channel2_diode' and 'r_channel2_diode'
+        :rtype: dict
+        """
+        if self._channel_tables is None:
+            v_channel1_switch, r_channel1_switch = self._get_channel_table(
+                self.transistor1, max([channel.t_j for channel in self.transistor1.switch.channel]), self.v_g_on1, 'switch')
+            v_channel2_diode, r_channel2_diode = self._get_channel_table(
+                self.transistor2, max([channel.t_j for channel in self.transistor2.diode.channel]), 0, 'diode')
+            self._channel_tables = _read_only({
+                'current': CONVERTER_CHANNEL_CURRENTS.copy(),
+                'v_channel1': r_channel1_switch * CONVERTER_CHANNEL_CURRENTS + v_channel1_switch,
+                'v_channel2': v_channel2_diode.copy(),
+                'r_channel1_switch': r_channel1_switch, 'v_channel1_switch': v_channel1_switch,
+                'v_channel2_diode': v_channel2_diode, 'r_channel2_diode': r_channel2_diode})
+        return self._channel_tables
+
+    def get_channel(self, current: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Interpolate the channel tables at the given currents, the values at NaN currents are 0.
+
+        :param current: current mesh
+        :type current: np.ndarray
+        :return: dictionary with the arrays 'v_channel1', 'v_channel2', 'r_channel1_switch', 'v_channel1_switch', 'v_channel2_diode'
+            and 'r_channel2_diode' in the shape of current
+        :rtype: dict
+        """
+        current = np.asarray(current, dtype=float)
+        invalid = np.isnan(current)
+        valid_current = np.where(invalid, 0, current)
+        tables = self.get_channel_tables()
+        return {name: np.where(invalid, 0, np.interp(valid_current, tables['current'], table)) for name, table in tables.items()
+                if name != 'current'}
+
+    def get_operating_point(self, zeta, v_in, v_out, p_out) -> Dict[str, np.ndarray]:
+        """
+        Get the duty cycles and currents of the converter, memoized per parameter mesh.
+
+        The peak current depends on the channel voltages, which depend on the peak current. Two iterations are calculated,
+        starting with ideal (zero voltage) channels. Points in continuous conduction mode (CCM) use the CCM equations, points in
+        discontinuous conduction mode (DCM) the DCM equations.
+
+        :param zeta: zeta = frequency * inductance, scalar or mesh
+        :param v_in: input voltage, scalar or mesh
+        :param v_out: output voltage, scalar or mesh
+        :param p_out: output power, scalar or mesh
+        :return: dictionary with the read-only arrays 'duty_cycle', 'i_peak', 'i_min_ccm', 'i1_rms', 'i1_mean', 'i2_rms', 'i2_mean',
+            'i_l_rms', 'i_l_mean', 'i_on1', 'i_off1', 'i_off2' and the channel arrays of get_channel() at the peak current
+        :rtype: dict
+        """
+        zeta, v_in, v_out, p_out = _broadcast_meshes(zeta, v_in, v_out, p_out)
+        key = _get_mesh_key(zeta, v_in, v_out, p_out)
+        operating_point = self._operating_points.get(key)
+        if operating_point is not None:
+            return operating_point
+
+        channel = {'v_channel1': np.zeros_like(zeta), 'v_channel2': np.zeros_like(zeta)}
+        for _ in range(2):
+            modes = self._get_modes(zeta, v_in, v_out, p_out, channel)
+            i_peak = _select_mode(modes['i_max_ccm'], modes['i_peak_dcm'], p_out, modes['boundary'])
+            channel = self.get_channel(i_peak)
+        modes = self._get_modes(zeta, v_in, v_out, p_out, channel)
+        duty_cycle_ccm, duty_cycle_dcm1, duty_cycle_dcm2 = modes['duty_cycle_ccm'], modes['duty_cycle_dcm1'], modes['duty_cycle_dcm2']
+        i_min_ccm, i_max_ccm, i_peak_dcm, boundary = modes['i_min_ccm'], modes['i_max_ccm'], modes['i_peak_dcm'], modes['boundary']
+        i_square_sum_ccm = i_min_ccm ** 2 + i_max_ccm * i_min_ccm + i_max_ccm ** 2
+
+        # turn-on current for transistor1 and turn-off current for transistor2 is i_min_ccm for CCM and 0 for DCM
+        i_on1 = np.where(p_out < boundary, 0, i_min_ccm)
+        operating_point = dict(channel)
+        operating_point.update({
+            'duty_cycle': _select_mode(duty_cycle_ccm, duty_cycle_dcm1, p_out, boundary),
+            'i_peak': i_peak,
+            'i_min_ccm': i_min_ccm,
+            'i1_rms': _select_mode(np.sqrt((duty_cycle_ccm * i_square_sum_ccm) / 3), np.sqrt((duty_cycle_dcm1 * i_peak_dcm ** 2) / 3),
+                                   p_out, boundary),
+            'i1_mean': _select_mode((duty_cycle_ccm * (i_min_ccm + i_max_ccm)) / 2, (duty_cycle_dcm1 * i_peak_dcm) / 2, p_out, boundary),
+            'i2_rms': _select_mode(np.sqrt(((1 - duty_cycle_ccm) * i_square_sum_ccm) / 3), np.sqrt((duty_cycle_dcm2 * i_peak_dcm ** 2) / 3),
+                                   p_out, boundary),
+            'i2_mean': _select_mode(((1 - duty_cycle_ccm) * (i_min_ccm + i_max_ccm)) / 2, (duty_cycle_dcm2 * i_peak_dcm) / 2, p_out, boundary),
+            'i_l_rms': _select_mode(np.sqrt((duty_cycle_ccm * i_square_sum_ccm) / 3 + -((duty_cycle_ccm - 1) * i_square_sum_ccm) / 3),
+                                    np.sqrt((duty_cycle_dcm1 * i_peak_dcm ** 2) / 3 + (duty_cycle_dcm2 * i_peak_dcm ** 2) / 3), p_out, boundary),
+            'i_l_mean': p_out / v_out,
+            'i_on1': i_on1,
+            # turn-off current for transistor1 is i_peak for CCM and DCM
+            'i_off1': i_peak,
+            'i_off2': i_on1})
+        _memoize(self._operating_points, key, _read_only(operating_point))
+        return operating_point
+
+    def get_switching_energy(self, e_on_off_rr: str, zeta, v_in, v_out, p_out, r_g: Optional[float] = None) -> np.ndarray:
+        """
+        Get the switching energies per switching period at the supply voltage of the loss curve, memoized per parameter mesh.
+
+        The turn-on energy of transistor1 is taken at the turn-on current (i_min_ccm in CCM, 0 in DCM), the turn-off energy of
+        transistor1 at the peak current and the reverse recovery energy of transistor2 at the turn-on current of transistor1.
+
+        :param e_on_off_rr: 'e_on' or 'e_off' of transistor1, 'e_rr' of transistor2
+        :type e_on_off_rr: str
+        :param zeta: zeta = frequency * inductance, scalar or mesh
+        :param v_in: input voltage, scalar or mesh
+        :param v_out: output voltage, scalar or mesh
+        :param p_out: output power, scalar or mesh
+        :param r_g: gate resistor, None to use the curve with the highest gate resistor, see get_energy_curve()
+        :type r_g: float or None
+        :return: read-only array of the switching energies, NaN where the current is NaN
+        :rtype: np.ndarray
+        """
+        operating_point = self.get_operating_point(zeta, v_in, v_out, p_out)
+        key = (_get_mesh_key(*_broadcast_meshes(zeta, v_in, v_out, p_out)), e_on_off_rr, r_g)
+        energy = self._switching_energies.get(key)
+        if energy is None:
+            current = operating_point[{'e_on': 'i_on1', 'e_off': 'i_off1', 'e_rr': 'i_off2'}[e_on_off_rr]]
+            graph_i_e, _ = self.get_energy_curve(e_on_off_rr, r_g)
+            energy = np.full_like(current, np.nan)
+            energy[~np.isnan(current)] = np.interp(current[~np.isnan(current)], graph_i_e[0], graph_i_e[1])
+            energy.flags.writeable = False
+            _memoize(self._switching_energies, key, energy)
+        return energy
+
+    def get_energy_curve(self, e_on_off_rr: str, r_g: Optional[float]) -> Tuple[np.ndarray, float]:
+        """
+        Get a graph_i_e loss curve of the engine, memoized per gate resistor.
+
+        The curve is taken at the highest junction temperature and supply voltage of the loss curves and scaled to the given gate
+        resistor. If the curve can not be scaled (e.g. no r_e curve or r_g out of range), the curve with the highest gate resistor
+        is used. The working point of the transistor (e.g. transistor1.wp.e_on) is not changed.
+
+        :param e_on_off_rr: 'e_on' or 'e_off' of transistor1, 'e_rr' of transistor2
+        :type e_on_off_rr: str
+        :param r_g: gate resistor, None to use the curve with the highest gate resistor
+        :type r_g: float or None
+        :return: graph_i_e of the curve and the supply voltage of the loss curves
+        :rtype: tuple
+        """
+        if (e_on_off_rr, r_g) not in self._energy_curves:
+            transistor = self.transistor2 if e_on_off_rr == 'e_rr' else self.transistor1
+            datasets = getattr(transistor.diode if e_on_off_rr == 'e_rr' else transistor.switch, e_on_off_rr)
+            t_j = max([i for i in [dataset.t_j for dataset in datasets] if i is not None])
+            v_supply_chosen = max([i for i in [dataset.v_supply for dataset in datasets] if i is not None])
+            try:
+                if r_g is None:
+                    raise ValueError("No gate resistor given")
+                curve = transistor.calc_object_i_e(e_on_off_rr=e_on_off_rr, t_j=t_j, v_supply=v_supply_chosen, r_g=r_g, normalize_t_to_v=10)
+            except Exception:
+                v_g_candidates = [i for i in [dataset.v_g for dataset in datasets] if i is not None]
+                curve = transistor.get_object_i_e(
+                    e_on_off_rr=e_on_off_rr, t_j=t_j, v_supply=v_supply_chosen,
+                    r_g=max([i for i in [dataset.r_g for dataset in datasets] if i is not None]),
+                    v_g=max(v_g_candidates) if e_on_off_rr == 'e_on' else min(v_g_candidates))
+            self._energy_curves[(e_on_off_rr, r_g)] = (np.asarray(curve.graph_i_e, dtype=float), v_supply_chosen)
+        return self._energy_curves[(e_on_off_rr, r_g)]
+
+    def calculate(self, zeta, v_in, v_out, p_out, frequency=None, r_g_on1: Optional[float] = None, r_g_off1: Optional[float] = None,
+                  t_heatsink=None, r_th_heatsink=None, quantities: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Calculate currents, losses and temperatures of the converter.
+
+        Only the intermediate results needed by the requested quantities are calculated, e.g. 't_diode2' does not need the
+        turn-on and turn-off loss curves of transistor1.
+
+        :param zeta: zeta = frequency * inductance, scalar or mesh
+        :param v_in: input voltage, scalar or mesh
+        :param v_out: output voltage, scalar or mesh
+        :param p_out: output power, scalar or mesh
+        :param frequency: switching frequency in kHz, scalar or mesh, needed by the switching losses and temperatures
+        :param r_g_on1: external turn-on gate resistor for transistor1, None to use the curve with the highest gate resistor
+        :type r_g_on1: float or None
+        :param r_g_off1: external turn-off gate resistor for transistor1, None to use the curve with the highest gate resistor
+        :type r_g_off1: float or None
+        :param t_heatsink: heatsink temperature, scalar or mesh, needed by the temperatures
+        :param r_th_heatsink: thermal resistance of the heatsink, scalar or mesh, needed by the temperatures
+        :param quantities: quantities to calculate, see CONVERTER_QUANTITIES. By default, all quantities which can be calculated
+            from the given parameters.
+        :type quantities: List[str] or None
+        :return: dictionary with an array per quantity
+        :rtype: dict
+        """
+        if quantities is None:
+            quantities = CONVERTER_QUANTITIES[:CONVERTER_QUANTITIES.index('p_on1')]
+            if frequency is not None:
+                quantities = CONVERTER_QUANTITIES[:CONVERTER_QUANTITIES.index('t_switch1')]
+                if t_heatsink is not None and r_th_heatsink is not None:
+                    quantities = CONVERTER_QUANTITIES
+        parameters = {'mesh': (zeta, v_in, v_out, p_out), 'frequency': frequency, 'r_g_on1': r_g_on1, 'r_g_off1': r_g_off1,
+                      't_heatsink': t_heatsink, 'r_th_heatsink': r_th_heatsink}
+        results = {}
+        return {quantity: np.array(self._get_result(quantity, results, parameters)) for quantity in quantities}
+
+    def _get_result(self, quantity: str, results: Dict[str, np.ndarray], parameters: Dict) -> np.ndarray:
+        """
+        Get a quantity of a calculate() call, the quantity and its intermediate results are calculated on first use.
+
+        :param quantity: quantity, see CONVERTER_QUANTITIES
+        :type quantity: str
+        :param results: quantities already calculated by this calculate() call
+        :type results: dict
+        :param parameters: parameters of the calculate() call
+        :type parameters: dict
+        :return: quantity
+        :rtype: np.ndarray
+        """
+        if quantity in results:
+            return results[quantity]
+        if quantity not in CONVERTER_QUANTITIES:
+            raise ValueError(f"quantity must be one of {CONVERTER_QUANTITIES}, not {quantity!r}")
+        if quantity in ['p_on1', 'p_off1', 'p_rr2', 't_switch1', 't_diode2'] and parameters['frequency'] is None:
+            raise ValueError(f"{quantity} needs the frequency")
+        if quantity in ['t_switch1', 't_diode2'] and (parameters['t_heatsink'] is None or parameters['r_th_heatsink'] is None):
+            raise ValueError(f"{quantity} needs t_heatsink and r_th_heatsink")
+
+        operating_point = self.get_operating_point(*parameters['mesh'])
+        if quantity in operating_point:
+            result = operating_point[quantity]
+        elif quantity == 'conduction_losses1':
+            result = (operating_point['i1_rms'] ** 2) * operating_point['r_channel1_switch'] + \
+                operating_point['i1_mean'] * operating_point['v_channel1_switch']
+        elif quantity == 'conduction_losses2':
+            result = operating_point['i2_rms'] * operating_point['v_channel2_diode']
+        elif quantity == 'conduction_losses':
+            result = self._get_result('conduction_losses1', results, parameters) + self._get_result('conduction_losses2', results, parameters)
+        elif quantity in ['p_on1', 'p_off1', 'p_rr2']:
+            e_on_off_rr, r_g = {'p_on1': ('e_on', parameters['r_g_on1']), 'p_off1': ('e_off', parameters['r_g_off1']), 'p_rr2': ('e_rr', 0)}[quantity]
+            _, v_supply_chosen = self.get_energy_curve(e_on_off_rr, r_g)
+            v_in, v_out = np.asarray(parameters['mesh'][1], dtype=float), np.asarray(parameters['mesh'][2], dtype=float)
+            result = self.get_switching_energy(e_on_off_rr, *parameters['mesh'], r_g) * parameters['frequency'] * 1000 * \
+                self._get_switching_voltage(v_in, v_out) / v_supply_chosen
+        elif quantity == 'p_on_off1':
+            result = self._get_result('p_on1', results, parameters) + self._get_result('p_off1', results, parameters)
+        elif quantity == 'p_on_off_rr_1_2':
+            result = self._get_result('p_on_off1', results, parameters) + self._get_result('p_rr2', results, parameters)
+        elif quantity == 'p1':
+            result = self._get_result('conduction_losses1', results, parameters) + self._get_result('p_on_off1', results, parameters)
+        elif quantity == 'p2':
+            result = self._get_result('conduction_losses2', results, parameters) + self._get_result('p_rr2', results, parameters)
+        elif quantity == 't_switch1':
+            r_th_switch = self.transistor1.switch.thermal_foster.r_th_total + self.transistor1.r_th_switch_cs + self.transistor1.r_th_cs
+            result = parameters['t_heatsink'] + self._get_result('p1', results, parameters) * (r_th_switch + parameters['r_th_heatsink'])
+        else:
+            r_th_diode = self.transistor2.diode.thermal_foster.r_th_total + self.transistor2.r_th_diode_cs + self.transistor2.r_th_cs
+            result = parameters['t_heatsink'] + self._get_result('p2', results, parameters) * (r_th_diode + parameters['r_th_heatsink'])
+        results[quantity] = result
+        return result
+
+    def _get_modes(self, zeta: np.ndarray, v_in: np.ndarray, v_out: np.ndarray, p_out: np.ndarray,
+                   channel: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Calculate the duty cycles and currents of both conduction modes, and the output power at the CCM/DCM boundary.
+
+        :param zeta: zeta mesh
+        :type zeta: np.ndarray
+        :param v_in: input voltage mesh
+        :type v_in: np.ndarray
+        :param v_out: output voltage mesh
+        :type v_out: np.ndarray
+        :param p_out: output power mesh
+        :type p_out: np.ndarray
+        :param channel: channel voltages 'v_channel1' and 'v_channel2'
+        :type channel: dict
+        :return: dictionary with the arrays 'duty_cycle_ccm', 'duty_cycle_dcm1', 'duty_cycle_dcm2', 'i_min_ccm', 'i_max_ccm',
+            'i_peak_dcm' and 'boundary' (CCM above, DCM below)
+        :rtype: dict
+        """
+        v_l_on, v_l_off = self._get_inductor_voltages(v_in, v_out, channel['v_channel1'], channel['v_channel2'])
+        # suppress warnings of invalid operating points (e.g. v_out > v_in for the buck converter), they are NaN
+        with np.errstate(divide='ignore', invalid='ignore'):
+            duty_cycle_ccm = v_l_off / (v_l_on + v_l_off)
+            duty_cycle_dcm1 = np.sqrt((2 * zeta * p_out) / (v_out * v_l_on * (1 + (v_l_on / v_l_off))))
+            duty_cycle_dcm2 = duty_cycle_dcm1 * (v_l_on / v_l_off)
+            return {'duty_cycle_ccm': duty_cycle_ccm, 'duty_cycle_dcm1': duty_cycle_dcm1, 'duty_cycle_dcm2': duty_cycle_dcm2,
+                    'i_min_ccm': (p_out / v_out) - ((v_l_on * duty_cycle_ccm) / (2 * zeta)),
+                    'i_max_ccm': (p_out / v_out) + (v_l_on * duty_cycle_ccm / (2 * zeta)),
+                    'i_peak_dcm': (v_l_on * duty_cycle_dcm1) / zeta,
+                    'boundary': v_out * duty_cycle_ccm * (v_l_on / (2 * zeta))}
+
+    def _get_inductor_voltages(self, v_in: np.ndarray, v_out: np.ndarray, v_channel1: np.ndarray,
+                               v_channel2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the inductor voltages while transistor1 (switch) and while transistor2 (diode) conducts.
+
+        :param v_in: input voltage
+        :type v_in: np.ndarray
+        :param v_out: output voltage
+        :type v_out: np.ndarray
+        :param v_channel1: channel voltage of transistor1
+        :type v_channel1: np.ndarray
+        :param v_channel2: channel voltage of transistor2
+        :type v_channel2: np.ndarray
+        :return: magnitudes of the inductor voltage while transistor1 conducts and while transistor2 conducts
+        :rtype: tuple
+        """
+        if self.topology == 'buck':
+            return v_in - v_out - v_channel1, v_out + v_channel2
+        elif self.topology == 'boost':
+            return v_in - v_channel1, -v_in + v_out + v_channel2
+        return v_in - v_channel1, v_out + v_channel2
+
+    def _get_switching_voltage(self, v_in: np.ndarray, v_out: np.ndarray) -> np.ndarray:
+        """
+        Get the voltage the transistors switch against.
+
+        :param v_in: input voltage
+        :type v_in: np.ndarray
+        :param v_out: output voltage
+        :type v_out: np.ndarray
+        :return: switching voltage
+        :rtype: np.ndarray
+        """
+        if self.topology == 'buck':
+            return v_in
+        elif self.topology == 'boost':
+            return v_out
+        return v_in + v_out
+
+    @staticmethod
+    def _get_channel_table(transistor, t_j: float, v_g: float, switch_or_diode: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Linearize the channel of a switch or diode at the currents CONVERTER_CHANNEL_CURRENTS up to i_abs_max.
+
+        :param transistor: transistor object
+        :type transistor: Transistor
+        :param t_j: junction temperature
+        :type t_j: float
+        :param v_g: gate voltage
+        :type v_g: float
+        :param switch_or_diode: 'switch' or 'diode'
+        :type switch_or_diode: str
+        :return: v_channel and r_channel arrays, the values above i_abs_max are the values at the highest current below
+        :rtype: tuple
+        """
+        v_channel = np.zeros_like(CONVERTER_CHANNEL_CURRENTS)
+        r_channel = np.zeros_like(CONVERTER_CHANNEL_CURRENTS)
+        valid = CONVERTER_CHANNEL_CURRENTS <= transistor.i_abs_max
+        if np.any(valid):
+            v_channel[valid], r_channel[valid] = transistor.calc_lin_channel_batch(t_j, v_g, CONVERTER_CHANNEL_CURRENTS[valid], switch_or_diode)
+            v_channel[~valid] = v_channel[valid][-1]
+            r_channel[~valid] = r_channel[valid][-1]
+        return v_channel, r_channel
+
+def get_converter_loss_engine(topology: str, transistor1, transistor2, v_g_on1: float) -> ConverterLossEngine:
+    """
+    Get the memoized ConverterLossEngine of the transistor objects, e.g. for the f_m_* functions of the topology calculator.
+
+    Engines are memoized by the identity of the transistor objects and the datasets of the transistors (see
+    _get_transistor_signature()), so a new engine is created after the datasets are changed. The CONVERTER_LOSS_ENGINE_CACHE_SIZE
+    most recently created engines are kept.
+
+    :param topology: 'buck', 'boost' or 'buck_boost'
+    :type topology: str
+    :param transistor1: transistor object for transistor1 (switch)
+    :type transistor1: Transistor
+    :param transistor2: transistor object for transistor2 (diode)
+    :type transistor2: Transistor
+    :param v_g_on1: turn-on gate voltage for transistor1
+    :type v_g_on1: float
+    :return: converter loss engine
+    :rtype: ConverterLossEngine
+    """
+    # the engine keeps references to the transistor objects, so their ids are not reused while the engine is memoized
+    key = (topology, id(transistor1), id(transistor2), v_g_on1)
+    signature = _get_transistor_signature(transistor1, transistor2)
+    memo_entry = _converter_loss_engines.get(key)
+    if memo_entry is None or memo_entry[0] != signature:
+        memo_entry = (signature, ConverterLossEngine(topology, transistor1, transistor2, v_g_on1))
+        _memoize(_converter_loss_engines, key, memo_entry)
+    return memo_entry[1]
+
+def _get_transistor_signature(transistor1, transistor2) -> Tuple:
+    """
+    Get the signature of the transistor data memoized by an engine (channel tables and loss curves).
+
+    The operating point indexes of the dataset lists are rebuilt if a list is replaced or datasets are added or removed, and reset
+    by invalidate_operating_point_index() after changing datasets in place, so they are compared by identity.
+
+    :param transistor1: transistor object for transistor1 (switch)
+    :type transistor1: Transistor
+    :param transistor2: transistor object for transistor2 (diode)
+    :type transistor2: Transistor
+    :return: signature
+    :rtype: tuple
+    """
+    return (tuple(transistor1.switch.get_operating_point_index(attribute) for attribute in ('channel', 'e_on', 'e_off')),
+            tuple(transistor2.diode.get_operating_point_index(attribute) for attribute in ('channel', 'e_rr')),
+            transistor1.i_abs_max, transistor2.i_abs_max)
+
+def _select_mode(ccm: np.ndarray, dcm: np.ndarray, p_out: np.ndarray, boundary: np.ndarray) -> np.ndarray:
+    """
+    Combine the CCM and DCM values of a mesh: DCM values below (and at) the boundary power, CCM values above.
+
+    :param ccm: values in continuous conduction mode
+    :type ccm: np.ndarray
+    :param dcm: values in discontinuous conduction mode
+    :type dcm: np.ndarray
+    :param p_out: output power
+    :type p_out: np.ndarray
+    :param boundary: output power at the CCM/DCM boundary
+    :type boundary: np.ndarray
+    :return: combined values, NaN where neither mode is valid
+    :rtype: np.ndarray
+    """
+    ccm = np.where(p_out < boundary, np.nan, ccm)
+    dcm = np.where(p_out > boundary, np.nan, dcm)
+    return np.where(np.isnan(dcm), ccm, dcm)
+
+def _broadcast_meshes(*meshes) -> Tuple[np.ndarray, ...]:
+    """
+    Convert scalars and meshes of parameters to float meshes of the same shape.
+
+    :param meshes: parameters, scalars or meshes
+    :return: float meshes
+    :rtype: tuple
+    """
+    return tuple(np.broadcast_arrays(*[np.asarray(mesh, dtype=float) for mesh in meshes]))
+
+def _get_mesh_key(*meshes: np.ndarray) -> str:
+    """
+    Calculate the memoization key of parameter meshes from their shapes and contents.
+
+    :param meshes: parameter meshes
+    :type meshes: np.ndarray
+    :return: sha256 hex digest
+    :rtype: str
+    """
+    hasher = hashlib.sha256()
+    for mesh in meshes:
+        hasher.update(f"{mesh.dtype.str}{mesh.shape}".encode())
+        hasher.update(np.ascontiguousarray(mesh).tobytes())
+    return hasher.hexdigest()
+
+def _memoize(memo: Dict, key, value) -> None:
+    """
+    Store a value in a memo dictionary, the oldest entries are deleted if there are more than CONVERTER_LOSS_ENGINE_CACHE_SIZE.
+
+    Memos are shared by the plot worker threads of the GUI, so the entries are deleted under a lock and the memos are read
+    with get().
+
+    :param memo: memo dictionary (insertion ordered)
+    :type memo: dict
+    :param key: key
+    :param value: value
+    """
+    with _memo_lock:
+        memo[key] = value
+        while len(memo) > CONVERTER_LOSS_ENGINE_CACHE_SIZE:
+            del memo[next(iter(memo))]
+
+def _read_only(arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Make memoized arrays read-only, since they are shared by all results of an engine.
+
+    :param arrays: dictionary of arrays
+    :type arrays: dict
+    :return: the same dictionary
+    :rtype: dict
+    """
+    for array in arrays.values():
+        array.flags.writeable = False
+    return arrays
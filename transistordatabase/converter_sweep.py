@@ -0,0 +1,257 @@
+"""Design-space sweep of the buck, boost and buck-boost converters over many transistor pairs, evaluated in worker processes."""
+# Python standard libraries
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import contextlib
+import io
+import os
+
+# Third party libraries
+import numpy as np
+
+# Local libraries
+from transistordatabase.converter_loss_engine import ConverterLossEngine, CONVERTER_QUANTITIES, CONVERTER_TOPOLOGIES
+
+# Parameters of the sweep grid, the gate resistors are optional (None: loss curves with the highest gate resistor are used)
+SWEEP_PARAMETERS = ['zeta', 'v_in', 'v_out', 'p_out', 'frequency', 't_heatsink', 'r_th_heatsink', 'v_g_on1', 'r_g_on1', 'r_g_off1']
+SWEEP_QUANTITIES = ['conduction_losses', 'p_on_off_rr_1_2', 'p1', 'p2', 't_switch1', 't_diode2']
+# Objectives of the Pareto front, all are minimized: total losses, highest junction temperature and count of transistors
+SWEEP_OBJECTIVES = ['p_total', 't_j_max', 'part_count']
+
+# Sweep of the worker process (see _initialize_worker()), the parallel transistors are memoized per (transistor index, count)
+_worker_sweep = {'topology': None, 'transistors': [], 'grid': {}, 'quantities': [], 'parallel_transistors': {}}
+
+def sweep(topology: str, transistor_pairs: Sequence[Tuple], parameter_grid: Dict, workers: Optional[int] = None,
+          quantities: Optional[List[str]] = None,
+          progress_callback: Callable[[int, int, Dict[str, np.ndarray]], None] = None) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Evaluate the losses and temperatures of a converter for many transistor pairs over a parameter grid.
+
+    Every transistor pair is evaluated in a worker process by a ConverterLossEngine for all points of the grid. The results are
+    collected in a columnar table (one array per column, one row per pair and grid point). Pairs which can not be evaluated
+    (e.g. missing loss curves) are printed and have NaN results. Every transistor object and the grid are sent to each worker
+    process once, the pairs only refer to them by index.
+
+    :param topology: 'buck', 'boost' or 'buck_boost'
+    :type topology: str
+    :param transistor_pairs: pairs of transistor1 (switch) and transistor2 (diode) objects, optionally with the counts of parallel
+        transistors: (transistor1, transistor2) or (transistor1, transistor2, count1, count2)
+    :type transistor_pairs: Sequence[tuple]
+    :param parameter_grid: values of the parameters SWEEP_PARAMETERS, scalars or lists. The grid is the cartesian product of all
+        values. r_g_on1 and r_g_off1 are optional, the frequency is given in kHz.
+    :type parameter_grid: dict
+    :param workers: count of worker processes (at most the count of CPUs), None for the count of CPUs, 0 or 1 to evaluate all
+        pairs in this process
+    :type workers: int or None
+    :param quantities: quantities of the table, see CONVERTER_QUANTITIES. SWEEP_QUANTITIES in case of None.
+    :type quantities: List[str] or None
+    :param progress_callback: called after every pair with (finished count, total count, table rows of the pair with the columns
+        of the result table), e.g. to save the results while the sweep is running
+    :type progress_callback: Callable[[int, int, Dict[str, np.ndarray]], None]
+    :return: table of all results and table of the Pareto front (see get_pareto_front()). Columns: 'pair' (index of the
+        transistor pair), 'transistor1', 'transistor2', 'count1', 'count2', 'part_count', the parameters, the quantities,
+        'p_total' (p1 + p2) and 't_j_max' (maximum of t_switch1 and t_diode2)
+    :rtype: tuple
+
+    :Example:
+
+    >>> import transistordatabase as tdb
+    >>> db = tdb.DatabaseManager()
+    >>> db.set_operation_mode_json()
+    >>> switches = [db.load_transistor(name) for name in ['Fuji_2MBI400XBE065-50', 'Infineon_FF200R12KE3']]
+    >>> pairs = [(switch, diode, count, count) for switch in switches for diode in switches for count in [1, 2]]
+    >>> grid = {'zeta': np.linspace(0.005, 0.05, 20), 'v_in': 400, 'v_out': 200, 'p_out': 5000, 'frequency': [10, 20, 50],
+    ...         't_heatsink': 40, 'r_th_heatsink': 0.1, 'v_g_on1': 15}
+    >>> results, pareto_front = tdb.sweep('buck', pairs, grid, workers=4)
+    """
+    if topology not in CONVERTER_TOPOLOGIES:
+        raise ValueError(f"topology must be one of {CONVERTER_TOPOLOGIES}, not {topology!r}")
+    quantities = list(SWEEP_QUANTITIES if quantities is None else quantities)
+    for quantity in quantities:
+        if quantity not in CONVERTER_QUANTITIES:
+            raise ValueError(f"quantity must be one of {CONVERTER_QUANTITIES}, not {quantity!r}")
+    grid = get_parameter_grid(parameter_grid)
+    # Pairs of transistor indexes and counts, every transistor object is only sent once to a worker process
+    transistors = []
+    transistor_indexes = {}
+    pairs = []
+    for transistor_pair in transistor_pairs:
+        if len(transistor_pair) not in [2, 4]:
+            raise ValueError("transistor pairs must be (transistor1, transistor2) or (transistor1, transistor2, count1, count2)")
+        indexes = []
+        for transistor in transistor_pair[:2]:
+            if id(transistor) not in transistor_indexes:
+                transistor_indexes[id(transistor)] = len(transistors)
+                transistors.append(transistor)
+            indexes.append(transistor_indexes[id(transistor)])
+        pairs.append((*indexes, *transistor_pair[2:]) if len(transistor_pair) == 4 else (*indexes, 1, 1))
+
+    workers = os.cpu_count() or 1 if workers is None else min(workers, os.cpu_count() or 1)
+    columns = ['pair', 'transistor1', 'transistor2', 'count1', 'count2', 'part_count'] + list(grid) + quantities + ['p_total', 't_j_max']
+    tables = [None] * len(pairs)
+
+    def collect(pair_index: int, table: Dict[str, np.ndarray], error: Optional[str]) -> None:
+        if error is not None:
+            print(f"Transistor pair {pair_index} ({table['transistor1'][0]}, {table['transistor2'][0]}) could not be evaluated: {error}")
+        table['pair'] = np.full(len(table['part_count']), pair_index)
+        tables[pair_index] = {column: table[column] for column in columns}
+        if progress_callback is not None:
+            progress_callback(sum(table is not None for table in tables), len(tables), tables[pair_index])
+
+    if workers <= 1 or len(pairs) <= 1:
+        try:
+            _initialize_worker(topology, transistors, grid, quantities)
+            for pair_index, pair in enumerate(pairs):
+                collect(pair_index, *_sweep_pair(*pair))
+        finally:
+            _initialize_worker(None, [], {}, [])
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pairs)), initializer=_initialize_worker,
+                                 initargs=(topology, transistors, grid, quantities)) as executor:
+            futures = {executor.submit(_sweep_pair, *pair): pair_index for pair_index, pair in enumerate(pairs)}
+            for future in as_completed(futures):
+                collect(futures[future], *future.result())
+
+    results = {column: np.concatenate([table[column] for table in tables]) if tables else np.empty(0) for column in columns}
+    return results, get_pareto_front(results)
+
+def get_parameter_grid(parameter_grid: Dict) -> Dict[str, np.ndarray]:
+    """
+    Expand the parameter values of a sweep to the cartesian product of all values.
+
+    :param parameter_grid: values of the parameters SWEEP_PARAMETERS, scalars or lists
+    :type parameter_grid: dict
+    :return: one array per parameter, all of the same length (one element per grid point)
+    :rtype: dict
+    """
+    for name in parameter_grid:
+        if name not in SWEEP_PARAMETERS:
+            raise ValueError(f"Unknown sweep parameter {name!r}. Available parameters: {SWEEP_PARAMETERS}")
+    missing = [name for name in SWEEP_PARAMETERS if name not in ['r_g_on1', 'r_g_off1'] and parameter_grid.get(name) is None]
+    if missing:
+        raise ValueError(f"Missing sweep parameters: {missing}")
+    names = [name for name in SWEEP_PARAMETERS if parameter_grid.get(name) is not None]
+    axes = np.meshgrid(*[np.atleast_1d(np.asarray(parameter_grid[name], dtype=float)) for name in names], indexing='ij')
+    return {name: axis.ravel() for name, axis in zip(names, axes)}
+
+def get_pareto_front(table: Dict[str, np.ndarray], objectives: Sequence[str] = SWEEP_OBJECTIVES) -> Dict[str, np.ndarray]:
+    """
+    Get the rows of a table which are not dominated by any other row, all objectives are minimized.
+
+    Rows with NaN objectives are skipped. Of identical rows, only the first one is kept. The rows of the front are sorted by the
+    objectives.
+
+    :param table: columnar table, e.g. the results of sweep()
+    :type table: dict
+    :param objectives: columns to minimize, the first two objectives should be the continuous ones
+    :type objectives: Sequence[str]
+    :return: table of the Pareto front with the same columns
+    :rtype: dict
+    """
+    values = np.column_stack([np.asarray(table[objective], dtype=float) for objective in objectives])
+    rows = np.flatnonzero(np.all(np.isfinite(values), axis=1))
+    rows = rows[np.lexsort(values[rows].T[::-1])]
+
+    # Pre-selection: a row is only on the front if it is not dominated within its group of equal further objectives (e.g. the
+    # part count), which is the two dimensional front of the first two objectives
+    if len(objectives) > 1:
+        groups = {}
+        for row in rows:
+            groups.setdefault(tuple(values[row, 2:]), []).append(row)
+        candidates = []
+        for group_rows in groups.values():
+            group_rows = np.array(group_rows)
+            previous_minimum = np.minimum.accumulate(np.concatenate([[np.inf], values[group_rows, 1]]))[:-1]
+            candidates.extend(group_rows[values[group_rows, 1] < previous_minimum])
+        rows = np.array(sorted(candidates, key=lambda row: tuple(values[row])), dtype=int)
+
+    front = []
+    for row in rows:
+        # the rows are sorted, only rows before can dominate this row
+        if not front or not np.any(np.all(values[front] <= values[row], axis=1)):
+            front.append(row)
+    return {column: np.asarray(array)[front] for column, array in table.items()}
+
+def _initialize_worker(topology: Optional[str], transistors: List, grid: Dict[str, np.ndarray], quantities: List[str]) -> None:
+    """
+    Set the sweep of a worker process (see sweep()), called once per worker process.
+
+    :param topology: 'buck', 'boost' or 'buck_boost'
+    :type topology: str
+    :param transistors: transistor objects of the sweep, referred to by the pairs by index
+    :type transistors: list
+    :param grid: parameter grid, see get_parameter_grid()
+    :type grid: dict
+    :param quantities: quantities of the table
+    :type quantities: List[str]
+    """
+    _worker_sweep.update(topology=topology, transistors=transistors, grid=grid, quantities=quantities, parallel_transistors={})
+
+def _get_worker_transistor(transistor_index: int, count: int):
+    """
+    Get a transistor of the sweep of a worker process, parallel transistors are created once per worker process.
+
+    :param transistor_index: index of the transistor object
+    :type transistor_index: int
+    :param count: count of parallel transistors
+    :type count: int
+    :return: transistor object
+    :rtype: Transistor
+    """
+    transistor = _worker_sweep['transistors'][transistor_index]
+    if count <= 1:
+        return transistor
+    parallel_transistors = _worker_sweep['parallel_transistors']
+    if (transistor_index, count) not in parallel_transistors:
+        from transistordatabase.database_manager import _get_worker_database_manager
+        parallel_transistors[(transistor_index, count)] = _get_worker_database_manager(None, None).parallel_transistors(transistor, count)
+    return parallel_transistors[(transistor_index, count)]
+
+def _sweep_pair(transistor_index1: int, transistor_index2: int, count1: int, count2: int) -> Tuple[Dict[str, np.ndarray], Optional[str]]:
+    """
+    Evaluate a transistor pair for all points of the parameter grid in a worker process (see sweep() and _initialize_worker()).
+
+    :param transistor_index1: index of the transistor object for transistor1 (switch)
+    :type transistor_index1: int
+    :param transistor_index2: index of the transistor object for transistor2 (diode)
+    :type transistor_index2: int
+    :param count1: count of parallel transistor1
+    :type count1: int
+    :param count2: count of parallel transistor2
+    :type count2: int
+    :return: table rows of the pair and the error message, None if the pair was evaluated
+    :rtype: tuple
+    """
+    topology, grid, quantities = _worker_sweep['topology'], _worker_sweep['grid'], _worker_sweep['quantities']
+    transistor1, transistor2 = _worker_sweep['transistors'][transistor_index1], _worker_sweep['transistors'][transistor_index2]
+    point_count = len(grid['zeta'])
+    table = {'transistor1': np.full(point_count, transistor1.name, dtype=object), 'transistor2': np.full(point_count, transistor2.name, dtype=object),
+             'count1': np.full(point_count, count1), 'count2': np.full(point_count, count2), 'part_count': np.full(point_count, count1 + count2)}
+    table.update(grid)
+    results = {quantity: np.full(point_count, np.nan) for quantity in set(quantities) | {'p1', 'p2', 't_switch1', 't_diode2'}}
+    error = None
+    # The messages of the loss curve selection are not printed for every pair
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            transistor1, transistor2 = _get_worker_transistor(transistor_index1, count1), _get_worker_transistor(transistor_index2, count2)
+            gate_parameters = [name for name in ['v_g_on1', 'r_g_on1', 'r_g_off1'] if name in grid]
+            gate_values = np.column_stack([grid[name] for name in gate_parameters])
+            engines = {}
+            for values in np.unique(gate_values, axis=0):
+                points = np.all(gate_values == values, axis=1)
+                gate = dict(zip(gate_parameters, values.tolist()))
+                if gate['v_g_on1'] not in engines:
+                    engines[gate['v_g_on1']] = ConverterLossEngine(topology, transistor1, transistor2, gate['v_g_on1'])
+                point_results = engines[gate['v_g_on1']].calculate(
+                    grid['zeta'][points], grid['v_in'][points], grid['v_out'][points], grid['p_out'][points], frequency=grid['frequency'][points],
+                    r_g_on1=gate.get('r_g_on1'), r_g_off1=gate.get('r_g_off1'), t_heatsink=grid['t_heatsink'][points],
+                    r_th_heatsink=grid['r_th_heatsink'][points], quantities=list(results))
+                for quantity, values_of_points in point_results.items():
+                    results[quantity][points] = values_of_points
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+    table.update({quantity: results[quantity] for quantity in quantities})
+    table['p_total'] = results['p1'] + results['p2']
+    table['t_j_max'] = np.fmax(results['t_switch1'], results['t_diode2'])
+    return table, error
@@ -0,0 +1,103 @@
+"""Resampling of channel and switching loss curves to common grids, shared by the PLECS, GeckoCIRCUITS and Simulink exporters."""
+# Python standard libraries
+from __future__ import annotations
+from typing import List, Dict, Optional
+
+# Third party libraries
+import numpy as np
+
+def resample_curves(curves: List, x: np.ndarray, x_row: int = 0, y_row: int = 1, absolute: bool = False) -> np.ndarray:
+    """
+    Interpolate several curves at the same x values.
+
+    :param curves: curves as 2xn arrays, e.g. graph_i_e (row 0: current, row 1: energy) or graph_v_i (row 0: voltage, row 1: current)
+    :type curves: list
+    :param x: x values, same for all curves
+    :type x: np.ndarray
+    :param x_row: row of the curves containing the x values (ascending)
+    :type x_row: int
+    :param y_row: row of the curves containing the y values
+    :type y_row: int
+    :param absolute: True to use the absolute values of the curves, e.g. for third quadrant channel curves
+    :type absolute: bool
+    :return: y values, one row per curve
+    :rtype: np.ndarray
+    """
+    x = np.asarray(x, dtype=float)
+    resampled = np.empty((len(curves), len(x)))
+    for row, curve in enumerate(curves):
+        curve = np.abs(curve) if absolute else np.asarray(curve)
+        resampled[row] = np.interp(x, curve[x_row], curve[y_row])
+    return resampled
+
+def get_loss_tensor(datasets: List, v_g: float, n_points: int = 20) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Resample the graph_i_e switching loss curves at a gate voltage to a (t_j x v_supply x current) tensor.
+
+    The current axis reaches from 0 to the smallest maximum current of the curves, so no curve is extrapolated. If there are
+    several curves for one (t_j, v_supply) combination (e.g. for different gate resistors), the first one is used.
+
+    :param datasets: SwitchEnergyData objects, e.g. Switch.e_on
+    :type datasets: list
+    :param v_g: gate voltage of the curves
+    :type v_g: float
+    :param n_points: number of points of the current axis
+    :type n_points: int
+    :return: dictionary with the axes 't_j', 'v_supply' and 'current' and the 'energy' tensor (NaN for missing combinations),
+        None if there are no graph_i_e curves at the gate voltage
+    :rtype: dict or None
+    """
+    curves = {}
+    for dataset in datasets:
+        if dataset.v_g == v_g and dataset.dataset_type == 'graph_i_e' and dataset.graph_i_e is not None:
+            curves.setdefault((dataset.t_j, dataset.v_supply), dataset.graph_i_e)
+    if not curves:
+        return None
+    t_j_axis = sorted({t_j for t_j, _ in curves})
+    v_supply_axis = sorted({v_supply for _, v_supply in curves})
+    current = np.linspace(0, min(np.max(graph_i_e[0]) for graph_i_e in curves.values()), n_points)
+    energy = np.full((len(t_j_axis), len(v_supply_axis), n_points), np.nan)
+    resampled = resample_curves(list(curves.values()), current)
+    for (t_j, v_supply), row in zip(curves, resampled):
+        energy[t_j_axis.index(t_j), v_supply_axis.index(v_supply)] = row
+    return _read_only({'t_j': np.array(t_j_axis), 'v_supply': np.array(v_supply_axis), 'current': current, 'energy': energy})
+
+def get_channel_tensor(datasets: List, v_g: Optional[float], n_points: int = 20) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Resample the absolute values of channel curves at a gate voltage to a (t_j x current) tensor.
+
+    The current axis reaches from 0 to the smallest maximum current of the curves. If there are several curves for one
+    junction temperature, the first one is used.
+
+    :param datasets: ChannelData objects, e.g. Switch.channel
+    :type datasets: list
+    :param v_g: gate voltage of the curves, None to use the curves of all gate voltages
+    :type v_g: float or None
+    :param n_points: number of points of the current axis
+    :type n_points: int
+    :return: dictionary with the axes 't_j' and 'current' and the 'voltage' tensor, None if there are no curves at the gate voltage
+    :rtype: dict or None
+    """
+    curves = {}
+    for dataset in datasets:
+        if v_g is None or dataset.v_g == v_g:
+            curves.setdefault(dataset.t_j, dataset.graph_v_i)
+    if not curves:
+        return None
+    t_j_axis = sorted(curves)
+    current = np.linspace(0, min(np.max(np.abs(curves[t_j][1])) for t_j in t_j_axis), n_points)
+    voltage = resample_curves([curves[t_j] for t_j in t_j_axis], current, x_row=1, y_row=0, absolute=True)
+    return _read_only({'t_j': np.array(t_j_axis), 'current': current, 'voltage': voltage})
+
+def _read_only(arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Make the arrays of a resampled tensor read-only, since the tensors are cached and shared between the exporters.
+
+    :param arrays: dictionary of arrays
+    :type arrays: dict
+    :return: the same dictionary
+    :rtype: dict
+    """
+    for array in arrays.values():
+        array.flags.writeable = False
+    return arrays
@@ -1,15 +1,17 @@
 """Contains important data classes like SOA, SwitchEnergyData, GateChargeCurve, ..."""
 # Python standard libraries
 from __future__ import annotations
-from matplotlib import pyplot as plt
 from typing import Dict, Union, List
 from datetime import datetime
 import numpy as np
+import copy
 import numpy.typing as npt
 
 # Local libraries
+from transistordatabase.lazy_imports import plt
 from transistordatabase.checker_functions import check_float
 from transistordatabase.helper_functions import isvalid_dict, get_img_raw_data
+from transistordatabase.plot_cache import cached_plot
 
 class GateChargeCurve:
     """A class to hold gate charge characteristics of switch which is added as a optional attribute inside switch class."""
@@ -34,16 +36,18 @@ class GateChargeCurve:
         self.i_g = args.get('i_g')
         self.graph_q_v = args.get('graph_q_v')
 
-    def convert_to_dict(self) -> dict:
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> dict:
         """
         Convert a GateChargeCurve object into dict datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: GateChargeCurve object of dict type
         :rtype: dict
         """
         d = dict(vars(self))
         for att_key in d:
-            if isinstance(d[att_key], np.ndarray):
+            if arrays_as_lists and isinstance(d[att_key], np.ndarray):
                 d[att_key] = d[att_key].tolist()
         return d
 
@@ -87,16 +91,18 @@ class SOA:
         self.t_c = args.get('t_c')
         self.graph_i_v = args.get('graph_i_v')
 
-    def convert_to_dict(self) -> dict:
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> dict:
         """
         Convert SOA object into dict datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: SOA object of dict type
         :rtype: dict
         """
         d = dict(vars(self))
         for att_key in d:
-            if isinstance(d[att_key], np.ndarray):
+            if arrays_as_lists and isinstance(d[att_key], np.ndarray):
                 d[att_key] = d[att_key].tolist()
         return d
 
@@ -144,16 +150,18 @@ class TemperatureDependResistance:
         self.r_channel_nominal = args.get('r_channel_nominal')
         self.graph_t_r = args.get('graph_t_r')
 
-    def convert_to_dict(self) -> dict:
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> dict:
         """
         Convert a TemperatureDependResistance object into dict datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: TemperatureDependResistance object of dict type
         :rtype: dict
         """
         d = dict(vars(self))
         for att_key in d:
-            if isinstance(d[att_key], np.ndarray):
+            if arrays_as_lists and isinstance(d[att_key], np.ndarray):
                 d[att_key] = d[att_key].tolist()
         return d
 
@@ -198,16 +206,18 @@ class EffectiveOutputCapacitance:
         self.v_gs = args.get('v_gs')
         self.v_ds = args.get('v_ds')
 
-    def convert_to_dict(self) -> dict:
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> dict:
         """
         Convert a EffectiveOutputCapacitance object into dict datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: EffectiveOutputCapacitance object of dict type
         :rtype: dict
         """
         d = dict(vars(self))
         for att_key in d:
-            if isinstance(d[att_key], np.ndarray):
+            if arrays_as_lists and isinstance(d[att_key], np.ndarray):
                 d[att_key] = d[att_key].tolist()
         return d
 
@@ -323,16 +333,18 @@ class SwitchEnergyData:
             self.graph_i_e = None
             self.graph_t_e = args.get('graph_t_e')
 
-    def convert_to_dict(self) -> dict:
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> dict:
         """
         Convert a SwitchEnergyData object into dict datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: SwitchEnergyData object of dict type
         :rtype: dict
         """
         d = dict(vars(self))
         for att_key in d:
-            if isinstance(d[att_key], np.ndarray):
+            if arrays_as_lists and isinstance(d[att_key], np.ndarray):
                 d[att_key] = d[att_key].tolist()
         return d
 
@@ -410,16 +422,18 @@ class ChannelData:
         self.graph_v_i = args.get('graph_v_i')
         self.v_g = args.get('v_g')
 
-    def convert_to_dict(self) -> dict:
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> dict:
         """
         Convert a ChannelData object into dict datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: ChannelData object of dict type
         :rtype: dict
         """
         d = dict(vars(self))
         for att_key in d:
-            if isinstance(d[att_key], np.ndarray):
+            if arrays_as_lists and isinstance(d[att_key], np.ndarray):
                 d[att_key] = d[att_key].tolist()
         return d
 
@@ -464,10 +478,12 @@ class LinearizedModel:
         self.r_channel = args.get('r_channel')
         self.v0_channel = args.get('v0_channel')
 
-    def convert_to_dict(self) -> dict:
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> dict:
         """
         Convert LinearizedModel object into dict datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: LinearizedModel object of dict type
         :rtype: dict
         """
@@ -498,16 +514,18 @@ class VoltageDependentCapacitance:
         self.t_j = args.get('t_j')
         self.graph_v_c = args.get('graph_v_c')
 
-    def convert_to_dict(self) -> dict:
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> dict:
         """
         Convert a VoltageDependentCapacitance object into dict datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: VoltageDependentCapacitance object of dict type
         :rtype: dict
         """
         d = dict(vars(self))
         for att_key in d:
-            if isinstance(d[att_key], np.ndarray):
+            if arrays_as_lists and isinstance(d[att_key], np.ndarray):
                 d[att_key] = d[att_key].tolist()
         return d
 
@@ -593,19 +611,22 @@ class FosterThermalModel:
             self.tau_vector = None
             self.graph_t_rthjc = None
 
-    def convert_to_dict(self) -> dict:
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> dict:
         """
         Convert a FosterThermalModel object into dict datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: FosterThermalModel of dict type
         :rtype: dict
         """
         d = dict(vars(self))
         for att_key in d:
-            if isinstance(d[att_key], np.ndarray):
+            if arrays_as_lists and isinstance(d[att_key], np.ndarray):
                 d[att_key] = d[att_key].tolist()
         return d
 
+    @cached_plot(key_attributes=('graph_t_rthjc', 'r_th_vector', 'tau_vector'))
     def get_plots(self, buffer_req: bool = False):
         """
         Plot tau vs rthjc.
@@ -710,18 +731,45 @@ class RawMeasurementData:
             self.dpt_off_vds = []
             self.dpt_off_id = []
 
-    def convert_to_dict(self) -> dict:
+    def __deepcopy__(self, memo):
+        """
+        Deep copy a RawMeasurementData object.
+
+        Read-only waveforms (e.g. memory-mapped from the binary operation mode) are shared instead of copied.
+
+        :param memo: memo dictionary of copy.deepcopy()
+        :return: copy of the RawMeasurementData object
+        :rtype: RawMeasurementData
+        """
+        new_object = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new_object
+        for key, value in vars(self).items():
+            if isinstance(value, list) and all(isinstance(curve, np.ndarray) and not curve.flags.writeable for curve in value):
+                setattr(new_object, key, list(value))
+            else:
+                setattr(new_object, key, copy.deepcopy(value, memo))
+        return new_object
+
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> dict:
         """
         Convert RawMeasurementData object into dict datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: Switch object of dict type
         :rtype: dict
         """
         d = dict(vars(self))
-        d['dpt_on_vds'] = [c.tolist() for c in self.dpt_on_vds]
-        d['dpt_on_id'] = [c.tolist() for c in self.dpt_on_id]
-        d['dpt_off_vds'] = [c.tolist() for c in self.dpt_off_vds]
-        d['dpt_off_id'] = [c.tolist() for c in self.dpt_off_id]
+        if arrays_as_lists:
+            d['dpt_on_vds'] = [c.tolist() for c in self.dpt_on_vds]
+            d['dpt_on_id'] = [c.tolist() for c in self.dpt_on_id]
+            d['dpt_off_vds'] = [c.tolist() for c in self.dpt_off_vds]
+            d['dpt_off_id'] = [c.tolist() for c in self.dpt_off_id]
+        else:
+            d['dpt_on_vds'] = list(self.dpt_on_vds)
+            d['dpt_on_id'] = list(self.dpt_on_id)
+            d['dpt_off_vds'] = list(self.dpt_off_vds)
+            d['dpt_off_id'] = list(self.dpt_off_id)
         return d
 
     def dpt_calculate_energies(self, integration_interval: str, dataset_type: str, energies: str, mode: str):
@@ -1,34 +1,125 @@
-"""Manage the database with its different operation modes (json and mongodb)."""
+"""Manage the database with its different operation modes (json, binary and mongodb)."""
 # Python standard libraries
+from __future__ import annotations
 from enum import Enum
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Union, Optional, Tuple, Callable, Iterator
 from datetime import datetime
-from matplotlib import pyplot as plt
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import functools
+import itertools
 import numpy as np
+import copy
+import hashlib
+import pickle
 import os
 import json
-import requests
-import deepdiff
+import struct
+import zipfile
+import contextlib
+import io
+import time
+import tempfile
+import threading
+from urllib.parse import urljoin
 import glob  # Can this be removed?
 
 # Local libraries
+from transistordatabase.json_serializer import write_json_file
+from transistordatabase.lazy_imports import plt, requests
 from transistordatabase.transistor import Transistor
-from transistordatabase.mongodb_handling import connect_local_tdb 
-from transistordatabase.helper_functions import get_copy_transistor_name, isvalid_transistor_name, read_data_file, html_to_pdf, get_xml_data, compare_list
+from transistordatabase.mongodb_handling import connect_local_tdb, create_transistor_indexes
+from transistordatabase.helper_functions import get_copy_transistor_name, isvalid_transistor_name, read_data_file, html_to_pdf, get_xml_data, compare_list, \
+    trusted_data
 from transistordatabase.checker_functions import check_float
 
+# Summary index of the scalar transistor data stored in the json/binary folder. Does not end with .json on purpose.
+SUMMARY_INDEX_FILE_NAME = ".tdb_summary_index"
+SUMMARY_INDEX_VERSION = 3
+
+# Libraries with less transistors are loaded without worker processes by load_all(), the process start-up takes longer
+PARALLEL_LOAD_MIN_COUNT = 64
+
+# Export formats of export_many() and the Transistor methods writing them
+EXPORT_FORMATS = {"json": "export_json", "matlab": "export_matlab", "simulink": "export_simulink_loss_model",
+                  "geckocircuits": "export_geckocircuits", "plecs": "export_plecs", "datasheet": "export_datasheet_pdf"}
+
+# Version of the validity checks. Transistors validated with another version are validated again on loading.
+TRANSISTOR_SCHEMA_VERSION = 1
+
+# Location of the curves in the transistor dictionary: ARRAY is a curve, ARRAY_LIST a list of curves,
+# a dict describes the keys of a dictionary and a list with one element describes every dictionary of a list.
+ARRAY = "array"
+ARRAY_LIST = "array_list"
+_SWITCH_ENERGY_SCHEMA = [{"graph_r_e": ARRAY, "graph_i_e": ARRAY, "graph_t_e": ARRAY}]
+TRANSISTOR_ARRAY_SCHEMA = {
+    "c_oss": [{"graph_v_c": ARRAY}],
+    "c_iss": [{"graph_v_c": ARRAY}],
+    "c_rss": [{"graph_v_c": ARRAY}],
+    "graph_v_ecoss": ARRAY,
+    "raw_measurement_data": [{"dpt_on_vds": ARRAY_LIST, "dpt_on_id": ARRAY_LIST, "dpt_off_vds": ARRAY_LIST, "dpt_off_id": ARRAY_LIST}],
+    "switch": {"thermal_foster": {"graph_t_rthjc": ARRAY},
+               "channel": [{"graph_v_i": ARRAY}],
+               "e_on": _SWITCH_ENERGY_SCHEMA,
+               "e_on_meas": _SWITCH_ENERGY_SCHEMA,
+               "e_off": _SWITCH_ENERGY_SCHEMA,
+               "e_off_meas": _SWITCH_ENERGY_SCHEMA,
+               "charge_curve": [{"graph_q_v": ARRAY}],
+               "r_channel_th": [{"graph_t_r": ARRAY}],
+               "soa": [{"graph_i_v": ARRAY}]},
+    "diode": {"thermal_foster": {"graph_t_rthjc": ARRAY},
+              "channel": [{"graph_v_i": ARRAY}],
+              "e_rr": _SWITCH_ENERGY_SCHEMA,
+              "soa": [{"graph_i_v": ARRAY}]}}
+
+# Binary operation mode: one uncompressed .npz file per transistor containing a json header and one contiguous float64 array
+BINARY_FILE_EXTENSION = ".npz"
+BINARY_HEADER_KEY = "header"
+BINARY_DATA_KEY = "data"
+BINARY_ARRAY_REFERENCE_KEY = "__npz_array__"
+BINARY_CONTENT_HASH_KEY = "__content_hash__"
+
+# ETag / Last-Modified values of downloaded fileexchange files, stored in the json/binary folder
+DOWNLOAD_CACHE_FILE_NAME = ".tdb_download_cache"
+DOWNLOAD_TIMEOUT = 30
+
+# Content hashes of the transistors at the last incremental sync, stored in the json/binary folder
+SYNC_MANIFEST_FILE_NAME = ".tdb_sync_manifest"
+
+# Non-scalar fields which are excluded from MongoDB query results
+QUERY_EXCLUDED_MONGODB_KEYS = ["c_oss", "c_iss", "c_rss", "c_oss_er", "c_oss_tr", "graph_v_ecoss", "raw_measurement_data",
+                               "switch.channel", "switch.e_on", "switch.e_off", "switch.e_on_meas", "switch.e_off_meas",
+                               "switch.linearized_switch", "switch.r_channel_th", "switch.charge_curve", "switch.soa", "switch.thermal_foster",
+                               "diode.channel", "diode.e_rr", "diode.linearized_diode", "diode.soa", "diode.thermal_foster"]
+
+def _synchronized(method: Callable) -> Callable:
+    """
+    Run a method of the DatabaseManager under its lock, see DatabaseManager._lock.
+
+    :param method: method which reads or changes the caches, the indexes or the files of the database
+    :type method: Callable
+    :return: method holding the lock
+    :rtype: Callable
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class OperationMode(Enum):
     """Operation mode definitions."""
 
     JSON = "json"
+    BINARY = "binary"
     MONGODB = "mongodb"
 
 class DatabaseManager:
     """
     Base class of the transistordatabase.
 
-    After creation, a operation mode must be set (either JSON or MongoDB) and
-    then from the DatabaseManager the Transistor data can be accessed.
+    After creation, a operation mode must be set (either JSON, binary or MongoDB) and
+    then from the DatabaseManager the Transistor data can be accessed. A DatabaseManager can be shared by several threads.
     """
 
     operation_mode: OperationMode
@@ -39,11 +130,49 @@ class DatabaseManager:
 
     module_manufacturers_file_path: str
     housing_types_file_path: str
-    
-    def __init__(self, housing_types_file_path: str = None, module_manufacturers_file_path: str = None):
+
+    cache_size: int
+    cache_hits: int
+    cache_misses: int
+
+    def __init__(self, housing_types_file_path: str = None, module_manufacturers_file_path: str = None, cache_size: int = 32,
+                 trusted_load: bool = True):
+        """
+        Initialize the DatabaseManager.
+
+        :param housing_types_file_path: Path to the housing types file. Default file of the package is used if None.
+        :type housing_types_file_path: str
+        :param module_manufacturers_file_path: Path to the module manufacturers file. Default file of the package is used if None.
+        :type module_manufacturers_file_path: str
+        :param cache_size: Maximum count of loaded transistor objects kept in memory (JSON mode). 0 disables the cache.
+        :type cache_size: int
+        :param trusted_load: json/binary mode: skip the validity checks for transistor files which were validated when they were
+            saved and did not change since (see summary index)
+        :type trusted_load: bool
+        """
         self.operation_mode = None
         self.tdb_directory = os.path.dirname(os.path.abspath(__file__))
 
+        # Name -> file path index of the json folder and LRU cache of loaded transistor objects (JSON mode only)
+        self._name_index = {}
+        self._name_index_mtime = None
+        self._transistor_cache = OrderedDict()
+        # Memo of parallel_transistors(), (name, object hash, count) -> transistor object
+        self._parallel_transistor_cache = OrderedDict()
+        self._summary_index = {}
+        self._summary_index_loaded_from = None
+        self.binary_memory_map = False
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.parallel_cache_hits = 0
+        self.parallel_cache_misses = 0
+        self.trusted_load = trusted_load
+        self.json_indent = 2
+        # The object cache, the memo, the indexes and the files are changed under this lock, so a DatabaseManager can be used
+        # by several threads (e.g. the plot workers of the GUI)
+        self._lock = threading.RLock()
+
         # Load housing_types and module_manufacturers
         if housing_types_file_path is None:
             self.housing_types_file_path = os.path.join(self.tdb_directory, "data", "housing_types.txt")
@@ -57,7 +186,8 @@ class DatabaseManager:
             self.module_manufacturers_file_path = module_manufacturers_file_path
         self.module_manufacturers = read_data_file(self.module_manufacturers_file_path)
 
-    def set_operation_mode_json(self, json_folder_path: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "database")) -> None:
+    def set_operation_mode_json(self, json_folder_path: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "database"),
+                                json_indent: Optional[int] = 2) -> None:
         """
         Set the database operation mode to json.
 
@@ -68,31 +198,18 @@ class DatabaseManager:
 
         :param json_folder_path: Path to json folder.
         :type json_folder_path: str
+        :param json_indent: indentation of the saved json files, None for compact files
+        :type json_indent: int or None
         """
         index_url = "https://raw.githubusercontent.com/upb-lea/transistordatabase_File_Exchange/main/index.txt"
         if self.operation_mode is not None:
             raise Exception("DatabaseManager operation mode can only be set once.")
         self.operation_mode = OperationMode.JSON
+        self.json_indent = json_indent
         if not os.path.isdir(json_folder_path):
             os.makedirs(json_folder_path)
             self.json_folder = json_folder_path
-            index_response = requests.get(index_url)
-            print(index_response)
-            if not index_response.ok:
-                raise Exception(f"Index file was not found. URL: {index_url}")
-            for transistor_url in index_response.iter_lines():
-                transistor_response = requests.get(transistor_url)
-                print(transistor_url)
-
-                # filename = transistor_url.split('/')[-1].decode()
-                filename = transistor_url.decode().split('/')[-1]
-                print(filename)
-                if not transistor_response.ok:
-                    print(f"Transistor with URL {transistor_url} couldn't be downloaded. Transistor was skipped.")
-                    continue
-                else:
-                    transistor = self.convert_dict_to_transistor_object(transistor_response.json())
-                    self.save_transistor(transistor, True)
+            self.download_from_fileexchange(index_url, overwrite=True)
         else:
             self.json_folder = json_folder_path
 
@@ -109,9 +226,32 @@ class DatabaseManager:
 
         if collection == "local":
             self.mongodb_collection = connect_local_tdb()
+            create_transistor_indexes(self.mongodb_collection)
         else:
             raise Exception("Currently only collection == local is supported.")
 
+    def set_operation_mode_binary(self, binary_folder_path: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "database_binary"),
+                                  memory_map: bool = True) -> None:
+        """
+        Set the database operation mode to binary.
+
+        Every transistor is stored as a .npz file containing a json header with the scalar data and the curves as
+        float64 arrays. Use convert_json_folder_to_binary() to convert an existing json database.
+
+        :param binary_folder_path: Path to binary folder. It is created if it does not exist.
+        :type binary_folder_path: str
+        :param memory_map: Memory-map the curve data of loaded transistors. The raw measurement waveforms (dpt_*) are then
+            only read from disk when they are accessed and are read-only.
+        :type memory_map: bool
+        """
+        if self.operation_mode is not None:
+            raise Exception("DatabaseManager operation mode can only be set once.")
+        self.operation_mode = OperationMode.BINARY
+        if not os.path.isdir(binary_folder_path):
+            os.makedirs(binary_folder_path)
+        self.binary_folder = binary_folder_path
+        self.binary_memory_map = memory_map
+
     def save_transistor(self, transistor: Transistor, overwrite: bool = None) -> None:
         """
         Save the transistor object to the desired database depending on the set operation mode.
@@ -122,48 +262,81 @@ class DatabaseManager:
         :param overwrite: Indicates whether to overwrite the existing transistor object in the local database if a match is found
         :type overwrite: bool or None
         """
+        self.save_many([transistor], overwrite)
+
+    @_synchronized
+    def save_many(self, transistors: List[Transistor], overwrite: bool = None) -> List[str]:
+        """
+        Save several transistor objects to the database depending on the set operation mode.
+
+        Existing transistors are looked up once: one directory scan (json/binary) or one query (MongoDB). In MongoDB mode
+        all transistors are written with a single bulk write, with overwrite=True as upserts without any lookup.
+
+        :param transistors: The transistor objects which shall be stored in the database.
+        :type transistors: List[Transistor]
+        :param overwrite: Indicates whether to overwrite existing transistor objects (same name) in the local database.
+            None: existing transistors are not saved, False: a copy with a new name is saved.
+        :type overwrite: bool or None
+        :return: names of the saved transistors
+        :rtype: List[str]
+        """
         if self.operation_mode is None:
             raise Exception("Please select an operation mode for the database manager.")
 
-        transistor_dict = transistor.convert_to_dict()
-        if "_id" in transistor_dict:
-            del transistor_dict["_id"]
-        if self.operation_mode == OperationMode.JSON:
-            transistor_path = os.path.join(self.json_folder, f"{transistor.name}.json")
-            if str(transistor.name) in os.listdir(self.json_folder):
-                if overwrite is None:
-                    print(f"A transistor object with name {transistor.name} already exists. \
-                    If you want to override it please set the override argument to true, if you want to create a copy with a \
-                    different id please set it to false")
-                    return
-                if overwrite:
-                    with open(transistor_path, "w") as fd:
-                        json.dump(transistor_dict, fd, indent=2)
-                else:
-                    new_name = get_copy_transistor_name(transistor_dict["name"])
-                    del transistor_dict["_id"]
-                    with open(os.path.join(self.json_folder, f"{new_name}.json")):
-                        json.dump(transistor_dict, fd, indent=2)
-            else:
-                with open(transistor_path, "w") as fd:
-                    json.dump(transistor_dict, fd, indent=2)
-
+        if self.operation_mode in [OperationMode.JSON, OperationMode.BINARY]:
+            database_folder, file_extension = self._get_database_folder()
+            existing_names = set(self._get_name_index())
         elif self.operation_mode == OperationMode.MONGODB:
-            if self.mongodb_collection.find_one({"_id": transistor._id}) is not None:
+            from pymongo import InsertOne, ReplaceOne
+            if overwrite:
+                existing_names = set()
+            else:
+                names = [str(transistor.name) for transistor in transistors]
+                existing_names = {transistor_dict["name"] for transistor_dict in
+                                  self.mongodb_collection.find({"name": {"$in": names}}, {"name": 1, "_id": 0})}
+            operations = []
+
+        saved_names = []
+        for transistor in transistors:
+            # json and binary mode write the numpy arrays directly
+            transistor_dict = transistor.convert_to_dict(arrays_as_lists=self.operation_mode == OperationMode.MONGODB)
+            transistor_dict.pop("_id", None)
+            transistor_name = transistor_dict["name"]
+            if transistor_name in existing_names:
                 if overwrite is None:
-                    print(f"A transistor object with id {transistor._id} already exists in the database. \
+                    print(f"A transistor object with name {transistor_name} already exists. \
                     If you want to override it please set the override argument to true, if you want to create a copy with a \
                     different id please set it to false")
-                    return
+                    continue
+                if not overwrite:
+                    transistor_dict["name"] = get_copy_transistor_name(transistor_name)
+                    while transistor_dict["name"] in existing_names:
+                        transistor_dict["name"] = get_copy_transistor_name(transistor_dict["name"])
+
+            if self.operation_mode == OperationMode.MONGODB:
                 if overwrite:
-                    self.mongodb_collection.replace_one({"_id": transistor._id}, transistor_dict)
+                    operations.append(ReplaceOne({"name": transistor_name}, transistor_dict, upsert=True))
                 else:
-                    del transistor_dict["_id"]
-                    transistor_dict["name"] = get_copy_transistor_name(transistor_dict["name"])
-                    self.mongodb_collection.insert_one(transistor_dict)
+                    operations.append(InsertOne(transistor_dict))
             else:
-                self.mongodb_collection.insert_one(transistor_dict)
+                self._invalidate_cache(transistor_dict["name"])
+                transistor_path = os.path.join(database_folder, f"{transistor_dict['name']}{file_extension}")
+                if self.operation_mode == OperationMode.JSON:
+                    write_json_file(transistor_dict, transistor_path, self.json_indent)
+                else:
+                    self.write_binary_transistor_file(transistor_dict, transistor_path)
+                self._update_summary_index(transistor_dict["name"], transistor_dict, write_index_file=False)
+            existing_names.add(transistor_dict["name"])
+            saved_names.append(transistor_dict["name"])
 
+        if self.operation_mode == OperationMode.MONGODB:
+            if operations:
+                self.mongodb_collection.bulk_write(operations)
+        elif saved_names and self._summary_index_loaded_from == database_folder:
+            self._write_summary_index_file()
+        return saved_names
+
+    @_synchronized
     def delete_transistor(self, transistor_name: str) -> None:
         """
         Delete the transistor with the given id from the database.
@@ -175,18 +348,27 @@ class DatabaseManager:
             raise Exception("Please select an operation mode for the database manager.")
 
         if self.operation_mode == OperationMode.JSON:
+            self._invalidate_cache(transistor_name)
             existing_files = os.listdir(self.json_folder)
             for file in existing_files:
                 if file.endswith(".json") and file[:-5] == transistor_name and isvalid_transistor_name(file[:-5]):
                     os.remove(os.path.join(self.json_folder, file))
             else:
                 print(f"Can not find transistor with name {transistor_name} in the database. Therefore it cannot be deleted.")
-        elif self.operation_mode == OperationMode.MONGODB:
-            if self.mongodb_collection.find_one({"name": transistor_name}) is not None:
-                self.mongodb_collection.delete_one({"name": transistor_name})
+            self._update_summary_index(transistor_name)
+        elif self.operation_mode == OperationMode.BINARY:
+            self._invalidate_cache(transistor_name)
+            transistor_path = os.path.join(self.binary_folder, f"{transistor_name}{BINARY_FILE_EXTENSION}")
+            if os.path.isfile(transistor_path):
+                os.remove(transistor_path)
             else:
                 print(f"Can not find transistor with name {transistor_name} in the database. Therefore it cannot be deleted.")
+            self._update_summary_index(transistor_name)
+        elif self.operation_mode == OperationMode.MONGODB:
+            if self.mongodb_collection.delete_one({"name": transistor_name}).deleted_count == 0:
+                print(f"Can not find transistor with name {transistor_name} in the database. Therefore it cannot be deleted.")
 
+    @_synchronized
     def load_transistor(self, transistor_name: str) -> Transistor:
         """
         Load a transistor from the database. The database is determined by the operation mode.
@@ -199,18 +381,377 @@ class DatabaseManager:
         if self.operation_mode is None:
             raise Exception("Please select an operation mode for the database manager.")
 
-        if self.operation_mode == OperationMode.JSON:
-            existing_files = os.listdir(self.json_folder)
-            for file_name in existing_files:
-                if file_name.endswith(".json") and file_name.startswith(str(transistor_name)) and isvalid_transistor_name(file_name[:-5]):
-                    with open(os.path.join(self.json_folder, file_name), "r") as fd:
-                        return self.convert_dict_to_transistor_object(json.load(fd))
+        if self.operation_mode in [OperationMode.JSON, OperationMode.BINARY]:
+            transistor_path = self._find_transistor_file(str(transistor_name))
+            if transistor_path is not None:
+                return self._load_cached_transistor(transistor_path)
             print(f"Transitor with name {transistor_name} not found.")
         elif self.operation_mode == OperationMode.MONGODB:
-            return self.convert_dict_to_transistor_object(self.mongodb_collection.find_one({"name": transistor_name}))
+            transistor_dict = self.mongodb_collection.find_one({"name": transistor_name})
+            if transistor_dict is not None:
+                return self.convert_dict_to_transistor_object(transistor_dict)
+            print(f"Transitor with name {transistor_name} not found.")
+
+        return None
+
+    def load_many(self, transistor_names: List[str], workers: int = 0) -> List[Transistor]:
+        """
+        Load several transistors from the database. The database is determined by the operation mode.
+
+        The json/binary folder is scanned once, in MongoDB mode a single query is used.
+
+        :param transistor_names: Names of the transistors
+        :type transistor_names: List[str]
+        :param workers: json/binary mode: count of worker processes to decode the files, 0 or 1 to decode them in this process
+        :type workers: int
+        :return: Transistor objects in the order of the names, None for transistors which are not found
+        :rtype: List[Transistor]
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+
+        transistor_names = [str(transistor_name) for transistor_name in transistor_names]
+        if self.operation_mode in [OperationMode.JSON, OperationMode.BINARY]:
+            transistor_paths = [self._find_transistor_file(transistor_name) for transistor_name in transistor_names]
+            found_paths = [transistor_path for transistor_path in transistor_paths if transistor_path is not None]
+            loaded_transistors = dict(zip(found_paths, self._load_transistor_files(found_paths, workers)))
+            transistors = [loaded_transistors.get(transistor_path) for transistor_path in transistor_paths]
+        elif self.operation_mode == OperationMode.MONGODB:
+            transistor_dicts = {transistor_dict["name"]: transistor_dict for transistor_dict in
+                                self.mongodb_collection.find({"name": {"$in": transistor_names}})}
+            transistors = [self.convert_dict_to_transistor_object(transistor_dicts[transistor_name]) if transistor_name in transistor_dicts
+                           else None for transistor_name in transistor_names]
+        else:
+            return None
+
+        for transistor_name, transistor in zip(transistor_names, transistors):
+            if transistor is None:
+                print(f"Transitor with name {transistor_name} not found.")
+        return transistors
+
+    def load_all(self, workers: Optional[int] = None) -> List[Transistor]:
+        """
+        Load all transistors of the database, sorted by name.
+
+        In json/binary mode, the files are decoded and the transistor objects are created in worker processes. Libraries with
+        less than PARALLEL_LOAD_MIN_COUNT transistors are loaded in this process.
+
+        :param workers: count of worker processes (at most the count of CPUs), None for the count of CPUs, 0 or 1 to load all
+            transistors in this process
+        :type workers: int or None
+        :return: Transistor objects, sorted by name
+        :rtype: List[Transistor]
+
+        :Example:
+
+        >>> import transistordatabase as tdb
+        >>> db = tdb.DatabaseManager()
+        >>> db.set_operation_mode_json()
+        >>> transistors = db.load_all(workers=4)
+        """
+        transistor_names = sorted(self.get_transistor_names_list())
+        # More processes than CPUs only add start-up and pickling overhead
+        workers = os.cpu_count() or 1 if workers is None else min(workers, os.cpu_count() or 1)
+        if len(transistor_names) < PARALLEL_LOAD_MIN_COUNT:
+            workers = 0
+        return self.load_many(transistor_names, workers)
+
+    def iter_transistors(self, filters: Dict = None, workers: int = 0) -> Iterator[Transistor]:
+        """
+        Iterate over the transistors in the database, the transistor objects are created one by one.
+
+        :param filters: see query(), None for all transistors
+        :type filters: Dict
+        :param workers: json/binary mode: count of worker processes to decode the files, 0 or 1 to decode them in this process.
+            The transistors are yielded in the same order as without workers, as soon as they are ready.
+        :type workers: int
+        :return: Transistor objects
+        :rtype: Iterator[Transistor]
+
+        :Example:
+
+        >>> import transistordatabase as tdb
+        >>> db = tdb.DatabaseManager()
+        >>> db.set_operation_mode_json()
+        >>> for transistor in db.iter_transistors({'type': 'SiC-MOSFET'}):
+        >>>     print(transistor.name)
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+
+        if self.operation_mode in [OperationMode.JSON, OperationMode.BINARY]:
+            if filters:
+                name_index = self._get_name_index()
+                transistor_paths = [name_index[transistor_row["name"]] for transistor_row in self.query(filters, ["name"])]
+            else:
+                transistor_paths = list(self._get_name_index().values())
+            yield from self._load_transistor_files(transistor_paths, workers)
+        elif self.operation_mode == OperationMode.MONGODB:
+            filters = {self._get_query_key(key): value for key, value in (filters or {}).items()}
+            for transistor_dict in self.mongodb_collection.find(self._get_mongodb_filter(filters)):
+                yield self.convert_dict_to_transistor_object(transistor_dict)
+
+    def _load_transistor_files(self, transistor_paths: List[str], workers: int = 0) -> Iterator[Transistor]:
+        """
+        Load json/binary transistor files, optionally in worker processes.
+
+        Without workers, the object cache is used (see _load_cached_transistor()). The worker processes bypass the cache,
+        the transistors are yielded in the order of the paths.
+
+        :param transistor_paths: Paths to the json/binary files
+        :type transistor_paths: List[str]
+        :param workers: count of worker processes, 0 or 1 to load the files in this process
+        :type workers: int
+        :return: Transistor objects
+        :rtype: Iterator[Transistor]
+        """
+        if workers is None or workers <= 1 or len(transistor_paths) <= 1:
+            for transistor_path in transistor_paths:
+                yield self._load_cached_transistor(transistor_path)
+            return
+
+        summary_entries = [self._get_current_summary_entry(transistor_path, os.stat(transistor_path)) if self.trusted_load else None
+                           for transistor_path in transistor_paths]
+        trusted = [summary_entry is not None and summary_entry["validated_hash"] == summary_entry["content_hash"] for summary_entry in summary_entries]
+        workers = min(workers, len(transistor_paths))
+        # Several files per task to reduce the inter-process communication, but enough tasks to balance the load
+        chunksize = max(1, len(transistor_paths) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_load_transistor_file, transistor_paths, trusted, itertools.repeat(self.housing_types_file_path),
+                                   itertools.repeat(self.module_manufacturers_file_path), chunksize=chunksize)
+            for summary_entry, transistor in zip(summary_entries, results):
+                if summary_entry is not None:
+                    summary_entry["validated_hash"] = summary_entry["content_hash"]
+                yield transistor
+
+    def export_many(self, transistor_names: Optional[List[str]], filepath: str, formats: Optional[List[str]] = None, workers: Optional[int] = None,
+                    export_options: Optional[Dict[str, Dict]] = None) -> List[Dict]:
+        """
+        Export several transistors to the simulation tool formats, each transistor is loaded and exported in a worker process.
+
+        The files of all transistors are written to the given directory, the current working directory is not used. The printed
+        messages of the exporters are collected in the report instead of being printed.
+
+        :param transistor_names: Names of the transistors, None for all transistors of the database
+        :type transistor_names: List[str] or None
+        :param filepath: directory to save the files, created if it does not exist
+        :type filepath: str
+        :param formats: export formats, see EXPORT_FORMATS. None for all formats.
+        :type formats: List[str] or None
+        :param workers: count of worker processes (at most the count of CPUs), None for the count of CPUs, 0 or 1 to export all
+            transistors in this process
+        :type workers: int or None
+        :param export_options: keyword arguments of the exporters per format, e.g. {'plecs': {'gate_voltages': [15, -15, 15, 0]}}
+        :type export_options: Dict[str, Dict] or None
+        :return: report per transistor in the order of the names: dictionary with 'name', 'success', 'error', 'duration' (seconds),
+            'formats' (per format: 'success', 'error', 'duration', 'files') and 'log' (printed messages)
+        :rtype: List[Dict]
+
+        :Example:
+
+        >>> import transistordatabase as tdb
+        >>> db = tdb.DatabaseManager()
+        >>> db.set_operation_mode_json()
+        >>> report = db.export_many(None, "exports", formats=["plecs", "geckocircuits"], workers=4)
+        >>> failed = [part["name"] for part in report if not part["success"]]
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+        formats = list(EXPORT_FORMATS) if formats is None else list(formats)
+        for export_format in formats:
+            if export_format not in EXPORT_FORMATS:
+                raise ValueError(f"Unknown export format '{export_format}'. Available formats: {list(EXPORT_FORMATS)}")
+        export_options = export_options or {}
+        filepath = os.path.abspath(filepath)
+        os.makedirs(filepath, exist_ok=True)
+        transistor_names = sorted(self.get_transistor_names_list()) if transistor_names is None else [str(name) for name in transistor_names]
+
+        # Sources: file paths (json/binary) or transistor dictionaries (MongoDB), loaded in the worker processes
+        if self.operation_mode in [OperationMode.JSON, OperationMode.BINARY]:
+            sources = [self._find_transistor_file(transistor_name) for transistor_name in transistor_names]
+            trusted = []
+            for source in sources:
+                summary_entry = self._get_current_summary_entry(source, os.stat(source)) if source is not None and self.trusted_load else None
+                trusted.append(summary_entry is not None and summary_entry["validated_hash"] == summary_entry["content_hash"])
+        else:
+            transistor_dicts = {transistor_dict["name"]: transistor_dict for transistor_dict in
+                                self.mongodb_collection.find({"name": {"$in": transistor_names}})}
+            sources = [transistor_dicts.get(transistor_name) for transistor_name in transistor_names]
+            trusted = [False] * len(sources)
+
+        workers = os.cpu_count() or 1 if workers is None else min(workers, os.cpu_count() or 1)
+        arguments = (transistor_names, sources, trusted, itertools.repeat(formats), itertools.repeat(filepath), itertools.repeat(export_options),
+                     itertools.repeat(self.housing_types_file_path), itertools.repeat(self.module_manufacturers_file_path))
+        if workers <= 1 or len(transistor_names) <= 1:
+            return list(map(_export_transistor, *arguments))
+        # The datasheet plots use pyplot, the worker processes must not use a gui backend
+        initializer = _use_headless_plot_backend if "datasheet" in formats else None
+        with ProcessPoolExecutor(max_workers=min(workers, len(transistor_names)), initializer=initializer) as executor:
+            return list(executor.map(_export_transistor, *arguments))
+
+    def _get_database_folder(self) -> Tuple[str, str]:
+        """
+        Return the folder and the file extension of the file based operation modes (json and binary).
 
+        :return: database folder, file extension
+        :rtype: Tuple[str, str]
+        """
+        if self.operation_mode == OperationMode.BINARY:
+            return self.binary_folder, BINARY_FILE_EXTENSION
+        return self.json_folder, ".json"
+
+    @_synchronized
+    def _get_name_index(self) -> Dict[str, str]:
+        """
+        Return the name -> file path index of the json/binary folder.
+
+        The index is rebuilt only if the modification time of the folder changed, so adding, removing or
+        renaming files by hand is noticed as well.
+
+        :return: Dictionary with transistor names as keys and the file paths as values
+        :rtype: Dict[str, str]
+        """
+        database_folder, file_extension = self._get_database_folder()
+        folder_mtime = os.stat(database_folder).st_mtime_ns
+        if folder_mtime != self._name_index_mtime:
+            self._name_index = {}
+            for file_name in os.listdir(database_folder):
+                transistor_name = file_name[:-len(file_extension)]
+                if file_name.endswith(file_extension) and isvalid_transistor_name(transistor_name):
+                    self._name_index[transistor_name] = os.path.join(database_folder, file_name)
+            self._name_index_mtime = folder_mtime
+        return self._name_index
+
+    def _find_transistor_file(self, transistor_name: str) -> Optional[str]:
+        """
+        Find the json file of the transistor with the given name.
+
+        An exact name match is preferred. Otherwise the first file starting with the given name is taken
+        (same behaviour as the former directory scan).
+
+        :param transistor_name: Name of the transistor
+        :type transistor_name: str
+        :return: Path to the json file or None if not found
+        :rtype: str or None
+        """
+        name_index = self._get_name_index()
+        if transistor_name in name_index:
+            return name_index[transistor_name]
+        for name, file_path in name_index.items():
+            if name.startswith(transistor_name):
+                return file_path
         return None
 
+    @_synchronized
+    def _load_cached_transistor(self, transistor_path: str) -> Transistor:
+        """
+        Load a transistor json/binary file using the LRU object cache.
+
+        Cache entries are validated against the modification time and size of the file. A copy of the cached
+        object is returned, so changes made by the caller never leak into the cache.
+
+        :param transistor_path: Path to the json file
+        :type transistor_path: str
+        :return: Transistor object
+        :rtype: Transistor
+        """
+        file_stat = os.stat(transistor_path)
+        file_signature = (file_stat.st_mtime_ns, file_stat.st_size)
+        cache_entry = self._transistor_cache.get(transistor_path)
+        if cache_entry is not None and cache_entry[0] == file_signature:
+            self.cache_hits += 1
+            self._transistor_cache.move_to_end(transistor_path)
+            return copy.deepcopy(cache_entry[1])
+
+        self.cache_misses += 1
+        summary_entry = self._get_current_summary_entry(transistor_path, file_stat) if self.trusted_load else None
+        trusted = summary_entry is not None and summary_entry["validated_hash"] == summary_entry["content_hash"]
+        transistor = self.convert_dict_to_transistor_object(self._read_transistor_file(transistor_path), trusted)
+        if summary_entry is not None:
+            # Validated now, the index file is updated on the next write
+            summary_entry["validated_hash"] = summary_entry["content_hash"]
+        if self.cache_size > 0:
+            self._transistor_cache[transistor_path] = (file_signature, copy.deepcopy(transistor))
+            self._transistor_cache.move_to_end(transistor_path)
+            while len(self._transistor_cache) > self.cache_size:
+                self._transistor_cache.popitem(last=False)
+        return transistor
+
+    @_synchronized
+    def _get_current_summary_entry(self, transistor_path: str, file_stat: os.stat_result) -> Optional[Dict]:
+        """
+        Get the summary index entry of a transistor file, if the entry is up to date.
+
+        The summary index file is read if necessary, but no transistor files are parsed.
+
+        :param transistor_path: Path to the json/binary file
+        :type transistor_path: str
+        :param file_stat: os.stat() result of the file
+        :type file_stat: os.stat_result
+        :return: summary entry, None if there is no entry or the file changed since
+        :rtype: dict
+        """
+        database_folder, file_extension = self._get_database_folder()
+        if self._summary_index_loaded_from != database_folder:
+            self._summary_index = self._read_summary_index_file()
+            self._summary_index_loaded_from = database_folder
+        summary_entry = self._summary_index.get(os.path.basename(transistor_path)[:-len(file_extension)])
+        if summary_entry is None or summary_entry["file_mtime_ns"] != file_stat.st_mtime_ns or summary_entry["file_size"] != file_stat.st_size:
+            return None
+        return summary_entry
+
+    def _read_transistor_file(self, transistor_path: str, header_only: bool = False) -> Dict:
+        """
+        Read the transistor dictionary from a json or binary file.
+
+        :param transistor_path: Path to the json/binary file
+        :type transistor_path: str
+        :param header_only: binary files only: do not read the arrays, they are returned as None
+        :type header_only: bool
+        :return: transistor dictionary
+        :rtype: dict
+        """
+        if transistor_path.endswith(BINARY_FILE_EXTENSION):
+            return self.read_binary_transistor_file(transistor_path, header_only, self.binary_memory_map)
+        with open(transistor_path, "r") as fd:
+            return json.load(fd)
+
+    @_synchronized
+    def _invalidate_cache(self, transistor_name: str) -> None:
+        """
+        Remove the transistor with the given name from the object cache and mark the name index as outdated.
+
+        :param transistor_name: Name of the transistor
+        :type transistor_name: str
+        """
+        database_folder, file_extension = self._get_database_folder()
+        self._transistor_cache.pop(os.path.join(database_folder, f"{transistor_name}{file_extension}"), None)
+        self._name_index_mtime = None
+
+    @_synchronized
+    def clear_cache(self) -> None:
+        """Clear the transistor object cache, the memo of parallel_transistors() and the name index and reset the hit/miss counters."""
+        self._transistor_cache.clear()
+        self._parallel_transistor_cache.clear()
+        self._name_index = {}
+        self._name_index_mtime = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.parallel_cache_hits = 0
+        self.parallel_cache_misses = 0
+
+    @_synchronized
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Return statistics of the transistor object cache and of the memo of parallel_transistors().
+
+        :return: Dictionary with the keys 'hits', 'misses', 'size', 'max_size', 'parallel_hits', 'parallel_misses' and 'parallel_size'
+        :rtype: Dict[str, int]
+        """
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "size": len(self._transistor_cache), "max_size": self.cache_size,
+                "parallel_hits": self.parallel_cache_hits, "parallel_misses": self.parallel_cache_misses,
+                "parallel_size": len(self._parallel_transistor_cache)}
+
     def get_transistor_names_list(self) -> List[str]:
         """
         Return a list containing every transistor name.
@@ -221,33 +762,23 @@ class DatabaseManager:
         if self.operation_mode is None:
             raise Exception("Please select an operation mode for the database manager.")
 
-        if self.operation_mode == OperationMode.JSON:
-            transistor_list = []
-            existing_files = os.listdir(self.json_folder)
-            for file in existing_files:
-                if isvalid_transistor_name(file[:-5]):
-                    transistor_list.append(file[:-5])
-
-            return transistor_list
+        if self.operation_mode in [OperationMode.JSON, OperationMode.BINARY]:
+            return list(self._get_name_index().keys())
         elif self.operation_mode == OperationMode.MONGODB:
-            transistor_list = []
-            returned_cursor = self.mongodb_collection.find()
-            for tran in returned_cursor:
-                transistor_list.append(tran['name'])
-
-            return transistor_list
+            # Projection: only the names are transferred (covered by the name index)
+            return [transistor_dict["name"] for transistor_dict in self.mongodb_collection.find({}, {"name": 1, "_id": 0})]
 
         return None
 
-    def print_tdb(self, filters: List[str] = None) -> List[str]:
+    def print_tdb(self, filters: List[str] = None) -> List[Dict]:
         """
         Print all transistor elements stored in the local database.
 
-        :param filters: filters for searching the database, e.g. 'name' or 'type'
+        :param filters: fields to print, e.g. 'name' or 'type'
         :type filters: List[str]
 
-        :return: Return a list with all transistor objects fitting to the search-filter
-        :rtype: List
+        :return: Return a list with the printed fields of all transistors
+        :rtype: List[Dict]
         """
         # Note: Never use mutable default arguments
         # see https://florimond.dev/en/posts/2018/08/python-mutable-defaults-are-the-source-of-all-evil/
@@ -262,32 +793,341 @@ class DatabaseManager:
                     "The 'filters' argument must be specified as a list of strings or a single string but is"
                     f" {type(filters)} instead.")
         if "name" not in filters:
-            filters.append("name")
+            filters.insert(0, "name")
         """Filters must be specified according to the respective objects they're associated with. 
         e.g. 'type' for type of Transistor or 'diode.technology' for technology of Diode."""
-        if self.operation_mode == OperationMode.MONGODB:
-            returned_cursor = self.mongodb_collection.find({})
-            transistor_list = []
-            for tran in returned_cursor:
-                transistor = self.convert_dict_to_transistor_object(tran)
-                transistor_list.append(transistor)
-            print(transistor_list)
-            return transistor_list
-        elif self.operation_mode == OperationMode.JSON:
-            all_transistor_names = self.get_transistor_names_list()
-            transistor_list = []
-            for transistor_name in all_transistor_names:
-                transistor = self.load_transistor(transistor_name)
-                transistor_list.append(transistor)
-            print(transistor_list)
-            return transistor_list
+        transistor_rows = self.query(fields=filters)
+        for transistor_row in transistor_rows:
+            print(transistor_row)
+        return transistor_rows
+
+    def query(self, filters: Dict = None, fields: List[str] = None) -> List[Dict]:
+        """
+        Query the scalar data of all transistors in the database without creating the transistor objects.
+
+        Only scalar values are read (e.g. 'v_abs_max', 'housing_type', 'switch_t_j_max'). Values of the switch and the diode
+        are prefixed with 'switch_' and 'diode_'. In MongoDB mode a projection is used, in JSON mode a summary index of the
+        json/binary folder is used, which is only updated for changed files.
+
+        :param filters: Dictionary with field names as keys. A value of type tuple or list is interpreted as an inclusive (min, max)
+            range (None for an open end), any other value has to match exactly.
+        :type filters: Dict
+        :param fields: Field names to return. 'name' is always returned. If None, all scalar fields are returned.
+        :type fields: List[str]
+        :return: List of dictionaries, one per transistor
+        :rtype: List[Dict]
+
+        :Example:
+
+        >>> import transistordatabase as tdb
+        >>> db = tdb.DatabaseManager()
+        >>> db.set_operation_mode_json()
+        >>> db.query({'housing_type': 'TO247', 'v_abs_max': (1000, None)}, ['v_abs_max', 'i_cont'])
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+
+        filters = {self._get_query_key(key): value for key, value in (filters or {}).items()}
+        if fields is not None:
+            fields = [self._get_query_key(field) for field in fields]
+            if "name" not in fields:
+                fields.insert(0, "name")
+
+        if self.operation_mode in [OperationMode.JSON, OperationMode.BINARY]:
+            transistor_rows = [row for row in self._get_summary_index().values() if self._matches_query_filters(row, filters)]
+        elif self.operation_mode == OperationMode.MONGODB:
+            mongo_filter = self._get_mongodb_filter(filters)
+            if fields is None:
+                projection = {key: 0 for key in QUERY_EXCLUDED_MONGODB_KEYS}
+            else:
+                projection = {self._get_mongodb_key(field): 1 for field in fields}
+            transistor_rows = [self._get_summary_row(transistor_dict) for transistor_dict in self.mongodb_collection.find(mongo_filter, projection)]
+        else:
+            return None
+
+        if fields is not None:
+            transistor_rows = [{field: row.get(field) for field in fields} for row in transistor_rows]
+        return transistor_rows
+
+    @_synchronized
+    def _get_summary_index(self) -> Dict[str, Dict]:
+        """
+        Return the summary rows (scalar values) of all transistors in the json/binary folder.
+
+        The summary index is stored in the json/binary folder (see SUMMARY_INDEX_FILE_NAME) and validated against the
+        modification time and size of the respective transistor files, so only new or changed files are parsed.
+
+        :return: Dictionary with transistor names as keys and summary rows as values
+        :rtype: Dict[str, Dict]
+        """
+        database_folder, _ = self._get_database_folder()
+        if self._summary_index_loaded_from != database_folder:
+            self._summary_index = self._read_summary_index_file()
+            self._summary_index_loaded_from = database_folder
+
+        name_index = self._get_name_index()
+        index_changed = False
+        for name in list(self._summary_index.keys()):
+            if name not in name_index:
+                del self._summary_index[name]
+                index_changed = True
+        for name, transistor_path in name_index.items():
+            file_stat = os.stat(transistor_path)
+            summary_entry = self._summary_index.get(name)
+            if summary_entry is None or summary_entry["file_mtime_ns"] != file_stat.st_mtime_ns or summary_entry["file_size"] != file_stat.st_size:
+                transistor_dict = self._read_transistor_file(transistor_path, header_only=True)
+                self._summary_index[name] = self._get_summary_entry(transistor_dict, file_stat)
+                index_changed = True
+        if index_changed:
+            self._write_summary_index_file()
+        return {name: self._summary_index[name]["row"] for name in name_index}
+
+    @_synchronized
+    def _update_summary_index(self, transistor_name: str, transistor_dict: Dict = None, write_index_file: bool = True) -> None:
+        """
+        Update the summary index for a single transistor after it was saved or deleted.
+
+        The index is only updated if it was already loaded, otherwise it is validated on the next access anyway. Saved
+        transistors are marked as validated, since they were checked when the transistor object was created.
+
+        :param transistor_name: Name of the transistor
+        :type transistor_name: str
+        :param transistor_dict: transistor dictionary as written to the json file. None if the transistor was deleted.
+        :type transistor_dict: dict
+        :param write_index_file: False to write the summary index file later, e.g. after saving several transistors
+        :type write_index_file: bool
+        """
+        database_folder, file_extension = self._get_database_folder()
+        if self._summary_index_loaded_from != database_folder:
+            return
+        transistor_path = os.path.join(database_folder, f"{transistor_name}{file_extension}")
+        if transistor_dict is not None and os.path.isfile(transistor_path):
+            self._summary_index[transistor_name] = self._get_summary_entry(transistor_dict, os.stat(transistor_path), validated=True)
+        else:
+            self._summary_index.pop(transistor_name, None)
+        if write_index_file:
+            self._write_summary_index_file()
+
+    def _read_summary_index_file(self) -> Dict[str, Dict]:
+        """
+        Read the summary index file of the json/binary folder.
+
+        The file is stored column by column. A missing, unreadable or outdated file results in an empty index.
+
+        :return: Dictionary with transistor names as keys and summary entries as values
+        :rtype: Dict[str, Dict]
+        """
+        index_file_path = os.path.join(self._get_database_folder()[0], SUMMARY_INDEX_FILE_NAME)
+        if not os.path.isfile(index_file_path):
+            return {}
+        try:
+            with open(index_file_path, "r") as fd:
+                columns = json.load(fd)
+            if columns.get("version") != SUMMARY_INDEX_VERSION:
+                return {}
+            # Transistors validated by an other version of the validity checks are not trusted
+            validated = columns.get("schema_version") == TRANSISTOR_SCHEMA_VERSION
+            summary_index = {}
+            for i, name in enumerate(columns["name"]):
+                summary_index[name] = {
+                    "file_mtime_ns": columns["file_mtime_ns"][i],
+                    "file_size": columns["file_size"][i],
+                    "content_hash": columns["content_hash"][i],
+                    "validated_hash": columns["validated_hash"][i] if validated else None,
+                    "operating_points": columns["operating_points"][i],
+                    "row": {field: values[i] for field, values in columns["fields"].items()}}
+            return summary_index
+        except (ValueError, KeyError, IndexError, TypeError):
+            print(f"Summary index file {index_file_path} is corrupted and will be rebuilt.")
+            return {}
+
+    def _write_summary_index_file(self) -> None:
+        """Write the summary index column by column to the json/binary folder (temporary file and rename)."""
+        fields = {}
+        for summary_entry in self._summary_index.values():
+            for field in summary_entry["row"]:
+                fields.setdefault(field, [])
+        names = list(self._summary_index.keys())
+        columns = {
+            "version": SUMMARY_INDEX_VERSION,
+            "schema_version": TRANSISTOR_SCHEMA_VERSION,
+            "name": names,
+            "file_mtime_ns": [self._summary_index[name]["file_mtime_ns"] for name in names],
+            "file_size": [self._summary_index[name]["file_size"] for name in names],
+            "content_hash": [self._summary_index[name]["content_hash"] for name in names],
+            "validated_hash": [self._summary_index[name]["validated_hash"] for name in names],
+            "operating_points": [self._summary_index[name]["operating_points"] for name in names],
+            "fields": {field: [self._summary_index[name]["row"].get(field) for name in names] for field in fields}}
+        index_file_path = os.path.join(self._get_database_folder()[0], SUMMARY_INDEX_FILE_NAME)
+        with open(index_file_path + ".tmp", "w") as fd:
+            json.dump(columns, fd)
+        os.replace(index_file_path + ".tmp", index_file_path)
+
+    @staticmethod
+    def _get_summary_entry(transistor_dict: Dict, file_stat: os.stat_result, validated: bool = False) -> Dict:
+        """
+        Create the summary index entry of a transistor.
+
+        :param transistor_dict: transistor dictionary
+        :type transistor_dict: dict
+        :param file_stat: os.stat() result of the transistor json file
+        :type file_stat: os.stat_result
+        :param validated: True if the transistor dictionary passed the validity checks
+        :type validated: bool
+        :return: summary entry containing the file signature, the content hash, the summary row and the channel operating points
+        :rtype: dict
+        """
+        if BINARY_CONTENT_HASH_KEY in transistor_dict:
+            # Header of a binary file: the hash was calculated from the complete dictionary when the file was written
+            transistor_dict = dict(transistor_dict)
+            content_hash = transistor_dict.pop(BINARY_CONTENT_HASH_KEY)
+        else:
+            content_hash = DatabaseManager.get_content_hash(transistor_dict)
+        operating_points = {}
+        for component in ["switch", "diode"]:
+            operating_points[component] = [[channel.get("t_j"), channel.get("v_g")] for channel in (transistor_dict.get(component) or {}).get("channel") or []]
+        return {"file_mtime_ns": file_stat.st_mtime_ns, "file_size": file_stat.st_size, "content_hash": content_hash,
+                "validated_hash": content_hash if validated else None, "operating_points": operating_points,
+                "row": DatabaseManager._get_summary_row(transistor_dict)}
+
+    @staticmethod
+    def get_content_hash(transistor_dict: Dict) -> str:
+        """
+        Calculate a hash of the transistor data which does not depend on the json formatting or the key order.
+
+        :param transistor_dict: transistor dictionary
+        :type transistor_dict: dict
+        :return: sha256 hex digest
+        :rtype: str
+        """
+        def convert(value):
+            if isinstance(value, np.ndarray):
+                return value.tolist()
+            if isinstance(value, np.generic):
+                return value.item()
+            return str(value)
+
+        transistor_dict = {key: value for key, value in transistor_dict.items() if key != "_id"}
+        return hashlib.sha256(json.dumps(transistor_dict, sort_keys=True, separators=(",", ":"), default=convert).encode()).hexdigest()
+
+    @_synchronized
+    def get_operating_points(self, transistor_name: str) -> Dict[str, List[List[float]]]:
+        """
+        Return the available channel operating points (t_j, v_g) of switch and diode without loading the transistor.
+
+        :param transistor_name: Name of the transistor
+        :type transistor_name: str
+        :return: Dictionary with the keys 'switch' and 'diode' containing lists of [t_j, v_g]
+        :rtype: Dict[str, List[List[float]]]
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+
+        if self.operation_mode in [OperationMode.JSON, OperationMode.BINARY]:
+            if transistor_name in self._get_summary_index():
+                return self._summary_index[transistor_name]["operating_points"]
+        elif self.operation_mode == OperationMode.MONGODB:
+            projection = {"switch.channel.t_j": 1, "switch.channel.v_g": 1, "diode.channel.t_j": 1, "diode.channel.v_g": 1}
+            transistor_dict = self.mongodb_collection.find_one({"name": transistor_name}, projection)
+            if transistor_dict is not None:
+                return {component: [[channel.get("t_j"), channel.get("v_g")] for channel in transistor_dict.get(component, {}).get("channel", [])]
+                        for component in ["switch", "diode"]}
+        print(f"Transitor with name {transistor_name} not found.")
+        return None
+
+    @staticmethod
+    def _get_summary_row(transistor_dict: Dict) -> Dict:
+        """
+        Extract the scalar values of a transistor dictionary.
+
+        Scalar values of the switch and the diode are added with the prefixes 'switch_' and 'diode_'.
+
+        :param transistor_dict: transistor dictionary
+        :type transistor_dict: dict
+        :return: Dictionary with the scalar values
+        :rtype: dict
+        """
+        row = {key: value for key, value in transistor_dict.items() if key != "_id" and not isinstance(value, (list, dict, np.ndarray))}
+        for component in ["switch", "diode"]:
+            for key, value in (transistor_dict.get(component) or {}).items():
+                if not isinstance(value, (list, dict, np.ndarray)):
+                    row[f"{component}_{key}"] = value
+        return row
+
+    @staticmethod
+    def _get_query_key(key: str) -> str:
+        """
+        Convert a field name like 'switch.t_j_max' to the key used in query rows ('switch_t_j_max').
+
+        :param key: field name
+        :type key: str
+        :return: key of the query rows
+        :rtype: str
+        """
+        return key.replace(".", "_", 1) if key.startswith(("switch.", "diode.")) else key
+
+    @staticmethod
+    def _get_mongodb_key(key: str) -> str:
+        """
+        Convert a key of the query rows like 'switch_t_j_max' to the MongoDB field name ('switch.t_j_max').
+
+        :param key: key of the query rows
+        :type key: str
+        :return: MongoDB field name
+        :rtype: str
+        """
+        return key.replace("_", ".", 1) if key.startswith(("switch_", "diode_")) else key
+
+    @staticmethod
+    def _get_mongodb_filter(filters: Dict) -> Dict:
+        """
+        Convert query filters (see query()) to a MongoDB filter.
+
+        :param filters: Dictionary with query keys (e.g. 'switch_t_j_max') as keys and values or (min, max) ranges as values
+        :type filters: Dict
+        :return: MongoDB filter
+        :rtype: Dict
+        """
+        mongo_filter = {}
+        for key, value in filters.items():
+            if isinstance(value, (tuple, list)):
+                mongo_filter[DatabaseManager._get_mongodb_key(key)] = {operator: limit for operator, limit in zip(["$gte", "$lte"], value) if limit is not None}
+            else:
+                mongo_filter[DatabaseManager._get_mongodb_key(key)] = value
+        return mongo_filter
+
+    @staticmethod
+    def _matches_query_filters(row: Dict, filters: Dict) -> bool:
+        """
+        Check if a query row matches all given filters.
+
+        :param row: query row
+        :type row: dict
+        :param filters: filters, see query()
+        :type filters: dict
+        :return: True if all filters match
+        :rtype: bool
+        """
+        for key, value in filters.items():
+            row_value = row.get(key)
+            if isinstance(value, (tuple, list)):
+                if row_value is None or isinstance(row_value, str):
+                    return False
+                if value[0] is not None and row_value < value[0]:
+                    return False
+                if value[1] is not None and row_value > value[1]:
+                    return False
+            elif row_value != value:
+                return False
+        return True
 
     def update_from_fileexchange(self, overwrite: bool = True,
                                  index_url: str = "https://raw.githubusercontent.com/upb-lea/transistordatabase_File_Exchange/main/index.txt",
                                  module_manufacturers_url: str = \
                                  "https://raw.githubusercontent.com/upb-lea/transistordatabase_File_Exchange/main/module_manufacturers.txt",
                                  housing_types_url: str = \
-                                 "https://raw.githubusercontent.com/upb-lea/transistordatabase_File_Exchange/main/housing_types.txt") -> None:
+                                 "https://raw.githubusercontent.com/upb-lea/transistordatabase_File_Exchange/main/housing_types.txt",
+                                 max_workers: int = 8, progress_callback: Callable[[int, int, str], None] = None) -> None:
         """
         Update your local transistor database from transistordatabase-fileexchange from given index-file url.
 
@@ -302,6 +1142,10 @@ class DatabaseManager:
         :type module_manufacturers_url: str
         :param housing_types_url: URL to the housing type file
         :type housing_types_url: str
+        :param max_workers: count of parallel downloads
+        :type max_workers: int
+        :param progress_callback: called after every transistor with (finished count, total count, transistor url)
+        :type progress_callback: Callable[[int, int, str], None]
 
         :return: None
         :rtype: None
@@ -309,24 +1153,13 @@ class DatabaseManager:
         print("Note: Please make sure that you have installed the latest version of the transistor database, "
               "especially if the update_from_fileexchange()-method ends in an error. "
               "Find the latest version here: https://pypi.org/project/transistordatabase/")
-        # Read links from index_url
-        index_response = requests.get(index_url)
-        if not index_response.ok:
-            raise Exception(f"Index file was not found. URL: {index_url}")
-        
-        for transistor_url in index_response.iter_lines():
-            transistor_response = requests.get(transistor_url)
-            if not transistor_response.ok:
-                print(f"Transistor with URL {transistor_url} couldn't be downloaded. Transistor was skipped.")
-                continue
-
-            transistor = self.convert_dict_to_transistor_object(transistor_response.json())
-            self.save_transistor(transistor, overwrite)
+        session = self._create_download_session(max_workers)
+        self.download_from_fileexchange(index_url, overwrite, max_workers, progress_callback, session)
 
         # Get module manufactuers and housing types if URLs are given
         # Then overwrite local files and update lists
         if module_manufacturers_url is not None:
-            module_manufacturers_response = requests.get(module_manufacturers_url)
+            module_manufacturers_response = session.get(module_manufacturers_url, timeout=DOWNLOAD_TIMEOUT)
             if not module_manufacturers_response.ok:
                 raise Exception(f"Given module manufacturers file was not found. URL: {module_manufacturers_url}")
 
@@ -337,7 +1170,7 @@ class DatabaseManager:
             print("Updated module manufacturers.")
 
         if housing_types_url is not None:
-            housing_types_response = requests.get(housing_types_url)
+            housing_types_response = session.get(housing_types_url, timeout=DOWNLOAD_TIMEOUT)
             if not housing_types_response.ok:
                 raise Exception(f"Given housing types file was not found. URL: {housing_types_response}")
 
@@ -347,45 +1180,363 @@ class DatabaseManager:
             self.housing_types = read_data_file(self.housing_types_file_path)
             print("Updated housing types.")
 
-    def compare_with_fileexchange(self, index_url: str, output_file: str):
+    def download_from_fileexchange(self, index_url: str, overwrite: bool = True, max_workers: int = 8,
+                                   progress_callback: Callable[[int, int, str], None] = None, session: requests.Session = None) -> Dict[str, int]:
+        """
+        Download all transistors listed in the given index file and save them to the database.
+
+        The transistor files are downloaded in parallel using a pooled session with retries. Download and conversion run in
+        worker threads while the transistors are saved in the calling thread. In json/binary mode the ETag and Last-Modified
+        headers are stored in the database folder, so files which did not change since the last download are skipped
+        (conditional requests).
+
+        :param index_url: URL to the index file which contains the links to all the transistor files (json formatted).
+        :type index_url: str
+        :param overwrite: True to overwrite existing transistor objects in local database, False to not overwrite them.
+        :type overwrite: bool
+        :param max_workers: count of parallel downloads
+        :type max_workers: int
+        :param progress_callback: called after every transistor with (finished count, total count, transistor url)
+        :type progress_callback: Callable[[int, int, str], None]
+        :param session: session to use for the requests. A new pooled session is created if None.
+        :type session: requests.Session
+        :return: Dictionary with the counts of 'downloaded', 'not_modified' and 'failed' transistors
+        :rtype: Dict[str, int]
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+        if session is None:
+            session = self._create_download_session(max_workers)
+
+        index_response = session.get(index_url, timeout=DOWNLOAD_TIMEOUT)
+        if not index_response.ok:
+            raise Exception(f"Index file was not found. URL: {index_url}")
+        transistor_urls = [line.decode().strip() for line in index_response.iter_lines() if line.strip()]
+
+        download_cache = self._read_state_file(DOWNLOAD_CACHE_FILE_NAME)
+        existing_transistor_names = self.get_transistor_names_list()
+
+        def download_transistor(transistor_url: str):
+            headers = {}
+            cache_entry = download_cache.get(transistor_url)
+            if cache_entry is not None and cache_entry.get("name") in existing_transistor_names:
+                if cache_entry.get("etag"):
+                    headers["If-None-Match"] = cache_entry["etag"]
+                if cache_entry.get("last_modified"):
+                    headers["If-Modified-Since"] = cache_entry["last_modified"]
+            response = session.get(transistor_url, headers=headers, timeout=DOWNLOAD_TIMEOUT)
+            if response.status_code == 304 or not response.ok:
+                return response, None
+            return response, self.convert_dict_to_transistor_object(response.json())
+
+        result = {"downloaded": 0, "not_modified": 0, "failed": 0}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(download_transistor, transistor_url): transistor_url for transistor_url in transistor_urls}
+            for finished_count, future in enumerate(as_completed(futures), start=1):
+                transistor_url = futures[future]
+                try:
+                    response, transistor = future.result()
+                except (requests.RequestException, ValueError, KeyError, TypeError) as error:
+                    print(f"Transistor with URL {transistor_url} couldn't be downloaded ({error}). Transistor was skipped.")
+                    result["failed"] += 1
+                else:
+                    if response.status_code == 304:
+                        result["not_modified"] += 1
+                    elif transistor is None:
+                        print(f"Transistor with URL {transistor_url} couldn't be downloaded. Transistor was skipped.")
+                        result["failed"] += 1
+                    else:
+                        self.save_transistor(transistor, overwrite)
+                        download_cache[transistor_url] = {"name": transistor.name, "etag": response.headers.get("ETag"),
+                                                          "last_modified": response.headers.get("Last-Modified")}
+                        result["downloaded"] += 1
+                if progress_callback is not None:
+                    progress_callback(finished_count, len(transistor_urls), transistor_url)
+
+        self._write_state_file(DOWNLOAD_CACHE_FILE_NAME, download_cache)
+        print(f"Fileexchange download: {result['downloaded']} downloaded, {result['not_modified']} not modified, {result['failed']} failed.")
+        return result
+
+    @staticmethod
+    def _create_download_session(max_workers: int = 8, retries: int = 3) -> requests.Session:
+        """
+        Create a requests session with a connection pool and retries with exponential backoff.
+
+        :param max_workers: count of parallel downloads, used as size of the connection pool
+        :type max_workers: int
+        :param retries: count of retries on connection errors and server errors
+        :type retries: int
+        :return: session
+        :rtype: requests.Session
+        """
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _read_state_file(self, file_name: str) -> Dict[str, Dict]:
+        """
+        Read a json state file (e.g. the download cache or the sync manifest) from the database folder (json and binary mode only).
+
+        :param file_name: file name of the state file, e.g. DOWNLOAD_CACHE_FILE_NAME
+        :type file_name: str
+        :return: content of the state file, empty dictionary if it does not exist
+        :rtype: Dict[str, Dict]
+        """
+        if self.operation_mode not in [OperationMode.JSON, OperationMode.BINARY]:
+            return {}
+        state_file_path = os.path.join(self._get_database_folder()[0], file_name)
+        if not os.path.isfile(state_file_path):
+            return {}
+        try:
+            with open(state_file_path, "r") as fd:
+                return json.load(fd)
+        except ValueError:
+            return {}
+
+    def _write_state_file(self, file_name: str, content: Dict[str, Dict]) -> None:
+        """
+        Write a json state file (e.g. the download cache or the sync manifest) to the database folder (json and binary mode only).
+
+        :param file_name: file name of the state file, e.g. DOWNLOAD_CACHE_FILE_NAME
+        :type file_name: str
+        :param content: content of the state file
+        :type content: Dict[str, Dict]
+        """
+        if self.operation_mode not in [OperationMode.JSON, OperationMode.BINARY]:
+            return
+        write_json_file(content, os.path.join(self._get_database_folder()[0], file_name), indent=None)
+
+    @staticmethod
+    def _is_synchronized(local_hash: Optional[str], remote_hash: str, sync_entry: Dict[str, str]) -> bool:
+        """
+        Check if a local transistor is up to date with the fileexchange.
+
+        The transistor is up to date if the content hashes are equal, or if the local file was written by the last sync
+        from the same remote content (the content hash of a saved transistor can differ from the downloaded one).
+
+        :param local_hash: content hash of the local transistor, None if the transistor does not exist locally
+        :type local_hash: str or None
+        :param remote_hash: content hash of the fileexchange transistor
+        :type remote_hash: str
+        :param sync_entry: entry of the transistor in the sync manifest, empty dictionary if not synchronized before
+        :type sync_entry: Dict[str, str]
+        :return: True if the local transistor is up to date
+        :rtype: bool
+        """
+        if local_hash is None:
+            return False
+        if local_hash == remote_hash:
+            return True
+        return sync_entry.get("remote_hash") == remote_hash and sync_entry.get("local_hash") == local_hash
+
+    @_synchronized
+    def get_content_hashes(self) -> Dict[str, str]:
+        """
+        Get the content hashes of all transistors in the local database (json and binary mode only).
+
+        The hashes are taken from the summary index, so only changed files are read.
+
+        :return: Dictionary with the transistor names as keys and the content hashes as values
+        :rtype: Dict[str, str]
+        """
+        if self.operation_mode not in [OperationMode.JSON, OperationMode.BINARY]:
+            raise Exception(f"Content hashes are not supported in operation mode {self.operation_mode}.")
+        return {name: self._summary_index[name]["content_hash"] for name in self._get_summary_index()}
+
+    def sync_from_fileexchange(self, manifest_url: str, overwrite: bool = True, max_workers: int = 8,
+                               progress_callback: Callable[[int, int, str], None] = None, session: requests.Session = None) -> Dict[str, List[str]]:
+        """
+        Incrementally synchronize the local database with a fileexchange manifest.
+
+        The manifest is a json file containing the content hash and the url of every transistor (see
+        create_fileexchange_manifest()). Only transistors whose content hash differs from the local database are downloaded.
+        In json/binary mode the remote and local hashes of the last sync are stored in the database folder, so transistors which
+        were changed by the conversion on saving are not downloaded again. In mongodb mode all transistors are downloaded.
+
+        :param manifest_url: URL to the manifest file. Relative transistor urls are resolved against this URL.
+        :type manifest_url: str
+        :param overwrite: True to overwrite existing transistor objects in local database, False to not overwrite them.
+        :type overwrite: bool
+        :param max_workers: count of parallel downloads
+        :type max_workers: int
+        :param progress_callback: called after every downloaded transistor with (finished count, total count, transistor url)
+        :type progress_callback: Callable[[int, int, str], None]
+        :param session: session to use for the requests. A new pooled session is created if None.
+        :type session: requests.Session
+        :return: Dictionary with the names of the 'updated', 'unchanged' and 'failed' transistors
+        :rtype: Dict[str, List[str]]
+        """
+        if self.operation_mode is None:
+            raise Exception("Please select an operation mode for the database manager.")
+        if session is None:
+            session = self._create_download_session(max_workers)
+
+        manifest_response = session.get(manifest_url, timeout=DOWNLOAD_TIMEOUT)
+        if not manifest_response.ok:
+            raise Exception(f"Manifest file was not found. URL: {manifest_url}")
+        manifest = manifest_response.json()
+
+        local_hashes = self.get_content_hashes() if self.operation_mode in [OperationMode.JSON, OperationMode.BINARY] else {}
+        sync_manifest = self._read_state_file(SYNC_MANIFEST_FILE_NAME)
+
+        result = {"updated": [], "unchanged": [], "failed": []}
+        changed_names = []
+        for name, manifest_entry in manifest.items():
+            local_hash = local_hashes.get(name)
+            sync_entry = sync_manifest.get(name, {})
+            if self._is_synchronized(local_hash, manifest_entry["hash"], sync_entry):
+                result["unchanged"].append(name)
+            else:
+                changed_names.append(name)
+
+        def download_transistor(name: str):
+            response = session.get(urljoin(manifest_url, manifest[name]["url"]), timeout=DOWNLOAD_TIMEOUT)
+            if not response.ok:
+                return None
+            return self.convert_dict_to_transistor_object(response.json())
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(download_transistor, name): name for name in changed_names}
+            for finished_count, future in enumerate(as_completed(futures), start=1):
+                name = futures[future]
+                try:
+                    transistor = future.result()
+                except (requests.RequestException, ValueError, KeyError, TypeError) as error:
+                    print(f"Transistor {name} couldn't be downloaded ({error}). Transistor was skipped.")
+                    transistor = None
+                if transistor is None:
+                    result["failed"].append(name)
+                else:
+                    self.save_transistor(transistor, overwrite)
+                    result["updated"].append(name)
+                if progress_callback is not None:
+                    progress_callback(finished_count, len(changed_names), manifest[name]["url"])
+
+        if self.operation_mode in [OperationMode.JSON, OperationMode.BINARY]:
+            local_hashes = self.get_content_hashes()
+            for name in result["updated"]:
+                if name in local_hashes:
+                    sync_manifest[name] = {"remote_hash": manifest[name]["hash"], "local_hash": local_hashes[name]}
+            self._write_state_file(SYNC_MANIFEST_FILE_NAME, sync_manifest)
+        print(f"Fileexchange sync: {len(result['updated'])} updated, {len(result['unchanged'])} unchanged, {len(result['failed'])} failed.")
+        return result
+
+    @staticmethod
+    def create_fileexchange_manifest(folder_path: str, base_url: str = "", manifest_file_path: str = None) -> Dict[str, Dict]:
+        """
+        Create the manifest for sync_from_fileexchange() from a folder of transistor json files.
+
+        :param folder_path: folder containing the transistor json files which are uploaded to the fileexchange
+        :type folder_path: str
+        :param base_url: URL prefix of the transistor files. Keep empty if the manifest is uploaded to the same folder.
+        :type base_url: str
+        :param manifest_file_path: If given, the manifest is written to this file.
+        :type manifest_file_path: str
+        :return: Dictionary with the transistor names as keys and 'hash' and 'url' as values
+        :rtype: Dict[str, Dict]
+        """
+        manifest = {}
+        for file_name in sorted(os.listdir(folder_path)):
+            if not file_name.endswith(".json"):
+                continue
+            with open(os.path.join(folder_path, file_name), "r") as fd:
+                transistor_dict = json.load(fd)
+            if not isinstance(transistor_dict, dict) or "name" not in transistor_dict:
+                continue
+            manifest[transistor_dict["name"]] = {"hash": DatabaseManager.get_content_hash(transistor_dict), "url": base_url + file_name}
+        if manifest_file_path is not None:
+            with open(manifest_file_path, "w") as fd:
+                json.dump(manifest, fd, indent=2)
+        return manifest
+
+    def compare_with_fileexchange(self, index_url: str, output_file: str, manifest_url: str = None, max_workers: int = 8,
+                                  session: requests.Session = None):
         """
         Compare the current database with the given database from the fileexchange.
 
-        Writes the difference in the given output_file.
+        Writes the difference in the given output_file. If a manifest is given (see create_fileexchange_manifest()), only the
+        transistors whose content hash differs from the local database are downloaded, otherwise all transistors of the index are downloaded.
 
-        :param index_url: URL to the index file containing links to the Transistors of the Database.
+        :param index_url: URL to the index file containing links to the Transistors of the Database. Not used if a manifest_url is given.
         :type index_url: str
         :param output_file: File path to the file where the diff is written
         :type output_file: str
+        :param manifest_url: URL to the manifest file. Relative transistor urls are resolved against this URL.
+        :type manifest_url: str
+        :param max_workers: count of parallel downloads
+        :type max_workers: int
+        :param session: session to use for the requests. A new pooled session is created if None.
+        :type session: requests.Session
         """
+        import deepdiff
+
+        if session is None:
+            session = self._create_download_session(max_workers)
         current_transistor_list = self.get_transistor_names_list()
+        local_hashes = self.get_content_hashes() if self.operation_mode in [OperationMode.JSON, OperationMode.BINARY] else {}
+        sync_manifest = self._read_state_file(SYNC_MANIFEST_FILE_NAME)
+
+        def is_synchronized(name: str, remote_hash: str) -> bool:
+            return self._is_synchronized(local_hashes.get(name), remote_hash, sync_manifest.get(name, {}))
 
-        # Read links from index_url
+        # Read links from manifest_url or index_url
         diff_dict = {}  # Dictionary containing the key as the name of the transistor and the value is the diff text.
-        index_response = requests.get(index_url)
-        if not index_response.ok:
-            raise Exception(f"Index file was not found. URL: {index_url}")
-        
-        for transistor_url in index_response.iter_lines():
-            transistor_response = requests.get(transistor_url)
-            if not transistor_response.ok:
-                print(f"Transistor with URL {transistor_url} couldn't be downloaded. Transistor was skipped.")
-                continue
+        if manifest_url is not None:
+            manifest_response = session.get(manifest_url, timeout=DOWNLOAD_TIMEOUT)
+            if not manifest_response.ok:
+                raise Exception(f"Manifest file was not found. URL: {manifest_url}")
+            transistor_urls = []
+            for name, manifest_entry in manifest_response.json().items():
+                if not is_synchronized(name, manifest_entry["hash"]):
+                    transistor_urls.append(urljoin(manifest_url, manifest_entry["url"]))
+                elif name in current_transistor_list:
+                    # Equal content hashes, no need to download the transistor and to calculate the diff
+                    current_transistor_list.remove(name)
+        else:
+            index_response = session.get(index_url, timeout=DOWNLOAD_TIMEOUT)
+            if not index_response.ok:
+                raise Exception(f"Index file was not found. URL: {index_url}")
+            transistor_urls = [urljoin(index_url, line.decode()) for line in index_response.iter_lines() if line]
+
+        def download_transistor(transistor_url: str) -> Optional[Dict]:
+            response = session.get(transistor_url, timeout=DOWNLOAD_TIMEOUT)
+            return response.json() if response.ok else None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(download_transistor, transistor_url): transistor_url for transistor_url in transistor_urls}
+            for future in as_completed(futures):
+                transistor_url = futures[future]
+                try:
+                    downloaded_transistor_dict = future.result()
+                except (requests.RequestException, ValueError) as error:
+                    print(f"Transistor with URL {transistor_url} couldn't be downloaded ({error}). Transistor was skipped.")
+                    continue
+                if downloaded_transistor_dict is None:
+                    print(f"Transistor with URL {transistor_url} couldn't be downloaded. Transistor was skipped.")
+                    continue
 
-            downloaded_transistor_dict = transistor_response.json()
-            downloaded_transistor_name = downloaded_transistor_dict["name"]
-            if downloaded_transistor_name in current_transistor_list:
-                existing_transistor_dict = self.load_transistor(downloaded_transistor_name).convert_to_dict()
-                # Here it is necessary to first get the deepdiff as json and then back to a dictionary. Because when calling DeepDiff().to_dict() it wouldn't be
-                # json serializable due to a datatype called PrettyOrderedSet.
-                # And since the to_json returns a srting it needs to be converted back to a dict in order to be represented well in the output file.
-                diff = json.loads(deepdiff.DeepDiff(existing_transistor_dict, downloaded_transistor_dict).to_json())
-                if diff:
-                    diff_dict[downloaded_transistor_name] = diff
-                current_transistor_list.remove(downloaded_transistor_name)
-            else:
-                # Transistor is not in local database
-                diff_dict[downloaded_transistor_name] = "Transistor missing in local database."
+                downloaded_transistor_name = downloaded_transistor_dict["name"]
+                if is_synchronized(downloaded_transistor_name, self.get_content_hash(downloaded_transistor_dict)):
+                    # Equal content hashes, no need to load the transistor and to calculate the diff
+                    current_transistor_list.remove(downloaded_transistor_name)
+                elif downloaded_transistor_name in current_transistor_list:
+                    existing_transistor_dict = self.load_transistor(downloaded_transistor_name).convert_to_dict()
+                    # Here it is necessary to first get the deepdiff as json and then back to a dictionary. Because when calling DeepDiff().to_dict()
+                    # it wouldn't be json serializable due to a datatype called PrettyOrderedSet.
+                    # And since the to_json returns a srting it needs to be converted back to a dict in order to be represented well in the output file.
+                    diff = json.loads(deepdiff.DeepDiff(existing_transistor_dict, downloaded_transistor_dict).to_json())
+                    if diff:
+                        diff_dict[downloaded_transistor_name] = diff
+                    current_transistor_list.remove(downloaded_transistor_name)
+                else:
+                    # Transistor is not in local database
+                    diff_dict[downloaded_transistor_name] = "Transistor missing in local database."
 
         for not_found_transistor in current_transistor_list:
             # Transistor was installed locally but not in database
@@ -398,12 +1549,17 @@ class DatabaseManager:
             with open(output_file, "w") as fd:
                 json.dump(diff_dict, fd, indent=2)
 
-    def export_all_datasheets(self, filter_list: list = None):
+    def export_all_datasheets(self, filter_list: list = None, headless: bool = False, workers: Optional[int] = None):
         """
         Export all the available transistor data present in the local mongoDB database.
 
         :param filter_list: a list of transistor names that needs to be exported in specific
         :type filter_list: list
+        :param headless: True to render the datasheets with matplotlib in worker processes (see Transistor.export_datasheet_pdf()),
+            False to print them with QtWebEngine
+        :type headless: bool
+        :param workers: headless only: count of worker processes, see export_many()
+        :type workers: int or None
 
         :return: None
         """
@@ -420,9 +1576,12 @@ class DatabaseManager:
                     filtered_list.append(item)
         else:
             filtered_list = transistor_list
-        if len(filtered_list) > 0:
-            for transistor_name in filtered_list:
-                transistor = self.load_transistor(transistor_name)
+        if len(filtered_list) > 0 and headless:
+            for part in self.export_many(filtered_list, os.getcwd(), ["datasheet"], workers):
+                error = part["error"] or part["formats"]["datasheet"]["error"]
+                print(part["log"] if part["success"] else f"Export virtual datasheet {part['name']} failed: {error}")
+        elif len(filtered_list) > 0:
+            for transistor in self.load_many(filtered_list):
                 html_list.append(transistor.export_datasheet(build_collection=True))
                 pdf_name_list.append(transistor.name + ".pdf")
                 paths_list.append(os.path.join(os.getcwd(), transistor.name + ".pdf"))
@@ -430,7 +1589,7 @@ class DatabaseManager:
         else:
             print("Nothing to export, please recheck inputs")
 
-    def convert_dict_to_transistor_object(self, transistor_dict: dict) -> Transistor:
+    def convert_dict_to_transistor_object(self, transistor_dict: dict, trusted: bool = False) -> Transistor:
         """
         Convert a dictionary to a transistor object.
 
@@ -439,98 +1598,46 @@ class DatabaseManager:
         - load()
         - import_json()
 
+        All curves listed in TRANSISTOR_ARRAY_SCHEMA are converted to numpy arrays in a single pass.
+
         :param transistor_dict: transistor dictionary
         :type transistor_dict: dict
+        :param trusted: True to skip the validity checks (isvalid_dict()), e.g. for data which was validated when it was saved.
+        :type trusted: bool
 
         :return: Transistor object
         :rtype: Transistor object
         """
-        # Convert transistor_args
-        if 'c_oss' in transistor_dict and transistor_dict['c_oss'] is not None:
-            for i in range(len(transistor_dict['c_oss'])):
-                transistor_dict['c_oss'][i]['graph_v_c'] = np.array(transistor_dict['c_oss'][i]['graph_v_c'])
-        if 'c_iss' in transistor_dict and transistor_dict['c_iss'] is not None:
-            for i in range(len(transistor_dict['c_iss'])):
-                transistor_dict['c_iss'][i]['graph_v_c'] = np.array(transistor_dict['c_iss'][i]['graph_v_c'])
-        if 'c_rss' in transistor_dict and transistor_dict['c_rss'] is not None:
-            for i in range(len(transistor_dict['c_rss'])):
-                transistor_dict['c_rss'][i]['graph_v_c'] = np.array(transistor_dict['c_rss'][i]['graph_v_c'])
-        if 'graph_v_ecoss' in transistor_dict and transistor_dict['graph_v_ecoss'] is not None:
-            transistor_dict['graph_v_ecoss'] = np.array(transistor_dict['graph_v_ecoss'])
-        if 'raw_measurement_data' in transistor_dict:
-            for i in range(len(transistor_dict['raw_measurement_data'])):
-                for u in range(len(transistor_dict['raw_measurement_data'][i]['dpt_on_vds'])):
-                    transistor_dict['raw_measurement_data'][i]['dpt_on_vds'][u] = np.array(transistor_dict['raw_measurement_data'][i]['dpt_on_vds'][u])
-                for u in range(len(transistor_dict['raw_measurement_data'][i]['dpt_on_id'])):
-                    transistor_dict['raw_measurement_data'][i]['dpt_on_id'][u] = np.array(transistor_dict['raw_measurement_data'][i]['dpt_on_id'][u])
-                for u in range(len(transistor_dict['raw_measurement_data'][i]['dpt_off_vds'])):
-                    transistor_dict['raw_measurement_data'][i]['dpt_off_vds'][u] = np.array(transistor_dict['raw_measurement_data'][i]['dpt_off_vds'][u])
-                for u in range(len(transistor_dict['raw_measurement_data'][i]['dpt_off_id'])):
-                    transistor_dict['raw_measurement_data'][i]['dpt_off_id'][u] = np.array(transistor_dict['raw_measurement_data'][i]['dpt_off_id'][u])
-
-        # Convert switch_args
-        switch_args = transistor_dict['switch']
-        if switch_args['thermal_foster']['graph_t_rthjc'] is not None:
-            switch_args['thermal_foster']['graph_t_rthjc'] = np.array(switch_args['thermal_foster']['graph_t_rthjc'])
-        for i in range(len(switch_args['channel'])):
-            switch_args['channel'][i]['graph_v_i'] = np.array(switch_args['channel'][i]['graph_v_i'])
-        for i in range(len(switch_args['e_on'])):
-            if switch_args['e_on'][i]['dataset_type'] == 'graph_r_e':
-                switch_args['e_on'][i]['graph_r_e'] = np.array(switch_args['e_on'][i]['graph_r_e'])
-            elif switch_args['e_on'][i]['dataset_type'] == 'graph_i_e':
-                switch_args['e_on'][i]['graph_i_e'] = np.array(switch_args['e_on'][i]['graph_i_e'])
-            elif switch_args['e_on'][i]['dataset_type'] == 'graph_t_e':
-                switch_args['e_on'][i]['graph_t_e'] = np.array(switch_args['e_on'][i]['graph_t_e'])
-        if 'e_on_meas' in switch_args:
-            for i in range(len(switch_args['e_on_meas'])):
-                if switch_args['e_on_meas'][i]['dataset_type'] == 'graph_r_e':
-                    switch_args['e_on_meas'][i]['graph_r_e'] = np.array(switch_args['e_on_meas'][i]['graph_r_e'])
-                elif switch_args['e_on_meas'][i]['dataset_type'] == 'graph_i_e':
-                    switch_args['e_on_meas'][i]['graph_i_e'] = np.array(switch_args['e_on_meas'][i]['graph_i_e'])
-                elif switch_args['e_on_meas'][i]['dataset_type'] == 'graph_t_e':
-                    switch_args['e_on_meas'][i]['graph_t_e'] = np.array(switch_args['e_on_meas'][i]['graph_t_e'])
-        for i in range(len(switch_args['e_off'])):
-            if switch_args['e_off'][i]['dataset_type'] == 'graph_r_e':
-                switch_args['e_off'][i]['graph_r_e'] = np.array(switch_args['e_off'][i]['graph_r_e'])
-            elif switch_args['e_off'][i]['dataset_type'] == 'graph_i_e':
-                switch_args['e_off'][i]['graph_i_e'] = np.array(switch_args['e_off'][i]['graph_i_e'])
-            elif switch_args['e_off'][i]['dataset_type'] == 'graph_t_e':
-                switch_args['e_off'][i]['graph_t_e'] = np.array(switch_args['e_off'][i]['graph_t_e'])
-        if 'e_off_meas' in switch_args:
-            for i in range(len(switch_args['e_off_meas'])):
-                if switch_args['e_off_meas'][i]['dataset_type'] == 'graph_r_e':
-                    switch_args['e_off_meas'][i]['graph_r_e'] = np.array(switch_args['e_off_meas'][i]['graph_r_e'])
-                elif switch_args['e_off_meas'][i]['dataset_type'] == 'graph_i_e':
-                    switch_args['e_off_meas'][i]['graph_i_e'] = np.array(switch_args['e_off_meas'][i]['graph_i_e'])
-                elif switch_args['e_off_meas'][i]['dataset_type'] == 'graph_t_e':
-                    switch_args['e_off_meas'][i]['graph_t_e'] = np.array(switch_args['e_off_meas'][i]['graph_t_e'])
-        if 'charge_curve' in switch_args:
-            for i in range(len(switch_args['charge_curve'])):
-                switch_args['charge_curve'][i]['graph_q_v'] = np.array(switch_args['charge_curve'][i]['graph_q_v'])
-        if 'r_channel_th' in switch_args:
-            for i in range(len(switch_args['r_channel_th'])):
-                switch_args['r_channel_th'][i]['graph_t_r'] = np.array(switch_args['r_channel_th'][i]['graph_t_r'])
-        if 'soa' in switch_args:
-            for i in range(len(switch_args['soa'])):
-                switch_args['soa'][i]['graph_i_v'] = np.array(switch_args['soa'][i]['graph_i_v'])
-
-        # Convert diode_args
-        diode_args = transistor_dict['diode']
-        if diode_args['thermal_foster']['graph_t_rthjc'] is not None:
-            diode_args['thermal_foster']['graph_t_rthjc'] = np.array(diode_args['thermal_foster']['graph_t_rthjc'])
-        for i in range(len(diode_args['channel'])):
-            diode_args['channel'][i]['graph_v_i'] = np.array(diode_args['channel'][i]['graph_v_i'])
-        for i in range(len(diode_args['e_rr'])):
-            if diode_args['e_rr'][i]['dataset_type'] == 'graph_r_e':
-                diode_args['e_rr'][i]['graph_r_e'] = np.array(diode_args['e_rr'][i]['graph_r_e'])
-            elif diode_args['e_rr'][i]['dataset_type'] == 'graph_i_e':
-                diode_args['e_rr'][i]['graph_i_e'] = np.array(diode_args['e_rr'][i]['graph_i_e'])
-        if 'soa' in diode_args:
-            for i in range(len(diode_args['soa'])):
-                diode_args['soa'][i]['graph_i_v'] = np.array(diode_args['soa'][i]['graph_i_v'])
-
-        return Transistor(transistor_dict, switch_args, diode_args, self.housing_types, self.module_manufacturers)
+        self._decode_arrays(transistor_dict, TRANSISTOR_ARRAY_SCHEMA)
+        with trusted_data() if trusted else contextlib.nullcontext():
+            return Transistor(transistor_dict, transistor_dict['switch'], transistor_dict['diode'], self.housing_types, self.module_manufacturers)
 
+    @staticmethod
+    def _decode_arrays(value, schema):
+        """
+        Convert the curves of a (part of a) transistor dictionary to numpy arrays, in place.
+
+        :param value: dictionary, list of dictionaries or curve
+        :param schema: part of TRANSISTOR_ARRAY_SCHEMA describing the value
+        :return: converted value
+        """
+        if value is None:
+            return None
+        if schema == ARRAY:
+            return np.array(value)
+        if schema == ARRAY_LIST:
+            # np.asarray: memory-mapped waveforms of the binary operation mode are not copied
+            return [np.asarray(item) for item in value]
+        if isinstance(schema, list):
+            for item in value:
+                DatabaseManager._decode_arrays(item, schema[0])
+            return value
+        for key, key_schema in schema.items():
+            if value.get(key) is not None:
+                value[key] = DatabaseManager._decode_arrays(value[key], key_schema)
+        return value
+
+    @_synchronized
     def parallel_transistors(self, transistor: Transistor, count_parallels: int = 2) -> Transistor:
         """
         Connect [count_parallels] transistors in parallel.
@@ -540,8 +1647,13 @@ class DatabaseManager:
         - name will be modified by adding _[count_parallels]_parallel
         - channel characteristics will be modified
         - e_on/e_off/e_rr characteristics will be modified
+        - voltage dependent capacitances will be modified
         - thermal behaviour will be modified
 
+        The curves are scaled on a copy of the transistor object, the transistor is not converted to a dictionary and not
+        validated again. The results are memoized per transistor name, content and count_parallels (up to cache_size
+        transistors), so connecting an unchanged transistor in parallel again only copies the memoized transistor object.
+
         :param transistor: transistor object to paralize
         :type transistor: Transistor
         :param count_parallels: count of parallel transistors of same type, default = 2
@@ -557,83 +1669,99 @@ class DatabaseManager:
         >>> parallel_transistorobject = transistor.parallel_transistors(3)
 
         """
-        transistor_dict = transistor.convert_to_dict()
+        if self.cache_size <= 0:
+            self.parallel_cache_misses += 1
+            return self._scale_parallel_transistor(transistor, count_parallels)
+
+        key = (transistor.name, self._get_object_hash(transistor), count_parallels)
+        parallel_transistor = self._parallel_transistor_cache.get(key)
+        if parallel_transistor is None:
+            self.parallel_cache_misses += 1
+            parallel_transistor = self._scale_parallel_transistor(transistor, count_parallels)
+            self._parallel_transistor_cache[key] = parallel_transistor
+            while len(self._parallel_transistor_cache) > self.cache_size:
+                self._parallel_transistor_cache.popitem(last=False)
+        else:
+            self.parallel_cache_hits += 1
+            self._parallel_transistor_cache.move_to_end(key)
+        # A copy is returned, so changes made by the caller never leak into the memo
+        return copy.deepcopy(parallel_transistor)
+
+    @staticmethod
+    def _scale_parallel_transistor(transistor: Transistor, count_parallels: int) -> Transistor:
+        """
+        Scale the curves of a copy of a transistor object to [count_parallels] transistors in parallel, see parallel_transistors().
+
+        Scaled arrays are replaced by new arrays, so caches which depend on the identity of the arrays are not used anymore.
+
+        :param transistor: transistor object to paralize
+        :type transistor: Transistor
+        :param count_parallels: count of parallel transistors of same type
+        :type count_parallels: int
+        :return: transistor object with parallel transistors
+        :rtype: Transistor
+        """
+        # factors of the x- and y-rows of the curves
+        scale_y = np.array([[1], [count_parallels]])
+        scale_x_y = np.array([[count_parallels], [count_parallels]])
+
+        parallel_transistor = copy.deepcopy(transistor)
+        parallel_transistor.wp = Transistor.WP()
+        parallel_transistor.__dict__.pop('_c_oss_integrals', None)
 
         # modify transistor elements
-        transistor_dict['name'] = f"{transistor_dict['name']}_{count_parallels}_parallel"
-        transistor_dict['r_th_switch_cs'] = transistor_dict['r_th_switch_cs'] / count_parallels
-        transistor_dict['r_th_diode_cs'] /= count_parallels
-        transistor_dict['r_th_cs'] /= count_parallels
-        transistor_dict['i_abs_max'] = transistor_dict['i_abs_max'] * count_parallels
-        transistor_dict['i_cont'] = transistor_dict['i_cont'] * count_parallels
-        transistor_dict['c_iss'] = transistor_dict['c_iss'] * count_parallels
-        transistor_dict['c_oss'] *= count_parallels
-        transistor_dict['c_rss'] *= count_parallels
-
-        # modify switch dict
-        for channel_dict in transistor_dict['switch']['channel']:
-            if 'graph_v_i' in channel_dict:
-                channel_dict['graph_v_i'][1] = [y * count_parallels for y in channel_dict['graph_v_i'][1]]
-        for e_on_dict in transistor_dict['switch']['e_on']:
-            if e_on_dict['dataset_type'] == 'graph_i_e':
-                e_on_dict['graph_i_e'][0] = [y * count_parallels for y in e_on_dict['graph_i_e'][0]]
-                e_on_dict['graph_i_e'][1] = [y * count_parallels for y in e_on_dict['graph_i_e'][1]]
-            if e_on_dict['dataset_type'] == 'graph_r_e':
-                e_on_dict['graph_r_e'][1] = [y * count_parallels for y in e_on_dict['graph_r_e'][1]]
-            if e_on_dict['dataset_type'] == 'graph_t_e':
-                e_on_dict['graph_t_e'][1] = [y * count_parallels for y in e_on_dict['graph_t_e'][1]]
-        for e_off_dict in transistor_dict['switch']['e_off']:
-            if e_off_dict['dataset_type'] == 'graph_i_e':
-                e_off_dict['graph_i_e'][0] = [y * count_parallels for y in e_off_dict['graph_i_e'][0]]
-                e_off_dict['graph_i_e'][1] = [y * count_parallels for y in e_off_dict['graph_i_e'][1]]
-            if e_off_dict['dataset_type'] == 'graph_r_e':
-                e_off_dict['graph_r_e'][1] = [y * count_parallels for y in e_off_dict['graph_r_e'][1]]
-            if e_off_dict['dataset_type'] == 'graph_t_e':
-                e_off_dict['graph_t_e'][1] = [y * count_parallels for y in e_off_dict['graph_t_e'][1]]
-        # modify diode dict
-        for x in transistor_dict['diode']['channel']:
-            x['graph_v_i'][1] = [y * count_parallels for y in x['graph_v_i'][1]]
-        for e_rr_dict in transistor_dict['diode']['e_rr']:
-            if e_rr_dict['dataset_type'] == 'graph_i_e':
-                e_rr_dict['graph_i_e'][0] = [y * count_parallels for y in e_rr_dict['graph_i_e'][0]]
-                e_rr_dict['graph_i_e'][1] = [y * count_parallels for y in e_rr_dict['graph_i_e'][1]]
-            if e_rr_dict['dataset_type'] == 'graph_r_e':
-                e_rr_dict['graph_r_e'][1] = [y * count_parallels for y in e_rr_dict['graph_r_e'][1]]
-
-        # modify switch thermal dict
-        transistor_dict['switch']['thermal_foster']['r_th_total'] /= count_parallels
-        transistor_dict['switch']['thermal_foster']['r_th_vector'] = None if \
-            transistor_dict['switch']['thermal_foster']['r_th_vector'] is None else [x / count_parallels for x in
-                                                                                     transistor_dict['switch'][
-                                                                                         'thermal_foster']['r_th_vector']]
-        transistor_dict['switch']['thermal_foster']['c_th_total'] = None if transistor_dict['switch']['thermal_foster']['c_th_total'] is None else \
-            transistor_dict['switch']['thermal_foster']['c_th_total'] / count_parallels
-        transistor_dict['switch']['thermal_foster']['c_th_vector'] = None if \
-            transistor_dict['switch']['thermal_foster']['c_th_vector'] is None else [x / count_parallels for x in
-                                                                                     transistor_dict['switch'][
-                                                                                         'thermal_foster']['c_th_vector']]
-
-        if transistor_dict['switch']['thermal_foster']['graph_t_rthjc'] is not None:
-            transistor_dict['switch']['thermal_foster']['graph_t_rthjc'][1] = [x / count_parallels for x in
-                                                                               transistor_dict['switch'][
-                                                                                   'thermal_foster'][
-                                                                                   'graph_t_rthjc'][1]]
-        # modify diode thermal dict
-        transistor_dict['diode']['thermal_foster']['r_th_total'] /= count_parallels
-        transistor_dict['diode']['thermal_foster']['r_th_vector'] = None if transistor_dict['diode']['thermal_foster']['r_th_vector'] is None else [
-            x / count_parallels for x in transistor_dict['diode']['thermal_foster']['r_th_vector']]
-        transistor_dict['diode']['thermal_foster']['c_th_total'] = None if transistor_dict['diode']['thermal_foster']['c_th_total'] is None else \
-            transistor_dict['diode']['thermal_foster']['c_th_total'] / count_parallels
-        transistor_dict['diode']['thermal_foster']['c_th_vector'] = None if transistor_dict['diode']['thermal_foster']['c_th_vector'] is None else [
-            x / count_parallels for x in transistor_dict['diode']['thermal_foster']['c_th_vector']]
-
-        if transistor_dict['diode']['thermal_foster']['graph_t_rthjc'] is not None:
-            transistor_dict['diode']['thermal_foster']['graph_t_rthjc'][1] = [x / count_parallels for x in
-                                                                              transistor_dict['diode'][
-                                                                                  'thermal_foster'][
-                                                                                  'graph_t_rthjc'][1]]
-
-        return self.convert_dict_to_transistor_object(transistor_dict)
+        parallel_transistor.name = f"{transistor.name}_{count_parallels}_parallel"
+        parallel_transistor.r_th_switch_cs = transistor.r_th_switch_cs / count_parallels
+        parallel_transistor.r_th_diode_cs = transistor.r_th_diode_cs / count_parallels
+        parallel_transistor.r_th_cs = transistor.r_th_cs / count_parallels
+        parallel_transistor.i_abs_max = transistor.i_abs_max * count_parallels
+        parallel_transistor.i_cont = transistor.i_cont * count_parallels
+        for capacitance in (parallel_transistor.c_iss or []) + (parallel_transistor.c_oss or []) + (parallel_transistor.c_rss or []):
+            capacitance.graph_v_c = np.asarray(capacitance.graph_v_c) * scale_y
+
+        # modify switch and diode curves
+        for channel in parallel_transistor.switch.channel + parallel_transistor.diode.channel:
+            if channel.graph_v_i is not None:
+                channel.graph_v_i = np.asarray(channel.graph_v_i) * scale_y
+        for energy in parallel_transistor.switch.e_on + parallel_transistor.switch.e_off + parallel_transistor.diode.e_rr:
+            if energy.dataset_type == 'graph_i_e':
+                energy.graph_i_e = np.asarray(energy.graph_i_e) * scale_x_y
+            if energy.dataset_type == 'graph_r_e':
+                energy.graph_r_e = np.asarray(energy.graph_r_e) * scale_y
+        for energy in parallel_transistor.switch.e_on + parallel_transistor.switch.e_off:
+            if energy.dataset_type == 'graph_t_e':
+                energy.graph_t_e = np.asarray(energy.graph_t_e) * scale_y
+
+        # modify switch and diode thermal models
+        for thermal_foster in [parallel_transistor.switch.thermal_foster, parallel_transistor.diode.thermal_foster]:
+            thermal_foster.r_th_total = thermal_foster.r_th_total / count_parallels
+            if thermal_foster.r_th_vector is not None:
+                thermal_foster.r_th_vector = np.asarray(thermal_foster.r_th_vector) / count_parallels
+            if thermal_foster.c_th_total is not None:
+                thermal_foster.c_th_total = thermal_foster.c_th_total / count_parallels
+            if thermal_foster.c_th_vector is not None:
+                thermal_foster.c_th_vector = np.asarray(thermal_foster.c_th_vector) / count_parallels
+            if thermal_foster.graph_t_rthjc is not None:
+                thermal_foster.graph_t_rthjc = np.asarray(thermal_foster.graph_t_rthjc) / scale_y
+
+        parallel_transistor.switch.invalidate_operating_point_index()
+        parallel_transistor.diode.invalidate_operating_point_index()
+        return parallel_transistor
+
+    @staticmethod
+    def _get_object_hash(transistor: Transistor) -> str:
+        """
+        Calculate a hash of the data of a transistor object, e.g. as memo key.
+
+        Faster than get_content_hash(), since the arrays are not converted to json. The hash depends on the array types, so
+        it is only used within a process.
+
+        :param transistor: transistor object
+        :type transistor: Transistor
+        :return: sha256 hex digest
+        :rtype: str
+        """
+        return hashlib.sha256(pickle.dumps(transistor.convert_to_dict(arrays_as_lists=False), protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
 
     @staticmethod
     def import_xml_data(files: Dict) -> Transistor:
@@ -701,22 +1829,168 @@ class DatabaseManager:
             print(e.args[0])
 
     @staticmethod
-    def export_single_transistor_to_json(transistor: Transistor, file_path: Optional[str] = None):
+    def export_single_transistor_to_json(transistor: Transistor, file_path: Optional[str] = None, indent: Optional[int] = 2,
+                                         serializer: Optional[str] = None):
         """
         Export a single transistor object to a json file.
 
+        The file is written atomically, see write_json_file().
+
         :param transistor: transistor name
         :type transistor: Transistor
         :param file_path: Specify a directory or a file path.
         :type file_path: Optional[str]
+        :param indent: indentation, None for a compact file
+        :type indent: Optional[int]
+        :param serializer: name of the json serializer (see json_serializer.JSON_SERIALIZERS), None for the default serializer
+        :type serializer: Optional[str]
         """
         if file_path is None:
             file_path = os.getcwd()
         if os.path.isdir(file_path):
             file_path = os.path.join(file_path, f"{transistor.name}.json")
             print(file_path)
-        with open(file_path, "w") as fd:
-            json.dump(transistor.convert_to_dict(), fd, indent=2)
+        write_json_file(transistor.convert_to_dict(arrays_as_lists=False), file_path, indent, serializer)
+
+    @staticmethod
+    def write_binary_transistor_file(transistor_dict: Dict, file_path: str) -> None:
+        """
+        Write a transistor dictionary to a binary (.npz) file.
+
+        All curves (keys starting with 'graph_' or 'dpt_') are stored one after another in a single contiguous float64 array,
+        everything else is stored in a json header which references the curves by offset and shape.
+        The file is not compressed. It is written to a temporary file first and then renamed.
+
+        :param transistor_dict: transistor dictionary, e.g. from Transistor.convert_to_dict() or a json file
+        :type transistor_dict: dict
+        :param file_path: path of the .npz file
+        :type file_path: str
+        """
+        arrays = []
+        data_size = 0
+
+        def store_array(curve):
+            nonlocal data_size
+            if curve is None or np.asarray(curve).dtype.kind not in "iuf":
+                # No array data or ragged/non-numeric data: keep it in the header
+                return curve.tolist() if isinstance(curve, np.ndarray) else curve
+            array = np.asarray(curve, dtype=np.float64)
+            arrays.append(array.ravel())
+            data_size += array.size
+            return {BINARY_ARRAY_REFERENCE_KEY: [data_size - array.size, list(array.shape)]}
+
+        def extract_arrays(value, key: str = ""):
+            if isinstance(value, dict):
+                return {sub_key: extract_arrays(sub_value, sub_key) for sub_key, sub_value in value.items()}
+            if key.startswith("graph_") and isinstance(value, (list, np.ndarray)):
+                return store_array(value)
+            if key.startswith("dpt_") and isinstance(value, (list, np.ndarray)):
+                return [store_array(curve) for curve in value]
+            if isinstance(value, list):
+                return [extract_arrays(item) for item in value]
+            return value
+
+        header = extract_arrays(transistor_dict)
+        header.pop("_id", None)
+        header[BINARY_CONTENT_HASH_KEY] = DatabaseManager.get_content_hash(transistor_dict)
+        header_array = np.frombuffer(json.dumps(header).encode(), dtype=np.uint8)
+        with open(file_path + ".tmp", "wb") as fd:
+            np.savez(fd, **{BINARY_HEADER_KEY: header_array, BINARY_DATA_KEY: np.concatenate(arrays) if arrays else np.zeros(0)})
+        os.replace(file_path + ".tmp", file_path)
+
+    @staticmethod
+    def read_binary_transistor_file(file_path: str, header_only: bool = False, memory_map: bool = False) -> Dict:
+        """
+        Read a transistor dictionary from a binary (.npz) file.
+
+        :param file_path: path of the .npz file
+        :type file_path: str
+        :param header_only: If True, the arrays are not read and the curves remain array references. The content hash is
+            contained with the key BINARY_CONTENT_HASH_KEY.
+        :type header_only: bool
+        :param memory_map: If True, the curves are read-only views of a memory-mapped array instead of being read into memory.
+        :type memory_map: bool
+        :return: transistor dictionary, curves are given as float64 numpy arrays (views of one contiguous array)
+        :rtype: dict
+        """
+        with np.load(file_path) as npz_file:
+            header = json.loads(npz_file[BINARY_HEADER_KEY].tobytes().decode())
+            if header_only:
+                # The content hash is kept, it is used by the summary index
+                return header
+            header.pop(BINARY_CONTENT_HASH_KEY, None)
+            data = DatabaseManager._memory_map_npz_member(file_path, BINARY_DATA_KEY) if memory_map else None
+            if data is None:
+                data = npz_file[BINARY_DATA_KEY]
+
+        def insert_arrays(value):
+            if isinstance(value, dict):
+                if BINARY_ARRAY_REFERENCE_KEY in value:
+                    offset, shape = value[BINARY_ARRAY_REFERENCE_KEY]
+                    return data[offset:offset + int(np.prod(shape))].reshape(shape)
+                return {key: insert_arrays(sub_value) for key, sub_value in value.items()}
+            if isinstance(value, list):
+                return [insert_arrays(item) for item in value]
+            return value
+
+        return insert_arrays(header)
+
+    @staticmethod
+    def _memory_map_npz_member(file_path: str, member_name: str) -> Optional[np.memmap]:
+        """
+        Memory-map an array stored uncompressed inside a .npz file.
+
+        :param file_path: path of the .npz file
+        :type file_path: str
+        :param member_name: name of the array inside the .npz file
+        :type member_name: str
+        :return: read-only memory-mapped array or None if the array can not be memory-mapped (e.g. compressed file)
+        :rtype: np.memmap or None
+        """
+        with zipfile.ZipFile(file_path) as zip_file:
+            zip_info = zip_file.getinfo(f"{member_name}.npy")
+        if zip_info.compress_type != zipfile.ZIP_STORED:
+            return None
+        with open(file_path, "rb") as fd:
+            # Skip the zip local file header (30 bytes + file name + extra field) to get to the .npy data
+            fd.seek(zip_info.header_offset)
+            local_header = fd.read(30)
+            file_name_length, extra_field_length = struct.unpack("<HH", local_header[26:30])
+            fd.seek(zip_info.header_offset + 30 + file_name_length + extra_field_length)
+            version = np.lib.format.read_magic(fd)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fd)
+            elif version == (2, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fd)
+            else:
+                return None
+            offset = fd.tell()
+        if not shape or 0 in shape:
+            return None
+        return np.memmap(file_path, dtype=dtype, mode="r", offset=offset, shape=shape, order="F" if fortran_order else "C")
+
+    @staticmethod
+    def convert_json_folder_to_binary(json_folder_path: str, binary_folder_path: str) -> List[str]:
+        """
+        Convert all transistor json files of a folder to binary files, e.g. to use an existing json database in binary operation mode.
+
+        :param json_folder_path: Path to the json folder
+        :type json_folder_path: str
+        :param binary_folder_path: Path to the binary folder. It is created if it does not exist.
+        :type binary_folder_path: str
+        :return: Names of the converted transistors
+        :rtype: List[str]
+        """
+        if not os.path.isdir(binary_folder_path):
+            os.makedirs(binary_folder_path)
+        converted_transistor_names = []
+        for file_name in sorted(os.listdir(json_folder_path)):
+            if file_name.endswith(".json") and isvalid_transistor_name(file_name[:-5]):
+                with open(os.path.join(json_folder_path, file_name), "r") as fd:
+                    transistor_dict = json.load(fd)
+                DatabaseManager.write_binary_transistor_file(transistor_dict, os.path.join(binary_folder_path, f"{file_name[:-5]}{BINARY_FILE_EXTENSION}"))
+                converted_transistor_names.append(file_name[:-5])
+        return converted_transistor_names
 
     @staticmethod
     def dpt_save_data(measurement_dict: Dict) -> Dict:
@@ -1305,3 +2579,99 @@ class DatabaseManager:
             dpt_raw_data |= {'dataset_type': 'dpt_u_i', 'r_g': r_g}
         dpt_dict = {'e_off_meas': e_off_meas, 'e_on_meas': e_on_meas, 'raw_measurement_data': dpt_raw_data}
         return dpt_dict
+
+
+@functools.lru_cache(maxsize=None)
+def _get_worker_database_manager(housing_types_file_path: str, module_manufacturers_file_path: str) -> DatabaseManager:
+    """
+    Get the DatabaseManager of a worker process, which is created once per process.
+
+    :param housing_types_file_path: Path to the housing types file
+    :type housing_types_file_path: str
+    :param module_manufacturers_file_path: Path to the module manufacturers file
+    :type module_manufacturers_file_path: str
+    :return: DatabaseManager without operation mode
+    :rtype: DatabaseManager
+    """
+    return DatabaseManager(housing_types_file_path, module_manufacturers_file_path, cache_size=0)
+
+def _load_transistor_file(transistor_path: str, trusted: bool, housing_types_file_path: str, module_manufacturers_file_path: str) -> Transistor:
+    """
+    Load a json/binary transistor file in a worker process (see DatabaseManager.load_many()).
+
+    :param transistor_path: Path to the json/binary file
+    :type transistor_path: str
+    :param trusted: True to skip the validity checks
+    :type trusted: bool
+    :param housing_types_file_path: Path to the housing types file
+    :type housing_types_file_path: str
+    :param module_manufacturers_file_path: Path to the module manufacturers file
+    :type module_manufacturers_file_path: str
+    :return: Transistor object
+    :rtype: Transistor
+    """
+    database_manager = _get_worker_database_manager(housing_types_file_path, module_manufacturers_file_path)
+    return database_manager.convert_dict_to_transistor_object(database_manager._read_transistor_file(transistor_path), trusted)
+
+def _use_headless_plot_backend() -> None:
+    """Use the non-interactive Agg backend of matplotlib in a worker process."""
+    plt.switch_backend("Agg")
+
+def _export_transistor(transistor_name: str, source: Union[str, Dict, None], trusted: bool, formats: List[str], filepath: str, export_options: Dict,
+                       housing_types_file_path: str, module_manufacturers_file_path: str) -> Dict:
+    """
+    Load and export a transistor in a worker process (see DatabaseManager.export_many()).
+
+    :param transistor_name: Name of the transistor
+    :type transistor_name: str
+    :param source: Path to the json/binary file or transistor dictionary (MongoDB), None if the transistor is not found
+    :type source: str or Dict or None
+    :param trusted: True to skip the validity checks
+    :type trusted: bool
+    :param formats: export formats, see EXPORT_FORMATS
+    :type formats: List[str]
+    :param filepath: directory to save the files
+    :type filepath: str
+    :param export_options: keyword arguments of the exporters per format
+    :type export_options: Dict
+    :param housing_types_file_path: Path to the housing types file
+    :type housing_types_file_path: str
+    :param module_manufacturers_file_path: Path to the module manufacturers file
+    :type module_manufacturers_file_path: str
+    :return: report of the transistor, see DatabaseManager.export_many()
+    :rtype: Dict
+    """
+    report = {"name": transistor_name, "success": False, "error": None, "duration": 0.0, "formats": {}, "log": ""}
+    start = time.perf_counter()
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        try:
+            if source is None:
+                raise KeyError(f"Transistor with name {transistor_name} not found.")
+            database_manager = _get_worker_database_manager(housing_types_file_path, module_manufacturers_file_path)
+            transistor_dict = database_manager._read_transistor_file(source) if isinstance(source, str) else source
+            transistor = database_manager.convert_dict_to_transistor_object(transistor_dict, trusted)
+        except Exception as e:
+            report["error"] = f"{type(e).__name__}: {e}"
+        else:
+            for export_format in formats:
+                format_start = time.perf_counter()
+                format_report = {"success": True, "error": None, "files": []}
+                # Some exporters print their errors instead of raising them: the files written by each exporter are collected in
+                # a temporary directory, an exporter without any file failed.
+                with tempfile.TemporaryDirectory(dir=filepath, prefix=".tdb_export_") as export_folder:
+                    try:
+                        getattr(transistor, EXPORT_FORMATS[export_format])(filepath=export_folder, **export_options.get(export_format, {}))
+                    except Exception as e:
+                        format_report.update(success=False, error=f"{type(e).__name__}: {e}")
+                    for file_name in sorted(os.listdir(export_folder)):
+                        os.replace(os.path.join(export_folder, file_name), os.path.join(filepath, file_name))
+                        format_report["files"].append(file_name)
+                if format_report["success"] and not format_report["files"]:
+                    format_report.update(success=False, error="No file exported, see log")
+                format_report["duration"] = time.perf_counter() - format_start
+                report["formats"][export_format] = format_report
+            report["success"] = all(format_report["success"] for format_report in report["formats"].values())
+    report["duration"] = time.perf_counter() - start
+    report["log"] = log.getvalue()
+    return report
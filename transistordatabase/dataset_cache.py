@@ -0,0 +1,125 @@
+"""Cached lookup structures of the dataset lists of the Switch and Diode classes (operating point indexes, interpolation tables, resampled curves)."""
+# Python standard libraries
+from __future__ import annotations
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+# Third party libraries
+import numpy as np
+
+# Local libraries
+from transistordatabase.operating_point_index import OperatingPointIndex
+from transistordatabase.curve_resampling import get_channel_tensor, get_loss_tensor
+
+# Private attributes of the cached lookup structures, not part of the transistor data
+DATASET_CACHE_ATTRIBUTES = ('_operating_point_indexes', '_channel_interpolation_tables', '_resampled_curves')
+
+class DatasetCacheMixin:
+    """
+    Mixin for the Switch and Diode classes, caches lookup structures of their dataset lists (e.g. channel, e_on, e_rr).
+
+    The caches are stored in the instance dictionary under DATASET_CACHE_ATTRIBUTES. They are skipped by collect_data() as
+    they are dictionaries and have to be removed from the dictionary of convert_to_dict() (see _get_data_dict()).
+    """
+
+    def _get_data_dict(self) -> Dict:
+        """
+        Get a shallow copy of the instance dictionary without the cached lookup structures, used by convert_to_dict().
+
+        :return: instance attributes
+        :rtype: dict
+        """
+        d = dict(vars(self))
+        for cache_attribute in DATASET_CACHE_ATTRIBUTES:
+            d.pop(cache_attribute, None)
+        return d
+
+    def _get_cached(self, cache_attribute: str, attribute: str, key: Hashable, create: Callable[[List], Any]) -> Any:
+        """
+        Get a value calculated from a dataset list, recalculated if the list is replaced or datasets are added or removed.
+
+        :param cache_attribute: name of the cache, one of DATASET_CACHE_ATTRIBUTES
+        :type cache_attribute: str
+        :param attribute: name of the dataset list, e.g. 'channel'
+        :type attribute: str
+        :param key: key of the value in the cache
+        :param create: function calculating the value from the dataset list
+        :type create: Callable
+        :return: cached value
+        """
+        datasets = getattr(self, attribute)
+        signature = (id(datasets), len(datasets))
+        cache = self.__dict__.setdefault(cache_attribute, {})
+        if key not in cache or cache[key][0] != signature:
+            cache[key] = (signature, create(datasets))
+        return cache[key][1]
+
+    def get_operating_point_index(self, attribute: str) -> OperatingPointIndex:
+        """
+        Get the operating point index of a dataset list, e.g. 'channel', 'e_on' or 'e_rr'.
+
+        The index is built on first use and rebuilt if the list is replaced or datasets are added or removed. After changing
+        datasets in place, call invalidate_operating_point_index().
+
+        :param attribute: name of the dataset list
+        :type attribute: str
+        :return: operating point index
+        :rtype: OperatingPointIndex
+        """
+        return self._get_cached('_operating_point_indexes', attribute, attribute, OperatingPointIndex)
+
+    def invalidate_operating_point_index(self) -> None:
+        """Reset the operating point indexes, the channel interpolation tables and the resampled curves."""
+        for cache_attribute in DATASET_CACHE_ATTRIBUTES:
+            self.__dict__.pop(cache_attribute, None)
+
+    def get_channel_interpolation_table(self, t_j: float, v_g: float = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the channel curve for the given operating point as interpolation table sorted by the current.
+
+        The table is calculated once per operating point and cached together with the operating point index of the channel data.
+
+        :param t_j: junction temperature
+        :type t_j: float
+        :param v_g: gate voltage. None to use the first dataset with the given junction temperature (e.g. for diodes).
+        :type v_g: float
+
+        :raises ValueError: Raised when there is no channel data for the given operating point
+
+        :return: currents (ascending), channel voltages
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        channel_index = self.get_operating_point_index('channel')
+        cache = self.__dict__.get('_channel_interpolation_tables')
+        if cache is None or cache['index'] is not channel_index:
+            cache = {'index': channel_index, 'tables': {}}
+            self._channel_interpolation_tables = cache
+        tables = cache['tables']
+        if (t_j, v_g) not in tables:
+            # The first matching dataset is used, same as in Transistor.calc_lin_channel()
+            candidate_datasets = channel_index.find_exact(t_j=t_j) if v_g is None else channel_index.find_exact(t_j=t_j, v_g=v_g)
+            if not candidate_datasets:
+                raise ValueError(f"No data available for linearization at the given operating point. Available operating points (t_j, v_g): "
+                                 f"{channel_index.operating_points('t_j', 'v_g')}")
+            graph_v_i = np.asarray(candidate_datasets[0].graph_v_i, dtype=float)
+            order = np.argsort(graph_v_i[1], kind='stable')
+            tables[(t_j, v_g)] = (graph_v_i[1][order], graph_v_i[0][order])
+        return tables[(t_j, v_g)]
+
+    def get_resampled_curves(self, attribute: str, v_g: float, n_points: int = 20) -> Dict | None:
+        """
+        Get the channel curves (attribute='channel') or the loss curves (e.g. attribute='e_on' or 'e_rr') at a gate voltage on a common grid.
+
+        The curves are resampled once per gate voltage (see curve_resampling.get_channel_tensor() and get_loss_tensor()) and cached
+        for all exporters. Like the operating point index, the cache is rebuilt if the dataset list changes.
+
+        :param attribute: name of the dataset list
+        :type attribute: str
+        :param v_g: gate voltage of the curves. For the channel curves None uses the curves of all gate voltages.
+        :type v_g: float
+        :param n_points: number of points of the current axis
+        :type n_points: int
+        :return: resampled curves (read-only arrays), None if there are no curves at the gate voltage
+        :rtype: dict or None
+        """
+        get_tensor = get_channel_tensor if attribute == 'channel' else get_loss_tensor
+        return self._get_cached('_resampled_curves', attribute, (attribute, v_g, n_points), lambda datasets: get_tensor(datasets, v_g, n_points))
@@ -0,0 +1,197 @@
+"""Headless rendering of the virtual datasheet to pdf with matplotlib, no Qt application or display is needed."""
+# Python standard libraries
+from __future__ import annotations
+from typing import Dict, List, Tuple
+import base64
+import io
+import os
+
+# A4 portrait in inches
+DATASHEET_PAGE_SIZE = (8.27, 11.69)
+DATASHEET_TABLE_ROWS_PER_PAGE = 40
+DATASHEET_PLOT_GRID = (3, 2)
+
+# Same plot titles as the html template (VirtualDatasheet_TransistorTemplate.html)
+DATASHEET_PLOT_TITLES = {'c_plots': 'Voltage dependent Capacitance', 'channel_plots': 'Channel Characteristics', 'energy_plots': 'Current vs. Energy',
+                         'energy_plots_r': 'Rg vs. Energy', 'energy_plots_t': 'Tj vs. Energy', 'r_channel_th_plot': 'On Resistance',
+                         'charge_curve': 'Gate charge,Qg', 'imp_plot': 'Thermal step response', 'soa': 'Safe operating Area'}
+
+# The page figure is created once per process and cleared for every page
+_page_figure = None
+
+def render_datasheet_pdf(trans: Dict, switch: Dict, diode: Dict, pdf_path: str) -> None:
+    """
+    Render the virtual datasheet to a pdf-file. Helper function of Transistor.export_datasheet_pdf().
+
+    The pages contain the parameter tables of the transistor, switch and diode followed by their plots. The file is written to a
+    temporary file first and then renamed, so an interrupted export never leaves a truncated pdf-file.
+
+    :param trans: transistor data along with units, see Transistor.get_datasheet_data()
+    :type trans: dict
+    :param switch: switch data along with units
+    :type switch: dict
+    :param diode: diode data along with units
+    :type diode: dict
+    :param pdf_path: path of the pdf-file
+    :type pdf_path: str
+    """
+    from matplotlib.backends.backend_pdf import PdfPages
+    title = f"{_get_value(trans.get('Name', ''))} - {_get_value(trans.get('Manufacturer', ''))}"
+    transistor_type = _get_value(trans.get('Type', 'Switch'))
+    tables = [("Transistor", _get_table_rows(trans)), (f"{transistor_type} Specifications", _get_table_rows(switch)),
+              ("Diode Specifications", _get_table_rows(diode))]
+    plots = [(f"Transistor: {DATASHEET_PLOT_TITLES.get(key, key)}", image) for key, image in _get_plots(trans).items()]
+    plots += [(f"{transistor_type}: {DATASHEET_PLOT_TITLES.get(key, key)}", image) for key, image in _get_plots(switch).items()]
+    plots += [(f"Diode: {DATASHEET_PLOT_TITLES.get(key, key)}", image) for key, image in _get_plots(diode).items()]
+    plots += _get_raw_measurement_plots(trans)
+
+    temp_path = pdf_path + ".tmp"
+    try:
+        with PdfPages(temp_path) as pdf:
+            for table_title, rows in tables:
+                for start in range(0, max(len(rows), 1), DATASHEET_TABLE_ROWS_PER_PAGE):
+                    pdf.savefig(_draw_table_page(title, table_title, rows[start:start + DATASHEET_TABLE_ROWS_PER_PAGE]))
+            plots_per_page = DATASHEET_PLOT_GRID[0] * DATASHEET_PLOT_GRID[1]
+            for start in range(0, len(plots), plots_per_page):
+                pdf.savefig(_draw_plot_page(title, plots[start:start + plots_per_page]))
+        os.replace(temp_path, pdf_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def _get_page_figure():
+    """
+    Get the cleared page figure of this process.
+
+    The figure is created without pyplot, so no gui backend is used and the figure is never shown.
+
+    :return: empty figure of DATASHEET_PAGE_SIZE
+    :rtype: matplotlib.figure.Figure
+    """
+    global _page_figure
+    if _page_figure is None:
+        from matplotlib.figure import Figure
+        _page_figure = Figure(figsize=DATASHEET_PAGE_SIZE)
+    _page_figure.clf()
+    return _page_figure
+
+def _draw_table_page(title: str, table_title: str, rows: List[Tuple[str, str, str]]):
+    """
+    Draw a page with a parameter table.
+
+    :param title: page title
+    :type title: str
+    :param table_title: table title
+    :type table_title: str
+    :param rows: rows of parameter name, value and unit
+    :type rows: list
+    :return: page figure
+    :rtype: matplotlib.figure.Figure
+    """
+    fig = _get_page_figure()
+    fig.text(0.5, 0.96, _escape(title), ha='center', va='top', fontsize=14, fontweight='bold')
+    fig.text(0.08, 0.91, _escape(table_title), ha='left', va='top', fontsize=12, fontweight='bold')
+    row_height = 0.82 / DATASHEET_TABLE_ROWS_PER_PAGE
+    for row_index, (name, value, unit) in enumerate(rows):
+        y = 0.87 - row_index * row_height
+        fig.text(0.08, y, _escape(name), ha='left', va='top', fontsize=9, fontweight='bold')
+        fig.text(0.38, y, _escape(value[:70]), ha='left', va='top', fontsize=9)
+        fig.text(0.88, y, _escape(unit), ha='left', va='top', fontsize=9)
+    return fig
+
+def _draw_plot_page(title: str, plots: List[Tuple[str, str]]):
+    """
+    Draw a page with a grid of plots.
+
+    :param title: page title
+    :type title: str
+    :param plots: plot titles and base64 encoded png images
+    :type plots: list
+    :return: page figure
+    :rtype: matplotlib.figure.Figure
+    """
+    import matplotlib.image
+    fig = _get_page_figure()
+    fig.text(0.5, 0.96, _escape(title), ha='center', va='top', fontsize=14, fontweight='bold')
+    for plot_index, (plot_title, image) in enumerate(plots):
+        ax = fig.add_subplot(DATASHEET_PLOT_GRID[0], DATASHEET_PLOT_GRID[1], plot_index + 1)
+        ax.imshow(matplotlib.image.imread(io.BytesIO(base64.b64decode(image)), format='png'))
+        ax.set_title(_escape(plot_title), fontsize=10)
+        ax.axis('off')
+    fig.subplots_adjust(left=0.04, right=0.96, bottom=0.04, top=0.9, hspace=0.25, wspace=0.1)
+    return fig
+
+def _get_table_rows(data: Dict) -> List[Tuple[str, str, str]]:
+    """
+    Get the parameter table rows of the datasheet data, plots are skipped.
+
+    :param data: transistor, switch or diode data along with units
+    :type data: dict
+    :return: rows of parameter name, value and unit
+    :rtype: list
+    """
+    rows = []
+    for key, value in data.items():
+        if key in ['plots', 'foster_plot', 'raw_measurement_data', 'Raw_measurement_data'] or isinstance(value, dict):
+            continue
+        if isinstance(value, list) and len(value) == 2:
+            rows.append((key, str(value[0]), '' if value[1] in [None, 'None'] else str(value[1])))
+        else:
+            rows.append((key, str(value), ''))
+    return rows
+
+def _get_plots(data: Dict) -> Dict[str, str]:
+    """
+    Get the plots of the datasheet data, nested plots (e.g. channel plots per gate voltage) are flattened.
+
+    :param data: transistor, switch or diode data
+    :type data: dict
+    :return: base64 encoded png images by plot name
+    :rtype: dict
+    """
+    plots = {}
+    for key, value in data.get('plots', {}).items():
+        if isinstance(value, dict):
+            plots.update({nested_key: image for nested_key, image in value.items() if image is not None})
+        elif value is not None:
+            plots[key] = value
+    if data.get('foster_plot', {}).get('imp_plot') is not None:
+        plots['imp_plot'] = data['foster_plot']['imp_plot']
+    return plots
+
+def _get_raw_measurement_plots(trans: Dict) -> List[Tuple[str, str]]:
+    """
+    Get the plots of the raw measurement data, see Transistor.raw_measurement_data_plots().
+
+    :param trans: transistor data
+    :type trans: dict
+    :return: plot titles (with the test conditions) and base64 encoded png images
+    :rtype: list
+    """
+    plots = []
+    for conditions, images in trans.get('raw_measurement_data', []):
+        condition_text = ", ".join(f"{name}={value[0]} {value[1]}" for name, value in conditions.items() if isinstance(value, list))
+        plots += [(f"Raw measurement ({condition_text})", image) for image in images]
+    return plots
+
+def _get_value(value) -> str:
+    """
+    Get the value of a datasheet entry, which is either a value or a list of value and unit.
+
+    :param value: datasheet entry
+    :return: value as text
+    :rtype: str
+    """
+    return str(value[0]) if isinstance(value, list) else str(value)
+
+def _escape(text: str) -> str:
+    """
+    Escape dollar signs, so matplotlib does not render the text as mathtext.
+
+    :param text: text
+    :type text: str
+    :return: escaped text
+    :rtype: str
+    """
+    return text.replace('$', r'\$')
@@ -1,18 +1,19 @@
 """Diode class."""
 # Python standard libraries
 from __future__ import annotations
-from matplotlib import pyplot as plt
-from typing import List
-from scipy.spatial import distance
+from typing import List, Tuple, Dict
 import numpy as np
 
 # Local libraries
+from transistordatabase.lazy_imports import plt
 from transistordatabase.helper_functions import get_img_raw_data, isvalid_dict
 from transistordatabase.checker_functions import check_keys
 from transistordatabase.data_classes import FosterThermalModel, ChannelData, SwitchEnergyData, LinearizedModel, SOA
 from transistordatabase.exceptions import MissingDataError
+from transistordatabase.dataset_cache import DatasetCacheMixin
+from transistordatabase.plot_cache import cached_plot
 
-class Diode:
+class Diode(DatasetCacheMixin):
     """Data associated with the (reverse) diode-characteristics of a MOSFET/SiC-MOSFET or IGBT. Can contain multiple channel- and e_rr- datasets."""
 
     # Metadata
@@ -139,19 +140,21 @@ class Diode:
             self.e_rr = []
             self.linearized_diode = []
 
-    def convert_to_dict(self) -> dict:
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> dict:
         """
         Convert a Diode object into dict datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: Diode object of dict type
         :rtype: dict
         """
-        d = dict(vars(self))
-        d['thermal_foster'] = self.thermal_foster.convert_to_dict()
-        d['channel'] = [c.convert_to_dict() for c in self.channel]
-        d['e_rr'] = [e.convert_to_dict() for e in self.e_rr]
-        d['linearized_diode'] = [ld.convert_to_dict() for ld in self.linearized_diode]
-        d['soa'] = [c.convert_to_dict() for c in self.soa]
+        d = self._get_data_dict()
+        d['thermal_foster'] = self.thermal_foster.convert_to_dict(arrays_as_lists)
+        d['channel'] = [c.convert_to_dict(arrays_as_lists) for c in self.channel]
+        d['e_rr'] = [e.convert_to_dict(arrays_as_lists) for e in self.e_rr]
+        d['linearized_diode'] = [ld.convert_to_dict(arrays_as_lists) for ld in self.linearized_diode]
+        d['soa'] = [c.convert_to_dict(arrays_as_lists) for c in self.soa]
         return d
 
     def find_next_gate_voltage(self, req_gate_vltgs: dict, export_type: str, check_specific_curves: list = None,
@@ -224,31 +227,18 @@ class Diode:
         :return: channel-object, e_rr-object
         :rtype: tuple[Transistor.ChannelData, Transistor.SwitchEnergyData]
         """
-        # Normalize t_j to v_g for distance metric
-        node = np.array([[t_j / normalize_t_to_v, v_g]])
-        # Find closest channeldata
-        channeldata_t_js = np.array([chan.t_j for chan in self.channel])
-        channeldata_v_gs = np.array([0 if chan.v_g is None else chan.v_g for chan in self.channel])
-        nodes = np.array([channeldata_t_js / normalize_t_to_v, channeldata_v_gs]).transpose()
-        index_channeldata = distance.cdist(node, nodes).argmin()
-        # Find closest e_rr
-        e_rrs = [e for e in self.e_rr if e.dataset_type == switch_energy_dataset_type]
-        if not e_rrs:
-            # raise KeyError(f"There is no e_rr data with type {SwitchEnergyData_dataset_type} for this Diode object.")
-            e_rrs = [None]
-            index_e_rr = 0
-        else:
-            e_rr_t_js = np.array([e.t_j for e in e_rrs])
-            e_rr_v_gs = np.array([0 if e.v_g is None else e.v_g for e in e_rrs])
-            nodes = np.array([e_rr_t_js / normalize_t_to_v, e_rr_v_gs]).transpose()
-            index_e_rr = distance.cdist(node, nodes).argmin()
-
+        # Find closest channeldata, t_j is normalized to v_g for distance metric
+        channeldata = self.get_operating_point_index('channel').find_nearest(t_j, v_g, normalize_t_to_v)
+        # Find closest e_rr, None if there is no e_rr data with the given dataset type
+        e_rr = self.get_operating_point_index('e_rr').find_nearest(t_j, v_g, normalize_t_to_v, dataset_type=switch_energy_dataset_type)
+        if e_rr is not None:
             print("run diode.find_approx_wp: closest working point for t_j = {0} °C and v_g = {1} V:".format(t_j, v_g))
-            print("channel: t_j = {0} °C and v_g = {1} V".format(self.channel[index_channeldata].t_j, self.channel[index_channeldata].v_g))
-            print("err:     t_j = {0} °C and v_g = {1} V".format(e_rrs[index_e_rr].t_j, e_rrs[index_e_rr].v_g))
+            print("channel: t_j = {0} °C and v_g = {1} V".format(channeldata.t_j, channeldata.v_g))
+            print("err:     t_j = {0} °C and v_g = {1} V".format(e_rr.t_j, e_rr.v_g))
 
-        return self.channel[index_channeldata], e_rrs[index_e_rr]
+        return channeldata, e_rr
 
+    @cached_plot(key_attributes=('channel',))
     def plot_all_channel_data(self, buffer_req: bool = False):
         """
         Plot all diode channel characteristic curves.
@@ -318,6 +308,7 @@ class Diode:
                 plt.show()
         return categorized_plots
 
+    @cached_plot(key_attributes=('e_rr',))
     def plot_energy_data(self, buffer_req: bool = False):
         """
         Plot all diode reverse recovery energy i-e characteristic curves which are extracted from the manufacturer datasheet.
@@ -361,6 +352,7 @@ class Diode:
             print("Diode reverse recovery energy i_e curves are not available for the chosen transistor")
             return None
 
+    @cached_plot(key_attributes=('e_rr',))
     def plot_energy_data_r(self, buffer_req: bool = False):
         """
         Plot all diode energy r-e characteristic curves.
@@ -404,6 +396,7 @@ class Diode:
             print("Diode reverse recovery energy r_e curves are not available for the chosen transistor")
             return None
 
+    @cached_plot(key_attributes=('soa',))
     def plot_soa(self, buffer_req: bool = False):
         """
         Plot and convert safe operating region characteristic plots in raw data format (Helper function).
@@ -0,0 +1,68 @@
+"""Command line interface to export many transistors of the database at once, see DatabaseManager.export_many()."""
+# Python standard libraries
+from __future__ import annotations
+import argparse
+import json
+from typing import List, Optional
+
+# Local libraries
+from transistordatabase.database_manager import DatabaseManager, EXPORT_FORMATS
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    """
+    Create the argument parser of the batch exporter.
+
+    :return: argument parser
+    :rtype: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(prog="tdb-export", description="Export transistors of the transistordatabase to the simulation tool formats.")
+    parser.add_argument("names", nargs="*", help="names of the transistors, all transistors of the database if no name is given")
+    parser.add_argument("-o", "--output-folder", required=True, help="directory to save the files, created if it does not exist")
+    parser.add_argument("-f", "--formats", nargs="+", choices=list(EXPORT_FORMATS), default=None, help="export formats, all formats by default")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="count of worker processes, count of CPUs by default")
+    database = parser.add_mutually_exclusive_group()
+    database.add_argument("--json-folder", default=None, help="json database folder, the default database of the package is used if not given")
+    database.add_argument("--binary-folder", default=None, help="binary database folder")
+    database.add_argument("--mongodb-collection", default=None, help="collection of the local MongoDB database")
+    parser.add_argument("--report", default=None, help="path of a json file to save the report of all transistors")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Export transistors as given by the command line arguments and print one line per transistor.
+
+    :param argv: command line arguments, sys.argv is used in case of None
+    :type argv: List[str] or None
+    :return: exit code, 1 if any export failed
+    :rtype: int
+    """
+    arguments = get_argument_parser().parse_args(argv)
+    database_manager = DatabaseManager()
+    if arguments.binary_folder is not None:
+        database_manager.set_operation_mode_binary(arguments.binary_folder)
+    elif arguments.mongodb_collection is not None:
+        database_manager.set_operation_mode_mongodb(arguments.mongodb_collection)
+    elif arguments.json_folder is not None:
+        database_manager.set_operation_mode_json(arguments.json_folder)
+    else:
+        database_manager.set_operation_mode_json()
+
+    report = database_manager.export_many(arguments.names or None, arguments.output_folder, arguments.formats, arguments.workers)
+    for part in report:
+        if part["success"]:
+            print(f"OK      {part['name']} ({part['duration']:.2f} s)")
+        else:
+            failed_formats = [f"{export_format}: {format_report['error']}" for export_format, format_report in part["formats"].items()
+                              if not format_report["success"]]
+            errors = [part["error"]] if part["error"] else failed_formats
+            print(f"FAILED  {part['name']} ({part['duration']:.2f} s): {'; '.join(errors)}")
+    failed_count = sum(not part["success"] for part in report)
+    print(f"Exported {len(report) - failed_count} of {len(report)} transistors to {arguments.output_folder}")
+    if arguments.report is not None:
+        with open(arguments.report, "w") as fd:
+            json.dump(report, fd, indent=2)
+    return 1 if failed_count else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
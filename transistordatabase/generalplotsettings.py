@@ -1,6 +1,6 @@
 """Set general plot settings, like LaTeX font."""
 
-from matplotlib import pyplot as plt
+from transistordatabase.lazy_imports import plt
 
 
 def global_plot_settings_font_latex() -> None:
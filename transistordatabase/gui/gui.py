@@ -14,6 +14,7 @@ import os
 import webbrowser
 import tempfile
 import datetime
+import inspect
 
 # Third party libraries
 from PyQt5.QtWidgets import QApplication, QWidget, QMainWindow, QVBoxLayout, QMessageBox, QFileDialog, QLineEdit, \
@@ -31,6 +32,34 @@ import buck_converter_functions
 import boost_converter_functions
 import buck_boost_converter_functions
 import comparison_tools_functions
+from plot_workers import PlotWorkerPool
+
+# Parameters of the topology calculator: axis label, name of the lineEdits (value, minimum and maximum) and keyword of the
+# calculation functions in buck_converter_functions.py, boost_converter_functions.py and buck_boost_converter_functions.py
+TOPOLOGY_PLOT_PARAMETERS = {"Zeta = f*L": ("zeta", "zeta"),
+                            "Vin [V]": ("v_in", "v_in"),
+                            "Vout [V]": ("v_out", "v_out"),
+                            "Output Power [W]": ("output_power", "p_out"),
+                            "Frequency [kHz]": ("frequency", "frequency")}
+# Quantities of the topology calculator: axis label and name of the calculation functions (f_m_<name> and f_vec_<name>)
+TOPOLOGY_PLOT_QUANTITIES = {"RMS Current Transistor1 [A]": "i1_rms",
+                            "RMS Current Diode Transistor2 [A]": "i2_rms",
+                            "Mean Current Transistor1 [A]": "i1_mean",
+                            "Mean Current Diode Transistor2 [A]": "i2_mean",
+                            "RMS Inductor Current [A]": "i_l_rms",
+                            "Mean Inductor Current [A]": "i_l_mean",
+                            "Peak Current [A]": "i_peak",
+                            "Conduction Losses Transistor1 [W]": "conduction_losses1",
+                            "Conduction Losses Diode Transistor2 [W]": "conduction_losses2",
+                            "Total Conduction Losses [W]": "conduction_losses",
+                            "Turn-on Switching Losses Transistor1 [W]": "p_on1",
+                            "Turn-off Switching Losses Transistor1 [W]": "p_off1",
+                            "Reverse Recovery Losses Diode Transistor2 [W]": "p_rr2",
+                            "Total Switching Losses Transistor1 [W]": "p_on_off1",
+                            "Total Power Losses Transistor1 [W]": "p1",
+                            "Total Switching Losses [W]": "p_on_off_rr_1_2",
+                            "Temperature Switch Transistor1 [°C]": "t_switch1",
+                            "Temperature Diode Transistor2 [°C]": "t_diode2"}
 
 
 def resource_path(relative_path):
@@ -72,6 +101,11 @@ class MainWindow(QMainWindow):
 
         transistor_list = self.tdb.get_transistor_names_list()
 
+        # The plots of the topology calculator and the comparison tools are calculated in worker threads, which load the
+        # transistors with the (thread-safe) database manager
+        self.topology_plot_pool = PlotWorkerPool(self.topology_render_plot, self.topology_plot_failed)
+        self.compare_plot_pool = PlotWorkerPool(self.compare_render_plot, self.compare_plot_failed)
+
         self.setWindowIcon(QtGui.QIcon("window_icon"))
 
         self.translation_dict = {
@@ -198,6 +232,12 @@ class MainWindow(QMainWindow):
         self.slider_topology_r_g_on_transistor1.valueChanged.connect(self.slider_topology_r_g_value_changed)
         self.slider_topology_r_g_off_transistor1.valueChanged.connect(self.slider_topology_r_g_value_changed)
 
+        # cancel the calculation of the topology plots when the inputs change, e.g. while a slider is dragged
+        self.slider_topology_r_g_on_transistor1.valueChanged.connect(self.topology_plot_pool.cancel)
+        self.slider_topology_r_g_off_transistor1.valueChanged.connect(self.topology_plot_pool.cancel)
+        self.comboBox_topology_transistor1.currentTextChanged.connect(self.topology_plot_pool.cancel)
+        self.comboBox_topology_transistor2.currentTextChanged.connect(self.topology_plot_pool.cancel)
+
         # run the function "comboBox_topology_topology_changed" when the current text of the ComboBox to choose the
         # topology changed, which will set the picture of the the circuit diagram below for chosen topology
         self.comboBox_topology_topology.currentTextChanged.connect(self.comboBox_topology_topology_changed)
@@ -333,6 +373,14 @@ class MainWindow(QMainWindow):
         self.slider_compare_r_g_on_transistor3.valueChanged.connect(self.slider_compare_r_g_value_changed)
         self.slider_compare_r_g_off_transistor3.valueChanged.connect(self.slider_compare_r_g_value_changed)
 
+        # cancel the calculation of the comparison plots when the inputs change, e.g. while a slider is dragged
+        for slider in [self.slider_compare_r_g_on_transistor1, self.slider_compare_r_g_off_transistor1, self.slider_compare_r_g_on_transistor2,
+                       self.slider_compare_r_g_off_transistor2, self.slider_compare_r_g_on_transistor3, self.slider_compare_r_g_off_transistor3]:
+            slider.valueChanged.connect(self.compare_plot_pool.cancel)
+        self.comboBox_compare_transistor1.currentTextChanged.connect(self.compare_plot_pool.cancel)
+        self.comboBox_compare_transistor2.currentTextChanged.connect(self.compare_plot_pool.cancel)
+        self.comboBox_compare_transistor3.currentTextChanged.connect(self.compare_plot_pool.cancel)
+
         # run the function "comboBox_compare_transistors_changed", when the current text of a comboBox to choose the
         # transistors changed
         self.comboBox_compare_transistor1.currentTextChanged.connect(self.comboBox_compare_transistor1_changed)
@@ -795,6 +843,7 @@ class MainWindow(QMainWindow):
         :rtype: None
         """
         self.tdb.update_from_fileexchange()
+        self.clear_plot_caches()
         self.label_updated_database.setText("Successfully Updated")
 
     def __del__(self):
@@ -2968,6 +3017,7 @@ class MainWindow(QMainWindow):
                 pass
 
         self.tdb.save_transistor(transistor_new, True)
+        self.clear_plot_caches()
         self.search_database_load_data()
         self.show_popup_message(f"Transistor <b>{transistor_new.name}</b> succsessfully overwritten!")
         self.button_create_transistor_create.setDisabled(True)
@@ -3026,6 +3076,7 @@ class MainWindow(QMainWindow):
         """Delete the marked transistor ('search transistor'-tab) from the local mongodb-database."""
         transistor = self.get_marked_transistor()
         self.tdb.delete_transistor(transistor.name)
+        self.clear_plot_caches()
         self.search_database_load_data()
 
     def load_from_search_database_into_create_transistor(self):
@@ -3463,40 +3514,9 @@ class MainWindow(QMainWindow):
 
         :return: None
         """
-        transistor_list = self.tdb.get_transistor_names_list()
-        transistordatabase = []
-
-        for i in range(len(transistor_list)):
-            transistor = self.tdb.load_transistor(transistor_list[i])
-
-            transistor_dict = transistor.convert_to_dict()
-            switch_dict = transistor.switch.convert_to_dict()
-            diode_dict = transistor.diode.convert_to_dict()
-
-            switch_dict_keys = list(switch_dict.keys())
-            for i in range(len(switch_dict_keys)):
-                switch_dict_keys[i] = "switch_" + switch_dict_keys[i]
-
-            switch_dict_keys_new = switch_dict_keys
-            switch_dict_keys_old = list(switch_dict.keys())
-
-            for i in range(len(switch_dict)):
-                switch_dict[switch_dict_keys_new[i]] = switch_dict.pop(switch_dict_keys_old[i])
-
-            diode_dict_keys = list(diode_dict.keys())
-            for i in range(len(diode_dict_keys)):
-                diode_dict_keys[i] = "diode_" + diode_dict_keys[i]
-
-            diode_dict_keys_new = diode_dict_keys
-            diode_dict_keys_old = list(diode_dict.keys())
-
-            for i in range(len(diode_dict)):
-                diode_dict[diode_dict_keys_new[i]] = diode_dict.pop(diode_dict_keys_old[i])
-            transistor_dict = {**transistor_dict, **switch_dict, **diode_dict}
-
-            transistordatabase.append(transistor_dict)
-
-        transistordatabase_keys = list(transistor_dict.keys())
+        # Only the scalar values are needed here, so the transistor objects are not created
+        transistordatabase = self.tdb.query()
+        transistordatabase_keys = list(transistordatabase[0].keys()) if transistordatabase else []
 
         keys_to_remove = ["c_oss", "c_iss", "c_rss", "raw_measurement_data", "graph_v_ecoss", "c_oss_tr",
                           "c_oss_er", "diode", "switch", "switch_channel", "switch_e_on",
@@ -3855,7 +3875,7 @@ class MainWindow(QMainWindow):
         print(len(transistordatabase_filtered))
         for transistor in transistordatabase_filtered:
             for key in keys_to_remove:
-                del transistor[key]
+                transistor.pop(key, None)
 
             for key in transistordatabase_keys:
                 if transistor[key] == 0:
@@ -4013,12 +4033,81 @@ class MainWindow(QMainWindow):
         """
         Add a Matplotlib figure to a QWidget and creates a plot based on all the possible inputs and selections.
 
+        The plot is created in the GUI thread, e.g. for the pop-out windows. compare_update_plots() loads the transistors in
+        worker threads.
+
         :param widget_compare_plot: widget for the matplotlib figure
         :type widget_compare_plot: QWidget
         :param matplotlibwidget_compare: matplotlib figure
         :param comboBox_compare_plot: comboBox to choose plot
         :return: None
         """
+        plot_id = (widget_plot, matplotlibwidget, comboBox_plot.currentText())
+        inputs = self.compare_get_plot_inputs(comboBox_plot)
+        try:
+            parameters = self.compare_calculate_plot(inputs)
+        except Exception as e:
+            self.compare_plot_failed(plot_id, str(e))
+            return
+        self.compare_render_plot(plot_id, parameters)
+
+    def compare_get_plot_inputs(self, comboBox_plot):
+        """
+        Read all inputs of a comparison plot from the widgets.
+
+        The inputs are texts, they are converted by compare_calculate_plot(). The inputs are used as cache key of the plot.
+
+        :param comboBox_plot: comboBox to choose plot
+        :return: inputs as tuple of (name, text) pairs
+        :rtype: tuple
+        """
+        inputs = {"plot": comboBox_plot.currentText()}
+        for number in [1, 2, 3]:
+            inputs[f"transistor{number}"] = getattr(self, f"comboBox_compare_transistor{number}").currentText()
+            inputs[f"number_parallel{number}"] = getattr(self, f"lineEdit_compare_number_parallel_transistor{number}").text()
+            inputs[f"r_g_on{number}"] = getattr(self, f"label_compare_r_g_on_value_transistor{number}").text()
+            inputs[f"r_g_off{number}"] = getattr(self, f"label_compare_r_g_off_value_transistor{number}").text()
+            inputs[f"v_supply{number}"] = getattr(self, f"lineEdit_compare_v_supply_transistor{number}").text()
+            inputs[f"t_j{number}"] = getattr(self, f"lineEdit_compare_t_j_transistor{number}").text()
+            inputs[f"v_g_on{number}"] = getattr(self, f"comboBox_compare_v_g_on_transistor{number}").currentText()
+            comboBox_v_g_off = getattr(self, f"comboBox_compare_v_g_off_transistor{number}")
+            inputs[f"v_g_off{number}"] = comboBox_v_g_off.currentText() if comboBox_v_g_off.count() >= 1 else None
+        return tuple(inputs.items())
+
+    def compare_calculate_plot(self, inputs):
+        """
+        Load the (parallel) transistors and convert the inputs of a comparison plot.
+
+        Runs in a worker thread of the comparison plot pool, so no widgets are accessed. The transistors are shared by all
+        comparison plots with the same transistor selection.
+
+        :param inputs: inputs of the plot, see compare_get_plot_inputs()
+        :type inputs: tuple
+        :return: plot and transistor parameters
+        :rtype: dict
+        """
+        inputs = dict(inputs)
+        parameters = {"plot": inputs["plot"]}
+        for number in [1, 2, 3]:
+            transistor_key = (inputs[f"transistor{number}"], inputs[f"number_parallel{number}"])
+            parameters[f"transistor{number}"] = self.compare_plot_pool.get_shared(
+                transistor_key, lambda key=transistor_key: self.load_parallel_transistor(*key))
+            for name in ["r_g_on", "r_g_off", "v_supply", "t_j", "v_g_on"]:
+                parameters[f"{name}{number}"] = float(inputs[f"{name}{number}"])
+            parameters[f"v_g_off{number}"] = None if inputs[f"v_g_off{number}"] is None else float(inputs[f"v_g_off{number}"])
+        return parameters
+
+    def compare_render_plot(self, plot_id, parameters):
+        """
+        Create a comparison plot from the loaded transistors and the converted inputs, runs in the GUI thread.
+
+        :param plot_id: widget for the matplotlib figure, matplotlib figure and name of the plot
+        :type plot_id: tuple
+        :param parameters: plot and transistor parameters, see compare_calculate_plot()
+        :type parameters: dict
+        :return: None
+        """
+        widget_plot, matplotlibwidget, _ = plot_id
         matplotlibwidget.axis.clear()
         self.layout = QVBoxLayout(widget_plot)
         self.layout.addWidget(matplotlibwidget)
@@ -4029,86 +4118,53 @@ class MainWindow(QMainWindow):
             pass
 
         try:
-            transistor1 = self.tdb.load_transistor(self.comboBox_compare_transistor1.currentText())
-            transistor2 = self.tdb.load_transistor(self.comboBox_compare_transistor2.currentText())
-            transistor3 = self.tdb.load_transistor(self.comboBox_compare_transistor3.currentText())
-
-            if self.lineEdit_compare_number_parallel_transistor1.text() != "1":
-                transistor1 = self.tdb.parallel_transistors(transistor1, int(self.lineEdit_compare_number_parallel_transistor1.text()))
-            if self.lineEdit_compare_number_parallel_transistor2.text() != "1":
-                transistor2 = self.tdb.parallel_transistors(transistor2, int(self.lineEdit_compare_number_parallel_transistor2.text()))
-            if self.lineEdit_compare_number_parallel_transistor3.text() != "1":
-                transistor3 = self.tdb.parallel_transistors(transistor3, int(self.lineEdit_compare_number_parallel_transistor3.text()))
-
-            r_g_on1 = float(self.label_compare_r_g_on_value_transistor1.text())
-            r_g_on2 = float(self.label_compare_r_g_on_value_transistor2.text())
-            r_g_on3 = float(self.label_compare_r_g_on_value_transistor3.text())
-            r_g_off1 = float(self.label_compare_r_g_off_value_transistor1.text())
-            r_g_off2 = float(self.label_compare_r_g_off_value_transistor2.text())
-            r_g_off3 = float(self.label_compare_r_g_off_value_transistor3.text())
-            v_supply1 = float(self.lineEdit_compare_v_supply_transistor1.text())
-            v_supply2 = float(self.lineEdit_compare_v_supply_transistor2.text())
-            v_supply3 = float(self.lineEdit_compare_v_supply_transistor3.text())
-            t_j1 = float(self.lineEdit_compare_t_j_transistor1.text())
-            t_j2 = float(self.lineEdit_compare_t_j_transistor2.text())
-            t_j3 = float(self.lineEdit_compare_t_j_transistor3.text())
-            v_g_on1 = float(self.comboBox_compare_v_g_on_transistor1.currentText())
-            v_g_on2 = float(self.comboBox_compare_v_g_on_transistor2.currentText())
-            v_g_on3 = float(self.comboBox_compare_v_g_on_transistor3.currentText())
-
-            if self.comboBox_compare_v_g_off_transistor1.count() >= 1:
-                v_g_off1 = float(self.comboBox_compare_v_g_off_transistor1.currentText())
-            else:
-                v_g_off1 = None
-
-            if self.comboBox_compare_v_g_off_transistor2.count() >= 1:
-                v_g_off2 = float(self.comboBox_compare_v_g_off_transistor2.currentText())
-            else:
-                v_g_off2 = None
-
-            if self.comboBox_compare_v_g_off_transistor3.count() >= 1:
-                v_g_off3 = float(self.comboBox_compare_v_g_off_transistor3.currentText())
-            else:
-                v_g_off3 = None
-
-            if comboBox_plot.currentText() == "Switch Energy Data vs. Channel Current Transistor1":
+            plot = parameters["plot"]
+            transistor1, transistor2, transistor3 = parameters["transistor1"], parameters["transistor2"], parameters["transistor3"]
+            r_g_on1, r_g_on2, r_g_on3 = parameters["r_g_on1"], parameters["r_g_on2"], parameters["r_g_on3"]
+            r_g_off1, r_g_off2, r_g_off3 = parameters["r_g_off1"], parameters["r_g_off2"], parameters["r_g_off3"]
+            v_supply1, v_supply2, v_supply3 = parameters["v_supply1"], parameters["v_supply2"], parameters["v_supply3"]
+            t_j1, t_j2, t_j3 = parameters["t_j1"], parameters["t_j2"], parameters["t_j3"]
+            v_g_on1, v_g_on2, v_g_on3 = parameters["v_g_on1"], parameters["v_g_on2"], parameters["v_g_on3"]
+            v_g_off1, v_g_off2, v_g_off3 = parameters["v_g_off1"], parameters["v_g_off2"], parameters["v_g_off3"]
+
+            if plot == "Switch Energy Data vs. Channel Current Transistor1":
                 comparison_tools_functions.plot_all_energy_data(transistor1, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Switch Energy Data vs. Channel Current Transistor2":
+            if plot == "Switch Energy Data vs. Channel Current Transistor2":
                 comparison_tools_functions.plot_all_energy_data(transistor2, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Switch Energy Data vs. Channel Current Transistor3":
+            if plot == "Switch Energy Data vs. Channel Current Transistor3":
                 comparison_tools_functions.plot_all_energy_data(transistor3, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Diode Energy Data vs. Channel Current Transistor1":
+            if plot == "Diode Energy Data vs. Channel Current Transistor1":
                 comparison_tools_functions.plot_all_energy_data(transistor1, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Diode Energy Data vs. Channel Current Transistor2":
+            if plot == "Diode Energy Data vs. Channel Current Transistor2":
                 comparison_tools_functions.plot_all_energy_data(transistor2, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Diode Energy Data vs. Channel Current Transistor3":
+            if plot == "Diode Energy Data vs. Channel Current Transistor3":
                 comparison_tools_functions.plot_all_energy_data(transistor3, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Switch Energy Data vs. Gate Resistor Transistor1":
+            if plot == "Switch Energy Data vs. Gate Resistor Transistor1":
                 comparison_tools_functions.plot_all_energy_data_r_g(transistor1, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Switch Energy Data vs. Gate Resistor Transistor2":
+            if plot == "Switch Energy Data vs. Gate Resistor Transistor2":
                 comparison_tools_functions.plot_all_energy_data_r_g(transistor2, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Switch Energy Data vs. Gate Resistor Transistor3":
+            if plot == "Switch Energy Data vs. Gate Resistor Transistor3":
                 comparison_tools_functions.plot_all_energy_data_r_g(transistor3, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Diode Energy Data vs. Gate Resistor Transistor1":
+            if plot == "Diode Energy Data vs. Gate Resistor Transistor1":
                 comparison_tools_functions.plot_all_energy_data_r_g(transistor1, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Diode Energy Data vs. Gate Resistor Transistor2":
+            if plot == "Diode Energy Data vs. Gate Resistor Transistor2":
                 comparison_tools_functions.plot_all_energy_data_r_g(transistor2, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Diode Energy Data vs. Gate Resistor Transistor3":
+            if plot == "Diode Energy Data vs. Gate Resistor Transistor3":
                 comparison_tools_functions.plot_all_energy_data_r_g(transistor3, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Switch Channel Data Transistor1":
+            if plot == "Switch Channel Data Transistor1":
                 comparison_tools_functions.plot_all_channel_data(transistor1, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Switch Channel Data Transistor2":
+            if plot == "Switch Channel Data Transistor2":
                 comparison_tools_functions.plot_all_channel_data(transistor2, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Switch Channel Data Transistor3":
+            if plot == "Switch Channel Data Transistor3":
                 comparison_tools_functions.plot_all_channel_data(transistor3, matplotlibwidget, "switch")
-            if comboBox_plot.currentText() == "Diode Channel Data Transistor1":
+            if plot == "Diode Channel Data Transistor1":
                 comparison_tools_functions.plot_all_channel_data(transistor1, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Diode Channel Data Transistor2":
+            if plot == "Diode Channel Data Transistor2":
                 comparison_tools_functions.plot_all_channel_data(transistor2, matplotlibwidget, "diode")
-            if comboBox_plot.currentText() == "Diode Channel Data Transistor3":
+            if plot == "Diode Channel Data Transistor3":
                 comparison_tools_functions.plot_all_channel_data(transistor3, matplotlibwidget, "diode")
 
-            if comboBox_plot.currentText() == "Switch Turn-on Losses":
+            if plot == "Switch Turn-on Losses":
                 comparison_tools_functions.plot_e_on(transistor1=transistor1,
                                                      transistor2=transistor2,
                                                      transistor3=transistor3,
@@ -4123,7 +4179,7 @@ class MainWindow(QMainWindow):
                                                      v_supply2=v_supply2,
                                                      v_supply3=v_supply3)
 
-            if comboBox_plot.currentText() == "Switch Turn-off Losses":
+            if plot == "Switch Turn-off Losses":
                 comparison_tools_functions.plot_e_off(transistor1=transistor1,
                                                       transistor2=transistor2,
                                                       transistor3=transistor3,
@@ -4138,7 +4194,7 @@ class MainWindow(QMainWindow):
                                                       v_supply2=v_supply2,
                                                       v_supply3=v_supply3)
 
-            if comboBox_plot.currentText() == "Diode Reverse Recovery Losses":
+            if plot == "Diode Reverse Recovery Losses":
                 comparison_tools_functions.plot_e_rr(transistor1=transistor1,
                                                      transistor2=transistor2,
                                                      transistor3=transistor3,
@@ -4153,7 +4209,7 @@ class MainWindow(QMainWindow):
                                                      v_supply2=v_supply2,
                                                      v_supply3=v_supply3)
 
-            if comboBox_plot.currentText() == "Switch Channel Data":
+            if plot == "Switch Channel Data":
                 comparison_tools_functions.plot_channel(transistor1=transistor1,
                                                         transistor2=transistor2,
                                                         transistor3=transistor3,
@@ -4169,7 +4225,7 @@ class MainWindow(QMainWindow):
                                                         v_g_off3=v_g_off3,
                                                         switch_diode="switch")
 
-            if comboBox_plot.currentText() == "Diode Channel Data":
+            if plot == "Diode Channel Data":
                 comparison_tools_functions.plot_channel(transistor1=transistor1,
                                                         transistor2=transistor2,
                                                         transistor3=transistor3,
@@ -4185,13 +4241,13 @@ class MainWindow(QMainWindow):
                                                         v_g_off3=v_g_off3,
                                                         switch_diode="diode")
 
-            if comboBox_plot.currentText() == "Output Capacitance Charge vs. Channel Voltage":
+            if plot == "Output Capacitance Charge vs. Channel Voltage":
                 comparison_tools_functions.plot_v_qoss(transistor1=transistor1,
                                                        transistor2=transistor2,
                                                        transistor3=transistor3,
                                                        matplotlibwidget=matplotlibwidget)
 
-            if comboBox_plot.currentText() == "Output Capacitance Energy vs. Channel Voltage":
+            if plot == "Output Capacitance Energy vs. Channel Voltage":
                 comparison_tools_functions.plot_v_eoss(transistor1=transistor1,
                                                        transistor2=transistor2,
                                                        transistor3=transistor3,
@@ -4199,39 +4255,36 @@ class MainWindow(QMainWindow):
         except:
             self.show_popup_message("Error: Inputs are missing or not numeric!")
 
+    def compare_plot_failed(self, plot_id, message):
+        """
+        Clear a comparison plot whose inputs could not be loaded or converted and show a notification, runs in the GUI thread.
+
+        :param plot_id: widget for the matplotlib figure, matplotlib figure and name of the plot
+        :type plot_id: tuple
+        :param message: error message of the calculation
+        :type message: str
+        :return: None
+        """
+        plot_id[1].axis.clear()
+        plot_id[1].figure.canvas.draw_idle()
+        self.show_popup_message(f"Error: Inputs are missing or not numeric! ({message})")
+
     def compare_update_plots(self):
         """
-        Run the function "topology_create_plot" for all QWidgets, Matplotlib figures and ComboBoxes.
+        Create all comparison plots, the transistors are loaded in worker threads and every plot is shown as soon as its inputs are loaded.
+
+        Plots with unchanged inputs are shown from the cache of the comparison plot pool, plots of a previous update which are
+        not finished yet are cancelled.
 
         :return: None
         """
-        self.compare_create_plot(self.widget_compare_plot1,
-                                 self.matplotlibwidget_compare1,
-                                 self.comboBox_compare_plot1)
-        self.compare_create_plot(self.widget_compare_plot2,
-                                 self.matplotlibwidget_compare2,
-                                 self.comboBox_compare_plot2)
-        self.compare_create_plot(self.widget_compare_plot3,
-                                 self.matplotlibwidget_compare3,
-                                 self.comboBox_compare_plot3)
-        self.compare_create_plot(self.widget_compare_plot4,
-                                 self.matplotlibwidget_compare4,
-                                 self.comboBox_compare_plot4)
-        self.compare_create_plot(self.widget_compare_plot5,
-                                 self.matplotlibwidget_compare5,
-                                 self.comboBox_compare_plot5)
-        self.compare_create_plot(self.widget_compare_plot6,
-                                 self.matplotlibwidget_compare6,
-                                 self.comboBox_compare_plot6)
-        self.compare_create_plot(self.widget_compare_plot7,
-                                 self.matplotlibwidget_compare7,
-                                 self.comboBox_compare_plot7)
-        self.compare_create_plot(self.widget_compare_plot8,
-                                 self.matplotlibwidget_compare8,
-                                 self.comboBox_compare_plot8)
-        self.compare_create_plot(self.widget_compare_plot9,
-                                 self.matplotlibwidget_compare9,
-                                 self.comboBox_compare_plot9)
+        plots = []
+        for number in range(1, 10):
+            comboBox_plot = getattr(self, f"comboBox_compare_plot{number}")
+            plot_id = (getattr(self, f"widget_compare_plot{number}"), getattr(self, f"matplotlibwidget_compare{number}"), comboBox_plot.currentText())
+            inputs = self.compare_get_plot_inputs(comboBox_plot)
+            plots.append((plot_id, inputs, self.compare_calculate_plot, (inputs,)))
+        self.compare_plot_pool.submit(plots)
 
     def compare_pop_out_plot1(self):
         """
@@ -4856,7 +4909,8 @@ class MainWindow(QMainWindow):
         """
         Add a Matplotlib figure to a QWidget and create a plot based on all the possible inputs and selections.
 
-        Uses the calculation-functions from buck_converter_functions.py, boost_converter_functions.py and buck_boost_converter_functions.py.
+        The plot is calculated in the GUI thread, e.g. for the pop-out windows, unless it is in the cache of the topology plot
+        pool. topology_update_plots() calculates the plots in worker threads.
 
         :param widget_topology_plot: widget for the Matplotlib figure
         :param matplotlibwidget: Matplotlib figure
@@ -4867,6 +4921,137 @@ class MainWindow(QMainWindow):
         :param converter: "buck_converter", "boost_converter" or "buck_boost_converter"
         :return: None
         """
+        inputs = self.topology_get_plot_inputs(comboBox_topology_plot_x_axis, comboBox_topology_plot_y_axis, comboBox_topology_plot_z_axis,
+                                               comboBox_topology_line_contour, converter)
+        plot_id = self.topology_get_plot_id(widget_topology_plot, matplotlibwidget, inputs)
+        result = self.topology_plot_pool.results.get(inputs)
+        if result is None:
+            try:
+                result = self.topology_calculate_plot(inputs)
+            except Exception as e:
+                self.topology_plot_failed(plot_id, str(e))
+                return
+        self.topology_render_plot(plot_id, result)
+
+    def topology_get_plot_inputs(self, comboBox_topology_plot_x_axis, comboBox_topology_plot_y_axis, comboBox_topology_plot_z_axis,
+                                 comboBox_topology_line_contour, converter):
+        """
+        Read all inputs of a topology plot from the widgets.
+
+        The inputs are texts, they are converted by topology_calculate_plot(). The inputs are used as cache key of the plot.
+
+        :param comboBox_topology_plot_x_axis: ComboBox for selection of the variable for the x-axis
+        :param comboBox_topology_plot_y_axis: ComboBox for selection of the variable for the y-axis
+        :param comboBox_topology_plot_z_axis: ComboBox for selection of the variable for the z-axis
+        :param comboBox_topology_line_contour: ComboBox for selection between line-plot and contour-plot
+        :param converter: "buck_converter", "boost_converter" or "buck_boost_converter"
+        :return: inputs as tuple of (name, value) pairs
+        :rtype: tuple
+        """
+        inputs = {"converter": converter,
+                  "line_contour": comboBox_topology_line_contour.currentText(),
+                  "x_axis": comboBox_topology_plot_x_axis.currentText(),
+                  "y_axis": comboBox_topology_plot_y_axis.currentText(),
+                  "z_axis": comboBox_topology_plot_z_axis.currentText(),
+                  "transistor1": self.comboBox_topology_transistor1.currentText(),
+                  "transistor2": self.comboBox_topology_transistor2.currentText(),
+                  "number_parallel1": self.lineEdit_topology_number_parallel_transistor1.text(),
+                  "number_parallel2": self.lineEdit_topology_number_parallel_transistor2.text(),
+                  "v_g_on1": self.comboBox_topology_v_g_on_transistor1.currentText(),
+                  "r_g_on1": self.label_topology_slider_r_g_on_value_transistor1.text(),
+                  "r_g_off1": self.label_topology_slider_r_g_off_value_transistor1.text(),
+                  "t_heatsink": self.lineEdit_topology_temperature_heatsink.text(),
+                  "r_th_heatsink": self.lineEdit_topology_thermal_resistance_heatsink.text()}
+        for line_edit, _ in TOPOLOGY_PLOT_PARAMETERS.values():
+            inputs[line_edit] = getattr(self, f"lineEdit_topology_{line_edit}").text()
+            inputs[f"{line_edit}_min"] = getattr(self, f"lineEdit_topology_{line_edit}_min").text()
+            inputs[f"{line_edit}_max"] = getattr(self, f"lineEdit_topology_{line_edit}_max").text()
+        return tuple(inputs.items())
+
+    def topology_calculate_plot(self, inputs):
+        """
+        Calculate the data of a topology plot.
+
+        Runs in a worker thread of the topology plot pool, so no widgets are accessed. Uses the calculation-functions from
+        buck_converter_functions.py, boost_converter_functions.py and buck_boost_converter_functions.py.
+
+        :param inputs: inputs of the plot, see topology_get_plot_inputs()
+        :type inputs: tuple
+        :return: plot type, axis labels and the vectors (line plot) or meshes (contour plot) of the axes
+        :rtype: dict
+        """
+        inputs = dict(inputs)
+        transistor1, transistor2 = self.topology_plot_pool.get_shared(
+            tuple(inputs[name] for name in ["transistor1", "number_parallel1", "transistor2", "number_parallel2"]),
+            lambda: (self.load_parallel_transistor(inputs["transistor1"], inputs["number_parallel1"]),
+                     self.load_parallel_transistor(inputs["transistor2"], inputs["number_parallel2"])))
+        arguments = {"v_g_on1": float(inputs["v_g_on1"]),
+                     "r_g_on1": float(inputs["r_g_on1"]),
+                     "r_g_off1": float(inputs["r_g_off1"]),
+                     "transistor1": transistor1,
+                     "transistor2": transistor2}
+        try:
+            arguments["t_heatsink"] = float(inputs["t_heatsink"])
+            arguments["r_th_heatsink"] = float(inputs["r_th_heatsink"])
+        except ValueError:
+            pass
+
+        def get_axis_vector(label):
+            line_edit = TOPOLOGY_PLOT_PARAMETERS[label][0]
+            return np.linspace(float(inputs[f"{line_edit}_min"]), float(inputs[f"{line_edit}_max"]), 100)
+
+        if inputs["line_contour"] == "Contour":
+            x_axis, y_axis = np.meshgrid(get_axis_vector(inputs["x_axis"]), get_axis_vector(inputs["y_axis"]))
+            axes = {inputs["x_axis"]: x_axis, inputs["y_axis"]: y_axis}
+            quantity, function_prefix = inputs["z_axis"], "f_m_"
+        elif inputs["line_contour"] == "Line":
+            x_axis = get_axis_vector(inputs["x_axis"])
+            axes = {inputs["x_axis"]: x_axis}
+            quantity, function_prefix = inputs["y_axis"], "f_vec_"
+        else:
+            raise ValueError(f"Unknown plot type {inputs['line_contour']}")
+
+        for label, (line_edit, keyword) in TOPOLOGY_PLOT_PARAMETERS.items():
+            if label in axes:
+                arguments[keyword] = axes[label]
+            elif inputs[line_edit] != "":
+                arguments[keyword] = np.full_like(x_axis, float(inputs[line_edit]))
+
+        function = getattr(inputs["converter"], function_prefix + TOPOLOGY_PLOT_QUANTITIES[quantity])
+        values = function(**{name: value for name, value in arguments.items() if name in inspect.signature(function).parameters})
+
+        result = {"line_contour": inputs["line_contour"], "x_label": inputs["x_axis"], "x": x_axis, "y_label": inputs["y_axis"]}
+        if inputs["line_contour"] == "Contour":
+            result.update({"y": y_axis, "z": values, "title": inputs["z_axis"]})
+        else:
+            result["y"] = values
+        return result
+
+    def topology_get_plot_id(self, widget_topology_plot, matplotlibwidget, inputs):
+        """
+        Get the identifier of a topology plot for the topology plot pool.
+
+        :param widget_topology_plot: widget for the Matplotlib figure
+        :param matplotlibwidget: Matplotlib figure
+        :param inputs: inputs of the plot, see topology_get_plot_inputs()
+        :type inputs: tuple
+        :return: widget, Matplotlib figure and the plotted quantity (for error messages)
+        :rtype: tuple
+        """
+        inputs = dict(inputs)
+        return widget_topology_plot, matplotlibwidget, inputs["z_axis"] if inputs["line_contour"] == "Contour" else inputs["y_axis"]
+
+    def topology_render_plot(self, plot_id, result):
+        """
+        Draw a calculated topology plot into its Matplotlib figure, runs in the GUI thread.
+
+        :param plot_id: widget, Matplotlib figure and the plotted quantity, see topology_get_plot_id()
+        :type plot_id: tuple
+        :param result: plot data, see topology_calculate_plot()
+        :type result: dict
+        :return: None
+        """
+        widget_topology_plot, matplotlibwidget, _ = plot_id
         annotations_list = []
 
         def clicked(event):
@@ -4881,258 +5066,9 @@ class MainWindow(QMainWindow):
         except:
             pass
 
-        transistor1 = self.tdb.load_transistor(self.comboBox_topology_transistor1.currentText())
-        transistor2 = self.tdb.load_transistor(self.comboBox_topology_transistor2.currentText())
-        v_g_on1 = float(self.comboBox_topology_v_g_on_transistor1.currentText())
-        r_g_on1 = float(self.label_topology_slider_r_g_on_value_transistor1.text())
-        r_g_off1 = float(self.label_topology_slider_r_g_off_value_transistor1.text())
-
-        try:
-            t_heatsink = float(self.lineEdit_topology_temperature_heatsink.text())
-            r_th_heatsink = float(self.lineEdit_topology_thermal_resistance_heatsink.text())
-        except:
-            pass
-
         try:
-            transistor1 = self.tdb.parallel_transistors(transistor1, int(self.lineEdit_topology_number_parallel_transistor1.text()))
-            transistor2 = self.tdb.parallel_transistors(transistor2, int(self.lineEdit_topology_number_parallel_transistor2.text()))
-
-            if comboBox_topology_line_contour.currentText() == "Contour":
-                if comboBox_topology_plot_x_axis.currentText() == "Zeta = f*L":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_zeta_min.text()),
-                                             float(self.lineEdit_topology_zeta_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Vin [V]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_v_in_min.text()),
-                                             float(self.lineEdit_topology_v_in_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Vout [V]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_v_out_min.text()),
-                                             float(self.lineEdit_topology_v_out_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Output Power [W]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_output_power_min.text()),
-                                             float(self.lineEdit_topology_output_power_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Frequency [kHz]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_frequency_min.text()),
-                                             float(self.lineEdit_topology_frequency_max.text()), 100)
-
-                if comboBox_topology_plot_y_axis.currentText() == "Zeta = f*L":
-                    vec_y_axis = np.linspace(float(self.lineEdit_topology_zeta_min.text()),
-                                             float(self.lineEdit_topology_zeta_max.text()), 100)
-                if comboBox_topology_plot_y_axis.currentText() == "Vin [V]":
-                    vec_y_axis = np.linspace(float(self.lineEdit_topology_v_in_min.text()),
-                                             float(self.lineEdit_topology_v_in_max.text()), 100)
-                if comboBox_topology_plot_y_axis.currentText() == "Vout [V]":
-                    vec_y_axis = np.linspace(float(self.lineEdit_topology_v_out_min.text()),
-                                             float(self.lineEdit_topology_v_out_max.text()), 100)
-                if comboBox_topology_plot_y_axis.currentText() == "Output Power [W]":
-                    vec_y_axis = np.linspace(float(self.lineEdit_topology_output_power_min.text()),
-                                             float(self.lineEdit_topology_output_power_max.text()), 100)
-                if comboBox_topology_plot_y_axis.currentText() == "Frequency [kHz]":
-                    vec_y_axis = np.linspace(float(self.lineEdit_topology_frequency_min.text()),
-                                             float(self.lineEdit_topology_frequency_max.text()), 100)
-
-                m_x, m_y = np.meshgrid(vec_x_axis, vec_y_axis)
-
-                if self.lineEdit_topology_zeta.text() != "":
-                    m_zeta = np.full_like(m_x, float(self.lineEdit_topology_zeta.text()))
-                if self.lineEdit_topology_v_in.text() != "":
-                    m_v_in = np.full_like(m_x, float(self.lineEdit_topology_v_in.text()))
-                if self.lineEdit_topology_v_out.text() != "":
-                    m_v_out = np.full_like(m_x, float(self.lineEdit_topology_v_out.text()))
-                if self.lineEdit_topology_output_power.text() != "":
-                    m_output_power = np.full_like(m_x, float(self.lineEdit_topology_output_power.text()))
-                if self.lineEdit_topology_frequency.text() != "":
-                    m_frequency = np.full_like(m_x, float(self.lineEdit_topology_frequency.text()))
-
-                if comboBox_topology_plot_x_axis.currentText() == "Zeta = f*L":
-                    m_zeta = m_x
-                if comboBox_topology_plot_x_axis.currentText() == "Vin [V]":
-                    m_v_in = m_x
-                if comboBox_topology_plot_x_axis.currentText() == "Vout [V]":
-                    m_v_out = m_x
-                if comboBox_topology_plot_x_axis.currentText() == "Output Power [W]":
-                    m_output_power = m_x
-                if comboBox_topology_plot_x_axis.currentText() == "Frequency [kHz]":
-                    m_frequency = m_x
-
-                if comboBox_topology_plot_y_axis.currentText() == "Zeta = f*L":
-                    m_zeta = m_y
-                if comboBox_topology_plot_y_axis.currentText() == "Vin [V]":
-                    m_v_in = m_y
-                if comboBox_topology_plot_y_axis.currentText() == "Vout [V]":
-                    m_v_out = m_y
-                if comboBox_topology_plot_y_axis.currentText() == "Output Power [W]":
-                    m_output_power = m_y
-                if comboBox_topology_plot_y_axis.currentText() == "Frequency [kHz]":
-                    m_frequency = m_y
-
-                if comboBox_topology_plot_z_axis.currentText() == "RMS Current Transistor1 [A]":
-                    m_z = converter.f_m_i1_rms(zeta=m_zeta,
-                                               v_in=m_v_in,
-                                               v_out=m_v_out,
-                                               p_out=m_output_power,
-                                               v_g_on1=v_g_on1,
-                                               transistor1=transistor1,
-                                               transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "RMS Current Diode Transistor2 [A]":
-                    m_z = converter.f_m_i2_rms(zeta=m_zeta,
-                                               v_in=m_v_in,
-                                               v_out=m_v_out,
-                                               p_out=m_output_power,
-                                               v_g_on1=v_g_on1,
-                                               transistor1=transistor1,
-                                               transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Mean Current Transistor1 [A]":
-                    m_z = converter.f_m_i1_mean(zeta=m_zeta,
-                                                v_in=m_v_in,
-                                                v_out=m_v_out,
-                                                p_out=m_output_power,
-                                                v_g_on1=v_g_on1,
-                                                transistor1=transistor1,
-                                                transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Mean Current Diode Transistor2 [A]":
-                    m_z = converter.f_m_i2_mean(zeta=m_zeta,
-                                                v_in=m_v_in,
-                                                v_out=m_v_out,
-                                                p_out=m_output_power,
-                                                v_g_on1=v_g_on1,
-                                                transistor1=transistor1,
-                                                transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "RMS Inductor Current [A]":
-                    m_z = converter.f_m_i_l_rms(zeta=m_zeta,
-                                                v_in=m_v_in,
-                                                v_out=m_v_out,
-                                                p_out=m_output_power,
-                                                v_g_on1=v_g_on1,
-                                                transistor1=transistor1,
-                                                transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Mean Inductor Current [A]":
-                    m_z = converter.f_m_i_l_mean(zeta=m_zeta,
-                                                 v_in=m_v_in,
-                                                 v_out=m_v_out,
-                                                 p_out=m_output_power,
-                                                 v_g_on1=v_g_on1,
-                                                 transistor1=transistor1,
-                                                 transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Peak Current [A]":
-                    m_z = converter.f_m_i_peak(zeta=m_zeta,
-                                               v_in=m_v_in,
-                                               v_out=m_v_out,
-                                               p_out=m_output_power,
-                                               v_g_on1=v_g_on1,
-                                               transistor1=transistor1,
-                                               transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Conduction Losses Transistor1 [W]":
-                    m_z = converter.f_m_conduction_losses1(zeta=m_zeta,
-                                                           v_in=m_v_in,
-                                                           v_out=m_v_out,
-                                                           p_out=m_output_power,
-                                                           v_g_on1=v_g_on1,
-                                                           transistor1=transistor1,
-                                                           transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Conduction Losses Diode Transistor2 [W]":
-                    m_z = converter.f_m_conduction_losses2(zeta=m_zeta,
-                                                           v_in=m_v_in,
-                                                           v_out=m_v_out,
-                                                           p_out=m_output_power,
-                                                           v_g_on1=v_g_on1,
-                                                           transistor1=transistor1,
-                                                           transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Total Conduction Losses [W]":
-                    m_z = converter.f_m_conduction_losses(zeta=m_zeta,
-                                                          v_in=m_v_in,
-                                                          v_out=m_v_out,
-                                                          p_out=m_output_power,
-                                                          v_g_on1=v_g_on1,
-                                                          transistor1=transistor1,
-                                                          transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Turn-on Switching Losses Transistor1 [W]":
-                    m_z = converter.f_m_p_on1(zeta=m_zeta,
-                                              v_in=m_v_in,
-                                              v_out=m_v_out,
-                                              p_out=m_output_power,
-                                              v_g_on1=v_g_on1,
-                                              transistor1=transistor1,
-                                              transistor2=transistor2,
-                                              r_g_on1=r_g_on1,
-                                              frequency=m_frequency)
-                if comboBox_topology_plot_z_axis.currentText() == "Turn-off Switching Losses Transistor1 [W]":
-                    m_z = converter.f_m_p_off1(zeta=m_zeta,
-                                               v_in=m_v_in,
-                                               v_out=m_v_out,
-                                               p_out=m_output_power,
-                                               v_g_on1=v_g_on1,
-                                               transistor1=transistor1,
-                                               transistor2=transistor2,
-                                               r_g_off1=r_g_off1,
-                                               frequency=m_frequency)
-                if comboBox_topology_plot_z_axis.currentText() == "Reverse Recovery Losses Diode Transistor2 [W]":
-                    m_z = converter.f_m_p_rr2(zeta=m_zeta,
-                                              v_in=m_v_in,
-                                              v_out=m_v_out,
-                                              p_out=m_output_power,
-                                              v_g_on1=v_g_on1,
-                                              transistor1=transistor1,
-                                              transistor2=transistor2,
-                                              frequency=m_frequency)
-                if comboBox_topology_plot_z_axis.currentText() == "Total Switching Losses Transistor1 [W]":
-                    m_z = converter.f_m_p_on_off1(zeta=m_zeta,
-                                                  v_in=m_v_in,
-                                                  v_out=m_v_out,
-                                                  p_out=m_output_power,
-                                                  v_g_on1=v_g_on1,
-                                                  transistor1=transistor1,
-                                                  transistor2=transistor2,
-                                                  r_g_on1=r_g_on1,
-                                                  r_g_off1=r_g_off1,
-                                                  frequency=m_frequency)
-                if comboBox_topology_plot_z_axis.currentText() == "Total Switching Losses [W]":
-                    m_z = converter.f_m_p_on_off_rr_1_2(zeta=m_zeta,
-                                                        v_in=m_v_in,
-                                                        v_out=m_v_out,
-                                                        p_out=m_output_power,
-                                                        v_g_on1=v_g_on1,
-                                                        transistor1=transistor1,
-                                                        transistor2=transistor2,
-                                                        r_g_on1=r_g_on1,
-                                                        r_g_off1=r_g_off1,
-                                                        frequency=m_frequency)
-                if comboBox_topology_plot_z_axis.currentText() == "Total Power Losses Transistor1 [W]":
-                    m_z = converter.f_m_p1(zeta=m_zeta,
-                                           v_in=m_v_in,
-                                           v_out=m_v_out,
-                                           p_out=m_output_power,
-                                           v_g_on1=v_g_on1,
-                                           transistor1=transistor1,
-                                           transistor2=transistor2,
-                                           r_g_on1=r_g_on1,
-                                           r_g_off1=r_g_off1,
-                                           frequency=m_frequency)
-                if comboBox_topology_plot_z_axis.currentText() == "Temperature Switch Transistor1 [°C]":
-                    m_z = converter.f_m_t_switch1(zeta=m_zeta,
-                                                  v_in=m_v_in,
-                                                  v_out=m_v_out,
-                                                  p_out=m_output_power,
-                                                  v_g_on1=v_g_on1,
-                                                  r_g_on1=r_g_on1,
-                                                  r_g_off1=r_g_off1,
-                                                  t_heatsink=t_heatsink,
-                                                  r_th_heatsink=r_th_heatsink,
-                                                  frequency=m_frequency,
-                                                  transistor1=transistor1,
-                                                  transistor2=transistor2)
-                if comboBox_topology_plot_z_axis.currentText() == "Temperature Diode Transistor2 [°C]":
-                    m_z = converter.f_m_t_diode2(zeta=m_zeta,
-                                                 v_in=m_v_in,
-                                                 v_out=m_v_out,
-                                                 p_out=m_output_power,
-                                                 v_g_on1=v_g_on1,
-                                                 t_heatsink=t_heatsink,
-                                                 r_th_heatsink=r_th_heatsink,
-                                                 frequency=m_frequency,
-                                                 transistor1=transistor1,
-                                                 transistor2=transistor2)
-
-                plot = matplotlibwidget.axis.contourf(m_x, m_y, m_z, 100, cmap=cm.inferno)
+            if result["line_contour"] == "Contour":
+                plot = matplotlibwidget.axis.contourf(result["x"], result["y"], result["z"], 100, cmap=cm.inferno)
                 matplotlibwidget.divider = make_axes_locatable(matplotlibwidget.axis)
                 matplotlibwidget.axis_cm = matplotlibwidget.divider.append_axes("right", size="3%", pad=0.03)
                 matplotlibwidget.figure.colorbar(plot, cax=matplotlibwidget.axis_cm, format='%.2f')
@@ -5140,304 +5076,82 @@ class MainWindow(QMainWindow):
                 matplotlibwidget.axis.ticklabel_format(useOffset=False)
                 matplotlibwidget.axis.xaxis.set_major_formatter(FormatStrFormatter('%.2f'))
                 matplotlibwidget.axis.yaxis.set_major_formatter(FormatStrFormatter('%.2f'))
-                matplotlibwidget.axis.set(xlabel=comboBox_topology_plot_x_axis.currentText(),
-                                          ylabel=comboBox_topology_plot_y_axis.currentText(),
-                                          title=comboBox_topology_plot_z_axis.currentText())
-                matplotlibwidget.figure.canvas.draw_idle()
-
-                matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                                 color="Green",
-                                                 linewidth=1)
-                matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
-
-        except:
-            matplotlibwidget.axis.clear()
-            matplotlibwidget.figure.canvas.draw_idle()
-            self.show_popup_message(
-                "Error: " + comboBox_topology_plot_z_axis.currentText() + " could not be plotted due to missing inputs or data!")
-
-        try:
-            if comboBox_topology_line_contour.currentText() == "Line":
-                if comboBox_topology_plot_x_axis.currentText() == "Zeta = f*L":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_zeta_min.text()),
-                                             float(self.lineEdit_topology_zeta_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Vin [V]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_v_in_min.text()),
-                                             float(self.lineEdit_topology_v_in_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Vout [V]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_v_out_min.text()),
-                                             float(self.lineEdit_topology_v_out_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Output Power [W]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_output_power_min.text()),
-                                             float(self.lineEdit_topology_output_power_max.text()), 100)
-                if comboBox_topology_plot_x_axis.currentText() == "Frequency [kHz]":
-                    vec_x_axis = np.linspace(float(self.lineEdit_topology_frequency_min.text()),
-                                             float(self.lineEdit_topology_frequency_max.text()), 100)
-
-                if self.lineEdit_topology_zeta.text() != "":
-                    vec_zeta = np.full_like(vec_x_axis, float(self.lineEdit_topology_zeta.text()))
-                if self.lineEdit_topology_v_in.text() != "":
-                    vec_v_in = np.full_like(vec_x_axis, float(self.lineEdit_topology_v_in.text()))
-                if self.lineEdit_topology_v_out.text() != "":
-                    vec_v_out = np.full_like(vec_x_axis, float(self.lineEdit_topology_v_out.text()))
-                if self.lineEdit_topology_output_power.text() != "":
-                    vec_output_power = np.full_like(vec_x_axis, float(self.lineEdit_topology_output_power.text()))
-                if self.lineEdit_topology_frequency.text() != "":
-                    vec_frequency = np.full_like(vec_x_axis, float(self.lineEdit_topology_frequency.text()))
-
-                if comboBox_topology_plot_x_axis.currentText() == "Zeta = f*L":
-                    vec_zeta = vec_x_axis
-                if comboBox_topology_plot_x_axis.currentText() == "Vin [V]":
-                    vec_v_in = vec_x_axis
-                if comboBox_topology_plot_x_axis.currentText() == "Vout [V]":
-                    vec_v_out = vec_x_axis
-                if comboBox_topology_plot_x_axis.currentText() == "Output Power [W]":
-                    vec_output_power = vec_x_axis
-                if comboBox_topology_plot_x_axis.currentText() == "Frequency [kHz]":
-                    vec_frequency = vec_x_axis
-
-                if comboBox_topology_plot_y_axis.currentText() == "RMS Current Transistor1 [A]":
-                    vec_y_axis = converter.f_vec_i1_rms(zeta=vec_zeta,
-                                                        v_in=vec_v_in,
-                                                        v_out=vec_v_out,
-                                                        p_out=vec_output_power,
-                                                        v_g_on1=v_g_on1,
-                                                        transistor1=transistor1,
-                                                        transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "RMS Current Diode Transistor2 [A]":
-                    vec_y_axis = converter.f_vec_i2_rms(zeta=vec_zeta,
-                                                        v_in=vec_v_in,
-                                                        v_out=vec_v_out,
-                                                        p_out=vec_output_power,
-                                                        v_g_on1=v_g_on1,
-                                                        transistor1=transistor1,
-                                                        transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Mean Current Transistor1 [A]":
-                    vec_y_axis = converter.f_vec_i1_mean(zeta=vec_zeta,
-                                                         v_in=vec_v_in,
-                                                         v_out=vec_v_out,
-                                                         p_out=vec_output_power,
-                                                         v_g_on1=v_g_on1,
-                                                         transistor1=transistor1,
-                                                         transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Mean Current Diode Transistor2 [A]":
-                    vec_y_axis = converter.f_vec_i2_mean(zeta=vec_zeta,
-                                                         v_in=vec_v_in,
-                                                         v_out=vec_v_out,
-                                                         p_out=vec_output_power,
-                                                         v_g_on1=v_g_on1,
-                                                         transistor1=transistor1,
-                                                         transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "RMS Inductor Current [A]":
-                    vec_y_axis = converter.f_vec_i_l_rms(zeta=vec_zeta,
-                                                         v_in=vec_v_in,
-                                                         v_out=vec_v_out,
-                                                         p_out=vec_output_power,
-                                                         v_g_on1=v_g_on1,
-                                                         transistor1=transistor1,
-                                                         transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Mean Inductor Current [A]":
-                    vec_y_axis = converter.f_vec_i_l_mean(zeta=vec_zeta,
-                                                          v_in=vec_v_in,
-                                                          v_out=vec_v_out,
-                                                          p_out=vec_output_power,
-                                                          v_g_on1=v_g_on1,
-                                                          transistor1=transistor1,
-                                                          transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Peak Current [A]":
-                    vec_y_axis = converter.f_vec_i_peak(zeta=vec_zeta,
-                                                        v_in=vec_v_in,
-                                                        v_out=vec_v_out,
-                                                        p_out=vec_output_power,
-                                                        v_g_on1=v_g_on1,
-                                                        transistor1=transistor1,
-                                                        transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Conduction Losses Transistor1 [W]":
-                    vec_y_axis = converter.f_vec_conduction_losses1(zeta=vec_zeta,
-                                                                    v_in=vec_v_in,
-                                                                    v_out=vec_v_out,
-                                                                    p_out=vec_output_power,
-                                                                    v_g_on1=v_g_on1,
-                                                                    transistor1=transistor1,
-                                                                    transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Conduction Losses Diode Transistor2 [W]":
-                    vec_y_axis = converter.f_vec_conduction_losses2(zeta=vec_zeta,
-                                                                    v_in=vec_v_in,
-                                                                    v_out=vec_v_out,
-                                                                    p_out=vec_output_power,
-                                                                    v_g_on1=v_g_on1,
-                                                                    transistor1=transistor1,
-                                                                    transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Total Conduction Losses [W]":
-                    vec_y_axis = converter.f_vec_conduction_losses(zeta=vec_zeta,
-                                                                   v_in=vec_v_in,
-                                                                   v_out=vec_v_out,
-                                                                   p_out=vec_output_power,
-                                                                   v_g_on1=v_g_on1,
-                                                                   transistor1=transistor1,
-                                                                   transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Turn-on Switching Losses Transistor1 [W]":
-                    vec_y_axis = converter.f_vec_p_on1(zeta=vec_zeta,
-                                                       v_in=vec_v_in,
-                                                       v_out=vec_v_out,
-                                                       p_out=vec_output_power,
-                                                       v_g_on1=v_g_on1,
-                                                       transistor1=transistor1,
-                                                       transistor2=transistor2,
-                                                       r_g_on1=r_g_on1,
-                                                       frequency=vec_frequency)
-                if comboBox_topology_plot_y_axis.currentText() == "Turn-off Switching Losses Transistor1 [W]":
-                    vec_y_axis = converter.f_vec_p_off1(zeta=vec_zeta,
-                                                        v_in=vec_v_in,
-                                                        v_out=vec_v_out,
-                                                        p_out=vec_output_power,
-                                                        v_g_on1=v_g_on1,
-                                                        transistor1=transistor1,
-                                                        transistor2=transistor2,
-                                                        r_g_off1=r_g_off1,
-                                                        frequency=vec_frequency)
-                if comboBox_topology_plot_y_axis.currentText() == "Reverse Recovery Losses Diode Transistor2 [W]":
-                    vec_y_axis = converter.f_vec_p_rr2(zeta=vec_zeta,
-                                                       v_in=vec_v_in,
-                                                       v_out=vec_v_out,
-                                                       p_out=vec_output_power,
-                                                       v_g_on1=v_g_on1,
-                                                       transistor1=transistor1,
-                                                       transistor2=transistor2,
-                                                       frequency=vec_frequency)
-                if comboBox_topology_plot_y_axis.currentText() == "Total Switching Losses Transistor1 [W]":
-                    vec_y_axis = converter.f_vec_p_on_off1(zeta=vec_zeta,
-                                                           v_in=vec_v_in,
-                                                           v_out=vec_v_out,
-                                                           p_out=vec_output_power,
-                                                           v_g_on1=v_g_on1,
-                                                           transistor1=transistor1,
-                                                           transistor2=transistor2,
-                                                           r_g_on1=r_g_on1,
-                                                           r_g_off1=r_g_off1,
-                                                           frequency=vec_frequency)
-                if comboBox_topology_plot_y_axis.currentText() == "Total Switching Losses [W]":
-                    vec_y_axis = converter.f_vec_p_on_off_rr_1_2(zeta=vec_zeta,
-                                                                 v_in=vec_v_in,
-                                                                 v_out=vec_v_out,
-                                                                 p_out=vec_output_power,
-                                                                 v_g_on1=v_g_on1,
-                                                                 transistor1=transistor1,
-                                                                 transistor2=transistor2,
-                                                                 r_g_on1=r_g_on1,
-                                                                 r_g_off1=r_g_off1,
-                                                                 frequency=vec_frequency)
-                if comboBox_topology_plot_y_axis.currentText() == "Total Power Losses Transistor1 [W]":
-                    vec_y_axis = converter.f_vec_p1(zeta=vec_zeta,
-                                                    v_in=vec_v_in,
-                                                    v_out=vec_v_out,
-                                                    p_out=vec_output_power,
-                                                    v_g_on1=v_g_on1,
-                                                    transistor1=transistor1,
-                                                    transistor2=transistor2,
-                                                    r_g_on1=r_g_on1,
-                                                    r_g_off1=r_g_off1,
-                                                    frequency=vec_frequency)
-                if comboBox_topology_plot_y_axis.currentText() == "Temperature Switch Transistor1 [°C]":
-                    vec_y_axis = converter.f_vec_t_switch1(zeta=vec_zeta,
-                                                           v_in=vec_v_in,
-                                                           v_out=vec_v_out,
-                                                           p_out=vec_output_power,
-                                                           v_g_on1=v_g_on1,
-                                                           r_g_on1=r_g_on1,
-                                                           r_g_off1=r_g_off1,
-                                                           t_heatsink=t_heatsink,
-                                                           r_th_heatsink=r_th_heatsink,
-                                                           frequency=vec_frequency,
-                                                           transistor1=transistor1,
-                                                           transistor2=transistor2)
-                if comboBox_topology_plot_y_axis.currentText() == "Temperature Diode Transistor2 [°C]":
-                    vec_y_axis = converter.f_vec_t_diode2(zeta=vec_zeta,
-                                                          v_in=vec_v_in,
-                                                          v_out=vec_v_out,
-                                                          p_out=vec_output_power,
-                                                          v_g_on1=v_g_on1,
-                                                          t_heatsink=t_heatsink,
-                                                          r_th_heatsink=r_th_heatsink,
-                                                          frequency=vec_frequency,
-                                                          transistor1=transistor1,
-                                                          transistor2=transistor2)
-
-                matplotlibwidget.axis.plot(vec_x_axis, vec_y_axis)
+                matplotlibwidget.axis.set(xlabel=result["x_label"],
+                                          ylabel=result["y_label"],
+                                          title=result["title"])
+            else:
+                matplotlibwidget.axis.plot(result["x"], result["y"])
                 matplotlibwidget.axis.ticklabel_format(useOffset=False)
                 matplotlibwidget.axis.grid()
                 matplotlibwidget.axis.set_position([0.15, 0.15, 0.8, 0.8])
                 matplotlibwidget.axis.xaxis.set_major_formatter(FormatStrFormatter('%.2f'))
                 matplotlibwidget.axis.yaxis.set_major_formatter(FormatStrFormatter('%.2f'))
-                matplotlibwidget.axis.set(xlabel=comboBox_topology_plot_x_axis.currentText(),
-                                          ylabel=comboBox_topology_plot_y_axis.currentText(), )
-                matplotlibwidget.figure.canvas.draw_idle()
+                matplotlibwidget.axis.set(xlabel=result["x_label"],
+                                          ylabel=result["y_label"], )
+            matplotlibwidget.figure.canvas.draw_idle()
 
-                matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
-                                                 color="Green", linewidth=1)
-                matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+            matplotlibwidget.cursor = Cursor(matplotlibwidget.axis, horizOn=True, vertOn=True, useblit=True,
+                                             color="Green", linewidth=1)
+            matplotlibwidget.figure.canvas.mpl_connect("button_press_event", clicked)
+        except Exception as e:
+            self.topology_plot_failed(plot_id, str(e))
 
-        except:
-            matplotlibwidget.axis.clear()
-            matplotlibwidget.figure.canvas.draw_idle()
-            self.show_popup_message(
-                "Error: " + comboBox_topology_plot_y_axis.currentText() + " could not be plotted due to missing inputs or data!")
+    def topology_plot_failed(self, plot_id, message):
+        """
+        Clear a topology plot which could not be calculated or drawn and show a notification, runs in the GUI thread.
+
+        :param plot_id: widget, Matplotlib figure and the plotted quantity, see topology_get_plot_id()
+        :type plot_id: tuple
+        :param message: error message of the calculation
+        :type message: str
+        :return: None
+        """
+        plot_id[1].axis.clear()
+        plot_id[1].figure.canvas.draw_idle()
+        self.show_popup_message("Error: " + plot_id[2] + f" could not be plotted due to missing inputs or data! ({message})")
 
     def topology_update_plots(self):
         """
-        Set the variable to determine the topology and runs the function "topology_create_plot" for all QWidgets, Matplotlib figures and ComboBoxes.
+        Calculate all topology plots in worker threads, every plot is shown as soon as it is calculated.
+
+        Plots with unchanged inputs are shown from the cache of the topology plot pool, plots of a previous update which are
+        not finished yet are cancelled.
 
         :return: None
         """
-        if self.comboBox_topology_topology.currentText() == "Buck-Converter":
-            converter = buck_converter_functions
-        elif self.comboBox_topology_topology.currentText() == "Boost-Converter":
-            converter = boost_converter_functions
-        elif self.comboBox_topology_topology.currentText() == "Buck-Boost-Converter":
-            converter = buck_boost_converter_functions
+        converter = self.get_converter()
+        plots = []
+        for number in range(1, 7):
+            inputs = self.topology_get_plot_inputs(*[getattr(self, f"comboBox_topology_plot{number}_{name}") for name in
+                                                     ["x_axis", "y_axis", "z_axis", "line_contour"]], converter)
+            plot_id = self.topology_get_plot_id(getattr(self, f"widget_topology_plot{number}"), getattr(self, f"matplotlibwidget_topology{number}"), inputs)
+            plots.append((plot_id, inputs, self.topology_calculate_plot, (inputs,)))
+        self.topology_plot_pool.submit(plots)
 
-        self.topology_create_plot(self.widget_topology_plot1,
-                                  self.matplotlibwidget_topology1,
-                                  self.comboBox_topology_plot1_x_axis,
-                                  self.comboBox_topology_plot1_y_axis,
-                                  self.comboBox_topology_plot1_z_axis,
-                                  self.comboBox_topology_plot1_line_contour,
-                                  converter)
-        self.topology_create_plot(self.widget_topology_plot2,
-                                  self.matplotlibwidget_topology2,
-                                  self.comboBox_topology_plot2_x_axis,
-                                  self.comboBox_topology_plot2_y_axis,
-                                  self.comboBox_topology_plot2_z_axis,
-                                  self.comboBox_topology_plot2_line_contour,
-                                  converter)
-        self.topology_create_plot(self.widget_topology_plot3,
-                                  self.matplotlibwidget_topology3,
-                                  self.comboBox_topology_plot3_x_axis,
-                                  self.comboBox_topology_plot3_y_axis,
-                                  self.comboBox_topology_plot3_z_axis,
-                                  self.comboBox_topology_plot3_line_contour,
-                                  converter)
-        self.topology_create_plot(self.widget_topology_plot4,
-                                  self.matplotlibwidget_topology4,
-                                  self.comboBox_topology_plot4_x_axis,
-                                  self.comboBox_topology_plot4_y_axis,
-                                  self.comboBox_topology_plot4_z_axis,
-                                  self.comboBox_topology_plot4_line_contour,
-                                  converter)
-        self.topology_create_plot(self.widget_topology_plot5,
-                                  self.matplotlibwidget_topology5,
-                                  self.comboBox_topology_plot5_x_axis,
-                                  self.comboBox_topology_plot5_y_axis,
-                                  self.comboBox_topology_plot5_z_axis,
-                                  self.comboBox_topology_plot5_line_contour,
-                                  converter)
-        self.topology_create_plot(self.widget_topology_plot6,
-                                  self.matplotlibwidget_topology6,
-                                  self.comboBox_topology_plot6_x_axis,
-                                  self.comboBox_topology_plot6_y_axis,
-                                  self.comboBox_topology_plot6_z_axis,
-                                  self.comboBox_topology_plot6_line_contour,
-                                  converter)
+    def clear_plot_caches(self):
+        """
+        Delete the cached plots of the topology calculator and the comparison tools, called after the database changed.
+
+        :return: None
+        """
+        self.topology_plot_pool.clear_cache()
+        self.compare_plot_pool.clear_cache()
+
+    def load_parallel_transistor(self, transistor_name, number_parallel):
+        """
+        Load a transistor and connect it in parallel, can be called in the worker threads of the plot pools.
+
+        :param transistor_name: name of the transistor
+        :type transistor_name: str
+        :param number_parallel: text of the count of parallel transistors
+        :type number_parallel: str
+        :return: transistor object
+        :rtype: Transistor
+        """
+        transistor = self.tdb.load_transistor(transistor_name)
+        if number_parallel != "1":
+            transistor = self.tdb.parallel_transistors(transistor, int(number_parallel))
+        return transistor
 
     def get_converter(self):
         """
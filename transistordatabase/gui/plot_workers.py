@@ -0,0 +1,221 @@
+"""Calculation of the GUI plots in background threads, with cancellation, caching of the results by the plot inputs and progressive rendering."""
+# Python standard libraries
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+import threading
+
+# Third party libraries
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+# Count of plot results kept by a PlotWorkerPool (a contour plot of the topology calculator is about 250 kB)
+PLOT_RESULT_CACHE_SIZE = 64
+# Count of shared inputs (e.g. the loaded transistors) kept by a PlotWorkerPool
+PLOT_SHARED_CACHE_SIZE = 8
+
+
+class PlotWorkerSignals(QObject):
+    """
+    Signals of a PlotWorker, emitted in the worker thread and received in the thread of the PlotWorkerPool.
+
+    QRunnable is no QObject, so the signals are defined in this separate class.
+    """
+
+    finished = pyqtSignal(int, object, object, object)
+    failed = pyqtSignal(int, object, str)
+
+
+class PlotWorker(QRunnable):
+    """Calculate the data of one plot in a thread of the QThreadPool of a PlotWorkerPool."""
+
+    def __init__(self, pool: 'PlotWorkerPool', generation: int, plot_id: Hashable, key: Hashable, calculate: Callable, args: Tuple):
+        """
+        Initialize a plot worker.
+
+        :param pool: pool which started the worker
+        :type pool: PlotWorkerPool
+        :param generation: generation of the pool when the worker was started, see PlotWorkerPool.cancel()
+        :type generation: int
+        :param plot_id: identifier of the plot, passed to the render function
+        :param key: cache key of the result, the inputs of the plot
+        :param calculate: calculation function, called with args in the worker thread. It must not access any widgets.
+        :type calculate: Callable
+        :param args: arguments of the calculation function
+        :type args: tuple
+        """
+        super().__init__()
+        self.pool = pool
+        self.generation = generation
+        self.plot_id = plot_id
+        self.key = key
+        self.calculate = calculate
+        self.args = args
+        self.signals = PlotWorkerSignals()
+
+    def run(self):
+        """Calculate the plot data, skipped if the worker is cancelled before it is started."""
+        if self.pool.is_cancelled(self.generation):
+            return
+        try:
+            result = self.calculate(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, self.plot_id, f"{type(e).__name__}: {e}")
+        else:
+            self.signals.finished.emit(self.generation, self.plot_id, self.key, result)
+
+
+class PlotWorkerPool(QObject):
+    """
+    Calculate plots in background threads and render them in the GUI thread as soon as each plot is calculated.
+
+    Every call of submit() cancels the plots of the previous call: workers which are not started yet are removed from the
+    thread pool and the results of running workers are cached, but not rendered. Results are cached by the inputs of the
+    plots, so plots with unchanged inputs are rendered without a calculation.
+    """
+
+    def __init__(self, render: Callable[[Hashable, Any], None], fail: Callable[[Hashable, str], None], max_thread_count: Optional[int] = None):
+        """
+        Initialize a plot worker pool, must be called in the GUI thread.
+
+        :param render: called in the GUI thread with the plot id and the result of the calculation
+        :type render: Callable
+        :param fail: called in the GUI thread with the plot id and the error message if the calculation failed
+        :type fail: Callable
+        :param max_thread_count: count of worker threads, None for the count of CPUs
+        :type max_thread_count: int or None
+        """
+        super().__init__()
+        self.render = render
+        self.fail = fail
+        self.thread_pool = QThreadPool()
+        if max_thread_count is not None:
+            self.thread_pool.setMaxThreadCount(max_thread_count)
+        self.generation = 0
+        # results of workers started before the last clear_cache() are not cached
+        self._cleared_generation = 0
+        self.results = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._shared = OrderedDict()
+        self._shared_lock = threading.Lock()
+
+    def submit(self, plots: List[Tuple[Hashable, Hashable, Callable, Tuple]]) -> None:
+        """
+        Cancel the running plots and calculate the given plots.
+
+        Cached plots are rendered immediately, the other plots are rendered in the order their calculations finish.
+
+        :param plots: plots as tuples of plot id, cache key (the plot inputs), calculation function and its arguments
+        :type plots: list
+        """
+        self.cancel()
+        for plot_id, key, calculate, args in plots:
+            if key in self.results:
+                self.cache_hits += 1
+                self.results.move_to_end(key)
+                self.render(plot_id, self.results[key])
+                continue
+            self.cache_misses += 1
+            worker = PlotWorker(self, self.generation, plot_id, key, calculate, args)
+            worker.signals.finished.connect(self._on_finished)
+            worker.signals.failed.connect(self._on_failed)
+            self.thread_pool.start(worker)
+
+    def cancel(self) -> None:
+        """Cancel all submitted plots, e.g. if the inputs changed. Running calculations finish, but are not rendered."""
+        self.generation += 1
+        self.thread_pool.clear()
+
+    def clear_cache(self) -> None:
+        """Cancel all submitted plots and delete the cached results and shared inputs, e.g. after the transistors in the database changed."""
+        self.cancel()
+        self._cleared_generation = self.generation
+        self.results.clear()
+        with self._shared_lock:
+            self._shared.clear()
+
+    def is_cancelled(self, generation: int) -> bool:
+        """
+        Check if the plots of a generation are cancelled, can be called in the worker threads.
+
+        :param generation: generation of the worker
+        :type generation: int
+        :return: True if the plots were cancelled
+        :rtype: bool
+        """
+        return generation != self.generation
+
+    def wait(self, timeout: int = -1) -> bool:
+        """
+        Wait until all workers finished, e.g. before closing the window. The results are rendered by the Qt event loop afterwards.
+
+        :param timeout: timeout in ms, -1 for no timeout
+        :type timeout: int
+        :return: True if all workers finished
+        :rtype: bool
+        """
+        return self.thread_pool.waitForDone(timeout)
+
+    def get_shared(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        """
+        Get an input shared by several plots (e.g. the loaded transistors), created once by the first worker which needs it.
+
+        Can be called in the worker threads. Every input is created once: workers which need an input that is being created wait
+        for it, workers which need other inputs are not blocked. If create() fails, the waiting workers get the exception and the
+        input is created again on the next call.
+
+        :param key: key of the input
+        :param create: function to create the input
+        :type create: Callable
+        :return: shared input
+        """
+        with self._shared_lock:
+            shared = self._shared.get(key)
+            is_creator = shared is None
+            if is_creator:
+                shared = self._shared[key] = Future()
+                while len(self._shared) > PLOT_SHARED_CACHE_SIZE:
+                    self._shared.popitem(last=False)
+            self._shared.move_to_end(key)
+        if is_creator:
+            try:
+                shared.set_result(create())
+            except Exception as e:
+                shared.set_exception(e)
+                with self._shared_lock:
+                    if self._shared.get(key) is shared:
+                        del self._shared[key]
+        return shared.result()
+
+    @pyqtSlot(int, object, object, object)
+    def _on_finished(self, generation: int, plot_id: Hashable, key: Hashable, result: Any) -> None:
+        """
+        Cache the result of a worker and render it if it is not cancelled, called in the GUI thread.
+
+        :param generation: generation of the worker
+        :type generation: int
+        :param plot_id: identifier of the plot
+        :param key: cache key of the result
+        :param result: result of the calculation
+        """
+        if generation >= self._cleared_generation:
+            self.results[key] = result
+            self.results.move_to_end(key)
+            while len(self.results) > PLOT_RESULT_CACHE_SIZE:
+                self.results.popitem(last=False)
+        if not self.is_cancelled(generation):
+            self.render(plot_id, result)
+
+    @pyqtSlot(int, object, str)
+    def _on_failed(self, generation: int, plot_id: Hashable, message: str) -> None:
+        """
+        Report a failed calculation if it is not cancelled, called in the GUI thread.
+
+        :param generation: generation of the worker
+        :type generation: int
+        :param plot_id: identifier of the plot
+        :param message: error message
+        :type message: str
+        """
+        if not self.is_cancelled(generation):
+            self.fail(plot_id, message)
@@ -1,9 +1,7 @@
 """Helper functions."""
 # Python standard libraries
 from __future__ import annotations
-from typing import List, Dict, Tuple
-from matplotlib import pyplot as plt
-from PyQt5 import QtWidgets, QtWebEngineWidgets
+from typing import List, Dict, Tuple, Optional
 import xml.etree.ElementTree as et
 import numpy as np
 import sys
@@ -11,22 +9,48 @@ import os
 import re
 import base64
 import io
+import contextlib
+import threading
+import types
 
 # Third party libraries
 from bson.objectid import ObjectId
 
 # Local libraries
+from transistordatabase.lazy_imports import plt
 from transistordatabase.checker_functions import check_realnum, check_str, check_2d_dataset
 from transistordatabase.constants import *
+from transistordatabase.curve_resampling import get_channel_tensor, get_loss_tensor
+from transistordatabase.plot_cache import cached_plot
 
 transistor_name_regex = "(\S*)( \((\d*)\))?"
 
+# Thread local, so parallel loads in other threads are still validated
+_validation_state = threading.local()
+
 
 # ==== Validation functions ====
 def isvalid_transistor_name(transistor_name):
     """Check if the given transistor name is valid."""
     return False if re.match(transistor_name_regex, transistor_name) is None else True
 
+@contextlib.contextmanager
+def trusted_data():
+    """
+    Skip the checks of isvalid_dict() in the current thread, e.g. for data which was already validated when it was saved.
+
+    Only None and empty dictionaries are still reported as not valid.
+
+    >>> with trusted_data():
+    ...     transistor = Transistor(transistor_args, switch_args, diode_args, housing_types, module_manufacturers)
+    """
+    previous = getattr(_validation_state, 'trusted', False)
+    _validation_state.trusted = True
+    try:
+        yield
+    finally:
+        _validation_state.trusted = previous
+
 def isvalid_dict(dataset_dict: Dict, dict_type: str) -> bool:
     """
     Check input argument dictionaries for their validity.
@@ -48,6 +72,8 @@ def isvalid_dict(dataset_dict: Dict, dict_type: str) -> bool:
 
     .. todo:: Error if given key is not used?
     """
+    if getattr(_validation_state, 'trusted', False) and isinstance(dataset_dict, dict):
+        return bool(dataset_dict)
     supported_types = ['MOSFET', 'IGBT', 'SiC-MOSFET', 'GaN-Transistor']
     instructions = {
         'Transistor': {
@@ -408,6 +434,9 @@ def html_to_pdf(html: List | str, name: List | str, path: List | str):
 
     :return: saves the html string to pdf file format
     """
+    # Qt is only needed for the pdf export
+    from PyQt5 import QtWidgets, QtWebEngineWidgets
+
     app = QtWidgets.QApplication(sys.argv)
     page = QtWebEngineWidgets.QWebEnginePage()
     path_item = str()
@@ -449,6 +478,7 @@ def html_to_pdf(html: List | str, name: List | str, path: List | str):
 
 
 # ==== Plot ====
+@cached_plot()
 def get_vc_plots(cap_data: Dict):
     """
     Plot and convert voltage dependant capacitance plots in raw data format. Invoked internally by export_datasheet() method. Helper function.
@@ -579,7 +609,10 @@ def negate_and_append(voltage: List, current: List) -> Tuple[List, np.array]:
 
 def get_loss_curves(loss_data: List, plecs_holder: Dict, loss_type: str, v_g: int, is_recovery_loss: bool) -> Dict:
     """
-    Extract loss information of switch/diode for plecs exporter. Called internally by get_curve_data() for using plecs exporter feature. Helper function.
+    Extract loss information of switch/diode for plecs exporter. Helper function.
+
+    The curves are resampled by curve_resampling.get_loss_tensor(), see fill_plecs_loss_curves(). Transistor.get_curve_data()
+    uses the resampled curves cached on the Switch/Diode object instead.
 
     :param loss_data: turn on/off energy data taken from transistor class switch or diode object
     :type loss_data: list
@@ -595,33 +628,15 @@ def get_loss_curves(loss_data: List, plecs_holder: Dict, loss_type: str, v_g: in
     :return: plecs_holder filled with the extracted switch's or diode's energy loss information
     :rtype: dict
     """
-    for energy_dict in loss_data:
-        if energy_dict['v_g'] == v_g and energy_dict['dataset_type'] == 'graph_i_e' and energy_dict['graph_i_e'] is not None:
-            try:
-                if limit_current and limit_current > max(energy_dict['graph_i_e'][0]):
-                    limit_current = max(energy_dict['graph_i_e'][0])
-            except NameError:
-                limit_current = max(energy_dict['graph_i_e'][0])
-    for energy_dict in loss_data:
-        if energy_dict['v_g'] == v_g and energy_dict['dataset_type'] == 'graph_i_e' and energy_dict['graph_i_e'] is not None:
-            interp_current = np.linspace(0, limit_current, 20)
-            loss_energy = np.interp(interp_current, energy_dict['graph_i_e'][0], energy_dict['graph_i_e'][1])
-            if 'Energy' not in plecs_holder[loss_type]:
-                plecs_holder[loss_type]['CurrentAxis'] = interp_current.tolist()
-                plecs_holder[loss_type]['Energy'] = {}
-                plecs_holder[loss_type]['TemperatureAxis'] = list()
-            rev_voltage = energy_dict['v_supply'] if not is_recovery_loss else -abs(energy_dict['v_supply'])
-            if rev_voltage not in plecs_holder[loss_type]['Energy']:
-                plecs_holder[loss_type]['Energy'][rev_voltage] = []
-            plecs_holder[loss_type]['Energy'][rev_voltage].append(loss_energy.tolist())
-            # Loss curves are defined at one v_g in many v_supply voltages, therefore to avoid redundancy in Tj and v_supply appends
-            plecs_holder[loss_type]['TemperatureAxis'].append(energy_dict['t_j']) \
-                if energy_dict['t_j'] not in plecs_holder[loss_type]['TemperatureAxis'] else None
-    return plecs_holder
+    datasets = [types.SimpleNamespace(**energy_dict) for energy_dict in loss_data]
+    return fill_plecs_loss_curves(get_loss_tensor(datasets, v_g), plecs_holder, loss_type, is_recovery_loss)
 
 def get_channel_data(channel_data: List, plecs_holder: Dict, v_on: int, is_diode: bool, has_body_diode: bool) -> Dict:
     """
-    Extract channel data of switch/diode for plecs exporter. Called internally by get_curve_data() for using plecs exporter feature. Helper function.
+    Extract channel data of switch/diode for plecs exporter. Helper function.
+
+    The curves are resampled by curve_resampling.get_channel_tensor(), see fill_plecs_channel_data(). Transistor.get_curve_data()
+    uses the resampled curves cached on the Switch/Diode object instead.
 
     :param channel_data: channel data taken from transistor class switch/diode object
     :type channel_data: list
@@ -637,24 +652,57 @@ def get_channel_data(channel_data: List, plecs_holder: Dict, v_on: int, is_diode
     :return: plecs_holder filled with the extracted switch's or diode's channel information
     :rtype: dict
     """
-    for channel in channel_data:
-        if channel['v_g'] == v_on or (not has_body_diode and is_diode):
-            try:
-                if limit_current and limit_current > max(np.abs(channel['graph_v_i'][1])):
-                    limit_current = max(np.abs(channel['graph_v_i'][1]))
-            except NameError:
-                limit_current = max(np.abs(channel['graph_v_i'][1]))
-    for channel in channel_data:
-        if channel['v_g'] == v_on or (not has_body_diode and is_diode):
-            interp_current = np.linspace(0, limit_current, 20)
-            channel_data = np.interp(interp_current, np.abs(channel['graph_v_i'][1]), np.abs(channel['graph_v_i'][0]))
-            if 'Channel' not in plecs_holder['ConductionLoss']:
-                plecs_holder['ConductionLoss']['CurrentAxis'] = interp_current.tolist()
-                plecs_holder['ConductionLoss']['Channel'] = list()
-                plecs_holder['ConductionLoss']['TemperatureAxis'] = list()
-            # forward characteristics are defined only at one gate voltage and does not depend on v_supply
-            plecs_holder['ConductionLoss']['TemperatureAxis'].append(channel['t_j'])
-            plecs_holder['ConductionLoss']['Channel'].append(channel_data.tolist())
+    datasets = [types.SimpleNamespace(**channel) for channel in channel_data]
+    v_g = None if is_diode and not has_body_diode else v_on
+    return fill_plecs_channel_data(get_channel_tensor(datasets, v_g), plecs_holder)
+
+def fill_plecs_loss_curves(loss_tensor: Optional[Dict], plecs_holder: Dict, loss_type: str, is_recovery_loss: bool) -> Dict:
+    """
+    Fill resampled switching loss curves into the data of the plecs exporter. Helper function.
+
+    Missing (t_j, v_supply) combinations are left out, so the energy lists do not match the temperature axis and
+    Transistor.get_curve_data() raises a MissingDataError.
+
+    :param loss_tensor: resampled loss curves, see curve_resampling.get_loss_tensor(). None if there are no curves.
+    :type loss_tensor: dict or None
+    :param plecs_holder: dictionary to collect the energy loss data
+    :type plecs_holder: dict
+    :param loss_type: either of type TurnOnLoss or TurnOffLoss
+    :type loss_type: str
+    :param is_recovery_loss: a boolean to specify the provided loss information relates to diode's reverse recovery losses
+    :type is_recovery_loss: bool
+
+    :return: plecs_holder filled with the switch's or diode's energy loss information
+    :rtype: dict
+    """
+    if loss_tensor is None:
+        return plecs_holder
+    plecs_holder[loss_type]['CurrentAxis'] = loss_tensor['current'].tolist()
+    plecs_holder[loss_type]['TemperatureAxis'] = loss_tensor['t_j'].tolist()
+    plecs_holder[loss_type]['Energy'] = {}
+    for v_supply, energy in zip(loss_tensor['v_supply'].tolist(), np.swapaxes(loss_tensor['energy'], 0, 1)):
+        rev_voltage = v_supply if not is_recovery_loss else -abs(v_supply)
+        plecs_holder[loss_type]['Energy'][rev_voltage] = [row.tolist() for row in energy if not np.isnan(row).any()]
+    return plecs_holder
+
+def fill_plecs_channel_data(channel_tensor: Optional[Dict], plecs_holder: Dict) -> Dict:
+    """
+    Fill resampled channel curves into the data of the plecs exporter. Helper function.
+
+    :param channel_tensor: resampled channel curves, see curve_resampling.get_channel_tensor(). None if there are no curves.
+    :type channel_tensor: dict or None
+    :param plecs_holder: dictionary to collect the channel data
+    :type plecs_holder: dict
+
+    :return: plecs_holder filled with the switch's or diode's channel information
+    :rtype: dict
+    """
+    if channel_tensor is None:
+        return plecs_holder
+    # forward characteristics are defined only at one gate voltage and does not depend on v_supply
+    plecs_holder['ConductionLoss']['CurrentAxis'] = channel_tensor['current'].tolist()
+    plecs_holder['ConductionLoss']['TemperatureAxis'] = channel_tensor['t_j'].tolist()
+    plecs_holder['ConductionLoss']['Channel'] = channel_tensor['voltage'].tolist()
     return plecs_holder
 
 def gen_exp_func(order: int):
@@ -756,16 +804,14 @@ def get_copy_transistor_name(current_name: str) -> str:
 
     '{current_name} (i)'
     """
-    result = re.match(transistor_name_regex, current_name)
-    if len(result.groups) == 2:
+    result = re.fullmatch(transistor_name_regex, current_name)
+    if result is None:
+        raise Exception(f"Given transistor name {current_name} is not a valid name and therefore a copy-name cannot be created.")
+    if not result.group(3):
         # Name is default-name -> ' (1)' will be added.
         return f"{current_name} (1)"
-    elif len(result.group) == 4:
-        # Name is already a copy-name -> Copy number will be raised
-        index = result.group(4)
-        return f"{current_name[-2]}{index+1})"
-    else:
-        raise Exception(f"Given transistor name {current_name} is not a valid name and therefore a copy-name cannot be created.")
+    # Name is already a copy-name -> Copy number will be raised
+    return f"{result.group(1)} ({int(result.group(3)) + 1})"
 
 def get_img_raw_data(plot):
     """
@@ -0,0 +1,135 @@
+"""Pluggable json serializers writing numpy arrays directly, and atomic json file writing."""
+# Python standard libraries
+from __future__ import annotations
+import importlib.util
+import json
+import os
+from typing import Any, Callable, Dict, Optional
+
+# Third party libraries
+import numpy as np
+
+def _default(value: Any) -> Any:
+    """
+    Convert numpy objects, which are not json serializable by default.
+
+    :param value: object to convert
+    :return: json serializable object
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _dumps_json(data: Any, indent: Optional[int]) -> bytes:
+    """
+    Serialize data with the json module of the standard library.
+
+    :param data: data to serialize, may contain numpy arrays
+    :param indent: indentation, None for compact output
+    :type indent: int or None
+    :return: utf-8 encoded json
+    :rtype: bytes
+    """
+    separators = None if indent is not None else (",", ":")
+    return json.dumps(data, indent=indent, separators=separators, default=_default).encode()
+
+def _dumps_orjson(data: Any, indent: Optional[int]) -> bytes:
+    """
+    Serialize data with orjson, which writes numpy arrays without converting them to lists.
+
+    orjson only supports an indentation of 2, other indentations are written by the json module.
+
+    :param data: data to serialize, may contain numpy arrays
+    :param indent: indentation, None for compact output
+    :type indent: int or None
+    :return: utf-8 encoded json
+    :rtype: bytes
+    """
+    if indent not in [None, 2]:
+        return _dumps_json(data, indent)
+    import orjson
+    option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent == 2 else 0)
+    # Non-contiguous arrays and other numpy objects are converted by _default
+    return orjson.dumps(data, option=option, default=_default)
+
+
+JSON_SERIALIZERS: Dict[str, Callable[[Any, Optional[int]], bytes]] = {"json": _dumps_json}
+if importlib.util.find_spec("orjson") is not None:
+    JSON_SERIALIZERS["orjson"] = _dumps_orjson
+
+_default_serializer = "orjson" if "orjson" in JSON_SERIALIZERS else "json"
+
+def register_json_serializer(name: str, dumps: Callable[[Any, Optional[int]], bytes]) -> None:
+    """
+    Register a json serializer.
+
+    :param name: name of the serializer
+    :type name: str
+    :param dumps: function(data, indent) returning the utf-8 encoded json. Must support numpy arrays and indent=None (compact output).
+    :type dumps: Callable
+    """
+    JSON_SERIALIZERS[name] = dumps
+
+def set_default_json_serializer(name: str) -> None:
+    """
+    Set the json serializer used by dumps_json() and write_json_file() if no serializer is given.
+
+    :param name: name of a registered serializer, e.g. 'json' or 'orjson' (if installed)
+    :type name: str
+    """
+    global _default_serializer
+    if name not in JSON_SERIALIZERS:
+        raise KeyError(f"Unknown json serializer '{name}'. Available serializers: {list(JSON_SERIALIZERS)}")
+    _default_serializer = name
+
+def get_default_json_serializer() -> str:
+    """
+    Get the name of the default json serializer.
+
+    :return: name of the serializer
+    :rtype: str
+    """
+    return _default_serializer
+
+def dumps_json(data: Any, indent: Optional[int] = 2, serializer: Optional[str] = None) -> bytes:
+    """
+    Serialize data, which may contain numpy arrays, to json.
+
+    :param data: data to serialize
+    :param indent: indentation, None for compact output
+    :type indent: int or None
+    :param serializer: name of the serializer, None for the default serializer
+    :type serializer: str or None
+    :return: utf-8 encoded json
+    :rtype: bytes
+    """
+    return JSON_SERIALIZERS[serializer or _default_serializer](data, indent)
+
+def write_json_file(data: Any, file_path: str, indent: Optional[int] = 2, serializer: Optional[str] = None) -> None:
+    """
+    Write data, which may contain numpy arrays, atomically to a json file.
+
+    The json is written to a temporary file in the same folder, which replaces the file afterwards. An interrupted write
+    never leaves a truncated file.
+
+    :param data: data to serialize
+    :param file_path: path of the json file
+    :type file_path: str
+    :param indent: indentation, None for compact output
+    :type indent: int or None
+    :param serializer: name of the serializer, None for the default serializer
+    :type serializer: str or None
+    """
+    content = dumps_json(data, indent, serializer)
+    # Temporary file name does not end with .json, so it is never listed as a transistor
+    temp_path = file_path + ".tmp"
+    try:
+        with open(temp_path, "wb") as fd:
+            fd.write(content)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
@@ -0,0 +1,31 @@
+"""Lazy imports of heavy third party modules, so importing transistordatabase stays fast for numerical use."""
+# Python standard libraries
+import importlib
+
+class LazyModule:
+    """Stand-in for a module, which is imported on the first attribute access."""
+
+    def __init__(self, module_name: str):
+        """
+        Initialize a LazyModule object.
+
+        :param module_name: full name of the module, e.g. 'matplotlib.pyplot'
+        :type module_name: str
+        """
+        self.__dict__['_module_name'] = module_name
+
+    def __getattr__(self, name: str):
+        """Import the module (if not already done) and return the attribute of the module."""
+        return getattr(importlib.import_module(self._module_name), name)
+
+    def __setattr__(self, name: str, value):
+        """Set the attribute of the module."""
+        setattr(importlib.import_module(self._module_name), name, value)
+
+    def __repr__(self) -> str:
+        """Return the representation of the lazily imported module."""
+        return f"<lazily imported module '{self._module_name}'>"
+
+
+plt = LazyModule("matplotlib.pyplot")
+requests = LazyModule("requests")
@@ -1,7 +1,63 @@
 """Hanle with the mongodb database."""
-# Third party libraries
-import pymongo
-from pymongo.errors import ServerSelectionTimeoutError
+# Python standard libraries
+import os
+# pymongo is imported on first use, see get_missing_server_connection_class() and __getattr__()
+
+LOCAL_MONGODB_HOST = "mongodb://localhost:27017/"
+
+# Secondary indexes of the transistor collection, the name has a unique index
+MONGODB_INDEX_FIELDS = ["type", "manufacturer", "v_abs_max", "i_cont"]
+
+# Shared MongoClient objects (with their connection pools) by host and process id. A client must not be used after a fork.
+_clients = {}
+
+def get_mongodb_client(host: str = LOCAL_MONGODB_HOST, server_selection_timeout_ms: int = None):
+    """
+    Get the shared MongoClient of a host.
+
+    The client is created on first use. MongoClient is thread-safe and keeps a connection pool, so all collections of a
+    host share the same connections.
+
+    :param host: MongoDB connection string
+    :type host: str
+    :param server_selection_timeout_ms: timeout to find a server in ms, None for the pymongo default
+    :type server_selection_timeout_ms: int
+    :return: MongoClient
+    :rtype: pymongo.MongoClient
+    """
+    import pymongo
+
+    key = (host, server_selection_timeout_ms, os.getpid())
+    if key not in _clients:
+        if server_selection_timeout_ms is None:
+            _clients[key] = pymongo.MongoClient(host)
+        else:
+            _clients[key] = pymongo.MongoClient(host, serverSelectionTimeoutMS=server_selection_timeout_ms)
+    return _clients[key]
+
+def close_mongodb_clients() -> None:
+    """Close all shared MongoClient objects of this process."""
+    for key in [key for key in _clients if key[2] == os.getpid()]:
+        _clients.pop(key).close()
+
+def create_transistor_indexes(collection) -> None:
+    """
+    Create the indexes of a transistor collection: a unique index on the name and the indexes of MONGODB_INDEX_FIELDS.
+
+    Existing indexes are kept. If the collection contains transistors with the same name, a non-unique name index is created.
+
+    :param collection: transistor collection
+    :type collection: pymongo.collection.Collection
+    """
+    from pymongo.errors import DuplicateKeyError, OperationFailure
+
+    try:
+        collection.create_index("name", unique=True)
+    except (DuplicateKeyError, OperationFailure) as e:
+        print(f"The transistor names in the database are not unique, a non-unique index is used: {e}")
+        collection.create_index("name", name="name_non_unique")
+    for field in MONGODB_INDEX_FIELDS:
+        collection.create_index(field)
 
 def connect_tdb(host: str):
     """
@@ -13,8 +69,8 @@ def connect_tdb(host: str):
     :return: transistor_database collection
     """
     if host == "local":
-        host = "mongodb://localhost:27017/"
-    my_transistor_database = pymongo.MongoClient(host)
+        host = LOCAL_MONGODB_HOST
+    my_transistor_database = get_mongodb_client(host)
     return my_transistor_database.transistor_database.collection
 
 
@@ -31,15 +87,16 @@ def connect_local_tdb():
 
     :raises pymongo.errors.ServerSelectionTimeoutError: if there is no mongoDB instance running
     """
+    from pymongo.errors import ServerSelectionTimeoutError
+
     try:
         max_server_delay = 1
-        host = "mongodb://localhost:27017/"
-        my_client = pymongo.MongoClient(host, serverSelectionTimeoutMS=max_server_delay)
+        my_client = get_mongodb_client(LOCAL_MONGODB_HOST, max_server_delay)
         my_client.server_info()
     except ServerSelectionTimeoutError:
         msg = 'Make sure that your MongoDB instance is running. If not please install it from ' \
               'https://docs.mongodb.com/manual/administration/install-community/'
-        raise MissingServerConnection(msg)
+        raise get_missing_server_connection_class()(msg)
     else:
         return my_client["local"]["transistor_database"]
 
@@ -50,20 +107,47 @@ def drop_local_tdb():
 
     :raises pymongo.errors.ServerSelectionTimeoutError: if there is no mongoDB instance running
     """
+    from pymongo.errors import ServerSelectionTimeoutError
+
     try:
         max_server_delay = 1
-        host = "mongodb://localhost:27017/"
-        my_client = pymongo.MongoClient(host, serverSelectionTimeoutMS=max_server_delay)
+        my_client = get_mongodb_client(LOCAL_MONGODB_HOST, max_server_delay)
         my_client.server_info()
     except ServerSelectionTimeoutError:
         msg = 'Make sure that your MongoDB instance is running. If not please install it from ' \
               'https://docs.mongodb.com/manual/administration/install-community/'
-        raise MissingServerConnection(msg)
+        raise get_missing_server_connection_class()(msg)
     else:
         my_client.drop_database('transistor_database')
 
-class MissingServerConnection(ServerSelectionTimeoutError):
-    """Reserved for future use."""
+def get_missing_server_connection_class() -> type:
+    """
+    Get the MissingServerConnection exception class.
+
+    The class derives from pymongo.errors.ServerSelectionTimeoutError, so it is created on first use to keep pymongo out of
+    the import of the transistordatabase.
+
+    :return: MissingServerConnection class
+    :rtype: type
+    """
+    global _missing_server_connection_class
+    if _missing_server_connection_class is None:
+        from pymongo.errors import ServerSelectionTimeoutError
+
+        class MissingServerConnection(ServerSelectionTimeoutError):
+            """Raised by connect_local_tdb() and drop_local_tdb() if no local MongoDB instance is running."""
+
+        MissingServerConnection.__module__ = __name__
+        MissingServerConnection.__qualname__ = "MissingServerConnection"
+        _missing_server_connection_class = MissingServerConnection
+    return _missing_server_connection_class
+
+
+_missing_server_connection_class = None
+
 
-    # TODO 
-    pass
+def __getattr__(name: str):
+    """Provide MissingServerConnection without importing pymongo on module import."""
+    if name == "MissingServerConnection":
+        return get_missing_server_connection_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,112 @@
+"""Index for the operating point lookups in lists of curve datasets (e.g. channel, e_on, e_off, e_rr)."""
+# Python standard libraries
+from __future__ import annotations
+from typing import List, Dict, Tuple, Any, TYPE_CHECKING
+
+# Third party libraries
+import numpy as np
+
+if TYPE_CHECKING:
+    # scipy is imported on first use of a KD-tree (see _get_tree())
+    from scipy.spatial import cKDTree
+
+class OperatingPointIndex:
+    """
+    Index for a list of datasets with operating point attributes like t_j, v_g, v_supply and r_g.
+
+    Exact lookups use a hash map per combination of attributes, nearest neighbour lookups use a KD-tree of the normalized
+    (t_j, v_g) points. Both are built on first use. The index does not track changes of the dataset list, the owning
+    Switch/Diode object rebuilds it (see DatasetCacheMixin.get_operating_point_index()).
+    """
+
+    datasets: List  #: indexed datasets, e.g. a list of ChannelData or SwitchEnergyData objects
+
+    def __init__(self, datasets: List):
+        """
+        Initialize an OperatingPointIndex object.
+
+        :param datasets: datasets to index, e.g. a list of ChannelData or SwitchEnergyData objects
+        :type datasets: list
+        """
+        self.datasets = list(datasets)
+        self._exact_maps = {}
+        self._trees = {}
+
+    def find_exact(self, **conditions) -> List:
+        """
+        Find all datasets whose attributes are equal to the given values, e.g. find_exact(t_j=25, v_g=15).
+
+        :param conditions: attribute names and values
+        :return: matching datasets in list order (empty list if there are none)
+        :rtype: list
+        """
+        key_names = tuple(sorted(conditions))
+        if key_names not in self._exact_maps:
+            exact_map = {}
+            for index, dataset in enumerate(self.datasets):
+                exact_map.setdefault(tuple(getattr(dataset, name, None) for name in key_names), []).append(index)
+            self._exact_maps[key_names] = exact_map
+        try:
+            indices = self._exact_maps[key_names].get(tuple(conditions[name] for name in key_names), [])
+        except TypeError:
+            # unhashable value, e.g. an array
+            indices = []
+        return [self.datasets[index] for index in indices]
+
+    def find_nearest(self, t_j: float, v_g: float, normalize_t_to_v: float = 10, **conditions) -> Any:
+        """
+        Find the dataset with the smallest distance to the given operating point.
+
+        The distance is calculated with t_j / normalize_t_to_v and v_g (v_g = None is treated as 0). For equal distances, the
+        first dataset of the list is returned.
+
+        :param t_j: junction temperature
+        :type t_j: float
+        :param v_g: gate voltage
+        :type v_g: float
+        :param normalize_t_to_v: ratio between t_j and v_g. e.g. 10 means 10°C is same difference as 1V
+        :type normalize_t_to_v: float
+        :param conditions: only datasets with these attribute values are considered, e.g. dataset_type='graph_i_e'
+        :return: nearest dataset, None if there is no dataset matching the conditions
+        """
+        candidates, tree = self._get_tree(normalize_t_to_v, conditions)
+        if tree is None:
+            return None
+        node = np.array([t_j / normalize_t_to_v, v_g])
+        min_distance, _ = tree.query(node)
+        # Take the first of all datasets with the minimum distance, same as an argmin over all distances
+        indices = tree.query_ball_point(node, min_distance * (1 + 1e-12) + 1e-12)
+        return candidates[min(indices)]
+
+    def operating_points(self, *names: str) -> List[Tuple]:
+        """
+        List the operating points of all datasets, e.g. for error messages.
+
+        :param names: attribute names, e.g. 't_j', 'v_g'
+        :return: list of tuples with the attribute values
+        :rtype: list[tuple]
+        """
+        return [tuple(getattr(dataset, name, None) for name in names) for dataset in self.datasets]
+
+    def _get_tree(self, normalize_t_to_v: float, conditions: Dict) -> Tuple[List, cKDTree | None]:
+        """
+        Get the KD-tree of the normalized (t_j, v_g) points of the datasets matching the conditions.
+
+        :param normalize_t_to_v: ratio between t_j and v_g
+        :type normalize_t_to_v: float
+        :param conditions: attribute names and values
+        :type conditions: dict
+        :return: matching datasets, KD-tree (None if there are no matching datasets)
+        :rtype: tuple[list, cKDTree | None]
+        """
+        key = (normalize_t_to_v, tuple(sorted(conditions.items())))
+        if key not in self._trees:
+            from scipy.spatial import cKDTree
+            candidates = self.find_exact(**conditions) if conditions else self.datasets
+            if candidates:
+                nodes = np.array([[dataset.t_j / normalize_t_to_v, 0 if dataset.v_g is None else dataset.v_g] for dataset in candidates],
+                                 dtype=float)
+                self._trees[key] = (candidates, cKDTree(nodes))
+            else:
+                self._trees[key] = (candidates, None)
+        return self._trees[key]
@@ -0,0 +1,267 @@
+"""Persistent cache of rendered plot images (virtual datasheet and GUI), keyed by a hash of the plotted data and the plot parameters."""
+# Python standard libraries
+from __future__ import annotations
+from typing import Any, Callable, Dict, Optional, Tuple
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import os
+
+# Third party libraries
+import numpy as np
+
+# Local libraries
+from transistordatabase.json_serializer import write_json_file
+
+# Increase if the plot methods change, so images of the old plot methods are not used anymore
+PLOT_CACHE_VERSION = 1
+PLOT_CACHE_FILE_EXTENSION = ".plot"
+DEFAULT_PLOT_CACHE_FOLDER = os.path.join(os.path.expanduser("~"), ".cache", "transistordatabase", "plots")
+DEFAULT_PLOT_CACHE_SIZE = 200 * 1024 * 1024
+# Environment variable to change the initial plot cache folder, 'none' disables the plot cache (see also set_plot_cache())
+PLOT_CACHE_FOLDER_ENVIRONMENT_VARIABLE = "TDB_PLOT_CACHE_FOLDER"
+# Matplotlib settings which change the rendered images, part of the cache key
+PLOT_CACHE_RC_PARAMS = ("font.", "text.usetex", "figure.dpi", "savefig.")
+
+_plot_cache_folder = os.environ.get(PLOT_CACHE_FOLDER_ENVIRONMENT_VARIABLE) or DEFAULT_PLOT_CACHE_FOLDER
+_plot_cache_folder = None if _plot_cache_folder.lower() == "none" else os.path.abspath(_plot_cache_folder)
+_plot_cache_size = DEFAULT_PLOT_CACHE_SIZE
+_plot_cache_statistics = {"hits": 0, "misses": 0}
+# Size of the cache folder in bytes, None if not known yet. Plots stored by other processes are counted on the next eviction.
+_plot_cache_tracked_size = None
+
+def set_plot_cache(folder: Optional[str] = DEFAULT_PLOT_CACHE_FOLDER, max_size: int = DEFAULT_PLOT_CACHE_SIZE) -> None:
+    """
+    Set the folder and the maximum size of the plot cache.
+
+    :param folder: cache folder, created on first use. None disables the plot cache.
+    :type folder: str or None
+    :param max_size: maximum size of all cached plots in bytes. The least recently used plots are deleted if the cache is larger.
+    :type max_size: int
+    """
+    global _plot_cache_folder, _plot_cache_size, _plot_cache_tracked_size
+    _plot_cache_folder = None if folder is None else os.path.abspath(folder)
+    _plot_cache_size = max_size
+    _plot_cache_tracked_size = None
+
+def get_plot_cache_folder() -> Optional[str]:
+    """
+    Get the folder of the plot cache.
+
+    :return: cache folder, None if the plot cache is disabled
+    :rtype: str or None
+    """
+    return _plot_cache_folder
+
+def get_plot_cache_statistics() -> Dict[str, int]:
+    """
+    Get the count of cache hits and misses of this process.
+
+    :return: dictionary with the keys 'hits' and 'misses'
+    :rtype: dict
+    """
+    return dict(_plot_cache_statistics)
+
+def clear_plot_cache() -> None:
+    """Delete all cached plots."""
+    global _plot_cache_tracked_size
+    _plot_cache_tracked_size = None
+    if _plot_cache_folder is None or not os.path.isdir(_plot_cache_folder):
+        return
+    for entry in os.scandir(_plot_cache_folder):
+        if entry.name.endswith(PLOT_CACHE_FILE_EXTENSION):
+            os.remove(entry.path)
+
+def get_plot_key(plot_name: str, data: Any, parameters: Dict) -> str:
+    """
+    Calculate the cache key of a plot.
+
+    Arrays are hashed by dtype, shape and content, objects by class name and public attributes. The matplotlib settings of
+    PLOT_CACHE_RC_PARAMS (fonts, dpi) are part of the key.
+
+    :param plot_name: name of the plot method, e.g. 'Switch.plot_energy_data'
+    :type plot_name: str
+    :param data: plotted data, e.g. a Switch object
+    :param parameters: plot parameters
+    :type parameters: dict
+    :return: sha256 hex digest
+    :rtype: str
+    """
+    import matplotlib
+
+    hasher = hashlib.sha256(f"{PLOT_CACHE_VERSION}:{plot_name}".encode())
+    _update_hash(hasher, {name: value for name, value in matplotlib.rcParams.items() if name.startswith(PLOT_CACHE_RC_PARAMS)})
+    _update_hash(hasher, data)
+    _update_hash(hasher, parameters)
+    return hasher.hexdigest()
+
+def cached_plot(key_attributes: Optional[Tuple[str, ...]] = None) -> Callable:
+    """
+    Cache the images returned by a plot function in the plot cache.
+
+    Functions with a buffer_req parameter are only cached if buffer_req is True (images are returned, not shown). The cache key
+    is calculated from the function name, the arguments and, for methods, the public attributes of the object.
+
+    :param key_attributes: methods only: attributes of the object the plot depends on, None for all public attributes
+    :type key_attributes: tuple or None
+    :return: decorator
+    :rtype: Callable
+    """
+    def decorator(function: Callable) -> Callable:
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _plot_cache_folder is None:
+                return function(*args, **kwargs)
+            bound_arguments = signature.bind(*args, **kwargs)
+            bound_arguments.apply_defaults()
+            parameters = dict(bound_arguments.arguments)
+            if not parameters.get('buffer_req', True):
+                return function(*args, **kwargs)
+            owner = parameters.pop('self', None)
+            if owner is not None and key_attributes is not None:
+                owner = {name: getattr(owner, name) for name in key_attributes}
+            key = get_plot_key(function.__qualname__, owner, parameters)
+            found, images = _load_plot(key)
+            if not found:
+                images = function(*args, **kwargs)
+                _store_plot(key, images)
+            return images
+        return wrapper
+    return decorator
+
+def _update_hash(hasher, value: Any) -> None:
+    """
+    Feed a value into a hash, recursively for containers and objects.
+
+    :param hasher: hashlib object
+    :param value: value to hash
+    """
+    if isinstance(value, np.ndarray):
+        hasher.update(f"ndarray{value.dtype.str}{value.shape}".encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        hasher.update(f"dict{len(value)}".encode())
+        for key in sorted(value, key=repr):
+            _update_hash(hasher, key)
+            _update_hash(hasher, value[key])
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            _update_hash(hasher, item)
+    elif hasattr(value, '__dict__') and not callable(value):
+        hasher.update(type(value).__qualname__.encode())
+        _update_hash(hasher, {name: attribute for name, attribute in vars(value).items() if not name.startswith('_')})
+    else:
+        hasher.update(f"{type(value).__name__}:{value!r};".encode())
+
+def _get_plot_path(key: str) -> str:
+    """
+    Get the path of a cached plot.
+
+    :param key: cache key
+    :type key: str
+    :return: file path
+    :rtype: str
+    """
+    return os.path.join(_plot_cache_folder, key + PLOT_CACHE_FILE_EXTENSION)
+
+def _load_plot(key: str) -> Tuple[bool, Any]:
+    """
+    Load a plot from the cache and mark it as recently used.
+
+    :param key: cache key
+    :type key: str
+    :return: True and the images if the plot is cached, False and None otherwise
+    :rtype: tuple
+    """
+    plot_path = _get_plot_path(key)
+    try:
+        with open(plot_path, "rb") as fd:
+            images = _decode(json.loads(fd.read()))
+        os.utime(plot_path)
+    except (OSError, ValueError, KeyError, TypeError):
+        _plot_cache_statistics["misses"] += 1
+        return False, None
+    _plot_cache_statistics["hits"] += 1
+    return True, images
+
+def _store_plot(key: str, images: Any) -> None:
+    """
+    Store a plot in the cache and delete the least recently used plots if the tracked cache size exceeds the maximum size.
+
+    The cache is optional: a folder which is not writable only prints a message.
+
+    :param key: cache key
+    :type key: str
+    :param images: return value of the plot function (base64 encoded images, dictionaries or lists of them, None)
+    """
+    global _plot_cache_tracked_size
+    try:
+        os.makedirs(_plot_cache_folder, exist_ok=True)
+        plot_path = _get_plot_path(key)
+        write_json_file(_encode(images), plot_path, indent=None)
+        if _plot_cache_tracked_size is None:
+            _plot_cache_tracked_size = _evict_plots()
+        else:
+            _plot_cache_tracked_size += os.path.getsize(plot_path)
+            if _plot_cache_tracked_size > _plot_cache_size:
+                _plot_cache_tracked_size = _evict_plots()
+    except OSError as e:
+        print(f"Plot cache {_plot_cache_folder} is not writable: {e}")
+
+def _evict_plots() -> int:
+    """
+    Delete the least recently used plots until the cache is not larger than the maximum size.
+
+    :return: size of the cache folder after the eviction in bytes
+    :rtype: int
+    """
+    entries = []
+    for entry in os.scandir(_plot_cache_folder):
+        if entry.name.endswith(PLOT_CACHE_FILE_EXTENSION):
+            try:
+                file_stat = entry.stat()
+            except FileNotFoundError:
+                # deleted by another process
+                continue
+            entries.append((file_stat.st_mtime_ns, file_stat.st_size, entry.path))
+    cache_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if cache_size <= _plot_cache_size:
+            break
+        # deleted by another process in the meantime
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+        cache_size -= size
+    return cache_size
+
+def _encode(value: Any) -> Any:
+    """
+    Encode a plot return value for json, dictionaries keep their (e.g. numeric) keys.
+
+    :param value: plot return value
+    :return: json serializable value
+    """
+    if isinstance(value, dict):
+        return {"dict": [[key, _encode(item)] for key, item in value.items()]}
+    if isinstance(value, (list, tuple)):
+        return {"list": [_encode(item) for item in value]}
+    return {"value": value}
+
+def _decode(value: Dict) -> Any:
+    """
+    Decode a plot return value encoded by _encode().
+
+    :param value: json value
+    :type value: dict
+    :return: plot return value
+    """
+    if "dict" in value:
+        return {key: _decode(item) for key, item in value["dict"]}
+    if "list" in value:
+        return [_decode(item) for item in value["list"]]
+    return value["value"]
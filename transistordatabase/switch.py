@@ -1,19 +1,20 @@
 """Switch class."""
 # Python standard libraries
 from __future__ import annotations
-from matplotlib import pyplot as plt
 from typing import List, Dict, Tuple
-from scipy.spatial import distance
 import numpy as np
 
 # Local libraries
+from transistordatabase.lazy_imports import plt
 from transistordatabase.helper_functions import get_img_raw_data, isvalid_dict
 from transistordatabase.checker_functions import check_keys
 from transistordatabase.data_classes import FosterThermalModel, ChannelData, SwitchEnergyData, LinearizedModel, TemperatureDependResistance, \
     GateChargeCurve, SOA
 from transistordatabase.exceptions import MissingDataError
+from transistordatabase.dataset_cache import DatasetCacheMixin
+from transistordatabase.plot_cache import cached_plot
 
-class Switch:
+class Switch(DatasetCacheMixin):
     """
     Data associated with the switching-characteristics of a MOSFET/SiC-MOSFET or IGBT.
 
@@ -248,24 +249,26 @@ class Switch:
             self.r_channel_th = []
             self.charge_curve = []
 
-    def convert_to_dict(self) -> Dict:
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> Dict:
         """
         Convert Switch object into dict datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: Switch object of dict type
         :rtype: dict
         """
-        d = dict(vars(self))
-        d['thermal_foster'] = self.thermal_foster.convert_to_dict()
-        d['channel'] = [c.convert_to_dict() for c in self.channel]
-        d['e_on'] = [e.convert_to_dict() for e in self.e_on]
-        d['e_off'] = [e.convert_to_dict() for e in self.e_off]
-        d['e_on_meas'] = [e.convert_to_dict() for e in self.e_on_meas]
-        d['e_off_meas'] = [e.convert_to_dict() for e in self.e_off_meas]
-        d['linearized_switch'] = [lsw.convert_to_dict() for lsw in self.linearized_switch]
-        d['r_channel_th'] = [tr.convert_to_dict() for tr in self.r_channel_th]
-        d['charge_curve'] = [q_v.convert_to_dict() for q_v in self.charge_curve]
-        d['soa'] = [c.convert_to_dict() for c in self.soa]
+        d = self._get_data_dict()
+        d['thermal_foster'] = self.thermal_foster.convert_to_dict(arrays_as_lists)
+        d['channel'] = [c.convert_to_dict(arrays_as_lists) for c in self.channel]
+        d['e_on'] = [e.convert_to_dict(arrays_as_lists) for e in self.e_on]
+        d['e_off'] = [e.convert_to_dict(arrays_as_lists) for e in self.e_off]
+        d['e_on_meas'] = [e.convert_to_dict(arrays_as_lists) for e in self.e_on_meas]
+        d['e_off_meas'] = [e.convert_to_dict(arrays_as_lists) for e in self.e_off_meas]
+        d['linearized_switch'] = [lsw.convert_to_dict(arrays_as_lists) for lsw in self.linearized_switch]
+        d['r_channel_th'] = [tr.convert_to_dict(arrays_as_lists) for tr in self.r_channel_th]
+        d['charge_curve'] = [q_v.convert_to_dict(arrays_as_lists) for q_v in self.charge_curve]
+        d['soa'] = [c.convert_to_dict(arrays_as_lists) for c in self.soa]
         return d
 
     def find_next_gate_voltage(self, req_gate_vltgs: Dict, export_type: str, check_specific_curves: List = None,
@@ -365,36 +368,22 @@ class Switch:
         :return: channel-object, e_on-object, e_off-object
         :rtype: tuple[Transistor.ChannelData, Transistor.SwitchEnergyData, Transistor.SwitchEnergyData]
         """
-        # Normalize t_j to v_g for distance metric
-        node = np.array([[t_j / normalize_t_to_v, v_g]])
-        # Find closest channeldata
-        channeldata_t_js = np.array([chan.t_j for chan in self.channel])
-        channeldata_v_gs = np.array([0 if chan.v_g is None else chan.v_g for chan in self.channel])
-        nodes = np.array([channeldata_t_js / normalize_t_to_v, channeldata_v_gs]).transpose()
-        index_channeldata = distance.cdist(node, nodes).argmin()
-
+        # Find closest channeldata, t_j is normalized to v_g for distance metric
+        channeldata = self.get_operating_point_index('channel').find_nearest(t_j, v_g, normalize_t_to_v)
         # Find closest e_on
-        e_ons = [e for e in self.e_on if e.dataset_type == switch_energy_dataset_type]
-        if not e_ons:
+        e_on = self.get_operating_point_index('e_on').find_nearest(t_j, v_g, normalize_t_to_v, dataset_type=switch_energy_dataset_type)
+        if e_on is None:
             raise KeyError(f"There is no e_on data with type {switch_energy_dataset_type} for this Switch object.")
-        e_on_t_js = np.array([e.t_j for e in e_ons])
-        e_on_v_gs = np.array([0 if e.v_g is None else e.v_g for e in e_ons])
-        nodes = np.array([e_on_t_js / normalize_t_to_v, e_on_v_gs]).transpose()
-        index_e_on = distance.cdist(node, nodes).argmin()
         # Find closest e_off
-        e_offs = [e for e in self.e_off if e.dataset_type == switch_energy_dataset_type]
-        if not e_offs:
+        e_off = self.get_operating_point_index('e_off').find_nearest(t_j, v_g, normalize_t_to_v, dataset_type=switch_energy_dataset_type)
+        if e_off is None:
             raise KeyError(f"There is no e_off data with type {switch_energy_dataset_type} for this Switch object.")
-        e_off_t_js = np.array([e.t_j for e in e_offs])
-        e_off_v_gs = np.array([0 if e.v_g is None else e.v_g for e in e_offs])
-        nodes = np.array([e_off_t_js / normalize_t_to_v, e_off_v_gs]).transpose()
-        index_e_off = distance.cdist(node, nodes).argmin()
         print("run switch.find_approx_wp: closest working point for t_j = {0} °C and v_g = {1} V:".format(t_j, v_g))
-        print(f"channel: t_j = {self.channel[index_channeldata].t_j} °C and v_g = {self.channel[index_channeldata].v_g} V")
-        print(f"eon:     t_j = {e_ons[index_e_on].t_j} °C and v_g = {e_ons[index_e_on].v_g} V")
-        print(f"eoff:    t_j = {e_offs[index_e_off].t_j} °C and v_g = {e_offs[index_e_off].v_g} V")
+        print(f"channel: t_j = {channeldata.t_j} °C and v_g = {channeldata.v_g} V")
+        print(f"eon:     t_j = {e_on.t_j} °C and v_g = {e_on.v_g} V")
+        print(f"eoff:    t_j = {e_off.t_j} °C and v_g = {e_off.v_g} V")
 
-        return self.channel[index_channeldata], e_ons[index_e_on], e_offs[index_e_off]
+        return channeldata, e_on, e_off
 
     def plot_channel_data_vge(self, gatevoltage: float) -> None:
         """
@@ -442,6 +431,7 @@ class Switch:
         plt.grid()
         plt.show()
 
+    @cached_plot(key_attributes=('channel',))
     def plot_all_channel_data(self, buffer_req: bool = False):
         """
         Plot all switch channel characteristic curves.
@@ -512,6 +502,7 @@ class Switch:
                 plt.show()
         return categorized_plots
 
+    @cached_plot(key_attributes=('e_on', 'e_off'))
     def plot_energy_data(self, buffer_req: bool = False):
         """
         Plot all switch energy i-e characteristic curves which are extracted from the manufacturer datasheet.
@@ -558,6 +549,7 @@ class Switch:
             print("Switch energy i_e curves are not available for the chosen transistor")
             return None
 
+    @cached_plot(key_attributes=('e_on', 'e_off'))
     def plot_energy_data_r(self, buffer_req: bool = False):
         """
         Plot all switch energy r-e characteristic curves.
@@ -602,6 +594,7 @@ class Switch:
             print("Switch energy r_e curves are not available for the chosen transistor")
             return None
 
+    @cached_plot(key_attributes=('e_on', 'e_off'))
     def plot_energy_data_t(self, buffer_req: bool = False):
         """
         Plot all switch energy vs Tj characteristic curves.
@@ -646,6 +639,7 @@ class Switch:
             print("Switch energy t_e curves are not available for the chosen transistor")
             return None
     
+    @cached_plot(key_attributes=('r_channel_th',))
     def plot_all_on_resistance_curves(self, buffer_req: bool = False):
         """
         Plot and convert Temperature dependent on-resistance plots in raw data format. Helper function.
@@ -679,6 +673,7 @@ class Switch:
         else:
             plt.show()
 
+    @cached_plot(key_attributes=('charge_curve',))
     def plot_all_charge_curves(self, buffer_req: bool = False):
         """
         Plot and convert gate emitter/source voltage dependant gate charge plots in raw data format. Helper function.
@@ -715,6 +710,7 @@ class Switch:
         else:
             plt.show()
 
+    @cached_plot(key_attributes=('soa',))
     def plot_soa(self, buffer_req: bool = False):
         """
         Plot and convert safe operating region characteristic plots in raw data format. Helper function.
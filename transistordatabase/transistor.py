@@ -1,18 +1,13 @@
 """Provide the transistor class."""
 # Python standard libraries
 from __future__ import annotations
-import matplotlib.pyplot as plt
 from typing import Dict, List, Union, Tuple, Optional
-from scipy import integrate
-from scipy.spatial import distance
-from scipy.optimize import curve_fit
 from datetime import datetime
 import numpy as np
 import numpy.typing as npt
 import re
 import os
 import json
-import scipy.io as sio
 import collections
 import copy
 import base64
@@ -20,11 +15,11 @@ import io
 import warnings
 
 # Third party libraries
-from jinja2 import Environment, FileSystemLoader
 from bson.objectid import ObjectId
 from bson import json_util
 
 # Local libraries
+from transistordatabase.lazy_imports import plt
 from transistordatabase.constants import *
 from transistordatabase.checker_functions import check_duplicates
 from transistordatabase.helper_functions import *
@@ -33,8 +28,20 @@ from transistordatabase.switch import Switch
 from transistordatabase.diode import Diode
 from transistordatabase.exceptions import MissingDataError
 from transistordatabase.exporter import dict2matlab
+from transistordatabase.curve_resampling import resample_curves
+from transistordatabase.json_serializer import write_json_file
+from transistordatabase.datasheet_pdf import render_datasheet_pdf
+from transistordatabase.plot_cache import cached_plot
 import transistordatabase.colors as tdb_colors
 
+# Result of Transistor.evaluate_working_points(). Curve indices refer to the lists of the switch/diode object, -1 if there is no curve.
+WORKING_POINT_DTYPE = np.dtype([('t_j', np.float64), ('v_g', np.float64), ('i_channel', np.float64),
+                                ('switch_channel_index', np.int64), ('e_on_index', np.int64), ('e_off_index', np.int64),
+                                ('switch_v_channel', np.float64), ('switch_r_channel', np.float64),
+                                ('diode_channel_index', np.int64), ('e_rr_index', np.int64),
+                                ('diode_v_channel', np.float64), ('diode_r_channel', np.float64),
+                                ('v_supply', np.float64), ('e_oss', np.float64), ('q_oss', np.float64)])
+
 class Transistor:
     """
     Transistor object which is the core class of transistordatabase module.
@@ -322,10 +329,12 @@ class Transistor:
         """Transistor object string representation."""
         return f"{self.name}, {self.type}, {self.manufacturer}"
 
-    def convert_to_dict(self) -> Dict:
+    def convert_to_dict(self, arrays_as_lists: bool = True) -> Dict:
         """
         Convert the transistor object in scope to a dictionary datatype.
 
+        :param arrays_as_lists: False to keep the numpy arrays, e.g. for serializers writing numpy arrays directly
+        :type arrays_as_lists: bool
         :return: Transistor object in dict type
         :rtype: dict
         """
@@ -336,16 +345,17 @@ class Transistor:
             self._id = None
         d = dict(vars(self))
         d.pop('wp', None)  # remove wp from converting. wp will not be stored to .json files
+        d.pop('_c_oss_integrals', None)
         d.pop('_id', None)
-        d['diode'] = self.diode.convert_to_dict()
-        d['switch'] = self.switch.convert_to_dict()
-        d['c_oss_er'] = self.c_oss_er.convert_to_dict() if self.c_oss_er is not None else None
-        d['c_oss_tr'] = self.c_oss_tr.convert_to_dict() if self.c_oss_tr is not None else None
-        d['c_oss'] = [c.convert_to_dict() for c in self.c_oss]
-        d['c_iss'] = [c.convert_to_dict() for c in self.c_iss]
-        d['c_rss'] = [c.convert_to_dict() for c in self.c_rss]
-        d['raw_measurement_data'] = [c.convert_to_dict() for c in self.raw_measurement_data]
-        if isinstance(self.graph_v_ecoss, np.ndarray):
+        d['diode'] = self.diode.convert_to_dict(arrays_as_lists)
+        d['switch'] = self.switch.convert_to_dict(arrays_as_lists)
+        d['c_oss_er'] = self.c_oss_er.convert_to_dict(arrays_as_lists) if self.c_oss_er is not None else None
+        d['c_oss_tr'] = self.c_oss_tr.convert_to_dict(arrays_as_lists) if self.c_oss_tr is not None else None
+        d['c_oss'] = [c.convert_to_dict(arrays_as_lists) for c in self.c_oss]
+        d['c_iss'] = [c.convert_to_dict(arrays_as_lists) for c in self.c_iss]
+        d['c_rss'] = [c.convert_to_dict(arrays_as_lists) for c in self.c_rss]
+        d['raw_measurement_data'] = [c.convert_to_dict(arrays_as_lists) for c in self.raw_measurement_data]
+        if arrays_as_lists and isinstance(self.graph_v_ecoss, np.ndarray):
             d['graph_v_ecoss'] = self.graph_v_ecoss.tolist()
         return d
 
@@ -404,6 +414,84 @@ class Transistor:
         # working point, calculate q_oss
         self.wp.graph_v_qoss = self.calc_v_qoss()
 
+    def evaluate_working_points(self, t_j: npt.ArrayLike, v_g: npt.ArrayLike, i_channel: npt.ArrayLike, v_supply: npt.ArrayLike = None,
+                                switch_or_diode: str = "both", normalize_t_to_v: float = 10) -> np.ndarray:
+        """
+        Evaluate many working points at once, without changing the .wp-class.
+
+        Same curve selection and channel linearization as update_wp(). The nearest curves are searched once per distinct
+        (t_j, v_g) pair and the channel is linearized once per selected channel curve for all currents.
+
+        :param t_j: junction temperatures
+        :type t_j: array_like
+        :param v_g: gate voltages
+        :type v_g: array_like
+        :param i_channel: channel currents for linearization
+        :type i_channel: array_like
+        :param v_supply: voltages to evaluate e_oss and q_oss at (optional, else NaN)
+        :type v_supply: array_like
+        :param switch_or_diode: 'switch' or 'diode' or 'both'
+        :type switch_or_diode: str
+        :param normalize_t_to_v: ratio between t_j and v_g. e.g. 10 means 10°C is same difference as 1V
+        :type normalize_t_to_v: float
+        :return: structured array with the dtype WORKING_POINT_DTYPE, one entry per working point
+        :rtype: np.ndarray
+        """
+        t_j, v_g, i_channel, v_supply = np.broadcast_arrays(np.asarray(t_j, dtype=float), np.asarray(v_g, dtype=float),
+                                                            np.asarray(i_channel, dtype=float),
+                                                            np.asarray(np.nan if v_supply is None else v_supply, dtype=float))
+        result = np.empty(t_j.shape, dtype=WORKING_POINT_DTYPE)
+        result['t_j'], result['v_g'], result['i_channel'], result['v_supply'] = t_j, v_g, i_channel, v_supply
+        for field in WORKING_POINT_DTYPE.names[3:12]:
+            result[field] = -1 if WORKING_POINT_DTYPE[field] == np.int64 else np.nan
+
+        operating_points, inverse = np.unique(np.stack([t_j.ravel(), v_g.ravel()], axis=-1), axis=0, return_inverse=True)
+        inverse = inverse.reshape(t_j.shape)
+        components = {'switch': ['channel', 'e_on', 'e_off'], 'diode': ['channel', 'e_rr']}
+        for component, attributes in components.items():
+            if switch_or_diode not in [component, "both"]:
+                continue
+            component_object = getattr(self, component)
+            for attribute in attributes:
+                operating_point_index = component_object.get_operating_point_index(attribute)
+                conditions = {} if attribute == 'channel' else {'dataset_type': 'graph_i_e'}
+                dataset_indices = {id(dataset): index for index, dataset in enumerate(operating_point_index.datasets)}
+                selected = np.array([dataset_indices.get(id(operating_point_index.find_nearest(op_t_j, op_v_g, normalize_t_to_v, **conditions)), -1)
+                                     for op_t_j, op_v_g in operating_points], dtype=np.int64)
+                result[f'{component}_channel_index' if attribute == 'channel' else f'{attribute}_index'] = selected[inverse]
+
+            # linearize the channel once per selected curve
+            channel_indices = result[f'{component}_channel_index']
+            for channel_index in np.unique(channel_indices[channel_indices >= 0]):
+                mask = channel_indices == channel_index
+                channel = component_object.channel[channel_index]
+                result[f'{component}_v_channel'][mask], result[f'{component}_r_channel'][mask] = \
+                    self.calc_lin_channel_batch(channel.t_j, channel.v_g, i_channel[mask], component)
+
+        if self.c_oss and not np.all(np.isnan(v_supply)):
+            graph_v_eoss, graph_v_qoss = self._get_c_oss_integrals()
+            result['e_oss'] = np.interp(v_supply, graph_v_eoss[0], graph_v_eoss[1])
+            result['q_oss'] = np.interp(v_supply, graph_v_qoss[0], graph_v_qoss[1])
+            result['e_oss'][np.isnan(v_supply)] = np.nan
+            result['q_oss'][np.isnan(v_supply)] = np.nan
+        else:
+            result['e_oss'] = np.nan
+            result['q_oss'] = np.nan
+        return result
+
+    def _get_c_oss_integrals(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the results of calc_v_eoss() and calc_v_qoss(), cached until c_oss[0] is replaced.
+
+        :return: graph_v_eoss, graph_v_qoss
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        cache = self.__dict__.get('_c_oss_integrals')
+        if cache is None or cache['graph_v_c'] is not self.c_oss[0].graph_v_c:
+            cache = {'graph_v_c': self.c_oss[0].graph_v_c, 'integrals': (self.calc_v_eoss(), self.calc_v_qoss())}
+            self._c_oss_integrals = cache
+        return cache['integrals']
+
     def init_loss_matrices(self):
         """Experimental."""
         self.init_switch_channel_matrix()
@@ -475,6 +563,7 @@ class Transistor:
         :return: e_oss numpy array
         :rtype: np.array
         """
+        from scipy import integrate
         # energy_cumtrapz = np.zeros_like(self.c_oss[0].graph_v_c[1], dtype=np.float32)
         energy_cumtrapz = integrate.cumulative_trapezoid(self.c_oss[0].graph_v_c[0] * self.c_oss[0].graph_v_c[1],
                                                          self.c_oss[0].graph_v_c[0], initial=0)
@@ -487,6 +576,7 @@ class Transistor:
         :return: q_oss numpy array
         :rtype: np.array
         """
+        from scipy import integrate
         charge_cumtrapz = integrate.cumulative_trapezoid(self.c_oss[0].graph_v_c[1], self.c_oss[0].graph_v_c[0],
                                                          initial=0)
 
@@ -613,6 +703,7 @@ class Transistor:
 
         :return: Respective plots are displayed
         """
+        from scipy import integrate
         v_original = self.c_oss[0].graph_v_c[0]
         c_original = self.c_oss[0].graph_v_c[1]
 
@@ -765,8 +856,7 @@ class Transistor:
         """
         dataset = None
         if switch_or_diode == 'switch':
-            candidate_datasets = [channel for channel in self.switch.channel if
-                                  (channel.t_j == t_j and channel.v_g == v_g)]
+            candidate_datasets = self.switch.get_operating_point_index('channel').find_exact(t_j=t_j, v_g=v_g)
             if len(candidate_datasets) == 0:
                 available_datasets = [(channel.t_j, channel.v_g) for channel in self.switch.channel]
                 print("Available operating points: (t_j, v_g)")
@@ -781,8 +871,7 @@ class Transistor:
 
         elif switch_or_diode == 'diode':
             if self.type in ['SiC-MOSFET', 'GaN-Transistor']:
-                candidate_datasets = [channel for channel in self.diode.channel if
-                                      (channel.t_j == t_j and channel.v_g == v_g)]
+                candidate_datasets = self.diode.get_operating_point_index('channel').find_exact(t_j=t_j, v_g=v_g)
                 if len(candidate_datasets) == 0:
                     available_datasets = [(channel.t_j, channel.v_g) for channel in self.diode.channel]
                     print("Available operating points: (t_j, v_g)")
@@ -795,8 +884,7 @@ class Transistor:
                           "different dataset is not yet implemented.")
                 dataset = candidate_datasets[0]
             else:
-                candidate_datasets = [channel for channel in self.diode.channel
-                                      if channel.t_j == t_j]
+                candidate_datasets = self.diode.get_operating_point_index('channel').find_exact(t_j=t_j)
                 if len(candidate_datasets) == 0:
                     available_datasets = [channel.t_j for channel in self.diode.channel]
                     print("Available operating points: (t_j)")
@@ -831,8 +919,7 @@ class Transistor:
         """
         dataset = None
         if e_on_off_rr == 'e_on':
-            candidate_datasets = [e_on for e_on in self.switch.e_on if (
-                e_on.t_j == t_j and e_on.v_g == v_g and e_on.v_supply == v_supply and e_on.r_g == r_g)]
+            candidate_datasets = self.switch.get_operating_point_index('e_on').find_exact(t_j=t_j, v_g=v_g, v_supply=v_supply, r_g=r_g)
             if len(candidate_datasets) == 0:
                 available_datasets = [(e_on.t_j, e_on.v_g, e_on.v_supply, e_on.r_g) for e_on in self.switch.e_on]
                 print("Available operating points: (t_j, v_g, v_supply, r_g)")
@@ -846,8 +933,7 @@ class Transistor:
             dataset = candidate_datasets[0]
 
         if e_on_off_rr == 'e_off':
-            candidate_datasets = [e_off for e_off in self.switch.e_off if (
-                e_off.t_j == t_j and e_off.v_g == v_g and e_off.v_supply == v_supply and e_off.r_g == r_g)]
+            candidate_datasets = self.switch.get_operating_point_index('e_off').find_exact(t_j=t_j, v_g=v_g, v_supply=v_supply, r_g=r_g)
             if len(candidate_datasets) == 0:
                 available_datasets = [(e_off.t_j, e_off.v_g, e_off.v_supply, e_off.r_g) for e_off in self.switch.e_off]
                 print("Available operating points: (t_j, v_g, v_supply, r_g)")
@@ -861,8 +947,7 @@ class Transistor:
             dataset = candidate_datasets[0]
 
         if e_on_off_rr == 'e_rr':
-            candidate_datasets = [e_rr for e_rr in self.diode.e_rr if (
-                e_rr.t_j == t_j and e_rr.v_g == v_g and e_rr.v_supply == v_supply and e_rr.r_g == r_g)]
+            candidate_datasets = self.diode.get_operating_point_index('e_rr').find_exact(t_j=t_j, v_g=v_g, v_supply=v_supply, r_g=r_g)
             if len(candidate_datasets) == 0:
                 available_datasets = [(e_rr.t_j, e_rr.v_g, e_rr.v_supply, e_rr.r_g) for e_rr in self.diode.e_rr]
                 print("Available operating points: (t_j, v_g, v_supply, r_g)")
@@ -957,21 +1042,9 @@ class Transistor:
         else:
             s_d = 'diode'
 
-        # use eval function to choose variable e_on/e_off/e_rr
-        # compile is necessary due to using eval combined with if-statement
-        # https://realpython.com/python-eval-function/
-        code = compile(
-            f"[{e_on_off_rr} for {e_on_off_rr} in self.{s_d}.{e_on_off_rr} if {e_on_off_rr}.dataset_type == 'graph_r_e' and "
-            f"{e_on_off_rr}.v_supply == {v_supply}]",
-            "<string>", "eval")
-        candidate_datasets = eval(code)
         # Find closest loss curve
-        node = np.array([[t_j / normalize_t_to_v, v_g]])
-        lossdata_t_js = np.array([curve.t_j for curve in candidate_datasets])
-        lossdata_v_gs = np.array([0 if curve.v_g is None else curve.v_g for curve in candidate_datasets])
-        nodes = np.array([lossdata_t_js / normalize_t_to_v, lossdata_v_gs]).transpose()
-        index_lossdata = distance.cdist(node, nodes).argmin()
-        dataset = candidate_datasets[index_lossdata]
+        dataset = getattr(self, s_d).get_operating_point_index(e_on_off_rr).find_nearest(t_j, v_g, normalize_t_to_v, dataset_type='graph_r_e',
+                                                                                         v_supply=v_supply)
         if dataset is None:
             code = compile(
                 f"[({e_on_off_rr}.t_j, {e_on_off_rr}.v_g, {e_on_off_rr}.v_supply, {e_on_off_rr}.r_g) for {e_on_off_rr} in self.{s_d}.{e_on_off_rr}]",
@@ -1110,8 +1183,7 @@ class Transistor:
                 f"In calc_lin_channel: linearizing current ({i_channel} A) higher than i_absmax ({self.i_abs_max} A)")
 
         if switch_or_diode == 'switch':
-            candidate_datasets = [channel for channel in self.switch.channel
-                                  if (channel.t_j == t_j and channel.v_g == v_g)]
+            candidate_datasets = self.switch.get_operating_point_index('channel').find_exact(t_j=t_j, v_g=v_g)
             if len(candidate_datasets) == 0:
                 available_datasets = [(channel.t_j, channel.v_g) for channel in self.switch.channel]
                 print("Available operating points: (t_j, v_g)")
@@ -1141,8 +1213,7 @@ class Transistor:
                 v_channel = voltage_interpolated - r_channel * i_channel
         elif switch_or_diode == 'diode':
             if self.type in ['SiC-MOSFET', 'GaN-Transistor']:
-                candidate_datasets = [channel for channel in self.diode.channel
-                                      if (channel.t_j == t_j and channel.v_g == v_g)]
+                candidate_datasets = self.diode.get_operating_point_index('channel').find_exact(t_j=t_j, v_g=v_g)
                 if len(candidate_datasets) == 0:
                     available_datasets = [(channel.t_j, channel.v_g) for channel in self.diode.channel]
                     print("Available operating points: (t_j, v_g)")
@@ -1154,8 +1225,7 @@ class Transistor:
                           "operating point. The first of these sets is automatically chosen because selection of a "
                           "different dataset is not yet implemented.")
             else:
-                candidate_datasets = [channel for channel in self.diode.channel
-                                      if channel.t_j == t_j]
+                candidate_datasets = self.diode.get_operating_point_index('channel').find_exact(t_j=t_j)
                 if len(candidate_datasets) == 0:
                     available_datasets = [channel.t_j for channel in self.diode.channel]
                     print("Available operating points: (t_j)")
@@ -1178,6 +1248,53 @@ class Transistor:
                              "linearization.")
         return round(v_channel, 6), round(r_channel, 9)
 
+    def calc_lin_channel_batch(self, t_j: float, v_g: float, i_channel: np.ndarray, switch_or_diode: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get interpolated channel parameters for an array of currents.
+
+        Vectorized version of calc_lin_channel(). The channel curve of the operating point is taken from the cached
+        interpolation table of the switch or diode object, so repeated calls do not search the channel data again.
+
+        :param t_j: junction temperature
+        :type t_j: float
+        :param v_g: gate voltage
+        :type v_g: float
+        :param i_channel: currents to linearize the channel
+        :type i_channel: np.ndarray
+        :param switch_or_diode: 'switch' or 'diode'
+        :type switch_or_diode: str
+
+        :raises ValueError: Raised when the given arguments either exceed the maximum values or not the expected values
+
+        :return: Linearized parameters for v_channel, r_channel (arrays with the shape of i_channel)
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        i_channel = np.asarray(i_channel, dtype=float)
+        if np.any(i_channel > self.i_abs_max):
+            raise ValueError(
+                f"In calc_lin_channel_batch: linearizing current ({i_channel.max()} A) higher than i_absmax ({self.i_abs_max} A)")
+
+        if switch_or_diode == 'switch':
+            current, voltage = self.switch.get_channel_interpolation_table(t_j, v_g)
+        elif switch_or_diode == 'diode':
+            # Same as calc_lin_channel(): the gate voltage is only considered for the body diode of SiC-MOSFETs and GaN-Transistors
+            current, voltage = self.diode.get_channel_interpolation_table(t_j, v_g if self.type in ['SiC-MOSFET', 'GaN-Transistor'] else None)
+        else:
+            raise ValueError("switch_or_diode must be either specified as 'switch' or 'diode' for channel "
+                             "linearization.")
+
+        voltage_interpolated = np.interp(i_channel, current, voltage)
+        if switch_or_diode == 'switch' and self.type in ['MOSFET', 'SiC-MOSFET']:
+            # transistor has no forward voltage
+            v_channel = np.zeros_like(i_channel)
+            r_channel = voltage_interpolated / i_channel
+        else:
+            # Other interpolating point will be with 10% less current
+            voltage_interpolated_2 = np.interp(i_channel * 0.9, current, voltage)
+            r_channel = (voltage_interpolated - voltage_interpolated_2) / (0.1 * i_channel)
+            v_channel = voltage_interpolated - r_channel * i_channel
+        return np.round(v_channel, 6), np.round(r_channel, 9)
+
     def calc_thermal_params(self, input_type: str = None, order: int = 4, plotbit: bool = False) -> None:
         """
         Generate thermal parameters like Rth_total, tau_total, Cth_total and vectors like Rth_vector, tau_vector, Cth_vector.
@@ -1207,6 +1324,7 @@ class Transistor:
         :return: Foster object filled with missing parameters within the input_type object of transistor object
         :rtype: None
         """
+        from scipy.optimize import curve_fit
         try:
             code = compile(f"self.{input_type}.thermal_foster", "<string>", "eval")
             foster_args = eval(code)
@@ -1336,6 +1454,7 @@ class Transistor:
         # plt.tight_layout()
         plt.show()
      
+    @cached_plot(key_attributes=('raw_measurement_data',))
     def raw_measurement_data_plots(self) -> list:
         """
         Plot raw measurement data.
@@ -1407,25 +1526,17 @@ class Transistor:
         plt.grid(color='green', linestyle='--', linewidth=0.5)
         return get_img_raw_data(plt)
 
-    def export_datasheet(self, build_collection=False) -> str | None:
+    def get_datasheet_data(self) -> Tuple[Dict, Dict, Dict]:
         """
-        Generate and export the virtual datasheet in form of a pdf-file.
+        Collect the data and plots of the virtual datasheet, used by export_datasheet() and export_datasheet_pdf().
 
-        :return: pdf file is created in the current working directory
-        :rtype: None
-
-        :Example:
-
-        >>> import transistordatabase as tdb
-        >>> transistor = tdb.load('Fuji_2MBI100XAA120-50')
-        >>> transistor.export_datasheet()
-
-        .. todo:: Instead of html file, generating a pdf file without third party requirements is a better option
+        :return: transistor, diode and switch data along with units, plots as base64 encoded png images
+        :rtype: dict, dict, dict
         """
         pdf_data = {}
         raw_measurement_plots = {}
         devices = {}
-        skip_ids = ['_id', 'wp', 'c_oss', 'c_iss', 'c_rss', 'graph_v_ecoss', 'c_oss_er', 'c_oss_tr']
+        skip_ids = ['_id', 'wp', '_c_oss_integrals', 'c_oss', 'c_iss', 'c_rss', 'graph_v_ecoss', 'c_oss_er', 'c_oss_tr']
         cap_plots = {'$c_{oss}$': self.c_oss, '$c_{rss}$': self.c_rss, '$c_{iss}$': self.c_iss}
         if (len(self.raw_measurement_data) > 0):
             raw_measurement_plots = self.raw_measurement_data_plots()
@@ -1447,7 +1558,27 @@ class Transistor:
                     pdf_data[attr.capitalize()] = getattr(self, attr)
                 elif (attr == 'c_oss_er' or attr == 'c_oss_tr') and getattr(self, attr) is not None:  # to be modified for boundary case
                     pdf_data[attr.capitalize()] = getattr(self, attr).c_o
-        trans, diode, switch = attach_units(pdf_data, devices)
+        return attach_units(pdf_data, devices)
+
+    def export_datasheet(self, build_collection=False) -> str | None:
+        """
+        Generate and export the virtual datasheet in form of a pdf-file.
+
+        The pdf is printed by QtWebEngine, see export_datasheet_pdf() for a headless export.
+
+        :return: pdf file is created in the current working directory
+        :rtype: None
+
+        :Example:
+
+        >>> import transistordatabase as tdb
+        >>> transistor = tdb.load('Fuji_2MBI100XAA120-50')
+        >>> transistor.export_datasheet()
+
+        .. todo:: Instead of html file, generating a pdf file without third party requirements is a better option
+        """
+        from jinja2 import Environment, FileSystemLoader
+        trans, diode, switch = self.get_datasheet_data()
         img_path = os.path.join(os.path.dirname(__file__), 'images', 'lea-upb.png')
         image_file_obj = open(img_path, "rb")
         image_binary_bytes = image_file_obj.read()
@@ -1467,8 +1598,29 @@ class Transistor:
         else:
             return html  
         
+    def export_datasheet_pdf(self, filepath: str = None) -> None:
+        """
+        Export the virtual datasheet as pdf-file without a display, rendered by matplotlib.
+
+        Unlike export_datasheet(), no Qt application is needed, so the datasheets of many transistors can be rendered in worker
+        processes, see DatabaseManager.export_many(formats=['datasheet']).
+
+        :param filepath: directory to save the pdf-file. CWD is used in case of None.
+        :type filepath: str
+
+        :Example:
+
+        >>> import transistordatabase as tdb
+        >>> transistor = tdb.load('Fuji_2MBI100XAA120-50')
+        >>> transistor.export_datasheet_pdf()
+        """
+        filepath = os.getcwd() if filepath is None else filepath
+        trans, diode, switch = self.get_datasheet_data()
+        render_datasheet_pdf(trans, switch, diode, os.path.join(filepath, f"{self.name}.pdf"))
+        print(f"Export virtual datasheet {self.name}.pdf to {filepath}")
+
     def export_simulink_loss_model(self, r_g_on: float = None, r_g_off: float = None, v_supply: float = None,
-                                   normalize_t_to_v: float = 10) -> None:
+                                   normalize_t_to_v: float = 10, filepath: str = None) -> None:
         """
         Export a simulation model for simulink inverter loss models.
 
@@ -1482,6 +1634,8 @@ class Transistor:
         :type v_supply: float
         :param normalize_t_to_v: a normalize value used in computing cartesian distance
         :type normalize_t_to_v: float
+        :param filepath: directory to save the .mat file. CWD is used in case of None.
+        :type filepath: str
 
         :raises Exception: Re-raised excception by calling calc_object_i_e(..)
         :raises ValueError: Raised when the switch type is other than IGBT
@@ -1504,6 +1658,7 @@ class Transistor:
 
         .. todo:: C_th is fixed at the moment to 1e-6 for switch an diode. Needs to be calculated from ohter data
         """
+        import scipy.io as sio
         try:
             # Notes on exporting the file:
             # values need to be exported as np.double(), otherwise the Simulink-model can not interpolate the data (but displaying the curves is working...)
@@ -1560,17 +1715,10 @@ class Transistor:
             # all elements need the same current vector size
             i_interp = np.linspace(0, self.i_abs_max, 10)
 
-            switch_channel_lower_interp = np.interp(i_interp, switch_channel_object_lower.graph_v_i[1], switch_channel_object_lower.graph_v_i[0])
-            switch_channel_upper_interp = np.interp(i_interp, switch_channel_object_upper.graph_v_i[1], switch_channel_object_upper.graph_v_i[0])
-            switch_channel_array = np.array([switch_channel_lower_interp, switch_channel_upper_interp])
-
-            e_on_lower_interp = np.interp(i_interp, eon_object_lower.graph_i_e[0], eon_object_lower.graph_i_e[1])
-            e_on_upper_interp = np.interp(i_interp, eon_object_upper.graph_i_e[0], eon_object_upper.graph_i_e[1])
-            e_on_array = np.array([e_on_lower_interp, e_on_upper_interp])
-
-            e_off_lower_interp = np.interp(i_interp, eoff_object_lower.graph_i_e[0], eoff_object_lower.graph_i_e[1])
-            e_off_upper_interp = np.interp(i_interp, eoff_object_upper.graph_i_e[0], eoff_object_upper.graph_i_e[1])
-            e_off_array = np.array([e_off_lower_interp, e_off_upper_interp])
+            switch_channel_array = resample_curves([switch_channel_object_lower.graph_v_i, switch_channel_object_upper.graph_v_i], i_interp,
+                                                   x_row=1, y_row=0)
+            e_on_array = resample_curves([eon_object_lower.graph_i_e, eon_object_upper.graph_i_e], i_interp)
+            e_off_array = resample_curves([eoff_object_lower.graph_i_e, eoff_object_upper.graph_i_e], i_interp)
 
             # Simulink-power-electronic loss model can not handle curves in case of the temperatures are the same
             temp_t_j_switch_channel_upper = switch_channel_object_upper.t_j + 1 \
@@ -1614,13 +1762,9 @@ class Transistor:
                     print("Upper : R_g = {0}, v_g = {1}, T_j = {2}, v_supply = {3}".format(
                         err_object_upper.r_g, err_object_upper.v_g, err_object_upper.t_j, err_object_upper.v_supply))
 
-            diode_channel_lower_interp = np.interp(i_interp, diode_channel_object_lower.graph_v_i[1], diode_channel_object_lower.graph_v_i[0])
-            diode_channel_upper_interp = np.interp(i_interp, diode_channel_object_upper.graph_v_i[1], diode_channel_object_upper.graph_v_i[0])
-            diode_channel_array = np.array([diode_channel_lower_interp, diode_channel_upper_interp])
-
-            e_rr_lower_interp = np.interp(i_interp, err_object_lower.graph_i_e[0], err_object_lower.graph_i_e[1])
-            e_rr_upper_interp = np.interp(i_interp, err_object_upper.graph_i_e[0], err_object_upper.graph_i_e[1])
-            err_array = np.array([e_rr_lower_interp, e_rr_upper_interp])
+            diode_channel_array = resample_curves([diode_channel_object_lower.graph_v_i, diode_channel_object_upper.graph_v_i], i_interp,
+                                                  x_row=1, y_row=0)
+            err_array = resample_curves([err_object_lower.graph_i_e, err_object_upper.graph_i_e], i_interp)
 
             # Simulink-power-electronic loss model can not handle curves in case of the temperatures are the same
             temp_t_j_switch_channel_upper = diode_channel_object_upper.t_j + 1 \
@@ -1653,15 +1797,40 @@ class Transistor:
                                'r_g_off': np.double(eoff_object_lower.r_g),
                                }
 
-            sio.savemat(self.name.replace('-', '_') + '_Simulink_lossmodel.mat', {self.name.replace('-', '_'): transistor_dict})
-            print(f"Export files {self.name}_Simulink_lossmodel.mat to {os.getcwd()}")
+            filepath = os.getcwd() if filepath is None else filepath
+            sio.savemat(os.path.join(filepath, self.name.replace('-', '_') + '_Simulink_lossmodel.mat'), {self.name.replace('-', '_'): transistor_dict})
+            print(f"Export files {self.name}_Simulink_lossmodel.mat to {filepath}")
         except Exception as e:
             print("Simulink exporter failed: {0}".format(e))
 
-    def export_matlab(self) -> None:
+    def export_json(self, filepath: str = None, indent: Optional[int] = 2, serializer: Optional[str] = None) -> None:
+        """
+        Export the transistor to a json file, which can be imported into the database again.
+
+        :param filepath: directory to save the .json file. CWD is used in case of None.
+        :type filepath: str
+        :param indent: indentation, None for a compact file
+        :type indent: Optional[int]
+        :param serializer: name of the json serializer (see json_serializer.JSON_SERIALIZERS), None for the default serializer
+        :type serializer: Optional[str]
+
+        :Example:
+
+        >>> import transistordatabase as tdb
+        >>> transistor = tdb.load('Fuji_2MBI100XAA120-50')
+        >>> transistor.export_json()
+        """
+        filepath = os.getcwd() if filepath is None else filepath
+        write_json_file(self.convert_to_dict(arrays_as_lists=False), os.path.join(filepath, f"{self.name}.json"), indent, serializer)
+        print(f"Export file {self.name}.json to {filepath}")
+
+    def export_matlab(self, filepath: str = None) -> None:
         """
         Export a transistor dictionary to a matlab dictionary.
 
+        :param filepath: directory to save the .mat file. CWD is used in case of None.
+        :type filepath: str
+
         :return: File stored in current working path
         :rtype: None
 
@@ -1671,6 +1840,7 @@ class Transistor:
         >>> transistor = tdb.load('Fuji_2MBI100XAA120-50')
         >>> transistor.export_matlab()
         """
+        import scipy.io as sio
         transistor_dict = self.convert_to_dict()
         dict_str = json.dumps(transistor_dict, default=json_util.default)
 
@@ -1680,8 +1850,9 @@ class Transistor:
         transistor_clean_dict['file_generated'] = f"{datetime.today()}"
         transistor_clean_dict['file_generated_by'] = "https://github.com/upb-lea/transistordatabase",
 
-        sio.savemat(self.name.replace('-', '_') + '_Matlab.mat', {self.name.replace('-', '_'): transistor_clean_dict})
-        print(f"Export files {self.name.replace('-', '_')}_Matlab.mat to {os.getcwd()}")
+        filepath = os.getcwd() if filepath is None else filepath
+        sio.savemat(os.path.join(filepath, self.name.replace('-', '_') + '_Matlab.mat'), {self.name.replace('-', '_'): transistor_clean_dict})
+        print(f"Export files {self.name.replace('-', '_')}_Matlab.mat to {filepath}")
 
     def collect_i_e_and_r_e_combination(self, switch_type: str, loss_type: str) -> Tuple[List, List]:
         """
@@ -1718,7 +1889,7 @@ class Transistor:
         return i_e_indexes, r_e_indexes
 
     def export_geckocircuits(self, recheck: bool = True, v_supply: float = None, v_g_on: float = None,
-                             v_g_off: float = None, r_g_on: float = None, r_g_off: float = None) -> None:
+                             v_g_off: float = None, r_g_on: float = None, r_g_off: float = None, filepath: str = None) -> None:
         """
         Export transistor data to GeckoCIRCUITS.
 
@@ -1734,6 +1905,8 @@ class Transistor:
         :type r_g_on: float
         :param r_g_off: gate resistor for turn-off
         :type r_g_off: float
+        :param filepath: directory to save the .scl files. CWD is used in case of None.
+        :type filepath: str
 
         :return: Two output files: 'Transistor.name'_Switch.scl and 'Transistor.name'_Diode.scl created in the current working directory
         :rtype: None
@@ -1752,6 +1925,7 @@ class Transistor:
         # diode on losses: these on losses must be generated, even if they are zero
         # diode channel: it is not allowed to use more than one current that is zero (otherwise geckocircuits can not calculate the losses)
         # v_supply, v_g_on, v_g_off, r_g_on, r_g_off
+        filepath = os.getcwd() if filepath is None else filepath
         v_supply = v_supply if v_supply else self.v_abs_max / 2
         defaults_list = get_gatedefaults(self.type)
 
@@ -1859,7 +2033,7 @@ class Transistor:
         ########################
         if any(sw_channel_curves):
 
-            file_switch = open(f"{self.name}_Switch(rg_on_{r_g_on})(rg_off_{r_g_off}).scl", "w")
+            file_switch = open(os.path.join(filepath, f"{self.name}_Switch(rg_on_{r_g_on})(rg_off_{r_g_off}).scl"), "w")
 
             # switch channel data
 
@@ -1918,17 +2092,11 @@ class Transistor:
             else:
                 for e_on in eon_curves:
                     on_current = e_on.graph_i_e[0]
-                    on_energy = e_on.graph_i_e[1]
                     # search for off loss curves
                     for e_off in eoff_curves:
                         if e_off.v_supply == switch_v_supply and e_off.v_g == v_g_off and e_off.r_g == r_g_off and e_off.t_j == e_on.t_j:
-                            # set off current and off energy
-                            off_current = e_off.graph_i_e[0]
-                            off_energy = e_off.graph_i_e[1]  # what the case if no matching off_energy found?
-
                             interp_current = np.linspace(0, on_current[-1], 10)
-                            interp_on_energy = np.interp(interp_current, on_current, on_energy)
-                            interp_off_energy = np.interp(interp_current, off_current, off_energy)
+                            interp_on_energy, interp_off_energy = resample_curves([e_on.graph_i_e, e_off.graph_i_e], interp_current)
 
                             print_current = np.array2string(interp_current, formatter={'float_kind': lambda x: "%.2f" % x})
                             print_current = print_current[1:-1]
@@ -1946,7 +2114,7 @@ class Transistor:
                             file_switch.write("<\SchaltverlusteMesskurve>\n")
 
             file_switch.close()
-            print(f"Exported file {self.name}_Switch(rg_on_{r_g_on})(rg_off_{r_g_off}).scl  to {os.getcwd()}")
+            print(f"Exported file {self.name}_Switch(rg_on_{r_g_on})(rg_off_{r_g_off}).scl  to {filepath}")
         else:
             print('\nGecko exporter switch failed: No channel curve available at the selected v_g \n Try by setting recheck = True if set to False')
 
@@ -1954,7 +2122,7 @@ class Transistor:
         # export file for diode
         ########################
         if any(diode_channel_curves):
-            file_diode = open(f"{self.name}_Diode(rg_{r_g_err}).scl", "w")
+            file_diode = open(os.path.join(filepath, f"{self.name}_Diode(rg_{r_g_err}).scl"), "w")
 
             # diode channel data
             # count number of arrays for conducting behaviour
@@ -2024,7 +2192,7 @@ class Transistor:
                         file_diode.write("<\SchaltverlusteMesskurve>\n")
 
             file_diode.close()
-            print(f"Exported file {self.name}_Diode(rg_{r_g_err}).scl to {os.getcwd()}")
+            print(f"Exported file {self.name}_Diode(rg_{r_g_err}).scl to {filepath}")
         else:
             print('\nGecko exporter diode failed: No channel curve available at the selected v_g \n Try by setting recheck = True if set to False')
 
@@ -2072,15 +2240,17 @@ class Transistor:
             file_c_oss.write(f"{v_interp[count]} {coss_interp[count]}\n")
 
         file_c_oss.close()
-        print(f"Exported file {nlc_filename} to {os.getcwd()}")
+        print(f"Exported file {nlc_filename} to {os.getcwd() if filepath is None else filepath}")
 
-    def export_plecs(self, recheck: bool = True, gate_voltages=None) -> None:
+    def export_plecs(self, recheck: bool = True, gate_voltages=None, filepath: str = None) -> None:
         """
         Generate and export the switch and diode .xmls files to be imported into plecs simulator.
 
         :param recheck: enables the selection of gate voltages near to the provided values if not found
         :type recheck: bool
         :param gate_voltages: gate voltage like v_g_on, v_g_off, v_d_on, v_d_off
+        :param filepath: directory to save the .xml files. CWD is used in case of None.
+        :type filepath: str
 
         :return: Two output files: 'Transistor.name'_Switch.xml and 'Transistor.name'_Diode.xml created in the current working directory
         :rtype: None
@@ -2091,8 +2261,10 @@ class Transistor:
         >>> transistor = tdb.load('Fuji_2MBI200XAA065-50')
         >>> transistor.export_plecs(recheck=True, gate_voltages=[15, -15, 15, 0])
         """
+        from jinja2 import Environment, FileSystemLoader
         if gate_voltages is None:
             gate_voltages = []
+        filepath = os.getcwd() if filepath is None else filepath
         switch_xml_data, diode_xml_data = self.get_curve_data(recheck, gate_voltages)
         template_dir = os.path.join(os.path.dirname(__file__), "templates")
         env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
@@ -2106,7 +2278,7 @@ class Transistor:
                 data['TurnOffLoss']['Energy'] = collections.OrderedDict(sorted(data['TurnOffLoss']['Energy'].items()))
                 template = env.get_template('PLECS_Exporter_template_Diode.txt')
                 output = template.render(diode=data)
-                with open(data['partnumber'] + "_diode.xml", "w") as fh:
+                with open(os.path.join(filepath, data['partnumber'] + "_diode.xml"), "w") as fh:
                     fh.write(output)
             elif data['type'] == 'IGBT' or data['type'] == 'MOSFET' or data['type'] == 'SiC-MOSFET':
                 if data['type'] == 'MOSFET' or data['type'] == 'SiC-MOSFET':
@@ -2119,9 +2291,9 @@ class Transistor:
                 template = env.get_template('PLECS_Exporter_template_Switch.txt')
                 output = template.render(transistor=data)
                 str_decoded = output.encode()
-                with open(data['partnumber'] + "_switch.xml", "w") as fh:
+                with open(os.path.join(filepath, data['partnumber'] + "_switch.xml"), "w") as fh:
                     fh.write(str_decoded.decode())
-        print("Export files {0}_switch.xml and {1}_diode.xml to {2}".format(data['partnumber'], data['partnumber'], os.getcwd()))
+        print("Export files {0}_switch.xml and {1}_diode.xml to {2}".format(data['partnumber'], data['partnumber'], filepath))
 
     class WP:
         """
@@ -2180,21 +2352,20 @@ class Transistor:
         :return: Availability codes
         :rtype: dict
         """
-        transistor_dict = self.convert_to_dict()
         codes = {'Switch': list(), 'Diode': list()}
-        if not transistor_dict['switch']['channel']:
+        if not self.switch.channel:
             codes['Switch'].append(1101)
-        if not transistor_dict['switch']['e_on']:
+        if not self.switch.e_on:
             codes['Switch'].append(1102)
-        if not transistor_dict['switch']['e_off']:
+        if not self.switch.e_off:
             codes['Switch'].append(1103)
-        if not transistor_dict['switch']['thermal_foster']:
+        if self.switch.thermal_foster is None:
             codes['Switch'].append(201)
-        if not transistor_dict['diode']['channel']:
+        if not self.diode.channel:
             codes['Diode'].append(1201)
-        if not transistor_dict['diode']['e_rr']:
+        if not self.diode.e_rr:
             codes['Diode'].append(1202)
-        if not transistor_dict['diode']['thermal_foster']:
+        if self.diode.thermal_foster is None:
             codes['Diode'].append(202)
         return codes
 
@@ -2219,32 +2390,31 @@ class Transistor:
             get_gatedefaults(self.type)
         v_g = v_g_on
         v_d = v_d_on
-        transistor_dict = self.convert_to_dict()
         exception_codes = self.validate_transistor()
-        is_body_diode = transistor_dict['type'].lower() in ['mosfet', 'sic-mosfet']
+        is_body_diode = self.type.lower() in ['mosfet', 'sic-mosfet']
         # Gather switch data to fill in plecs template exporter
         plecs_transistor = None
         try:
             if 1101 in exception_codes['Switch']:
                 raise MissingDataError(1101)
             plecs_transistor = {
-                'type': transistor_dict['type'],
-                'vendor': transistor_dict['manufacturer'],
-                'partnumber': transistor_dict['name'],
+                'type': self.type,
+                'vendor': self.manufacturer,
+                'partnumber': self.name,
                 'ConductionLoss': {},
                 'TurnOnLoss': {},
                 'TurnOffLoss': {},
                 'Comment': [
                     "This datasheet was created by {0} on {1} and was exported using transistordatabase.".format(
-                        transistor_dict['author'], transistor_dict['datasheet_date']),
-                    "Datasheet Link : {0}".format(re.sub(r'&', '&amp;', transistor_dict['datasheet_hyperlink'])),
+                        self.author, self.datasheet_date),
+                    "Datasheet Link : {0}".format(re.sub(r'&', '&amp;', self.datasheet_hyperlink)),
                     "File generated : {0}".format(datetime.today()),
                     "File generated by : https://github.com/upb-lea/transistordatabase"]
             }
             if channel_recheck:
                 near_to_voltages = {'v_channel_gs': v_g_on, 'v_g_on': v_g_on, 'v_g_off': v_g_off}
                 v_g, v_g_on, v_g_off = self.switch.find_next_gate_voltage(req_gate_vltgs=near_to_voltages, export_type='plecs')
-            plecs_transistor = get_channel_data(transistor_dict['switch']['channel'], plecs_transistor, v_g, False, is_body_diode)
+            plecs_transistor = fill_plecs_channel_data(self.switch.get_resampled_curves('channel', v_g), plecs_transistor)
             # Check if channel information exists else throw exception and don't export transistor xml data
             if 'Channel' not in plecs_transistor['ConductionLoss']:
                 raise MissingDataError(1111)
@@ -2255,10 +2425,10 @@ class Transistor:
 
             # Turn on loss information extraction
             if 1104 not in exception_codes['Switch']:
-                plecs_transistor = get_loss_curves(transistor_dict['switch']['e_on'], plecs_transistor, 'TurnOnLoss', v_g_on, False)
+                plecs_transistor = fill_plecs_loss_curves(self.switch.get_resampled_curves('e_on', v_g_on), plecs_transistor, 'TurnOnLoss', False)
                 if 'Energy' not in plecs_transistor['TurnOnLoss']:
                     plecs_transistor['TurnOnLoss']['CurrentAxis'] = plecs_transistor['ConductionLoss']['CurrentAxis']
-                    plecs_transistor['TurnOnLoss']['Energy'] = {transistor_dict['v_abs_max']: [[0] * len(
+                    plecs_transistor['TurnOnLoss']['Energy'] = {self.v_abs_max: [[0] * len(
                         plecs_transistor['ConductionLoss']['CurrentAxis'])]}
                     plecs_transistor['TurnOnLoss']['TemperatureAxis'] = [25]
                 else:
@@ -2268,16 +2438,16 @@ class Transistor:
                             raise MissingDataError(1102)
             else:
                 plecs_transistor['TurnOnLoss']['CurrentAxis'] = plecs_transistor['ConductionLoss']['CurrentAxis']
-                plecs_transistor['TurnOnLoss']['Energy'] = {transistor_dict['v_abs_max']: [[0] * len(
+                plecs_transistor['TurnOnLoss']['Energy'] = {self.v_abs_max: [[0] * len(
                     plecs_transistor['ConductionLoss']['CurrentAxis'])]}
                 plecs_transistor['TurnOnLoss']['TemperatureAxis'] = [25]
             # Turn off loss information extraction
             if 1105 not in exception_codes['Switch']:
-                plecs_transistor = get_loss_curves(transistor_dict['switch']['e_off'], plecs_transistor, 'TurnOffLoss', v_g_off, False)
+                plecs_transistor = fill_plecs_loss_curves(self.switch.get_resampled_curves('e_off', v_g_off), plecs_transistor, 'TurnOffLoss', False)
                 if 'Energy' not in plecs_transistor['TurnOffLoss']:
                     plecs_transistor['TurnOffLoss']['CurrentAxis'] = plecs_transistor['ConductionLoss']['CurrentAxis']
                     plecs_transistor['TurnOffLoss']['TemperatureAxis'] = [25]
-                    plecs_transistor['TurnOffLoss']['Energy'] = {transistor_dict['v_abs_max']: [[0] * len(
+                    plecs_transistor['TurnOffLoss']['Energy'] = {self.v_abs_max: [[0] * len(
                         plecs_transistor['ConductionLoss']['CurrentAxis'])]}
                 else:
                     for key, _ in plecs_transistor['TurnOffLoss']['Energy'].items():
@@ -2287,17 +2457,17 @@ class Transistor:
             else:
                 plecs_transistor['TurnOffLoss']['CurrentAxis'] = plecs_transistor['ConductionLoss']['CurrentAxis']
                 plecs_transistor['TurnOffLoss']['TemperatureAxis'] = [25]
-                plecs_transistor['TurnOffLoss']['Energy'] = {transistor_dict['v_abs_max']: [[0] * len(
+                plecs_transistor['TurnOffLoss']['Energy'] = {self.v_abs_max: [[0] * len(
                     plecs_transistor['ConductionLoss']['CurrentAxis'])]}
             # switch forster parameter extraction either vector list of total values
-            if transistor_dict['switch']['thermal_foster']['r_th_vector'] is not None:
-                plecs_transistor['RElement'] = transistor_dict['switch']['thermal_foster']['r_th_vector']
-                plecs_transistor['TauElement'] = transistor_dict['switch']['thermal_foster']['tau_vector']
+            if self.switch.thermal_foster.r_th_vector is not None:
+                plecs_transistor['RElement'] = self.switch.thermal_foster.r_th_vector
+                plecs_transistor['TauElement'] = self.switch.thermal_foster.tau_vector
             else:
-                plecs_transistor['RElement'] = transistor_dict['switch']['thermal_foster']['r_th_total'] if \
-                    transistor_dict['switch']['thermal_foster']['r_th_total'] else 1e-6,
-                plecs_transistor['TauElement'] = transistor_dict['switch']['thermal_foster']['tau_total'] if \
-                    transistor_dict['switch']['thermal_foster']['tau_total'] else plecs_transistor['RElement']
+                plecs_transistor['RElement'] = self.switch.thermal_foster.r_th_total if \
+                    self.switch.thermal_foster.r_th_total else 1e-6,
+                plecs_transistor['TauElement'] = self.switch.thermal_foster.tau_total if \
+                    self.switch.thermal_foster.tau_total else plecs_transistor['RElement']
         except MissingDataError as e:
             print(e.args[0], e.em[e.args[0]] + '.scl')
         # Gather diode data to fill in plecs template exporter
@@ -2307,28 +2477,29 @@ class Transistor:
                 raise MissingDataError(1201)
             plecs_diode = {
                 'type': "Diode",
-                'vendor': transistor_dict['manufacturer'],
-                'partnumber': transistor_dict['name'],
+                'vendor': self.manufacturer,
+                'partnumber': self.name,
                 'ConductionLoss': {},
                 'TurnOnLoss': {},
                 'TurnOffLoss': {},
                 'Comment': [
                     "This datasheet was created by {0} on {1} and was exported using transistordatabase.".format(
-                        transistor_dict['author'], transistor_dict['datasheet_date']),
-                    "Datasheet Link : {0}".format(re.sub(r'&', '&amp;', transistor_dict['datasheet_hyperlink'])),
+                        self.author, self.datasheet_date),
+                    "Datasheet Link : {0}".format(re.sub(r'&', '&amp;', self.datasheet_hyperlink)),
                     "File generated : {0}".format(datetime.today()),
                     "File generated by : https://github.com/upb-lea/transistordatabase"]
             }
             if channel_recheck:
                 near_to_voltages = {'v_channel_gs': v_d_on, 'v_d_off': v_d_off}
                 v_d, v_d_off = self.diode.find_next_gate_voltage(req_gate_vltgs=near_to_voltages, export_type='plecs')
-            plecs_diode = get_channel_data(transistor_dict['diode']['channel'], plecs_diode, v_d, True, is_body_diode)
+            # Diodes without body diode (IGBT): the channel curves of all gate voltages are used
+            plecs_diode = fill_plecs_channel_data(self.diode.get_resampled_curves('channel', v_d if is_body_diode else None), plecs_diode)
             if 'Channel' not in plecs_diode['ConductionLoss']:
                 raise MissingDataError(1211)
 
             # Diode reverse recovery loss extraction
             if 1202 not in exception_codes['Diode']:
-                plecs_diode = get_loss_curves(transistor_dict['diode']['e_rr'], plecs_diode, 'TurnOffLoss', v_d_off, True)
+                plecs_diode = fill_plecs_loss_curves(self.diode.get_resampled_curves('e_rr', v_d_off), plecs_diode, 'TurnOffLoss', True)
                 if 'Energy' not in plecs_diode['TurnOffLoss']:
                     plecs_diode['TurnOffLoss']['CurrentAxis'] = [0]
                     plecs_diode['TurnOffLoss']['Energy'] = {0: [[0]]}
@@ -2348,14 +2519,14 @@ class Transistor:
             plecs_diode['TurnOnLoss']['Energy'] = {0: [[0]]}
             plecs_diode['TurnOnLoss']['TemperatureAxis'] = [25]
             # diode forster parameter extraction either vector list of total values
-            if transistor_dict['diode']['thermal_foster']['r_th_vector'] is not None:
-                plecs_diode['RElement'] = transistor_dict['diode']['thermal_foster']['r_th_vector']
-                plecs_diode['TauElement'] = transistor_dict['diode']['thermal_foster']['tau_vector']
+            if self.diode.thermal_foster.r_th_vector is not None:
+                plecs_diode['RElement'] = self.diode.thermal_foster.r_th_vector
+                plecs_diode['TauElement'] = self.diode.thermal_foster.tau_vector
             else:
-                plecs_diode['RElement'] = transistor_dict['diode']['thermal_foster']['r_th_total'] if \
-                    transistor_dict['diode']['thermal_foster']['r_th_total'] else 1e-6,
-                plecs_diode['TauElement'] = transistor_dict['diode']['thermal_foster']['tau_total'] if \
-                    transistor_dict['diode']['thermal_foster']['tau_total'] else plecs_diode['RElement']
+                plecs_diode['RElement'] = self.diode.thermal_foster.r_th_total if \
+                    self.diode.thermal_foster.r_th_total else 1e-6,
+                plecs_diode['TauElement'] = self.diode.thermal_foster.tau_total if \
+                    self.diode.thermal_foster.tau_total else plecs_diode['RElement']
         except MissingDataError as e:
             print(e.args[0], e.em[e.args[0]] + '.scl')
         return plecs_transistor if plecs_transistor is not None and 'Channel' in plecs_transistor['ConductionLoss'] \
@@ -2428,6 +2599,7 @@ class Transistor:
                 # Only create RawMeasurementData objects from valid dicts
                 self.raw_measurement_data.append(
                     RawMeasurementData(measurement_data.get('raw_measurement_data')))
+        self.switch.invalidate_operating_point_index()
 
     def add_soa_data(self, soa_data: Union[Dict, List], switch_type: str, clear: bool = False):
         """
@@ -2490,6 +2662,7 @@ class Transistor:
                 self.diode.soa.clear()
                 for soa_item in soa_list:
                     self.diode.soa.append(SOA(soa_item))
+            getattr(self, switch_type).invalidate_operating_point_index()
             print('Updated Switch.SOA successfully!')
         else:
             print('No new item to add!')
@@ -2543,6 +2716,7 @@ class Transistor:
             self.switch.charge_curve.clear()
             for charge_item in charge_list:
                 self.switch.charge_curve.append(GateChargeCurve(charge_item))
+            self.switch.invalidate_operating_point_index()
             print('Updated Switch.Charge_Curve successfully!')
         else:
             print('No new item to add!')
@@ -2596,6 +2770,7 @@ class Transistor:
             self.switch.r_channel_th.clear()
             for r_channel_item in r_channel_list:
                 self.switch.r_channel_th.append(TemperatureDependResistance(r_channel_item))
+            self.switch.invalidate_operating_point_index()
             print('Updated Switch.r_channel_th successfully!')
         else:
             print('No new item to add!')